@@ -79,10 +79,15 @@ def run_daily_briefs() -> Dict[str, int]:
         return summary
 
     provider = get_crypto_data_provider()
+    try:
+        snapshots = provider.get_snapshots(PERP_TICKERS)
+    except Exception as e:
+        logger.error(f"perp_brief_daily_runner: snapshot refresh failed: {e}")
+        snapshots = {}
 
     for ticker in PERP_TICKERS:
         try:
-            snap = provider.get_snapshot(ticker)
+            snap = snapshots.get(ticker)
             if not snap:
                 summary["snapshot_missing"] += 1
                 logger.warning(f"perp_brief_daily_runner: snapshot missing for {ticker}")
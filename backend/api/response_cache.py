@@ -2,7 +2,10 @@
 API Response Cache - High-performance caching for API endpoints.
 
 Provides TTL-based caching for frequently accessed endpoints to reduce
-database load and improve response times by 50-60%.
+database load and improve response times by 50-60%. Concurrent misses on a
+key are coalesced into one computation, optionally serving the stale value
+while it refreshes, and get_stats() breaks hits/misses/compute latency down
+per key prefix.
 
 Usage:
     from backend.api.response_cache import response_cache, cached_response
@@ -16,14 +19,21 @@ Usage:
     # Manual approach
     response_cache.set("key", value, ttl=60)
     value = response_cache.get("key")
+
+    # Manual single-flight (one compute for all concurrent callers)
+    value = response_cache.get_or_compute("gex:SPY", lambda: compute("SPY"), ttl=60)
 """
 
+import sys
 import time
+import asyncio
 import threading
 import logging
 import hashlib
 import json
-from typing import Any, Dict, Optional, Callable, TypeVar
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Dict, Optional, Callable, Tuple, TypeVar
 from functools import wraps
 from dataclasses import dataclass
 
@@ -31,6 +41,9 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Stats bucket for keys that carry no "<prefix>:" part
+DEFAULT_PREFIX = 'other'
+
 
 @dataclass
 class CacheEntry:
@@ -39,6 +52,9 @@ class CacheEntry:
     created_at: float
     ttl_seconds: float
     hit_count: int = 0
+    size_bytes: int = 0
+    prefix: str = DEFAULT_PREFIX
+    stale_seconds: float = 0  # How long past the TTL the value may still be served stale
 
     @property
     def is_expired(self) -> bool:
@@ -48,10 +64,32 @@ class CacheEntry:
     def remaining_ttl(self) -> float:
         return self.ttl_seconds - (time.time() - self.created_at)
 
+    @property
+    def is_servable_stale(self) -> bool:
+        return time.time() - self.created_at <= self.ttl_seconds + self.stale_seconds
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate payload size: the JSON the endpoint would send."""
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+def _prefix_of(key: str) -> str:
+    prefix, sep, _ = key.partition(':')
+    return prefix if sep else DEFAULT_PREFIX
+
 
 class APIResponseCache:
     """
-    Thread-safe TTL cache for API responses.
+    Thread-safe TTL + LRU cache for API responses.
+
+    Entries live in an OrderedDict in least-recently-used order, so eviction
+    past max_entries / max_bytes is O(1) per entry. get_or_compute (and its
+    async twin) coalesces concurrent misses on a key into one computation
+    and can serve a stale value while a single refresher runs.
 
     Default TTLs:
     - GEX data: 60 seconds (market data changes frequently)
@@ -68,16 +106,25 @@ class APIResponseCache:
     TTL_HISTORICAL = 300  # Historical data
     TTL_PERFORMANCE = 120 # Performance metrics
 
-    def __init__(self, max_entries: int = 500):
-        self._cache: Dict[str, CacheEntry] = {}
+    def __init__(self, max_entries: int = 500, max_bytes: int = 64 * 1024 * 1024):
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self._lock = threading.RLock()
         self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
         self._stats = {
             'hits': 0,
             'misses': 0,
+            'stale_hits': 0,
+            'coalesced': 0,
             'sets': 0,
             'evictions': 0
         }
+        self._prefix_stats: Dict[str, Dict[str, float]] = {}
+        # key -> Future of the in-progress computation (threads)
+        self._inflight: Dict[str, Future] = {}
+        # key -> Task of the in-progress computation (event loop)
+        self._async_inflight: Dict[str, asyncio.Task] = {}
 
     def _make_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate a unique cache key from prefix and arguments."""
@@ -87,60 +134,99 @@ class APIResponseCache:
         for k, v in sorted(kwargs.items()):
             key_parts.append(f"{k}={v}")
         key_string = "|".join(key_parts)
-        return hashlib.md5(key_string.encode()).hexdigest()[:16]
+        return f"{prefix}:{hashlib.md5(key_string.encode()).hexdigest()[:16]}"
+
+    # =========================================================================
+    # ENTRIES
+    # =========================================================================
+
+    def _record(self, prefix: str, stat: str, amount: float = 1) -> None:
+        self._stats[stat] = self._stats.get(stat, 0) + amount
+        bucket = self._prefix_stats.get(prefix)
+        if bucket is None:
+            bucket = self._prefix_stats[prefix] = {
+                'hits': 0, 'misses': 0, 'stale_hits': 0, 'coalesced': 0,
+                'sets': 0, 'computes': 0, 'compute_ms_total': 0.0, 'compute_ms_max': 0.0,
+            }
+        bucket[stat] = bucket.get(stat, 0) + amount
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get a value from cache if not expired."""
+    def _record_compute(self, prefix: str, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
         with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                self._stats['misses'] += 1
-                return None
-            if entry.is_expired:
-                del self._cache[key]
-                self._stats['misses'] += 1
+            self._record(prefix, 'computes')
+            bucket = self._prefix_stats[prefix]
+            bucket['compute_ms_total'] += elapsed_ms
+            bucket['compute_ms_max'] = max(bucket['compute_ms_max'], elapsed_ms)
+
+    def _remove(self, key: str) -> None:
+        entry = self._cache.pop(key)
+        self._bytes -= entry.size_bytes
+
+    def _lookup(self, key: str, prefix: str, stale_ok: bool) -> Tuple[str, Any]:
+        """('hit' | 'stale' | 'miss', value). Caller holds the lock; counts the outcome."""
+        entry = self._cache.get(key)
+        if entry is not None:
+            if not entry.is_expired:
+                self._cache.move_to_end(key)
+                entry.hit_count += 1
+                self._record(prefix, 'hits')
+                return 'hit', entry.value
+            if entry.is_servable_stale:
+                if stale_ok:
+                    self._cache.move_to_end(key)
+                    self._record(prefix, 'stale_hits')
+                    return 'stale', entry.value
+            else:
+                self._remove(key)
                 self._stats['evictions'] += 1
-                return None
-            entry.hit_count += 1
-            self._stats['hits'] += 1
-            return entry.value
+        self._record(prefix, 'misses')
+        return 'miss', None
 
-    def set(self, key: str, value: Any, ttl: float) -> None:
-        """Store a value in cache with TTL."""
+    def get(self, key: str, prefix: Optional[str] = None) -> Optional[Any]:
+        """Get a value from cache if not expired."""
         with self._lock:
-            # Cleanup if at capacity
-            if len(self._cache) >= self._max_entries:
-                self._cleanup_expired()
-                # If still at capacity, remove oldest entries
-                if len(self._cache) >= self._max_entries:
-                    oldest_keys = sorted(
-                        self._cache.keys(),
-                        key=lambda k: self._cache[k].created_at
-                    )[:self._max_entries // 4]
-                    for k in oldest_keys:
-                        del self._cache[k]
-                        self._stats['evictions'] += 1
+            return self._lookup(key, prefix or _prefix_of(key), stale_ok=False)[1]
 
+    def set(self, key: str, value: Any, ttl: float, prefix: Optional[str] = None,
+            stale_ttl: float = 0) -> None:
+        """Store a value in cache with TTL (servable stale for stale_ttl more seconds)."""
+        prefix = prefix or _prefix_of(key)
+        size = _estimate_size(value)
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
             self._cache[key] = CacheEntry(
                 value=value,
                 created_at=time.time(),
-                ttl_seconds=ttl
+                ttl_seconds=ttl,
+                size_bytes=size,
+                prefix=prefix,
+                stale_seconds=stale_ttl
             )
-            self._stats['sets'] += 1
+            self._bytes += size
+            self._record(prefix, 'sets')
+
+            # Evict least recently used entries past either limit (never the new one)
+            while len(self._cache) > 1 and (
+                len(self._cache) > self._max_entries or self._bytes > self._max_bytes
+            ):
+                self._remove(next(iter(self._cache)))
+                self._stats['evictions'] += 1
 
     def _cleanup_expired(self) -> int:
-        """Remove expired entries. Returns count of removed entries."""
-        expired = [k for k, v in self._cache.items() if v.is_expired]
-        for k in expired:
-            del self._cache[k]
-        self._stats['evictions'] += len(expired)
-        return len(expired)
+        """Remove entries past their TTL and stale window. Returns count of removed entries."""
+        with self._lock:
+            expired = [k for k, v in self._cache.items() if not v.is_servable_stale]
+            for k in expired:
+                self._remove(k)
+            self._stats['evictions'] += len(expired)
+            return len(expired)
 
     def invalidate(self, key: str) -> bool:
         """Remove a specific key from cache."""
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._remove(key)
                 return True
             return False
 
@@ -149,7 +235,7 @@ class APIResponseCache:
         with self._lock:
             keys_to_remove = [k for k in self._cache if k.startswith(prefix)]
             for k in keys_to_remove:
-                del self._cache[k]
+                self._remove(k)
             return len(keys_to_remove)
 
     def clear(self) -> None:
@@ -157,17 +243,151 @@ class APIResponseCache:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._bytes = 0
             self._stats['evictions'] += count
 
+    # =========================================================================
+    # SINGLE-FLIGHT
+    # =========================================================================
+
+    def single_flight(self, key: str, compute: Callable[[], T], prefix: Optional[str] = None) -> T:
+        """
+        Run compute() once for all threads asking for key at the same time;
+        the others block and receive its result (or exception). Does not
+        cache - callers that store with per-result TTLs use this directly.
+        """
+        prefix = prefix or _prefix_of(key)
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+            else:
+                self._record(prefix, 'coalesced')
+        if not owner:
+            return future.result()
+
+        started = time.perf_counter()
+        try:
+            result = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            self._record_compute(prefix, started)
+
+    def get_or_compute(self, key: str, compute: Callable[[], T], ttl: float,
+                       prefix: Optional[str] = None, stale_ttl: float = 0) -> T:
+        """
+        Cached value for key, else compute() it once (single-flight) and cache
+        any non-None result. With stale_ttl, an expired value younger than
+        ttl + stale_ttl is returned immediately while one background thread
+        refreshes it.
+        """
+        prefix = prefix or _prefix_of(key)
+        with self._lock:
+            state, value = self._lookup(key, prefix, stale_ok=stale_ttl > 0)
+            refresh = state == 'stale' and key not in self._inflight
+        if state == 'hit':
+            return value
+
+        def compute_and_store():
+            result = compute()
+            if result is not None:
+                self.set(key, result, ttl, prefix=prefix, stale_ttl=stale_ttl)
+            return result
+
+        if state == 'stale':
+            if refresh:
+                threading.Thread(
+                    target=self._refresh_quietly, args=(key, compute_and_store, prefix),
+                    name=f"cache-refresh-{prefix}", daemon=True
+                ).start()
+            return value
+        return self.single_flight(key, compute_and_store, prefix)
+
+    def _refresh_quietly(self, key: str, compute: Callable[[], Any], prefix: str) -> None:
+        try:
+            self.single_flight(key, compute, prefix)
+        except Exception as e:
+            logger.warning(f"Cache refresh failed for {prefix} ({key[-8:]}): {e}")
+
+    async def aget_or_compute(self, key: str, compute: Callable[[], Awaitable[T]], ttl: float,
+                              prefix: Optional[str] = None, stale_ttl: float = 0) -> T:
+        """get_or_compute for coroutines: one task per key on the running event loop."""
+        prefix = prefix or _prefix_of(key)
+        with self._lock:
+            state, value = self._lookup(key, prefix, stale_ok=stale_ttl > 0)
+        if state == 'hit':
+            return value
+
+        loop = asyncio.get_running_loop()
+        task = self._async_inflight.get(key)
+        if task is not None and task.get_loop() is loop:
+            if state == 'stale':
+                return value
+            with self._lock:
+                self._record(prefix, 'coalesced')
+            return await asyncio.shield(task)
+
+        async def compute_and_store():
+            started = time.perf_counter()
+            try:
+                result = await compute()
+            finally:
+                self._record_compute(prefix, started)
+            if result is not None:
+                self.set(key, result, ttl, prefix=prefix, stale_ttl=stale_ttl)
+            return result
+
+        task = loop.create_task(compute_and_store())
+        self._async_inflight[key] = task
+        task.add_done_callback(lambda t: self._async_task_done(key, t))
+        if state == 'stale':
+            return value
+        return await asyncio.shield(task)
+
+    def _async_task_done(self, key: str, task: asyncio.Task) -> None:
+        if self._async_inflight.get(key) is task:
+            del self._async_inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Cache compute failed for {key[-8:]}: {task.exception()}")
+
+    # =========================================================================
+    # STATS
+    # =========================================================================
+
     def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
+        """Get cache statistics (totals plus a per-prefix breakdown)."""
         with self._lock:
             total = self._stats['hits'] + self._stats['misses']
             hit_rate = (self._stats['hits'] / total * 100) if total > 0 else 0
+            prefixes = {}
+            for prefix, bucket in self._prefix_stats.items():
+                lookups = bucket['hits'] + bucket['stale_hits'] + bucket['misses']
+                computes = bucket['computes']
+                prefixes[prefix] = {
+                    **bucket,
+                    'compute_ms_total': round(bucket['compute_ms_total'], 2),
+                    'compute_ms_max': round(bucket['compute_ms_max'], 2),
+                    'compute_ms_avg': round(bucket['compute_ms_total'] / computes, 2) if computes else 0,
+                    'hit_rate_pct': round((bucket['hits'] + bucket['stale_hits']) / lookups * 100, 2)
+                    if lookups else 0,
+                }
             return {
                 **self._stats,
                 'entries': len(self._cache),
-                'hit_rate_pct': round(hit_rate, 2)
+                'bytes': self._bytes,
+                'max_entries': self._max_entries,
+                'max_bytes': self._max_bytes,
+                'inflight': len(self._inflight) + len(self._async_inflight),
+                'hit_rate_pct': round(hit_rate, 2),
+                'prefixes': prefixes
             }
 
 
@@ -178,19 +398,25 @@ response_cache = APIResponseCache()
 def cached_response(
     ttl: float = 60,
     key_prefix: str = "api",
-    skip_if: Optional[Callable[..., bool]] = None
+    skip_if: Optional[Callable[..., bool]] = None,
+    stale_ttl: float = 0
 ):
     """
     Decorator to cache API endpoint responses.
 
+    Concurrent misses on the same key share one call of the endpoint
+    (single-flight). With stale_ttl > 0, callers get the expired value for
+    up to stale_ttl more seconds while a single refresh runs.
+
     Args:
         ttl: Time-to-live in seconds
-        key_prefix: Prefix for cache keys
+        key_prefix: Prefix for cache keys (and the get_stats() bucket)
         skip_if: Optional function that returns True to skip caching
+        stale_ttl: Seconds past ttl an expired value may be served while refreshing
 
     Usage:
         @router.get("/api/gex/{symbol}")
-        @cached_response(ttl=60, key_prefix="gex")
+        @cached_response(ttl=60, key_prefix="gex", stale_ttl=30)
         async def get_gex(symbol: str):
             return expensive_database_call()
     """
@@ -201,24 +427,11 @@ def cached_response(
             if skip_if and skip_if(*args, **kwargs):
                 return await func(*args, **kwargs)
 
-            # Generate cache key
             cache_key = response_cache._make_key(key_prefix, *args, **kwargs)
-
-            # Try to get from cache
-            cached = response_cache.get(cache_key)
-            if cached is not None:
-                logger.debug(f"Cache HIT: {key_prefix} ({cache_key[:8]}...)")
-                return cached
-
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-
-            # Only cache successful responses
-            if result is not None:
-                response_cache.set(cache_key, result, ttl)
-                logger.debug(f"Cache SET: {key_prefix} ({cache_key[:8]}...) ttl={ttl}s")
-
-            return result
+            return await response_cache.aget_or_compute(
+                cache_key, lambda: func(*args, **kwargs), ttl,
+                prefix=key_prefix, stale_ttl=stale_ttl
+            )
 
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -226,27 +439,13 @@ def cached_response(
             if skip_if and skip_if(*args, **kwargs):
                 return func(*args, **kwargs)
 
-            # Generate cache key
             cache_key = response_cache._make_key(key_prefix, *args, **kwargs)
-
-            # Try to get from cache
-            cached = response_cache.get(cache_key)
-            if cached is not None:
-                logger.debug(f"Cache HIT: {key_prefix} ({cache_key[:8]}...)")
-                return cached
-
-            # Execute function and cache result
-            result = func(*args, **kwargs)
-
-            # Only cache successful responses
-            if result is not None:
-                response_cache.set(cache_key, result, ttl)
-                logger.debug(f"Cache SET: {key_prefix} ({cache_key[:8]}...) ttl={ttl}s")
-
-            return result
+            return response_cache.get_or_compute(
+                cache_key, lambda: func(*args, **kwargs), ttl,
+                prefix=key_prefix, stale_ttl=stale_ttl
+            )
 
         # Return appropriate wrapper based on function type
-        import asyncio
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
         return sync_wrapper
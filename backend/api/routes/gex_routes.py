@@ -210,12 +210,20 @@ def get_gex_data_with_fallback(symbol: str) -> Dict[str, Any]:
     # Check cache first (60 second TTL for GEX data)
     if CACHE_AVAILABLE:
         cache_key = f"gex_data_{symbol}"
-        cached = response_cache.get(cache_key)
+        cached = response_cache.get(cache_key, prefix="gex_data")
         if cached:
             cached['from_cache'] = True
             logger.debug(f"Cache HIT for GEX {symbol}")
             return cached
+        # On a miss, concurrent requests for the symbol share one fetch
+        return response_cache.single_flight(
+            cache_key, lambda: _fetch_gex_data(symbol), prefix="gex_data"
+        )
+    return _fetch_gex_data(symbol)
+
 
+def _fetch_gex_data(symbol: str) -> Dict[str, Any]:
+    """Uncached body of get_gex_data_with_fallback (caches each source with its own TTL)."""
     errors = []
 
     # PRIMARY: TradingVolatility — stable, pre-calculated net gamma already on the
@@ -283,7 +291,7 @@ def get_gex_data_with_fallback(symbol: str) -> Dict[str, Any]:
                         logger.warning(f"Failed to store GEX data: {e}")
                 # Cache the response
                 if CACHE_AVAILABLE:
-                    response_cache.set(f"gex_data_{symbol}", data, APIResponseCache.TTL_GEX)
+                    response_cache.set(f"gex_data_{symbol}", data, APIResponseCache.TTL_GEX, prefix="gex_data")
                 return data
         else:
             error_msg = data.get('error', 'Unknown error') if data else 'No data returned'
@@ -304,7 +312,7 @@ def get_gex_data_with_fallback(symbol: str) -> Dict[str, Any]:
             except Exception as e:
                 logger.warning(f"Failed to store Tradier GEX data: {e}")
         if CACHE_AVAILABLE:
-            response_cache.set(f"gex_data_{symbol}", tradier_direct, APIResponseCache.TTL_GEX)
+            response_cache.set(f"gex_data_{symbol}", tradier_direct, APIResponseCache.TTL_GEX, prefix="gex_data")
         return tradier_direct
     else:
         errors.append("Tradier direct: Not available or failed")
@@ -321,7 +329,7 @@ def get_gex_data_with_fallback(symbol: str) -> Dict[str, Any]:
                 logger.warning(f"Failed to store Tradier GEX data: {e}")
         # Cache the response
         if CACHE_AVAILABLE:
-            response_cache.set(f"gex_data_{symbol}", tradier_data, APIResponseCache.TTL_GEX)
+            response_cache.set(f"gex_data_{symbol}", tradier_data, APIResponseCache.TTL_GEX, prefix="gex_data")
         return tradier_data
     else:
         errors.append("Tradier calculation: Failed or unavailable")
@@ -333,7 +341,7 @@ def get_gex_data_with_fallback(symbol: str) -> Dict[str, Any]:
         logger.debug(f"Using database fallback for {symbol}")
         # Cache database data for shorter time (30s) since it's already stale
         if CACHE_AVAILABLE:
-            response_cache.set(f"gex_data_{symbol}", db_data, 30)
+            response_cache.set(f"gex_data_{symbol}", db_data, 30, prefix="gex_data")
         return db_data
     else:
         errors.append("Database fallback: No recent data found")
@@ -6,6 +6,7 @@ Handles trader status, performance, positions, trades, and equity curve.
 IMPORTANT: Trade execution endpoints are protected by ENABLE_LIVE_TRADING flag.
 """
 
+import json
 import math
 import os
 from datetime import datetime, timedelta
@@ -2982,6 +2983,56 @@ async def get_sync_status():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# =============================================================================
+# SCHEDULER JOB METRICS
+# =============================================================================
+
+@router.get("/scheduler/job-metrics")
+async def get_scheduler_job_metrics(job_id: str = None, pool: str = None):
+    """
+    Per-job runtime and start-lag histograms for the APScheduler jobs.
+
+    Served live when the scheduler runs in this process, otherwise from the
+    snapshot the scheduler worker flushes to autonomous_config every minute.
+
+    Args:
+        job_id: Only this job (e.g. fortress_trading)
+        pool: Only jobs in this executor pool (scans, training, maintenance, default)
+    """
+    metrics = None
+    source = "live"
+    try:
+        from scheduler.job_pools import get_job_metrics
+        metrics = get_job_metrics().snapshot()
+    except ImportError:
+        pass
+
+    if not metrics or not metrics.get("jobs"):
+        source = "database"
+        try:
+            conn = get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT value FROM autonomous_config WHERE key = 'scheduler_job_metrics'")
+            row = cursor.fetchone()
+            conn.close()
+            value = row[0] if row else None
+            metrics = json.loads(value) if isinstance(value, str) else value
+        except Exception as e:
+            logger.error(f"Error loading scheduler job metrics: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    if not metrics:
+        return {"success": False, "error": "No scheduler job metrics recorded yet", "data": None}
+
+    jobs = metrics.get("jobs", {})
+    if job_id:
+        jobs = {k: v for k, v in jobs.items() if k == job_id}
+    if pool:
+        jobs = {k: v for k, v in jobs.items() if v.get("pool") == pool}
+
+    return {"success": True, "source": source, "data": {**metrics, "jobs": jobs}}
+
+
 # =============================================================================
 # TRADIER SANDBOX EOD CLOSE ENDPOINTS
 # =============================================================================
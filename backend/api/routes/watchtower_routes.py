@@ -46,6 +46,10 @@ _cache: Dict[str, Any] = {}
 _cache_times: Dict[str, float] = {}
 CACHE_TTL_SECONDS = 30  # 30 second cache for gamma data (reduced for more responsive updates)
 PRICE_CACHE_TTL = 10    # 10 second cache for prices
+# /gamma responses: concurrent dashboard polls share one build (single-flight),
+# and an expired response is served for a few more seconds while one refresh runs
+GAMMA_RESPONSE_TTL = 5
+GAMMA_RESPONSE_STALE_TTL = 10
 
 
 def get_cached(key: str, ttl: int = CACHE_TTL_SECONDS) -> Any:
@@ -103,6 +107,15 @@ try:
 except ImportError as e:
     logger.warning(f"WATCHTOWER engine not available: {e}")
 
+# Shared API response cache (single-flight per key)
+try:
+    from backend.api.response_cache import cached_response
+except ImportError as e:
+    logger.warning(f"Response cache not available: {e}")
+
+    def cached_response(**_kwargs):
+        return lambda func: func
+
 # Try to import Tradier data fetcher
 TRADIER_AVAILABLE = False
 TradierDataFetcher = None  # Define as None first
@@ -1105,6 +1118,7 @@ async def get_real_prices() -> tuple:
 
 
 @router.get("/gamma")
+@cached_response(ttl=GAMMA_RESPONSE_TTL, key_prefix="watchtower_gamma", stale_ttl=GAMMA_RESPONSE_STALE_TTL)
 async def get_gamma_data(
     symbol: str = Query("SPY", description="Symbol (SPY, SPX, QQQ, IWM, DIA)"),
     expiration: Optional[str] = Query(None, description="Expiration date YYYY-MM-DD"),
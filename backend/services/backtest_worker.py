@@ -16,6 +16,13 @@ Usage:
 
     # Or as module
     python -m backend.services.backtest_worker
+
+Concurrency:
+    BACKTEST_WORKER_LANES lists one worker slot per entry (a process each),
+    naming the job_queue.LANES it claims from. The default "short,any" keeps
+    one slot on backtests so a long ML training job never blocks them, and
+    lets the other take anything. Slots wake on the enqueue NOTIFY and poll
+    every POLL_INTERVAL as a fallback.
 """
 
 import os
@@ -23,6 +30,8 @@ import sys
 import time
 import signal
 import logging
+import threading
+import multiprocessing
 import uuid
 from datetime import datetime
 
@@ -38,15 +47,18 @@ logging.basicConfig(
 logger = logging.getLogger("backtest_worker")
 
 from backend.services.job_queue import (
-    JobType, JobStatus,
-    get_pending_jobs, start_job, complete_job, fail_job,
-    update_job_progress, cleanup_old_jobs
+    JobType, JobStatus, JobListener, LANES,
+    get_pending_jobs, start_job, claim_job, complete_job, fail_job,
+    heartbeat_job, requeue_stale_jobs, update_job_progress, cleanup_old_jobs
 )
 
 
 # Worker configuration
 WORKER_ID = f"worker_{uuid.uuid4().hex[:8]}"
-POLL_INTERVAL = 5  # seconds between polling for jobs
+POLL_INTERVAL = 5  # seconds between polls when no NOTIFY arrives
+HEARTBEAT_INTERVAL = 30    # seconds between heartbeats of a running job
+STALE_CHECK_INTERVAL = 60  # seconds between stale-claim recovery sweeps
+WORKER_LANES = [l.strip() for l in os.getenv('BACKTEST_WORKER_LANES', 'short,any').split(',') if l.strip()]
 BATCH_SIZE = 10    # ML scoring batch size
 MAX_TRADES_PER_BATCH = 50  # Process trades in batches to update progress
 
@@ -455,8 +467,38 @@ def auto_process_trades_batched(job_id: str, trades: list) -> dict:
         return {"error": str(e), "trades_recorded": 0}
 
 
-def process_job(job: dict):
-    """Process a single job based on its type"""
+class JobHeartbeat:
+    """Background heartbeat for a running job (with-statement)."""
+
+    def __init__(self, job_id: str, worker_id: str, interval: float = HEARTBEAT_INTERVAL):
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{job_id}", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if not heartbeat_job(self.job_id, self.worker_id):
+                logger.warning(f"Lost claim on job {self.job_id} (requeued as stale?)")
+                return
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+
+def process_job(job: dict, claimed: bool = False):
+    """
+    Process a single job based on its type.
+
+    claimed: True when the job came from claim_job (already running under
+    WORKER_ID); otherwise it is claimed here with start_job.
+    """
     job_id = job['job_id']
     job_type = job['job_type']
     config = job.get('config', {}) or {}
@@ -464,25 +506,26 @@ def process_job(job: dict):
     logger.info(f"Starting job {job_id} (type: {job_type})")
 
     # Claim the job
-    if not start_job(job_id, WORKER_ID):
+    if not claimed and not start_job(job_id, WORKER_ID):
         logger.warning(f"Could not claim job {job_id} - may be taken by another worker")
         return
 
     try:
-        if job_type == JobType.BACKTEST.value:
-            result = process_backtest_job(job_id, config)
-        elif job_type == JobType.SPX_BACKTEST.value:
-            result = process_spx_backtest_job(job_id, config)
-        elif job_type == JobType.ML_TRAINING.value:
-            result = process_ml_training_job(job_id, config)
-        else:
-            raise ValueError(f"Unknown job type: {job_type}")
-
-        complete_job(job_id, result)
+        with JobHeartbeat(job_id, WORKER_ID):
+            if job_type == JobType.BACKTEST.value:
+                result = process_backtest_job(job_id, config)
+            elif job_type == JobType.SPX_BACKTEST.value:
+                result = process_spx_backtest_job(job_id, config)
+            elif job_type == JobType.ML_TRAINING.value:
+                result = process_ml_training_job(job_id, config)
+            else:
+                raise ValueError(f"Unknown job type: {job_type}")
+
+        complete_job(job_id, result, worker_id=WORKER_ID)
         logger.info(f"Job {job_id} completed successfully")
 
     except Exception as e:
-        fail_job(job_id, str(e))
+        fail_job(job_id, str(e), worker_id=WORKER_ID)
         logger.error(f"Job {job_id} failed: {e}")
 
 
@@ -520,45 +563,109 @@ def process_ml_training_job(job_id: str, config: dict) -> dict:
         raise
 
 
-def run_worker():
-    """Main worker loop"""
-    logger.info(f"Starting backtest worker {WORKER_ID}")
-    logger.info(f"Poll interval: {POLL_INTERVAL}s, Batch size: {BATCH_SIZE}")
+def _close_db_pool():
+    try:
+        from database_adapter import close_pool
+        logger.info("[SHUTDOWN] Closing database connection pool...")
+        close_pool()
+        logger.info("[SHUTDOWN] Database pool closed")
+    except Exception as e:
+        logger.error(f"[SHUTDOWN] Database pool close failed: {e}")
 
-    # Cleanup old jobs on startup
-    cleanup_old_jobs(days=7)
+
+def run_slot(lane: str = "any"):
+    """
+    Claim-and-run loop for one worker slot.
+
+    Claims the next job of the lane atomically (FOR UPDATE SKIP LOCKED), so
+    any number of slots on any number of hosts can run side by side. When
+    the lane is empty it sleeps on the job LISTEN channel, waking as soon as
+    a job is enqueued or after POLL_INTERVAL. Every STALE_CHECK_INTERVAL it
+    also requeues jobs whose worker stopped heartbeating.
+    """
+    job_types = LANES[lane]
+    listener = JobListener()
+    last_stale_check = 0.0
+    logger.info(f"Worker {WORKER_ID} claiming lane '{lane}' ({', '.join(t.value for t in job_types)})")
 
     while not shutdown_requested:
         try:
-            # Get pending jobs
-            jobs = get_pending_jobs(limit=1)
-
-            if jobs:
-                for job in jobs:
-                    if shutdown_requested:
-                        break
-                    process_job(job)
+            if time.time() - last_stale_check >= STALE_CHECK_INTERVAL:
+                requeue_stale_jobs()
+                last_stale_check = time.time()
+
+            job = claim_job(WORKER_ID, job_types)
+            if job:
+                process_job(job, claimed=True)
             else:
-                # No jobs, wait before polling again
-                time.sleep(POLL_INTERVAL)
+                listener.wait(POLL_INTERVAL)
 
         except Exception as e:
             logger.error(f"Worker error: {e}", exc_info=True)
             time.sleep(POLL_INTERVAL)
 
+    listener.close()
+
+
+def _slot_main(worker_id: str, lane: str):
+    """Entry point of a slot process (spawned by run_worker)."""
+    global WORKER_ID
+    WORKER_ID = worker_id
+    run_slot(lane)
+    _close_db_pool()
+    logger.info(f"Worker {WORKER_ID} stopped")
+
+
+def run_worker():
+    """Main worker loop: one slot in-process, or one child process per lane."""
+    logger.info(f"Starting backtest worker {WORKER_ID}")
+    logger.info(f"Lanes: {', '.join(WORKER_LANES)}, Poll interval: {POLL_INTERVAL}s, Batch size: {BATCH_SIZE}")
+
+    unknown = [lane for lane in WORKER_LANES if lane not in LANES]
+    if unknown or not WORKER_LANES:
+        raise SystemExit(f"Unknown BACKTEST_WORKER_LANES entries {unknown}; choose from {sorted(LANES)}")
+
+    # Cleanup old jobs on startup
+    cleanup_old_jobs(days=7)
+
+    if len(WORKER_LANES) == 1:
+        run_slot(WORKER_LANES[0])
+    else:
+        # spawn, not fork: children must not share the parent's pooled DB sockets
+        ctx = multiprocessing.get_context("spawn")
+        slots = {}
+
+        def start(i: int, lane: str):
+            proc = ctx.Process(target=_slot_main, args=(f"{WORKER_ID}_{i}{lane}", lane),
+                               name=f"backtest-slot-{i}-{lane}")
+            proc.start()
+            slots[i] = (lane, proc)
+
+        for i, lane in enumerate(WORKER_LANES):
+            start(i, lane)
+
+        forwarded = False
+        while slots:
+            if shutdown_requested and not forwarded:
+                for lane, proc in slots.values():
+                    proc.terminate()  # SIGTERM: slot finishes its current job and exits
+                forwarded = True
+            for i, (lane, proc) in list(slots.items()):
+                proc.join(timeout=1)
+                if proc.is_alive():
+                    continue
+                del slots[i]
+                if not shutdown_requested:
+                    logger.error(f"Worker slot {i} ({lane}) exited with {proc.exitcode}, restarting")
+                    start(i, lane)
+
     # Graceful shutdown sequence
     logger.info("=" * 60)
     logger.info("GRACEFUL SHUTDOWN SEQUENCE")
     logger.info("=" * 60)
 
     # Close database connection pool
-    try:
-        from database_adapter import close_pool
-        logger.info("[SHUTDOWN] Closing database connection pool...")
-        close_pool()
-        logger.info("[SHUTDOWN] Database pool closed")
-    except Exception as e:
-        logger.error(f"[SHUTDOWN] Database pool close failed: {e}")
+    _close_db_pool()
 
     logger.info("=" * 60)
     logger.info(f"Worker {WORKER_ID} shutdown complete")
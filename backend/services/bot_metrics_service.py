@@ -26,8 +26,13 @@ logger = logging.getLogger(__name__)
 MTM_AVAILABLE = False
 calculate_ic_mark_to_market = None
 calculate_spread_mark_to_market = None
+get_fleet_mark_to_market = None
 try:
-    from trading.mark_to_market import calculate_ic_mark_to_market, calculate_spread_mark_to_market
+    from trading.mark_to_market import (
+        calculate_ic_mark_to_market,
+        calculate_spread_mark_to_market,
+        get_fleet_mark_to_market,
+    )
     MTM_AVAILABLE = True
     logger.info("bot_metrics_service: MTM functions loaded successfully")
 except ImportError as e:
@@ -507,80 +512,19 @@ class BotMetricsService:
 
                 # CRITICAL: Calculate unrealized P&L using mark-to-market (NOT from stale DB column)
                 # The positions table unrealized_pnl column is never updated with live values
+                # All options bots are marked together in one fleet pass (shared across bots
+                # and callers for a few seconds), so this is a dict lookup, not a quote fetch
                 if open_count > 0 and MTM_AVAILABLE:
                     try:
-                        # Iron Condor bots: FORTRESS, SAMSON, ANCHOR
-                        if bot in [BotName.FORTRESS, BotName.SAMSON, BotName.ANCHOR]:
-                            underlying = 'SPY' if bot == BotName.FORTRESS else 'SPX'
-                            cursor.execute(f"""
-                                SELECT position_id, total_credit, contracts, spread_width,
-                                       put_short_strike, put_long_strike, call_short_strike, call_long_strike,
-                                       expiration
-                                FROM {positions_table}
-                                WHERE status = 'open'
-                            """)
-                            open_positions = cursor.fetchall()
-
-                            for pos in open_positions:
-                                pos_id, credit, contracts, spread_w, put_short, put_long, call_short, call_long, exp = pos
-                                if not all([credit, contracts, put_short, put_long, call_short, call_long, exp]):
-                                    continue
-                                try:
-                                    exp_str = str(exp) if not isinstance(exp, str) else exp
-                                    mtm = calculate_ic_mark_to_market(
-                                        underlying=underlying,
-                                        expiration=exp_str,
-                                        put_short_strike=float(put_short),
-                                        put_long_strike=float(put_long),
-                                        call_short_strike=float(call_short),
-                                        call_long_strike=float(call_long),
-                                        contracts=int(contracts),
-                                        entry_credit=float(credit),
-                                        use_cache=True
-                                    )
-                                    if mtm.get('success') and mtm.get('unrealized_pnl') is not None:
-                                        total_unrealized += mtm['unrealized_pnl']
-                                except Exception as pos_err:
-                                    logger.debug(f"MTM failed for {bot.value} position {pos_id}: {pos_err}")
-
-                        # Directional spread bots: SOLOMON, GIDEON
-                        elif bot in [BotName.SOLOMON, BotName.GIDEON]:
-                            cursor.execute(f"""
-                                SELECT position_id, spread_type, entry_debit, contracts,
-                                       long_strike, short_strike, expiration
-                                FROM {positions_table}
-                                WHERE status = 'open'
-                            """)
-                            open_positions = cursor.fetchall()
-
-                            for pos in open_positions:
-                                pos_id, spread_type, debit, contracts, long_strike, short_strike, exp = pos
-                                if not all([debit, contracts, long_strike, short_strike, exp]):
-                                    continue
-                                try:
-                                    exp_str = str(exp) if not isinstance(exp, str) else exp
-                                    mtm = calculate_spread_mark_to_market(
-                                        underlying='SPY',
-                                        expiration=exp_str,
-                                        long_strike=float(long_strike),
-                                        short_strike=float(short_strike),
-                                        spread_type=spread_type or 'call_debit',
-                                        contracts=int(contracts),
-                                        entry_debit=float(debit),
-                                        use_cache=True
-                                    )
-                                    if mtm.get('success') and mtm.get('unrealized_pnl') is not None:
-                                        total_unrealized += mtm['unrealized_pnl']
-                                except Exception as pos_err:
-                                    logger.debug(f"MTM failed for {bot.value} position {pos_id}: {pos_err}")
-
                         # VALOR: Futures bot - unrealized calculated differently
-                        # For now, just log that we need live price to calculate unrealized
-                        elif bot == BotName.VALOR:
+                        # Note: VALOR calculates unrealized P&L directly in its status endpoint
+                        # using live Tastytrade quotes. For unified metrics, we use 0 as placeholder.
+                        if bot == BotName.VALOR:
                             logger.debug(f"VALOR unrealized P&L requires live futures quote - skipping in unified metrics")
-                            # Note: VALOR calculates unrealized P&L directly in its status endpoint
-                            # using live Tastytrade quotes. For unified metrics, we use 0 as placeholder.
-                            pass
+                        else:
+                            bot_mtm = get_fleet_mark_to_market().get(bot.value.lower())
+                            if bot_mtm and bot_mtm['method'] == 'mark_to_market':
+                                total_unrealized += bot_mtm['unrealized_pnl']
 
                     except Exception as mtm_err:
                         logger.warning(f"MTM calculation failed for {bot.value}: {mtm_err}")
@@ -745,70 +689,9 @@ class BotMetricsService:
                 # Calculate unrealized P&L using MTM for open positions
                 if open_count > 0 and MTM_AVAILABLE:
                     try:
-                        # Iron Condor bots: FORTRESS, SAMSON, ANCHOR
-                        if bot in [BotName.FORTRESS, BotName.SAMSON, BotName.ANCHOR]:
-                            underlying = 'SPY' if bot == BotName.FORTRESS else 'SPX'
-                            cursor.execute(f"""
-                                SELECT position_id, total_credit, contracts, spread_width,
-                                       put_short_strike, put_long_strike, call_short_strike, call_long_strike,
-                                       expiration
-                                FROM {positions_table}
-                                WHERE status = 'open'
-                            """)
-                            open_positions = cursor.fetchall()
-
-                            for pos in open_positions:
-                                pos_id, credit, contracts, spread_w, put_short, put_long, call_short, call_long, exp = pos
-                                if not all([credit, contracts, put_short, put_long, call_short, call_long, exp]):
-                                    continue
-                                try:
-                                    exp_str = str(exp) if not isinstance(exp, str) else exp
-                                    mtm = calculate_ic_mark_to_market(
-                                        underlying=underlying,
-                                        expiration=exp_str,
-                                        put_short_strike=float(put_short),
-                                        put_long_strike=float(put_long),
-                                        call_short_strike=float(call_short),
-                                        call_long_strike=float(call_long),
-                                        contracts=int(contracts),
-                                        entry_credit=float(credit),
-                                        use_cache=True
-                                    )
-                                    if mtm.get('success') and mtm.get('unrealized_pnl') is not None:
-                                        unrealized_pnl += mtm['unrealized_pnl']
-                                except Exception as pos_err:
-                                    logger.debug(f"MTM failed for {bot.value} position {pos_id}: {pos_err}")
-
-                        # Directional spread bots: SOLOMON, GIDEON
-                        elif bot in [BotName.SOLOMON, BotName.GIDEON]:
-                            cursor.execute(f"""
-                                SELECT position_id, spread_type, entry_debit, contracts,
-                                       long_strike, short_strike, expiration
-                                FROM {positions_table}
-                                WHERE status = 'open'
-                            """)
-                            open_positions = cursor.fetchall()
-
-                            for pos in open_positions:
-                                pos_id, spread_type, debit, contracts, long_strike, short_strike, exp = pos
-                                if not all([debit, contracts, long_strike, short_strike, exp]):
-                                    continue
-                                try:
-                                    exp_str = str(exp) if not isinstance(exp, str) else exp
-                                    mtm = calculate_spread_mark_to_market(
-                                        underlying='SPY',
-                                        expiration=exp_str,
-                                        long_strike=float(long_strike),
-                                        short_strike=float(short_strike),
-                                        spread_type=spread_type or 'call_debit',
-                                        contracts=int(contracts),
-                                        entry_debit=float(debit),
-                                        use_cache=True
-                                    )
-                                    if mtm.get('success') and mtm.get('unrealized_pnl') is not None:
-                                        unrealized_pnl += mtm['unrealized_pnl']
-                                except Exception as pos_err:
-                                    logger.debug(f"MTM failed for {bot.value} position {pos_id}: {pos_err}")
+                        bot_mtm = get_fleet_mark_to_market().get(bot.value.lower())
+                        if bot_mtm and bot_mtm['method'] == 'mark_to_market':
+                            unrealized_pnl += bot_mtm['unrealized_pnl']
 
                     except Exception as mtm_err:
                         logger.warning(f"MTM calculation failed for {bot.value} equity curve: {mtm_err}")
@@ -224,7 +224,16 @@ class GracefulShutdownManager:
         await self._safeguard_positions()
 
     async def _close_database(self):
-        """Close database connection pool"""
+        """Flush queued log rows, then close database connection pool"""
+        try:
+            from db.write_behind import flush_write_behind
+            logger.info("[CLOSE] Flushing write-behind log queue...")
+            flush_write_behind()
+        except ImportError:
+            logger.debug("[CLOSE] Write-behind queue not available")
+        except Exception as e:
+            logger.error(f"[CLOSE] Write-behind flush failed: {e}")
+
         try:
             from database_adapter import close_pool
             logger.info("[CLOSE] Closing database connection pool...")
@@ -11,17 +11,25 @@ Usage:
     # Check status
     status = get_job_status(job_id)
 
-    # Worker processes jobs
-    process_pending_jobs()
+    # Worker claims the next job in its lane (atomic, safe with many workers)
+    job = claim_job(worker_id, job_types=[JobType.BACKTEST, JobType.SPX_BACKTEST])
+
+Workers claim with FOR UPDATE SKIP LOCKED, so any number of worker
+processes can share the table. enqueue_job sends a NOTIFY on JOB_CHANNEL
+that JobListener turns into an immediate wakeup (workers still poll as a
+fallback). Running jobs heartbeat; requeue_stale_jobs() hands jobs whose
+worker died back to the queue.
 """
 
 import os
 import sys
 import json
+import time
+import select
 import logging
 import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from enum import Enum
 
 # Add project root
@@ -46,8 +54,32 @@ class JobType(str, Enum):
     SPX_BACKTEST = "spx_backtest"
 
 
+# Lower runs first. Short backtests go ahead of ML training.
+DEFAULT_PRIORITY = {
+    JobType.BACKTEST: 10,
+    JobType.SPX_BACKTEST: 20,
+    JobType.ML_TRAINING: 50,
+}
+
+# Worker lanes: the job types a worker slot may claim
+LANES = {
+    "short": [JobType.BACKTEST, JobType.SPX_BACKTEST],
+    "long": [JobType.ML_TRAINING],
+    "any": list(JobType),
+}
+
+JOB_CHANNEL = "background_jobs"
+STALE_AFTER_SECONDS = 180  # Running job with no heartbeat for this long is requeued
+MAX_ATTEMPTS = 3           # Claims before a repeatedly abandoned job is failed
+
+_table_ready = False
+
+
 def ensure_job_table():
     """Create job queue table if it doesn't exist"""
+    global _table_ready
+    if _table_ready:
+        return
     try:
         conn = get_connection()
         cursor = conn.cursor()
@@ -69,17 +101,31 @@ def ensure_job_table():
 
             CREATE INDEX IF NOT EXISTS idx_jobs_status ON background_jobs(status);
             CREATE INDEX IF NOT EXISTS idx_jobs_created ON background_jobs(created_at);
+
+            ALTER TABLE background_jobs ADD COLUMN IF NOT EXISTS config JSONB;
+            ALTER TABLE background_jobs ADD COLUMN IF NOT EXISTS progress_message TEXT;
+            ALTER TABLE background_jobs ADD COLUMN IF NOT EXISTS worker_id VARCHAR(64);
+            ALTER TABLE background_jobs ADD COLUMN IF NOT EXISTS priority INTEGER DEFAULT 100;
+            ALTER TABLE background_jobs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP;
+            ALTER TABLE background_jobs ADD COLUMN IF NOT EXISTS attempts INTEGER DEFAULT 0;
+
+            CREATE INDEX IF NOT EXISTS idx_jobs_pending_priority
+                ON background_jobs(priority, created_at) WHERE status = 'pending';
         ''')
         conn.commit()
         conn.close()
+        _table_ready = True
         logger.info("Job queue table ready")
     except Exception as e:
         logger.error(f"Error creating job table: {e}")
 
 
-def enqueue_job(job_type: JobType, config: Dict[str, Any]) -> str:
+def enqueue_job(job_type: JobType, config: Dict[str, Any], priority: Optional[int] = None) -> str:
     """
-    Add a job to the queue.
+    Add a job to the queue and wake listening workers.
+
+    Args:
+        priority: Lower runs first (default: DEFAULT_PRIORITY for the job type)
 
     Returns:
         job_id: Unique identifier to track the job
@@ -87,14 +133,18 @@ def enqueue_job(job_type: JobType, config: Dict[str, Any]) -> str:
     ensure_job_table()
 
     job_id = f"{job_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    if priority is None:
+        priority = DEFAULT_PRIORITY.get(job_type, 100)
 
     try:
         conn = get_connection()
         cursor = conn.cursor()
         cursor.execute('''
-            INSERT INTO background_jobs (job_id, job_type, status, config)
-            VALUES (%s, %s, %s, %s)
-        ''', (job_id, job_type.value, JobStatus.PENDING.value, json.dumps(config)))
+            INSERT INTO background_jobs (job_id, job_type, status, config, priority)
+            VALUES (%s, %s, %s, %s, %s)
+        ''', (job_id, job_type.value, JobStatus.PENDING.value, json.dumps(config), priority))
+        # Delivered to LISTENers when the insert commits
+        cursor.execute("SELECT pg_notify(%s, %s)", (JOB_CHANNEL, job_type.value))
         conn.commit()
         conn.close()
 
@@ -145,13 +195,13 @@ def get_job_status(job_id: str) -> Optional[Dict[str, Any]]:
 
 
 def update_job_progress(job_id: str, progress: int, message: str = None):
-    """Update job progress (0-100)"""
+    """Update job progress (0-100). Also counts as a heartbeat."""
     try:
         conn = get_connection()
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE background_jobs
-            SET progress = %s, progress_message = %s
+            SET progress = %s, progress_message = %s, heartbeat_at = NOW()
             WHERE job_id = %s
         ''', (progress, message, job_id))
         conn.commit()
@@ -167,7 +217,8 @@ def start_job(job_id: str, worker_id: str):
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE background_jobs
-            SET status = %s, started_at = NOW(), worker_id = %s
+            SET status = %s, started_at = NOW(), heartbeat_at = NOW(), worker_id = %s,
+                attempts = COALESCE(attempts, 0) + 1
             WHERE job_id = %s AND status = %s
         ''', (JobStatus.RUNNING.value, worker_id, job_id, JobStatus.PENDING.value))
         affected = cursor.rowcount
@@ -179,33 +230,40 @@ def start_job(job_id: str, worker_id: str):
         return False
 
 
-def complete_job(job_id: str, result: Dict[str, Any]):
-    """Mark job as completed with results"""
+def complete_job(job_id: str, result: Dict[str, Any], worker_id: Optional[str] = None):
+    """
+    Mark job as completed with results. With worker_id, only if that worker
+    still holds the claim (the job may have been requeued as stale).
+    """
     try:
         conn = get_connection()
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE background_jobs
             SET status = %s, result = %s, completed_at = NOW(), progress = 100
-            WHERE job_id = %s
-        ''', (JobStatus.COMPLETED.value, json.dumps(result), job_id))
+            WHERE job_id = %s AND (%s IS NULL OR worker_id = %s)
+        ''', (JobStatus.COMPLETED.value, json.dumps(result), job_id, worker_id, worker_id))
+        affected = cursor.rowcount
         conn.commit()
         conn.close()
-        logger.info(f"Job {job_id} completed")
+        if affected:
+            logger.info(f"Job {job_id} completed")
+        else:
+            logger.warning(f"Job {job_id} completed but its claim was lost - result discarded")
     except Exception as e:
         logger.error(f"Error completing job: {e}")
 
 
-def fail_job(job_id: str, error: str):
-    """Mark job as failed with error"""
+def fail_job(job_id: str, error: str, worker_id: Optional[str] = None):
+    """Mark job as failed with error (only if worker_id still holds the claim, when given)"""
     try:
         conn = get_connection()
         cursor = conn.cursor()
         cursor.execute('''
             UPDATE background_jobs
             SET status = %s, error = %s, completed_at = NOW()
-            WHERE job_id = %s
-        ''', (JobStatus.FAILED.value, error, job_id))
+            WHERE job_id = %s AND (%s IS NULL OR worker_id = %s)
+        ''', (JobStatus.FAILED.value, error, job_id, worker_id, worker_id))
         conn.commit()
         conn.close()
         logger.error(f"Job {job_id} failed: {error}")
@@ -224,7 +282,7 @@ def get_pending_jobs(job_type: Optional[JobType] = None, limit: int = 10) -> lis
                 SELECT job_id, job_type, config
                 FROM background_jobs
                 WHERE status = %s AND job_type = %s
-                ORDER BY created_at ASC
+                ORDER BY priority ASC NULLS LAST, created_at ASC
                 LIMIT %s
             ''', (JobStatus.PENDING.value, job_type.value, limit))
         else:
@@ -232,7 +290,7 @@ def get_pending_jobs(job_type: Optional[JobType] = None, limit: int = 10) -> lis
                 SELECT job_id, job_type, config
                 FROM background_jobs
                 WHERE status = %s
-                ORDER BY created_at ASC
+                ORDER BY priority ASC NULLS LAST, created_at ASC
                 LIMIT %s
             ''', (JobStatus.PENDING.value, limit))
 
@@ -245,6 +303,173 @@ def get_pending_jobs(job_type: Optional[JobType] = None, limit: int = 10) -> lis
         return []
 
 
+def _job_type_values(job_types: Optional[Iterable]) -> Optional[List[str]]:
+    if job_types is None:
+        return None
+    return [t.value if isinstance(t, JobType) else str(t) for t in job_types]
+
+
+def claim_job(worker_id: str, job_types: Optional[Iterable[JobType]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Atomically claim and start the next pending job.
+
+    The highest-priority (then oldest) pending job of job_types is locked with
+    FOR UPDATE SKIP LOCKED and marked running in one statement, so concurrent
+    workers never claim the same job and never block on each other's rows.
+
+    Returns:
+        {'job_id', 'job_type', 'config'} or None when the lane is empty
+    """
+    ensure_job_table()
+    types = _job_type_values(job_types)
+    try:
+        conn = get_connection()
+        cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        cursor.execute('''
+            UPDATE background_jobs
+            SET status = %s, started_at = NOW(), heartbeat_at = NOW(), worker_id = %s,
+                attempts = COALESCE(attempts, 0) + 1
+            WHERE job_id = (
+                SELECT job_id
+                FROM background_jobs
+                WHERE status = %s AND (%s::text[] IS NULL OR job_type = ANY(%s::text[]))
+                ORDER BY priority ASC NULLS LAST, created_at ASC
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING job_id, job_type, config
+        ''', (JobStatus.RUNNING.value, worker_id, JobStatus.PENDING.value, types, types))
+        row = cursor.fetchone()
+        conn.commit()
+        conn.close()
+        return dict(row) if row else None
+    except Exception as e:
+        logger.error(f"Error claiming job: {e}")
+        return None
+
+
+def heartbeat_job(job_id: str, worker_id: str) -> bool:
+    """Refresh a running job's heartbeat. False when worker_id no longer holds it."""
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            UPDATE background_jobs
+            SET heartbeat_at = NOW()
+            WHERE job_id = %s AND worker_id = %s AND status = %s
+        ''', (job_id, worker_id, JobStatus.RUNNING.value))
+        affected = cursor.rowcount
+        conn.commit()
+        conn.close()
+        return affected > 0
+    except Exception as e:
+        logger.error(f"Error sending heartbeat for {job_id}: {e}")
+        return True  # Transient DB error - keep working, the next beat retries
+
+
+def requeue_stale_jobs(stale_after_seconds: int = STALE_AFTER_SECONDS,
+                       max_attempts: int = MAX_ATTEMPTS) -> int:
+    """
+    Recover jobs whose worker died: running jobs with no heartbeat for
+    stale_after_seconds go back to pending (and wake workers), or fail once
+    they have been claimed max_attempts times. Safe to run from every worker.
+
+    Returns:
+        Number of jobs requeued or failed
+    """
+    try:
+        conn = get_connection()
+        cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        cursor.execute('''
+            UPDATE background_jobs
+            SET status = CASE WHEN COALESCE(attempts, 0) >= %s THEN %s ELSE %s END,
+                error = CASE WHEN COALESCE(attempts, 0) >= %s
+                             THEN 'Abandoned by worker ' || COALESCE(worker_id, '?') || ' after ' || attempts || ' attempts'
+                             ELSE error END,
+                completed_at = CASE WHEN COALESCE(attempts, 0) >= %s THEN NOW() ELSE NULL END,
+                started_at = CASE WHEN COALESCE(attempts, 0) >= %s THEN started_at ELSE NULL END,
+                worker_id = CASE WHEN COALESCE(attempts, 0) >= %s THEN worker_id ELSE NULL END
+            WHERE job_id IN (
+                SELECT job_id
+                FROM background_jobs
+                WHERE status = %s
+                  AND COALESCE(heartbeat_at, started_at, created_at) < NOW() - make_interval(secs => %s)
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING job_id, job_type, status
+        ''', (max_attempts, JobStatus.FAILED.value, JobStatus.PENDING.value,
+              max_attempts, max_attempts, max_attempts, max_attempts,
+              JobStatus.RUNNING.value, stale_after_seconds))
+        rows = cursor.fetchall()
+        for row in rows:
+            if row['status'] == JobStatus.PENDING.value:
+                cursor.execute("SELECT pg_notify(%s, %s)", (JOB_CHANNEL, row['job_type']))
+        conn.commit()
+        conn.close()
+        for row in rows:
+            logger.warning(f"Stale job {row['job_id']} -> {row['status']}")
+        return len(rows)
+    except Exception as e:
+        logger.error(f"Error requeueing stale jobs: {e}")
+        return 0
+
+
+class JobListener:
+    """
+    LISTEN on JOB_CHANNEL over a dedicated connection (LISTEN needs a session
+    of its own, not a pooled connection). wait() returns as soon as a job is
+    enqueued or requeued, or after timeout as the polling fallback. If the
+    connection cannot be opened or drops, wait() degrades to a plain sleep
+    and reconnects on the next call.
+    """
+
+    def __init__(self, database_url: Optional[str] = None, channel: str = JOB_CHANNEL):
+        self.database_url = database_url or os.getenv('DATABASE_URL')
+        self.channel = channel
+        self._conn = None
+
+    def _connect(self) -> bool:
+        if self._conn is not None:
+            return True
+        if not self.database_url:
+            return False
+        try:
+            conn = psycopg2.connect(self.database_url)
+            conn.autocommit = True
+            conn.cursor().execute(f'LISTEN "{self.channel}"')
+            self._conn = conn
+            logger.info(f"Listening for jobs on '{self.channel}'")
+            return True
+        except Exception as e:
+            logger.warning(f"Job LISTEN unavailable, polling only: {e}")
+            return False
+
+    def wait(self, timeout: float) -> List[str]:
+        """Block up to timeout seconds; returns notification payloads (job types)."""
+        if not self._connect():
+            time.sleep(timeout)
+            return []
+        try:
+            if select.select([self._conn], [], [], timeout) == ([], [], []):
+                return []
+            self._conn.poll()
+            payloads = [n.payload for n in self._conn.notifies]
+            self._conn.notifies.clear()
+            return payloads
+        except Exception as e:
+            logger.warning(f"Job listener connection lost: {e}")
+            self.close()
+            return []
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+
 def get_recent_jobs(limit: int = 20) -> list:
     """Get recent jobs for dashboard display"""
     try:
@@ -4,6 +4,7 @@ from dataclasses import replace
 from typing import List
 from trading.helios.models import JoshuaConfig
 from .runner import run_backtest
+from .snapshot_store import SnapshotStore
 from .metrics import summarize, go_no_go
 
 def parse_args(argv=None) -> argparse.Namespace:
@@ -12,7 +13,13 @@ def parse_args(argv=None) -> argparse.Namespace:
     p.add_argument("--end", type=lambda s: dt.date.fromisoformat(s), default=dt.date(2026,5,22))
     p.add_argument("--pts", type=int, nargs="+", default=[20, 30, 50])
     p.add_argument("--sls", type=int, nargs="+", default=[30, 50, 100])
+    p.add_argument("--workers", type=int, default=1,
+                   help="replay trading days on this many processes (1 = sequential)")
     p.add_argument("--out", default="backtest/blaze_gex_0dte/output/results.csv")
+    p.add_argument("--snapshot-cache", default="backtest/blaze_gex_0dte/output/snapshots",
+                   help="per-day chain + GexSnapshot cache shared by every grid cell")
+    p.add_argument("--no-snapshot-cache", action="store_true",
+                   help="rebuild snapshots from the DB for every grid cell")
     return p.parse_args(argv)
 
 def build_grid(pts: List[int], sls: List[int]) -> List[JoshuaConfig]:
@@ -24,9 +31,10 @@ def main(argv=None) -> int:
     args = parse_args(argv)
     db_url = os.environ["DATABASE_URL"]
     os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    store = None if args.no_snapshot_cache else SnapshotStore(args.snapshot_cache)
     rows = []
     for cfg in build_grid(args.pts, args.sls):
-        outcomes = run_backtest(db_url, cfg, args.start, args.end)
+        outcomes = run_backtest(db_url, cfg, args.start, args.end, store=store, workers=args.workers)
         for setup, s in summarize(outcomes).items():
             verdict = go_no_go(s)
             rows.append({
@@ -8,16 +8,17 @@ in reconstruct.py.
 from __future__ import annotations
 import datetime as dt
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Iterable, List, Optional, Tuple
 
-from backtest.intraday_walls.bs import derive_spot_from_parity
+from quant.bs import derive_spot_from_parity
 from backtest.joshua_replay.engine import replay_day, TradeOutcome
 from trading.helios.gex_client import GexSnapshot
 from .loader import DayChain, load_day
 from .reconstruct import _t_years_remaining
 from .providers import make_providers
 from .runner import _minute_of
+from .parallel import run_days
 
 _TRADING_DAYS = 252.0
 
@@ -148,24 +149,71 @@ def replay_daychain_fullboard(day: DayChain, eod: EodGex, config) -> List[TradeO
     return replay_day(snaps, config=config, spot_mark_provider=mark_provider, debit_estimator=debit_estimator)
 
 
-def run_fullboard_backtest(iron_db_url: str, orat_db_url: str, config, start: dt.date, end: dt.date, dte: int = 0) -> List[TradeOutcome]:
+@dataclass
+class FullboardDayJob:
+    """Intraday chain + ORAT full-board GEX per day for parallel.run_days."""
+    iron_db_url: str
+    orat_db_url: str
+    config: object
+    dte: int = 0
+    iron: object = field(default=None, repr=False)
+    orat: object = field(default=None, repr=False)
+
+    def connect(self) -> None:
+        import psycopg2
+        self.iron = psycopg2.connect(self.iron_db_url)
+        self.orat = psycopg2.connect(self.orat_db_url)
+
+    def close(self) -> None:
+        for conn in (self.iron, self.orat):
+            if conn is not None:
+                conn.close()
+        self.iron = self.orat = None
+
+    def load(self, trade_date: dt.date):
+        day = load_day(self.iron, trade_date, dte=self.dte)
+        if day is None:
+            return None
+        eod = load_eod_gex(self.orat, trade_date)
+        if eod is None:
+            return None
+        return day, eod
+
+    def replay(self, loaded) -> List[TradeOutcome]:
+        day, eod = loaded
+        return replay_daychain_fullboard(day, eod, self.config)
+
+
+def _session_dates(conn, start: dt.date, end: dt.date, dte: int) -> List[dt.date]:
+    op = "=" if dte == 0 else ">"
+    cur = conn.cursor()
+    cur.execute(
+        f"SELECT DISTINCT trade_date FROM helios_options_intraday "
+        f"WHERE expiration_date {op} trade_date AND trade_date BETWEEN %s AND %s ORDER BY trade_date",
+        (start, end),
+    )
+    dates = [r[0] for r in cur.fetchall()]
+    cur.close()
+    return dates
+
+
+def run_fullboard_backtest(iron_db_url: str, orat_db_url: str, config, start: dt.date, end: dt.date, dte: int = 0,
+                           workers: int = 1) -> List[TradeOutcome]:
     """Cross-DB: intraday chain (dte=0 same-day / dte=1 next-day) from IronForge
-    + full-board EOD GEX from ORAT."""
+    + full-board EOD GEX from ORAT. workers > 1 replays days on a process pool."""
     import psycopg2
-    op = "=" if dte == 0 else ">"
     iron = psycopg2.connect(iron_db_url)
+    if workers > 1:
+        try:
+            dates = _session_dates(iron, start, end, dte)
+        finally:
+            iron.close()
+        return run_days(FullboardDayJob(iron_db_url, orat_db_url, config, dte), dates, workers)
+
     orat = psycopg2.connect(orat_db_url)
     out: List[TradeOutcome] = []
     try:
-        cur = iron.cursor()
-        cur.execute(
-            f"SELECT DISTINCT trade_date FROM helios_options_intraday "
-            f"WHERE expiration_date {op} trade_date AND trade_date BETWEEN %s AND %s ORDER BY trade_date",
-            (start, end),
-        )
-        dates = [r[0] for r in cur.fetchall()]
-        cur.close()
-        for d in dates:
+        for d in _session_dates(iron, start, end, dte):
             day = load_day(iron, d, dte=dte)
             if day is None:
                 continue
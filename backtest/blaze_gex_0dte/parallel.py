@@ -0,0 +1,101 @@
+"""Day-parallel execution for the 0DTE backtests.
+
+Trading days replay independently, so a date range is split into small
+chunks and fanned out over a process pool. Each worker opens its own DB
+connections once (DayJob.connect) and walks its chunk with the next day's
+load running on a background thread while the current day replays. At most
+2 chunks per worker are in flight, and outcomes are merged back in date order
+so results are identical to a sequential run.
+"""
+from __future__ import annotations
+import datetime as dt
+import logging
+import multiprocessing.util
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Protocol, Sequence, Tuple, TypeVar
+
+from backtest.joshua_replay.engine import TradeOutcome
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CHUNK_DAYS = 5
+IN_FLIGHT_PER_WORKER = 2
+
+
+class DayJob(Protocol):
+    """Picklable per-day work: connect() runs once per worker, then load/replay per day."""
+    def connect(self) -> None: ...
+    def close(self) -> None: ...
+    def load(self, trade_date: dt.date) -> Any: ...
+    def replay(self, loaded: Any) -> List[TradeOutcome]: ...
+
+
+def prefetched(items: Iterable[T], load: Callable[[T], R]) -> Iterator[Tuple[T, R]]:
+    """Yield (item, load(item)) with the next item's load already running."""
+    items = list(items)
+    if not items:
+        return
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(load, items[0])
+        for i, item in enumerate(items):
+            loaded = pending.result()
+            if i + 1 < len(items):
+                pending = pool.submit(load, items[i + 1])
+            yield item, loaded
+
+
+def run_chunk(job: DayJob, dates: Sequence[dt.date]) -> List[Tuple[dt.date, List[TradeOutcome]]]:
+    """Replay consecutive days on an already-connected job."""
+    out = []
+    for d, loaded in prefetched(dates, job.load):
+        out.append((d, job.replay(loaded) if loaded is not None else []))
+    return out
+
+
+# Worker-process state: the job and its connections live for the pool's lifetime.
+_worker_job: DayJob = None
+
+
+def _init_worker(job: DayJob) -> None:
+    global _worker_job
+    job.connect()
+    multiprocessing.util.Finalize(None, job.close, exitpriority=10)
+    _worker_job = job
+
+
+def _run_worker_chunk(dates: Sequence[dt.date]):
+    return run_chunk(_worker_job, dates)
+
+
+def run_days(job: DayJob, dates: Sequence[dt.date], workers: int,
+             chunk_days: int = DEFAULT_CHUNK_DAYS) -> List[TradeOutcome]:
+    """Replay every date on a pool of `workers` processes; outcomes in date order."""
+    dates = sorted(dates)
+    if not dates:
+        return []
+    chunks = [dates[i:i + chunk_days] for i in range(0, len(dates), chunk_days)]
+    by_date: Dict[dt.date, List[TradeOutcome]] = {}
+    max_in_flight = workers * IN_FLIGHT_PER_WORKER
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(job,)) as pool:
+        queued = iter(chunks)
+        in_flight = set()
+        while True:
+            for chunk in queued:
+                in_flight.add(pool.submit(_run_worker_chunk, chunk))
+                if len(in_flight) >= max_in_flight:
+                    break
+            if not in_flight:
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                by_date.update(fut.result())
+            logger.debug("day-parallel: %d/%d days done", len(by_date), len(dates))
+
+    out: List[TradeOutcome] = []
+    for d in dates:
+        out.extend(by_date.get(d, []))
+    return out
@@ -5,7 +5,9 @@ import math
 from typing import List, Optional
 from zoneinfo import ZoneInfo
 
-from backtest.intraday_walls.bs import bs_gamma, implied_vol, derive_spot_from_parity
+import numpy as np
+
+from quant.bs import bs_gamma_array, implied_vol_array, derive_spot_from_parity
 from trading.helios.gex_client import GexSnapshot
 from .loader import DayChain
 
@@ -24,14 +26,30 @@ def _t_years_remaining(trade_date: dt.date, minute: int, first_bar_et_hour=9, fi
     secs = max((close_et - now_et).total_seconds(), 60.0)
     return secs / (365.0 * 24.0 * 3600.0)
 
+def snapshot_time(trade_date: dt.date, minute: int) -> dt.datetime:
+    """snapshot_at for a loader bar-minute (see the encoding note in build_snapshots)."""
+    return dt.datetime(trade_date.year, trade_date.month, trade_date.day,
+                       13, 30, tzinfo=dt.timezone.utc) + dt.timedelta(minutes=minute)
+
 def _atm_strike(chain_keys, spot: float) -> Optional[float]:
     strikes = sorted({k for (k, _r) in chain_keys})
     if not strikes:
         return None
     return min(strikes, key=lambda k: abs(k - spot))
 
+def _argmax_strike(strikes: np.ndarray, gamma: np.ndarray, side: np.ndarray, default: float) -> float:
+    if not side.any():
+        return default
+    g = np.where(side, gamma, -np.inf)
+    # Last index of the max -> highest strike on ties.
+    return float(strikes[len(g) - 1 - int(np.argmax(g[::-1]))])
+
 def build_snapshots(day: DayChain) -> List[GexSnapshot]:
     out: List[GexSnapshot] = []
+    # Pass 1: per-minute spot/T from parity, and every (strike, right) with a
+    # usable mid and OI, stacked so the whole day is IV-solved in one call.
+    minutes = []  # (minute, t, spot, atm_k, row_start, row_end)
+    ks, calls, mids, ois, spots, ts = [], [], [], [], [], []
     for minute in day.minutes():
         chain = day.bars[minute]
         t = _t_years_remaining(day.trade_date, minute)
@@ -48,38 +66,58 @@ def build_snapshots(day: DayChain) -> List[GexSnapshot]:
         spot = derive_spot_from_parity(cm, pm, atm_k, t)
         if spot <= 0:
             continue
-        by_strike = {}
-        atm_iv = None
-        for (k, r), q in chain.items():
+        start = len(ks)
+        for (k, r) in chain:
             mid = day.mid(minute, k, r)
             if mid is None:
                 continue
             oi = day.oi.get((k, r), 0)
             if oi <= 0:
                 continue
-            iv = implied_vol(mid, spot, k, t, r == "C")
-            if iv is None:
-                continue
-            if k == atm_k and r == "C":
-                atm_iv = iv
-            dg = bs_gamma(spot, k, t, iv) * oi * 100.0 * spot * spot * 0.01
-            d = by_strike.setdefault(k, {"C": 0.0, "P": 0.0})
-            d["C" if r == "C" else "P"] += dg
-        if not by_strike or atm_iv is None:
+            ks.append(k)
+            calls.append(r == "C")
+            mids.append(mid)
+            ois.append(oi)
+            spots.append(spot)
+            ts.append(t)
+        if len(ks) > start:
+            minutes.append((minute, t, spot, atm_k, start, len(ks)))
+    if not minutes:
+        return out
+
+    ks_all = np.array(ks, dtype=float)
+    calls_all = np.array(calls, dtype=bool)
+    spots_all = np.array(spots, dtype=float)
+    ts_all = np.array(ts, dtype=float)
+    ivs_all = implied_vol_array(mids, spots_all, ks_all, ts_all, calls_all)
+    ok_all = ~np.isnan(ivs_all)
+    dg_all = (bs_gamma_array(spots_all, ks_all, ts_all, np.where(ok_all, ivs_all, 0.0))
+              * np.array(ois, dtype=float) * 100.0 * spots_all * spots_all * 0.01)
+
+    # Pass 2: per-minute aggregation over that minute's slice.
+    for minute, t, spot, atm_k, lo, hi in minutes:
+        ks, calls, ivs, ok = ks_all[lo:hi], calls_all[lo:hi], ivs_all[lo:hi], ok_all[lo:hi]
+        atm = ok & calls & (ks == atm_k)
+        if not atm.any():
             continue
-        call_above = [(v["C"], k) for k, v in by_strike.items() if k >= spot and v["C"] > 0]
-        put_below = [(v["P"], k) for k, v in by_strike.items() if k <= spot and v["P"] > 0]
-        call_wall = max(call_above)[1] if call_above else spot
-        put_wall = max(put_below)[1] if put_below else spot
-        net_gex = sum(v["C"] - v["P"] for v in by_strike.values())
+        atm_iv = float(ivs[atm][0])
+        ks, calls, dg = ks[ok], calls[ok], dg_all[lo:hi][ok]
+        strikes, inv = np.unique(ks, return_inverse=True)
+        cg = np.bincount(inv, weights=np.where(calls, dg, 0.0), minlength=len(strikes))
+        pg = np.bincount(inv, weights=np.where(calls, 0.0, dg), minlength=len(strikes))
+        # Walls: largest gamma on each side of spot; ties go to the higher
+        # strike (matches max() over (gamma, strike) tuples).
+        call_side = (strikes >= spot) & (cg > 0)
+        put_side = (strikes <= spot) & (pg > 0)
+        call_wall = _argmax_strike(strikes, cg, call_side, spot)
+        put_wall = _argmax_strike(strikes, pg, put_side, spot)
+        net = cg - pg
+        net_gex = float(net.sum())
         flip = spot
-        cum = 0.0
-        for k in sorted(by_strike):
-            nxt = cum + (by_strike[k]["C"] - by_strike[k]["P"])
-            if cum <= 0 < nxt or cum >= 0 > nxt:
-                flip = k
-                break
-            cum = nxt
+        cum = np.concatenate(([0.0], np.cumsum(net)))
+        crossed = ((cum[:-1] <= 0) & (cum[1:] > 0)) | ((cum[:-1] >= 0) & (cum[1:] < 0))
+        if crossed.any():
+            flip = float(strikes[int(np.argmax(crossed))])
         sigma_1d = spot * atm_iv * math.sqrt(1.0 / _TRADING_DAYS)
         # Encode snapshot_at in the replay engine's FIXED UTC-5h minute
         # convention so engine._minutes_since_open_ct() recovers exactly the
@@ -87,8 +125,7 @@ def build_snapshots(day: DayChain) -> List[GexSnapshot]:
         # A real ET->UTC encode would drift +60 min in winter (engine uses a
         # fixed -5h, not DST-aware), mis-mapping the PT/SL mark lookups.
         # 13:30 UTC - 5h = 08:30 -> minute 0; +minute thereafter.
-        snap_at = dt.datetime(day.trade_date.year, day.trade_date.month, day.trade_date.day,
-                              13, 30, tzinfo=dt.timezone.utc) + dt.timedelta(minutes=minute)
+        snap_at = snapshot_time(day.trade_date, minute)
         out.append(GexSnapshot(
             symbol="SPY", spot=spot, net_gex=net_gex, flip_point=flip,
             call_wall=call_wall, put_wall=put_wall, vix=0.0,
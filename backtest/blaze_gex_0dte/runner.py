@@ -1,21 +1,24 @@
 """Drive one 0DTE DayChain through the real setups via replay_day."""
 from __future__ import annotations
 import datetime as dt
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 from backtest.joshua_replay.engine import replay_day, TradeOutcome
 from trading.helios.models import JoshuaConfig
 from .loader import DayChain, load_day
 from .reconstruct import build_snapshots
 from .providers import make_providers
+from .snapshot_store import SnapshotStore, day_versions
+from .parallel import run_days
 
 def _minute_of(snapshot) -> int:
     ct = snapshot.snapshot_at - dt.timedelta(hours=5)
     open_t = ct.replace(hour=9, minute=30, second=0, microsecond=0)
     return int((ct - open_t).total_seconds() // 60)
 
-def replay_daychain(day: DayChain, config: JoshuaConfig) -> List[TradeOutcome]:
-    snaps = build_snapshots(day)
+def replay_daychain(day: DayChain, config: JoshuaConfig, snapshots=None) -> List[TradeOutcome]:
+    snaps = build_snapshots(day) if snapshots is None else snapshots
     if not snaps:
         return []
     _debit_min0, mark_provider = make_providers(day)
@@ -35,20 +38,72 @@ def replay_daychain(day: DayChain, config: JoshuaConfig) -> List[TradeOutcome]:
         debit_estimator=debit_estimator,
     )
 
-def run_backtest(db_url: str, config: JoshuaConfig, start: dt.date, end: dt.date) -> List[TradeOutcome]:
+def _session_dates(conn, start: dt.date, end: dt.date) -> List[dt.date]:
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT DISTINCT trade_date FROM helios_options_intraday "
+        "WHERE expiration_date = trade_date AND trade_date BETWEEN %s AND %s ORDER BY trade_date",
+        (start, end),
+    )
+    dates = [r[0] for r in cur.fetchall()]
+    cur.close()
+    return dates
+
+@dataclass
+class ZeroDteDayJob:
+    """One 0DTE session per day for parallel.run_days (own connection per worker)."""
+    db_url: str
+    config: JoshuaConfig
+    store: Optional[SnapshotStore] = None
+    versions: Dict[dt.date, str] = field(default_factory=dict)
+    conn: object = field(default=None, repr=False)
+
+    def connect(self) -> None:
+        import psycopg2
+        self.conn = psycopg2.connect(self.db_url)
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def load(self, trade_date: dt.date):
+        if self.store is not None:
+            return self.store.get_or_build(trade_date, 0, self.versions[trade_date],
+                                           lambda: load_day(self.conn, trade_date))
+        return load_day(self.conn, trade_date)
+
+    def replay(self, loaded) -> List[TradeOutcome]:
+        if isinstance(loaded, DayChain):
+            return replay_daychain(loaded, self.config)
+        return replay_daychain(loaded.day, self.config, snapshots=loaded.snapshots)
+
+def run_backtest(db_url: str, config: JoshuaConfig, start: dt.date, end: dt.date,
+                 store: Optional[SnapshotStore] = None, workers: int = 1) -> List[TradeOutcome]:
+    """Replay every 0DTE session in [start, end]. With a store, each day's chain and
+    snapshots are reconstructed once and reused by every later config; workers > 1
+    fans the days out over a process pool (same outcomes, same order)."""
     import psycopg2
     conn = psycopg2.connect(db_url)
+    if workers > 1:
+        try:
+            versions = day_versions(conn, start, end) if store is not None else {}
+            dates = list(versions) if store is not None else _session_dates(conn, start, end)
+        finally:
+            conn.close()
+        job = ZeroDteDayJob(db_url=db_url, config=config, store=store, versions=versions)
+        return run_days(job, dates, workers)
+
     all_out: List[TradeOutcome] = []
     try:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT DISTINCT trade_date FROM helios_options_intraday "
-            "WHERE expiration_date = trade_date AND trade_date BETWEEN %s AND %s ORDER BY trade_date",
-            (start, end),
-        )
-        dates = [r[0] for r in cur.fetchall()]
-        cur.close()
-        for d in dates:
+        if store is not None:
+            for d, version in day_versions(conn, start, end).items():
+                cached = store.get_or_build(d, 0, version, lambda: load_day(conn, d))
+                if cached is None:
+                    continue
+                all_out.extend(replay_daychain(cached.day, config, snapshots=cached.snapshots))
+            return all_out
+        for d in _session_dates(conn, start, end):
             day = load_day(conn, d)
             if day is None:
                 continue
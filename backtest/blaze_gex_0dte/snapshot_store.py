@@ -0,0 +1,180 @@
+"""On-disk per-day cache of the 0DTE chain + reconstructed GexSnapshots.
+
+build_snapshots() IV-solves every contract at every minute, but its output
+depends only on the day's bars/OI, never on PT/SL. Each (trade_date, dte) is
+reconstructed once and written as flat .npy tables under a content address:
+
+    <root>/<key[:2]>/<key>/{meta.json, bars.npy, oi.npy, snaps.npy}
+
+key = sha256(trade_date, dte, data version, SNAPSHOT_FORMAT). The data
+version is a cheap per-day aggregate of the source tables (see
+day_versions), so corrected or re-ingested bars get a fresh entry instead of
+a stale hit. Every grid cell memory-maps the tables and rebuilds the
+DayChain/snapshots from them without touching the IV solver.
+"""
+from __future__ import annotations
+import datetime as dt
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from trading.helios.gex_client import GexSnapshot
+from .loader import DayChain
+from .reconstruct import build_snapshots, regime_for_net_gex, snapshot_time
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever build_snapshots or the table layout changes.
+SNAPSHOT_FORMAT = 1
+
+_BARS_DTYPE = np.dtype([("minute", "<i4"), ("strike", "<f8"), ("right", "U1"),
+                        ("bid", "<f8"), ("ask", "<f8")])
+_OI_DTYPE = np.dtype([("strike", "<f8"), ("right", "U1"), ("oi", "<i8")])
+_SNAPS_DTYPE = np.dtype([("minute", "<i4"), ("spot", "<f8"), ("net_gex", "<f8"),
+                         ("flip_point", "<f8"), ("call_wall", "<f8"), ("put_wall", "<f8"),
+                         ("sigma_1d_band_width", "<f8")])
+
+
+@dataclass
+class CachedDay:
+    day: DayChain
+    snapshots: List[GexSnapshot]
+
+
+def day_versions(conn, start: dt.date, end: dt.date, dte: int = 0) -> Dict[dt.date, str]:
+    """Data version per trade_date in [start, end] from one aggregate pass per table."""
+    op = "=" if dte == 0 else ">"
+    cur = conn.cursor()
+    cur.execute(
+        f"SELECT trade_date, COUNT(*), MIN(bar_time), MAX(bar_time), SUM(COALESCE(bid, 0) + COALESCE(ask, 0)) "
+        f"FROM helios_options_intraday "
+        f"WHERE expiration_date {op} trade_date AND trade_date BETWEEN %s AND %s "
+        f"GROUP BY trade_date ORDER BY trade_date",
+        (start, end),
+    )
+    bars = cur.fetchall()
+    cur.execute(
+        f"SELECT trade_date, COUNT(*), SUM(open_interest) FROM helios_options_oi "
+        f"WHERE expiration_date {op} trade_date AND trade_date BETWEEN %s AND %s "
+        f"GROUP BY trade_date",
+        (start, end),
+    )
+    oi = {d: f"{n}:{total}" for d, n, total in cur.fetchall()}
+    cur.close()
+    return {d: f"{n}:{t0}:{t1}:{quote_sum}|{oi.get(d, '0:0')}" for d, n, t0, t1, quote_sum in bars}
+
+
+def _day_to_tables(day: DayChain):
+    rows = [(m, k, r, np.nan if q[0] is None else q[0], np.nan if q[1] is None else q[1])
+            for m, chain in day.bars.items() for (k, r), q in chain.items()]
+    bars = np.array(rows, dtype=_BARS_DTYPE)
+    oi = np.array([(k, r, o) for (k, r), o in day.oi.items()], dtype=_OI_DTYPE)
+    return bars, oi
+
+
+def _snaps_to_table(trade_date: dt.date, snaps: List[GexSnapshot]) -> np.ndarray:
+    base = snapshot_time(trade_date, 0)
+    return np.array([
+        (int((s.snapshot_at - base).total_seconds() // 60), s.spot, s.net_gex, s.flip_point,
+         s.call_wall, s.put_wall, s.sigma_1d_band_width)
+        for s in snaps
+    ], dtype=_SNAPS_DTYPE)
+
+
+def _tables_to_day(trade_date: dt.date, bars: np.ndarray, oi: np.ndarray) -> DayChain:
+    day = DayChain(trade_date=trade_date,
+                   oi={(float(k), str(r)): int(o) for k, r, o in oi.tolist()})
+    for m, k, r, b, a in bars.tolist():
+        day.bars.setdefault(m, {})[(k, r)] = (None if b != b else b, None if a != a else a)
+    return day
+
+
+def _table_to_snaps(trade_date: dt.date, snaps: np.ndarray) -> List[GexSnapshot]:
+    return [
+        GexSnapshot(
+            symbol="SPY", spot=spot, net_gex=net_gex, flip_point=flip,
+            call_wall=call_wall, put_wall=put_wall, vix=0.0,
+            regime=regime_for_net_gex(net_gex),
+            sigma_1d_band_width=sigma, snapshot_at=snapshot_time(trade_date, m),
+        )
+        for m, spot, net_gex, flip, call_wall, put_wall, sigma in snaps.tolist()
+    ]
+
+
+class SnapshotStore:
+    """Content-addressed (trade_date, dte, data version) -> CachedDay on disk."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.hits = 0
+        self.builds = 0
+
+    @staticmethod
+    def key(trade_date: dt.date, dte: int, version: str) -> str:
+        payload = json.dumps([trade_date.isoformat(), dte, version, SNAPSHOT_FORMAT])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path(self, trade_date: dt.date, dte: int, version: str) -> str:
+        key = self.key(trade_date, dte, version)
+        return os.path.join(self.root, key[:2], key)
+
+    def get(self, trade_date: dt.date, dte: int, version: str) -> Optional[CachedDay]:
+        """Cached day, or None when the entry is missing or records an empty session."""
+        path = self.path(trade_date, dte, version)
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        if meta.get("empty"):
+            return None
+        load = lambda name: np.load(os.path.join(path, name), mmap_mode="r")
+        return CachedDay(
+            day=_tables_to_day(trade_date, load("bars.npy"), load("oi.npy")),
+            snapshots=_table_to_snaps(trade_date, load("snaps.npy")),
+        )
+
+    def contains(self, trade_date: dt.date, dte: int, version: str) -> bool:
+        return os.path.exists(os.path.join(self.path(trade_date, dte, version), "meta.json"))
+
+    def put(self, trade_date: dt.date, dte: int, version: str, day: Optional[DayChain],
+            snapshots: Optional[List[GexSnapshot]] = None) -> None:
+        """Write an entry atomically; a concurrent writer of the same key wins harmlessly."""
+        final = self.path(trade_date, dte, version)
+        os.makedirs(os.path.dirname(final), exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=os.path.dirname(final))
+        try:
+            meta = {"trade_date": trade_date.isoformat(), "dte": dte, "version": version,
+                    "format": SNAPSHOT_FORMAT, "empty": day is None}
+            if day is not None:
+                bars, oi = _day_to_tables(day)
+                np.save(os.path.join(tmp, "bars.npy"), bars)
+                np.save(os.path.join(tmp, "oi.npy"), oi)
+                np.save(os.path.join(tmp, "snaps.npy"), _snaps_to_table(trade_date, snapshots or []))
+            with open(os.path.join(tmp, "meta.json"), "w") as f:
+                json.dump(meta, f)
+            try:
+                os.rename(tmp, final)
+            except OSError:
+                if not os.path.exists(os.path.join(final, "meta.json")):
+                    raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def get_or_build(self, trade_date: dt.date, dte: int, version: str,
+                     load: Callable[[], Optional[DayChain]]) -> Optional[CachedDay]:
+        """Cached day, reconstructing it via load() + build_snapshots() on a miss."""
+        if self.contains(trade_date, dte, version):
+            self.hits += 1
+            return self.get(trade_date, dte, version)
+        day = load()
+        snaps = build_snapshots(day) if day is not None else None
+        self.put(trade_date, dte, version, day, snaps)
+        self.builds += 1
+        logger.debug("snapshot store: built %s dte=%d (%d snapshots)",
+                     trade_date, dte, len(snaps or []))
+        return None if day is None else CachedDay(day=day, snapshots=snaps)
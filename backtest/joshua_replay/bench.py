@@ -0,0 +1,70 @@
+"""Benchmark replay_day on a synthetic 390-minute session.
+
+Usage:
+    python -m backtest.joshua_replay.bench [--days 20] [--repeat 3]
+
+Every minute sits on the call wall in a HIGH_POSITIVE regime so wall_fade
+keeps firing (3 per day at the default cap, more with --cap), which is the
+case where mark construction used to re-walk the whole day per fire.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import statistics
+import time
+from dataclasses import replace
+from typing import List
+
+import numpy as np
+
+from backtest.joshua_replay.engine import replay_day
+from trading.helios.gex_client import GexSnapshot
+from trading.helios.models import JoshuaConfig
+
+SESSION_MINUTES = 390
+
+
+def synthetic_day(seed: int = 0, minutes: int = SESSION_MINUTES) -> List[GexSnapshot]:
+    """One snapshot per minute from the 9:30 ET open, random-walk spot near the call wall."""
+    rng = np.random.default_rng(seed)
+    base = dt.datetime(2026, 5, 1, 13, 30, tzinfo=dt.timezone.utc)
+    spots = 500.0 + np.cumsum(rng.normal(0.0, 0.05, size=minutes))
+    return [
+        GexSnapshot(
+            symbol="SPY", spot=float(spot), net_gex=2.0e9, flip_point=495.0,
+            call_wall=500.5, put_wall=490.0, vix=18.0, regime="HIGH_POSITIVE",
+            sigma_1d_band_width=5.0, snapshot_at=base + dt.timedelta(minutes=i),
+        )
+        for i, spot in enumerate(spots)
+    ]
+
+
+def _mark_provider(*, snapshot, action, minute, entry_minute, debit) -> float:
+    move = snapshot.spot - 500.0
+    return max(0.0, debit * (1.0 + (move if action.direction == "call" else -move) * 0.25))
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="Time replay_day on synthetic 390-minute days.")
+    p.add_argument("--days", type=int, default=20)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--cap", type=int, default=50, help="max_trades_per_setup_per_day")
+    args = p.parse_args(argv)
+
+    config = replace(JoshuaConfig(), max_trades_per_setup_per_day=args.cap)
+    days = [synthetic_day(seed) for seed in range(args.days)]
+    timings, trades = [], 0
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        trades = sum(len(replay_day(snaps, config=config, spot_mark_provider=_mark_provider)) for snaps in days)
+        timings.append(time.perf_counter() - t0)
+
+    per_day_ms = statistics.median(timings) / len(days) * 1000.0
+    print(f"replay_day: {len(days)} x {SESSION_MINUTES}-minute days, {trades} trades, "
+          f"median {per_day_ms:.2f} ms/day over {args.repeat} runs")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,12 +9,14 @@ import datetime as dt
 from dataclasses import dataclass
 from typing import Callable, List, Optional
 
+import numpy as np
+
 from trading.helios.gex_client import GexSnapshot
 from trading.helios.models import DailyState, JoshuaConfig, SetupType
 from trading.helios.setups.base import SetupAction
 from trading.helios.setups.flip_cross import FlipBuffer
 from trading.helios.signals import dispatch
-from quant.sim import simulate_intraday, MarkSeries
+from quant.sim import simulate_intraday, MarkArray
 
 
 @dataclass(frozen=True)
@@ -50,10 +52,11 @@ def replay_day(
     eod_minute = (eod_h - 8) * 60 + (eod_m - 30)
 
     last_exit_minute = -1  # enforce "one open position at a time" (mirrors trader.run_cycle)
+    minutes = _DayMinutes(snapshots, eod_minute)
 
-    for snap in snapshots:
+    for i, snap in enumerate(snapshots):
         buffer.add(snap)
-        entry_minute = _minutes_since_open_ct(snap.snapshot_at)
+        entry_minute = int(minutes.minute[i])
         if entry_minute < 0:
             continue
         if entry_minute >= eod_minute:
@@ -69,20 +72,17 @@ def replay_day(
         if debit <= 0:
             continue
 
-        marks = {}
-        for future_snap in snapshots:
-            m = _minutes_since_open_ct(future_snap.snapshot_at)
-            if m < entry_minute:
-                continue
-            if m > eod_minute:
-                break
-            marks[m] = spot_mark_provider(
-                snapshot=future_snap, action=action, minute=m, entry_minute=entry_minute, debit=debit,
+        positions = minutes.mark_positions(entry_minute)
+        values = np.full(int(minutes.minute[positions].max(initial=entry_minute)) - entry_minute + 1, np.nan)
+        for p in positions.tolist():
+            m = int(minutes.minute[p])
+            values[m - entry_minute] = spot_mark_provider(
+                snapshot=snapshots[p], action=action, minute=m, entry_minute=entry_minute, debit=debit,
             )
-        if entry_minute not in marks:
-            marks[entry_minute] = debit
+        if np.isnan(values[0]):
+            values[0] = debit
 
-        ms = MarkSeries(marks)
+        ms = MarkArray(entry_minute, values)
         sim = simulate_intraday(
             debit=debit,
             entry_minute=entry_minute,
@@ -107,6 +107,36 @@ def replay_day(
     return outcomes
 
 
+class _DayMinutes:
+    """
+    Per-day minute index over the snapshot list, built once so each fire
+    slices its mark inputs instead of re-walking the whole day.
+
+    Mark inputs for an entry are the snapshots before the first one past
+    eod_minute with minute >= entry_minute; a later snapshot in the same
+    minute replaces an earlier one.
+    """
+
+    def __init__(self, snapshots: List[GexSnapshot], eod_minute: int):
+        self.minute = np.fromiter((_minutes_since_open_ct(s.snapshot_at) for s in snapshots),
+                                  dtype=np.int64, count=len(snapshots))
+        past_eod = np.nonzero(self.minute > eod_minute)[0]
+        cutoff = int(past_eod[0]) if len(past_eod) else len(snapshots)
+        window = self.minute[:cutoff]
+        # Last snapshot of each minute inside the window
+        _, rev_first = np.unique(window[::-1], return_index=True)
+        keep = np.sort(cutoff - 1 - rev_first)
+        self._keep = keep
+        self._keep_minute = window[keep]
+        self._sorted = bool(np.all(np.diff(window) >= 0))
+
+    def mark_positions(self, entry_minute: int) -> np.ndarray:
+        """Snapshot positions feeding the marks of an entry at entry_minute."""
+        if self._sorted:
+            return self._keep[np.searchsorted(self._keep_minute, entry_minute, side='left'):]
+        return self._keep[self._keep_minute >= entry_minute]
+
+
 def _minutes_since_open_ct(ts: dt.datetime) -> int:
     ct = ts - dt.timedelta(hours=5)
     open_t = ct.replace(hour=8, minute=30, second=0, microsecond=0)
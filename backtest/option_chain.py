@@ -0,0 +1,162 @@
+"""
+Option Chain Arrays
+===================
+
+Column arrays over one trading day's options chain, sorted by (dte, strike),
+for the spread / condor finders in zero_dte_hybrid_fixed.py. Built either
+from the List[Dict] rows of get_options_for_date or straight from the ORAT
+EOD cache columns (orat_eod_cache.py), which are already in that order.
+
+A DTE is a contiguous slice, strike bounds are binary searches, and "closest
+strike" is a masked argmin. Tie-breaking follows the list-based finders
+exactly: among equally close strikes the row that came first in the input
+list wins, and DTE selection iterates the same set() of DTEs.
+
+Author: AlphaGEX Team
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+QUOTE_COLUMNS = ('underlying_price', 'put_bid', 'put_ask', 'call_bid', 'call_ask')
+CHAIN_COLUMNS = ('dte', 'strike') + QUOTE_COLUMNS
+
+
+class OptionChain:
+    """Sorted column view of a day's option rows."""
+
+    def __init__(self, columns: Dict[str, np.ndarray], order: Optional[np.ndarray] = None):
+        """
+        columns: CHAIN_COLUMNS arrays (NaN for missing quotes), any row order.
+        order: column row behind each entry of the finders' options list
+        (options[j] came from row order[j]); identity when omitted.
+        """
+        dte = np.asarray(columns['dte']).astype(np.int64)
+        strike = np.asarray(columns['strike'], dtype=float)
+        if order is None:
+            order = np.arange(len(dte))
+        positions = np.empty_like(order)
+        positions[order] = np.arange(len(order))
+        # Same iteration order as list(set(o['dte'] for o in options)) in the finders
+        self.available_dtes = list(set(dte[order].tolist()))
+
+        by_strike = np.lexsort((strike, dte))
+        self.pos = positions[by_strike]
+        self.dte = dte[by_strike]
+        self.strike = strike[by_strike]
+        for col in QUOTE_COLUMNS:
+            setattr(self, col, np.asarray(columns[col], dtype=float)[by_strike])
+
+        self._masks: Dict[Tuple[str, float], np.ndarray] = {}
+        self._slices: Dict[int, slice] = {}
+
+    @classmethod
+    def from_rows(cls, options: List[Dict]) -> 'OptionChain':
+        """Build from get_options_for_date rows (None -> NaN)."""
+        return cls({c: np.array([o.get(c) for o in options], dtype=float) for c in CHAIN_COLUMNS})
+
+    def __len__(self) -> int:
+        return len(self.strike)
+
+    # =========================================================================
+    # DTE SELECTION
+    # =========================================================================
+
+    def nearest_dte(self, target_dte: int) -> int:
+        return min(self.available_dtes, key=lambda x: abs(x - target_dte))
+
+    def rows(self, dte: int) -> slice:
+        """Rows for one DTE, ordered by strike."""
+        if dte not in self._slices:
+            lo = int(np.searchsorted(self.dte, dte, side='left'))
+            hi = int(np.searchsorted(self.dte, dte, side='right'))
+            self._slices[dte] = slice(lo, hi)
+        return self._slices[dte]
+
+    def underlying(self, dte: int) -> float:
+        """underlying_price of the first input row with this DTE."""
+        rows = self.rows(dte)
+        return float(self.underlying_price[rows.start + int(np.argmin(self.pos[rows]))])
+
+    # =========================================================================
+    # CANDIDATES
+    # =========================================================================
+
+    def above(self, column: str, threshold: float) -> np.ndarray:
+        """Cached mask column > threshold (missing values never pass)."""
+        key = (column, threshold)
+        if key not in self._masks:
+            with np.errstate(invalid='ignore'):
+                self._masks[key] = getattr(self, column) > threshold
+        return self._masks[key]
+
+    def candidates(self, rows: slice, ok: Optional[np.ndarray] = None,
+                   below: float = None, above: float = None,
+                   at_most: float = None, at_least: float = None,
+                   near: float = None, within: float = None) -> np.ndarray:
+        """
+        Row indexes in rows passing ok and the strike bounds: strictly below /
+        above, at_most / at_least (inclusive), or |strike - near| < within.
+        """
+        lo, hi = rows.start, rows.stop
+        strikes = self.strike[lo:hi]
+        start, stop = 0, hi - lo
+        if near is not None:
+            # Widened window, then the exact |strike - near| < within test below
+            start = max(start, int(np.searchsorted(strikes, near - within - 1, side='left')))
+            stop = min(stop, int(np.searchsorted(strikes, near + within + 1, side='right')))
+        if below is not None:
+            stop = min(stop, int(np.searchsorted(strikes, below, side='left')))
+        if above is not None:
+            start = max(start, int(np.searchsorted(strikes, above, side='right')))
+        if at_most is not None:
+            stop = min(stop, int(np.searchsorted(strikes, at_most, side='right')))
+        if at_least is not None:
+            start = max(start, int(np.searchsorted(strikes, at_least, side='left')))
+        if start >= stop:
+            return np.empty(0, dtype=np.int64)
+
+        idx = np.arange(lo + start, lo + stop)
+        keep = np.ones(len(idx), dtype=bool) if ok is None else ok[idx]
+        if near is not None:
+            keep &= np.abs(self.strike[idx] - near) < within
+        return idx[keep]
+
+    def _earliest(self, idx: np.ndarray) -> int:
+        return int(idx[np.argmin(self.pos[idx])])
+
+    def closest(self, idx: np.ndarray, target: float) -> Optional[int]:
+        """Candidate with strike closest to target (first input row on ties)."""
+        if not len(idx):
+            return None
+        dist = np.abs(self.strike[idx] - target)
+        return self._earliest(idx[dist == dist.min()])
+
+    def first(self, idx: np.ndarray) -> Optional[int]:
+        """Candidate that came first in the input rows."""
+        return self._earliest(idx) if len(idx) else None
+
+    def highest(self, idx: np.ndarray) -> Optional[int]:
+        if not len(idx):
+            return None
+        strikes = self.strike[idx]
+        return self._earliest(idx[strikes == strikes.max()])
+
+    def lowest(self, idx: np.ndarray) -> Optional[int]:
+        if not len(idx):
+            return None
+        strikes = self.strike[idx]
+        return self._earliest(idx[strikes == strikes.min()])
+
+    # =========================================================================
+    # VALUES
+    # =========================================================================
+
+    def strike_at(self, i: int) -> float:
+        return float(self.strike[i])
+
+    def quote(self, i: int, column: str) -> float:
+        """Quote value with missing / zero treated as 0 (the finders' `get(col, 0) or 0`)."""
+        v = float(getattr(self, column)[i])
+        return v if v == v and v else 0
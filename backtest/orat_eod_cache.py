@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+ORAT EOD Columnar Cache
+=======================
+
+Local, offline copy of orat_options_eod for the 0DTE/hybrid backtesters.
+
+Each (ticker, year) is exported once into NumPy column files that are
+memory-mapped on read:
+
+    <root>/<TICKER>/<YEAR>/
+        meta.json            ticker, year, row count, columns, export time,
+                             last exported trade_date
+        index.npy            (trade_date, dte, start, stop) per chain slice
+        <column>.npy         one float64 array per column (dte is int32)
+
+Rows are sorted by (trade_date, dte, strike), so every DTE window for a
+trade_date is one contiguous slice - a lookup is two binary searches and no
+per-row conversion until a backtester asks for dicts. NULLs are stored as
+NaN (a NULL dte as -1) and come back as None, like the psycopg2 rows.
+
+Usage:
+    # One-time export (uses ORAT_DATABASE_URL, falls back to DATABASE_URL)
+    python backtest/orat_eod_cache.py --ticker SPX --years 2021 2022 2023 2024 2025
+
+    # Backtesters read from it when ORAT_EOD_CACHE_DIR is set (or orat_cache_dir=...)
+    ORAT_EOD_CACHE_DIR=backtest/orat_cache python backtest/zero_dte_hybrid_fixed.py
+
+Author: AlphaGEX Team
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'orat_cache')
+
+# Columns the hybrid / 0DTE backtesters read from orat_options_eod
+CACHE_COLUMNS = [
+    'strike', 'underlying_price', 'dte',
+    'put_bid', 'put_ask', 'call_bid', 'call_ask',
+    'delta', 'put_iv', 'call_iv',
+    'gamma', 'call_oi', 'put_oi',
+]
+
+_INDEX_DTYPE = np.dtype([('trade_date', 'datetime64[D]'), ('dte', '<i4'),
+                         ('start', '<i8'), ('stop', '<i8')])
+_EXPORT_BATCH_ROWS = 200_000
+
+
+def _as_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def export_year(conn, ticker: str, year: int, root: str = DEFAULT_CACHE_DIR) -> int:
+    """
+    Export one ticker/year of orat_options_eod into the cache. Replaces any
+    previous export of that year. Returns the number of rows written.
+    """
+    cursor = conn.cursor(name=f'orat_eod_export_{ticker}_{year}')
+    cursor.itersize = _EXPORT_BATCH_ROWS
+    cursor.execute(f"""
+        SELECT trade_date, {', '.join(CACHE_COLUMNS)}
+        FROM orat_options_eod
+        WHERE ticker = %s
+          AND trade_date >= %s
+          AND trade_date < %s
+        ORDER BY trade_date, dte NULLS FIRST, strike
+    """, (ticker, date(year, 1, 1), date(year + 1, 1, 1)))
+
+    dates, columns = [], {c: [] for c in CACHE_COLUMNS}
+    while True:
+        batch = cursor.fetchmany(_EXPORT_BATCH_ROWS)
+        if not batch:
+            break
+        dates.append(np.array([_as_date(r[0]) for r in batch], dtype='datetime64[D]'))
+        for i, col in enumerate(CACHE_COLUMNS, start=1):
+            if col == 'dte':
+                columns[col].append(np.array([-1 if r[i] is None else int(r[i]) for r in batch], dtype=np.int32))
+            else:
+                columns[col].append(np.array([np.nan if r[i] is None else float(r[i]) for r in batch]))
+    cursor.close()
+
+    trade_dates = np.concatenate(dates) if dates else np.empty(0, dtype='datetime64[D]')
+    arrays = {c: (np.concatenate(v) if v else np.empty(0, dtype=np.int32 if c == 'dte' else float))
+              for c, v in columns.items()}
+
+    # One index entry per (trade_date, dte) run of rows
+    n = len(trade_dates)
+    if n:
+        breaks = np.nonzero((trade_dates[1:] != trade_dates[:-1]) | (arrays['dte'][1:] != arrays['dte'][:-1]))[0] + 1
+        starts = np.concatenate(([0], breaks))
+        stops = np.concatenate((breaks, [n]))
+    else:
+        starts = stops = np.empty(0, dtype=np.int64)
+    index = np.empty(len(starts), dtype=_INDEX_DTYPE)
+    index['trade_date'] = trade_dates[starts]
+    index['dte'] = arrays['dte'][starts]
+    index['start'] = starts
+    index['stop'] = stops
+
+    final = os.path.join(root, ticker.upper(), str(year))
+    os.makedirs(os.path.dirname(final), exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix='.tmp-', dir=os.path.dirname(final))
+    try:
+        np.save(os.path.join(tmp, 'index.npy'), index)
+        for col, arr in arrays.items():
+            np.save(os.path.join(tmp, f'{col}.npy'), arr)
+        with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+            json.dump({'ticker': ticker.upper(), 'year': year, 'rows': n, 'columns': CACHE_COLUMNS,
+                       'exported_at': datetime.now().isoformat(),
+                       'max_trade_date': str(trade_dates.max()) if n else None}, f)
+        if os.path.exists(final):
+            shutil.rmtree(final)
+        os.rename(tmp, final)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return n
+
+
+# =============================================================================
+# READ
+# =============================================================================
+
+class _YearTable:
+    """Memory-mapped columns + (trade_date, dte) index for one ticker/year."""
+
+    def __init__(self, path: str):
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+        self.index = np.load(os.path.join(path, 'index.npy'))
+        self.columns = {c: np.load(os.path.join(path, f'{c}.npy'), mmap_mode='r') for c in CACHE_COLUMNS}
+        self.exported_on = _as_date(meta['exported_at'])
+        # Exports written before max_trade_date was recorded: read it off the index
+        last = meta.get('max_trade_date') or (str(self.index['trade_date'][-1]) if len(self.index) else None)
+        self.max_trade_date = _as_date(last) if last else None
+
+    def covers_through(self, day: date) -> bool:
+        """True when this export holds every trade date up to day: its last
+        trade_date reaches day, or it was exported after day (so anything
+        missing was not in the table either - weekends, holidays)."""
+        if self.max_trade_date is not None and self.max_trade_date >= day:
+            return True
+        return self.exported_on > day
+
+    def rows(self, trade_date: date, min_dte: int, max_dte: int) -> slice:
+        day = np.datetime64(trade_date, 'D')
+        lo = int(np.searchsorted(self.index['trade_date'], day, side='left'))
+        hi = int(np.searchsorted(self.index['trade_date'], day, side='right'))
+        dtes = self.index['dte'][lo:hi]
+        first = lo + int(np.searchsorted(dtes, min_dte, side='left'))
+        last = lo + int(np.searchsorted(dtes, max_dte, side='right'))
+        if first >= last:
+            return slice(0, 0)
+        return slice(int(self.index['start'][first]), int(self.index['stop'][last - 1]))
+
+
+class OratEodCache:
+    """Reader for cached orat_options_eod years (see module docstring for the layout)."""
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR):
+        self.root = root
+        self._tables: Dict[tuple, Optional[_YearTable]] = {}
+
+    def _table(self, ticker: str, year: int) -> Optional[_YearTable]:
+        key = (ticker.upper(), year)
+        if key not in self._tables:
+            path = os.path.join(self.root, key[0], str(year))
+            self._tables[key] = _YearTable(path) if os.path.exists(os.path.join(path, 'meta.json')) else None
+        return self._tables[key]
+
+    def covers(self, ticker: str, start, end) -> bool:
+        """True when every year in [start, end] has been exported for ticker
+        and each export is recent enough to reach the part of [start, end]
+        falling in its year (a current-year export from last month is not)."""
+        start, end = _as_date(start), _as_date(end)
+        for year in range(start.year, end.year + 1):
+            table = self._table(ticker, year)
+            if table is None or not table.covers_through(min(end, date(year, 12, 31))):
+                return False
+        return True
+
+    def trading_days(self, ticker: str, start, end) -> List[str]:
+        """Distinct trade dates in [start, end] as YYYY-MM-DD strings."""
+        start, end = _as_date(start), _as_date(end)
+        days = []
+        for year in range(start.year, end.year + 1):
+            table = self._table(ticker, year)
+            if table is None:
+                continue
+            d = np.unique(table.index['trade_date'])
+            d = d[(d >= np.datetime64(start, 'D')) & (d <= np.datetime64(end, 'D'))]
+            days.extend(str(x) for x in d)
+        return days
+
+    def chain(self, ticker: str, trade_date, min_dte: int, max_dte: int) -> Dict[str, np.ndarray]:
+        """Columnar chain for trade_date with min_dte <= dte <= max_dte, ordered by (dte, strike)."""
+        trade_date = _as_date(trade_date)
+        table = self._table(ticker, trade_date.year)
+        if table is None:
+            return {c: np.empty(0) for c in CACHE_COLUMNS}
+        rows = table.rows(trade_date, min_dte, max_dte)
+        return {c: arr[rows] for c, arr in table.columns.items()}
+
+    def options(self, ticker: str, trade_date, min_dte: int, max_dte: int,
+                columns: Sequence[str] = CACHE_COLUMNS, nearest_dte: Optional[int] = None) -> List[Dict]:
+        """
+        The chain as row dicts in the shape the backtesters build from
+        psycopg2 rows (floats, int dte, None for NULL). Ordered by (dte, strike),
+        or by (|dte - nearest_dte|, strike) when nearest_dte is given.
+        """
+        chain = self.chain(ticker, trade_date, min_dte, max_dte)
+        return chain_rows(chain, row_order(chain, nearest_dte), columns)
+
+
+def row_order(chain: Dict[str, np.ndarray], nearest_dte: Optional[int] = None) -> np.ndarray:
+    """Row order of OratEodCache.options() over chain()."""
+    if nearest_dte is None:
+        return np.arange(len(chain['dte']))
+    return np.lexsort((chain['strike'], np.abs(chain['dte'].astype(np.int64) - nearest_dte)))
+
+
+def chain_rows(chain: Dict[str, np.ndarray], order: np.ndarray,
+               columns: Sequence[str] = CACHE_COLUMNS) -> List[Dict]:
+    """Row dicts for chain[order] (NaN -> None)."""
+    if not len(order):
+        return []
+    values = []
+    for col in columns:
+        arr = chain[col][order]
+        if col == 'dte':
+            values.append(arr.tolist())
+        else:
+            values.append([None if v != v else v for v in arr.tolist()])
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+_cache_instances: Dict[str, OratEodCache] = {}
+
+
+def get_orat_eod_cache(root: Optional[str] = None) -> Optional[OratEodCache]:
+    """Shared cache for root (default: ORAT_EOD_CACHE_DIR). None when no cache is configured."""
+    root = root or os.getenv('ORAT_EOD_CACHE_DIR')
+    if not root:
+        return None
+    if root not in _cache_instances:
+        _cache_instances[root] = OratEodCache(root)
+    return _cache_instances[root]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export orat_options_eod to the local columnar cache')
+    parser.add_argument('--ticker', default='SPX')
+    parser.add_argument('--years', type=int, nargs='+', required=True)
+    parser.add_argument('--out', default=os.getenv('ORAT_EOD_CACHE_DIR') or DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    import psycopg2
+    database_url = os.getenv('ORAT_DATABASE_URL') or os.getenv('DATABASE_URL')
+    if not database_url:
+        raise SystemExit("Neither ORAT_DATABASE_URL nor DATABASE_URL is set.")
+
+    conn = psycopg2.connect(database_url)
+    try:
+        for year in args.years:
+            rows = export_year(conn, args.ticker, year, args.out)
+            print(f"  {args.ticker} {year}: {rows:,} rows -> {os.path.join(args.out, args.ticker.upper(), str(year))}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
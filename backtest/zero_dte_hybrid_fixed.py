@@ -44,6 +44,9 @@ except ImportError:
     YFINANCE_AVAILABLE = False
     print("Warning: yfinance not installed")
 
+from backtest.option_chain import OptionChain
+from backtest.orat_eod_cache import chain_rows, get_orat_eod_cache, row_order
+
 # GEX Calculator integration for GEX-Protected strategies
 try:
     from quant.chronicles_gex_calculator import ChroniclesGEXCalculator, GEXData
@@ -248,6 +251,8 @@ class HybridFixedBacktester:
         take_profit_pct: float = None,  # Exit at X% of max profit (e.g., 0.5 = 50%)
         exit_on_wall_break: bool = False,  # Exit if price breaks opposite GEX wall
         exit_by_hour: int = None,  # Exit by this hour if profitable (e.g., 14 = 2pm)
+        # Local orat_options_eod export (default: ORAT_EOD_CACHE_DIR)
+        orat_cache_dir: str = None,
     ):
         self.start_date = start_date
         self.end_date = end_date or datetime.now().strftime('%Y-%m-%d')
@@ -286,6 +291,14 @@ class HybridFixedBacktester:
         self.exit_on_wall_break = exit_on_wall_break
         self.exit_by_hour = exit_by_hour
 
+        # Options chains come from the local columnar export when it covers the
+        # whole range, otherwise from the ORAT database
+        self.orat_cache = get_orat_eod_cache(orat_cache_dir)
+        if self.orat_cache is not None and not self.orat_cache.covers(self.ticker, self.start_date, self.end_date):
+            print(f"⚠️ ORAT cache at {self.orat_cache.root} does not cover {self.ticker} "
+                  f"{self.start_date} → {self.end_date}, using the database")
+            self.orat_cache = None
+
         # Intraday exit stats
         self.intraday_exit_stats = {
             'take_profit_exits': 0,
@@ -379,6 +392,7 @@ class HybridFixedBacktester:
 
         # Cache
         self.spx_ohlc: Dict[str, Dict] = {}
+        self._option_chain: Optional[Tuple[List[Dict], OptionChain]] = None
         self.vix_data: Dict[str, float] = {}
 
         # GEX Calculator for GEX-Protected strategies
@@ -1020,6 +1034,8 @@ class HybridFixedBacktester:
 
     def get_trading_days(self) -> List[str]:
         """Get all trading days from ORAT options data"""
+        if self.orat_cache is not None:
+            return self.orat_cache.trading_days(self.ticker, self.start_date, self.end_date)
         try:
             conn = self.get_connection()
             cursor = conn.cursor()
@@ -1049,40 +1065,18 @@ class HybridFixedBacktester:
     def get_options_for_date(self, trade_date: str, target_dte: int) -> List[Dict]:
         """Get options near target DTE"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
             # Get options within range of target DTE
             min_dte = max(0, target_dte - 3)
             max_dte = target_dte + 7
 
-            cursor.execute("""
-                SELECT
-                    strike, underlying_price, dte,
-                    put_bid, put_ask, call_bid, call_ask,
-                    delta, put_iv, call_iv,
-                    gamma, call_oi, put_oi
-                FROM orat_options_eod
-                WHERE ticker = %s
-                  AND trade_date = %s
-                  AND dte >= %s
-                  AND dte <= %s
-                ORDER BY ABS(dte - %s), strike
-            """, (self.ticker, trade_date, min_dte, max_dte, target_dte))
-
-            columns = ['strike', 'underlying_price', 'dte', 'put_bid', 'put_ask',
-                       'call_bid', 'call_ask', 'delta', 'put_iv', 'call_iv',
-                       'gamma', 'call_oi', 'put_oi']
-
-            options = []
-            for row in cursor.fetchall():
-                opt = dict(zip(columns, row))
-                for key in opt:
-                    if opt[key] is not None and key != 'dte':
-                        opt[key] = float(opt[key])
-                options.append(opt)
-
-            conn.close()
+            if self.orat_cache is not None:
+                # Hand the finders the cached columns directly - no per-row rebuild
+                chain = self.orat_cache.chain(self.ticker, trade_date, min_dte, max_dte)
+                order = row_order(chain, target_dte)
+                options = chain_rows(chain, order)
+                self._option_chain = (options, OptionChain(chain, order))
+            else:
+                options = self._query_options_for_date(trade_date, min_dte, max_dte, target_dte)
 
             # Debug logging for first few calls
             if self.debug_mode and not hasattr(self, '_options_debug_count'):
@@ -1105,6 +1099,51 @@ class HybridFixedBacktester:
             print(f"⚠️ Warning: Error fetching options for {trade_date}: {e}")
             return []
 
+    def _query_options_for_date(self, trade_date: str, min_dte: int, max_dte: int,
+                                target_dte: int) -> List[Dict]:
+        """orat_options_eod rows for trade_date, nearest target DTE first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT
+                strike, underlying_price, dte,
+                put_bid, put_ask, call_bid, call_ask,
+                delta, put_iv, call_iv,
+                gamma, call_oi, put_oi
+            FROM orat_options_eod
+            WHERE ticker = %s
+              AND trade_date = %s
+              AND dte >= %s
+              AND dte <= %s
+            ORDER BY ABS(dte - %s), strike
+        """, (self.ticker, trade_date, min_dte, max_dte, target_dte))
+
+        columns = ['strike', 'underlying_price', 'dte', 'put_bid', 'put_ask',
+                   'call_bid', 'call_ask', 'delta', 'put_iv', 'call_iv',
+                   'gamma', 'call_oi', 'put_oi']
+
+        options = []
+        for row in cursor.fetchall():
+            opt = dict(zip(columns, row))
+            for key in opt:
+                if opt[key] is not None and key != 'dte':
+                    opt[key] = float(opt[key])
+            options.append(opt)
+
+        conn.close()
+        return options
+
+    def option_chain(self, options: List[Dict]) -> OptionChain:
+        """
+        Sorted array view of a day's options, built once and shared by every
+        finder called with the same list (find_strategy, APACHE fallbacks,
+        GEX-protected IC all reuse it).
+        """
+        if self._option_chain is None or self._option_chain[0] is not options:
+            self._option_chain = (options, OptionChain.from_rows(options))
+        return self._option_chain[1]
+
     def find_bull_put_spread(self, options: List[Dict], open_price: float,
                              strike_distance: float, target_dte: int,
                              use_raw_distance: bool = False) -> Optional[Dict]:
@@ -1112,17 +1151,10 @@ class HybridFixedBacktester:
         if not options:
             return None
 
-        available_dtes = list(set(o['dte'] for o in options))
-        if not available_dtes:
-            return None
-
-        actual_dte = min(available_dtes, key=lambda x: abs(x - target_dte))
-        dte_options = [o for o in options if o['dte'] == actual_dte]
-
-        if not dte_options:
-            return None
-
-        underlying = dte_options[0]['underlying_price']
+        chain = self.option_chain(options)
+        actual_dte = chain.nearest_dte(target_dte)
+        rows = chain.rows(actual_dte)
+        underlying = chain.underlying(actual_dte)
 
         # Target put strike at specified distance below open
         if use_raw_distance:
@@ -1131,33 +1163,26 @@ class HybridFixedBacktester:
             put_target = open_price - (self.sd_multiplier * strike_distance)
         put_target = round(put_target / 5) * 5
 
-        # Find OTM puts
-        otm_puts = [o for o in dte_options if o['strike'] < underlying
-                   and o.get('put_bid', 0) and o['put_bid'] > 0.05]
-
-        if not otm_puts:
+        # Short put at target among OTM puts
+        short_put = chain.closest(chain.candidates(rows, chain.above('put_bid', 0.05), below=underlying), put_target)
+        if short_put is None:
             return None
 
-        # Short put at target
-        short_put = min(otm_puts, key=lambda x: abs(x['strike'] - put_target))
-
         # Long put below
-        long_put_strike = short_put['strike'] - self.spread_width
-        long_put_candidates = [o for o in dte_options
-                              if abs(o['strike'] - long_put_strike) < 2
-                              and o.get('put_ask', 0) and o['put_ask'] > 0]
-        if not long_put_candidates:
+        long_put_strike = chain.strike_at(short_put) - self.spread_width
+        long_put = chain.closest(chain.candidates(rows, chain.above('put_ask', 0), near=long_put_strike, within=2),
+                                 long_put_strike)
+        if long_put is None:
             return None
-        long_put = min(long_put_candidates, key=lambda x: abs(x['strike'] - long_put_strike))
 
-        put_credit = (short_put.get('put_bid', 0) or 0) - (long_put.get('put_ask', 0) or 0)
+        put_credit = chain.quote(short_put, 'put_bid') - chain.quote(long_put, 'put_ask')
         if put_credit <= 0:
             return None
 
         return {
             'actual_dte': actual_dte,
-            'put_short_strike': short_put['strike'],
-            'put_long_strike': long_put['strike'],
+            'put_short_strike': chain.strike_at(short_put),
+            'put_long_strike': chain.strike_at(long_put),
             'put_credit': put_credit,
             'call_short_strike': 0,
             'call_long_strike': 0,
@@ -1173,17 +1198,10 @@ class HybridFixedBacktester:
         if not options:
             return None
 
-        available_dtes = list(set(o['dte'] for o in options))
-        if not available_dtes:
-            return None
-
-        actual_dte = min(available_dtes, key=lambda x: abs(x - target_dte))
-        dte_options = [o for o in options if o['dte'] == actual_dte]
-
-        if not dte_options:
-            return None
-
-        underlying = dte_options[0]['underlying_price']
+        chain = self.option_chain(options)
+        actual_dte = chain.nearest_dte(target_dte)
+        rows = chain.rows(actual_dte)
+        underlying = chain.underlying(actual_dte)
 
         # Target call strike at specified distance above open
         if use_raw_distance:
@@ -1192,26 +1210,19 @@ class HybridFixedBacktester:
             call_target = open_price + (self.sd_multiplier * strike_distance)
         call_target = round(call_target / 5) * 5
 
-        # Find OTM calls
-        otm_calls = [o for o in dte_options if o['strike'] > underlying
-                    and o.get('call_bid', 0) and o['call_bid'] > 0.05]
-
-        if not otm_calls:
+        # Short call at target among OTM calls
+        short_call = chain.closest(chain.candidates(rows, chain.above('call_bid', 0.05), above=underlying), call_target)
+        if short_call is None:
             return None
 
-        # Short call at target
-        short_call = min(otm_calls, key=lambda x: abs(x['strike'] - call_target))
-
         # Long call above
-        long_call_strike = short_call['strike'] + self.spread_width
-        long_call_candidates = [o for o in dte_options
-                               if abs(o['strike'] - long_call_strike) < 2
-                               and o.get('call_ask', 0) and o['call_ask'] > 0]
-        if not long_call_candidates:
+        long_call_strike = chain.strike_at(short_call) + self.spread_width
+        long_call = chain.closest(chain.candidates(rows, chain.above('call_ask', 0), near=long_call_strike, within=2),
+                                  long_call_strike)
+        if long_call is None:
             return None
-        long_call = min(long_call_candidates, key=lambda x: abs(x['strike'] - long_call_strike))
 
-        call_credit = (short_call.get('call_bid', 0) or 0) - (long_call.get('call_ask', 0) or 0)
+        call_credit = chain.quote(short_call, 'call_bid') - chain.quote(long_call, 'call_ask')
         if call_credit <= 0:
             return None
 
@@ -1220,8 +1231,8 @@ class HybridFixedBacktester:
             'put_short_strike': 0,
             'put_long_strike': 0,
             'put_credit': 0,
-            'call_short_strike': short_call['strike'],
-            'call_long_strike': long_call['strike'],
+            'call_short_strike': chain.strike_at(short_call),
+            'call_long_strike': chain.strike_at(long_call),
             'call_credit': call_credit,
             'total_credit': call_credit,
             'strategy_type': 'bear_call'
@@ -1241,17 +1252,9 @@ class HybridFixedBacktester:
         if not options:
             return None
 
-        available_dtes = list(set(o['dte'] for o in options))
-        if not available_dtes:
-            return None
-
-        actual_dte = min(available_dtes, key=lambda x: abs(x - target_dte))
-        dte_options = [o for o in options if o['dte'] == actual_dte]
-
-        if not dte_options:
-            return None
-
-        underlying = dte_options[0]['underlying_price']
+        chain = self.option_chain(options)
+        actual_dte = chain.nearest_dte(target_dte)
+        rows = chain.rows(actual_dte)
 
         # Target long call strike at or slightly below current price (ATM or slightly ITM)
         if use_raw_distance:
@@ -1260,29 +1263,22 @@ class HybridFixedBacktester:
             long_call_target = open_price - (self.sd_multiplier * strike_distance * 0.25)
         long_call_target = round(long_call_target / 5) * 5
 
-        # Find calls near the money
-        near_calls = [o for o in dte_options
-                     if o.get('call_ask', 0) and o['call_ask'] > 0.05
-                     and o.get('call_bid', 0) and o['call_bid'] > 0.05]
-
-        if not near_calls:
+        # Long call at target (buy at ask) among calls with a two-sided market
+        quoted = chain.above('call_ask', 0.05) & chain.above('call_bid', 0.05)
+        long_call = chain.closest(chain.candidates(rows, quoted), long_call_target)
+        if long_call is None:
             return None
 
-        # Long call at target (buy at ask)
-        long_call = min(near_calls, key=lambda x: abs(x['strike'] - long_call_target))
-
         # Short call above (sell at bid) - spread_width away
-        short_call_strike = long_call['strike'] + self.spread_width
-        short_call_candidates = [o for o in dte_options
-                                if abs(o['strike'] - short_call_strike) < 2
-                                and o.get('call_bid', 0) and o['call_bid'] > 0]
-        if not short_call_candidates:
+        short_call_strike = chain.strike_at(long_call) + self.spread_width
+        short_call = chain.closest(chain.candidates(rows, chain.above('call_bid', 0), near=short_call_strike, within=2),
+                                   short_call_strike)
+        if short_call is None:
             return None
-        short_call = min(short_call_candidates, key=lambda x: abs(x['strike'] - short_call_strike))
 
         # Debit spread: pay ask for long, receive bid for short
-        long_cost = long_call.get('call_ask', 0) or 0
-        short_credit = short_call.get('call_bid', 0) or 0
+        long_cost = chain.quote(long_call, 'call_ask')
+        short_credit = chain.quote(short_call, 'call_bid')
         net_debit = long_cost - short_credit  # Positive = cost
 
         if net_debit <= 0:
@@ -1299,8 +1295,8 @@ class HybridFixedBacktester:
             'put_short_strike': 0,
             'put_long_strike': 0,
             'put_credit': 0,
-            'call_short_strike': short_call['strike'],
-            'call_long_strike': long_call['strike'],
+            'call_short_strike': chain.strike_at(short_call),
+            'call_long_strike': chain.strike_at(long_call),
             'call_credit': -net_debit,  # Negative credit = debit
             'total_credit': -net_debit,  # Negative = debit spread
             'strategy_type': 'bull_call',
@@ -1323,17 +1319,9 @@ class HybridFixedBacktester:
         if not options:
             return None
 
-        available_dtes = list(set(o['dte'] for o in options))
-        if not available_dtes:
-            return None
-
-        actual_dte = min(available_dtes, key=lambda x: abs(x - target_dte))
-        dte_options = [o for o in options if o['dte'] == actual_dte]
-
-        if not dte_options:
-            return None
-
-        underlying = dte_options[0]['underlying_price']
+        chain = self.option_chain(options)
+        actual_dte = chain.nearest_dte(target_dte)
+        rows = chain.rows(actual_dte)
 
         # Target long put strike at or slightly above current price (ATM or slightly ITM)
         if use_raw_distance:
@@ -1342,29 +1330,22 @@ class HybridFixedBacktester:
             long_put_target = open_price + (self.sd_multiplier * strike_distance * 0.25)
         long_put_target = round(long_put_target / 5) * 5
 
-        # Find puts near the money
-        near_puts = [o for o in dte_options
-                    if o.get('put_ask', 0) and o['put_ask'] > 0.05
-                    and o.get('put_bid', 0) and o['put_bid'] > 0.05]
-
-        if not near_puts:
+        # Long put at target (buy at ask) among puts with a two-sided market
+        quoted = chain.above('put_ask', 0.05) & chain.above('put_bid', 0.05)
+        long_put = chain.closest(chain.candidates(rows, quoted), long_put_target)
+        if long_put is None:
             return None
 
-        # Long put at target (buy at ask)
-        long_put = min(near_puts, key=lambda x: abs(x['strike'] - long_put_target))
-
         # Short put below (sell at bid) - spread_width away
-        short_put_strike = long_put['strike'] - self.spread_width
-        short_put_candidates = [o for o in dte_options
-                               if abs(o['strike'] - short_put_strike) < 2
-                               and o.get('put_bid', 0) and o['put_bid'] > 0]
-        if not short_put_candidates:
+        short_put_strike = chain.strike_at(long_put) - self.spread_width
+        short_put = chain.closest(chain.candidates(rows, chain.above('put_bid', 0), near=short_put_strike, within=2),
+                                  short_put_strike)
+        if short_put is None:
             return None
-        short_put = min(short_put_candidates, key=lambda x: abs(x['strike'] - short_put_strike))
 
         # Debit spread: pay ask for long, receive bid for short
-        long_cost = long_put.get('put_ask', 0) or 0
-        short_credit = short_put.get('put_bid', 0) or 0
+        long_cost = chain.quote(long_put, 'put_ask')
+        short_credit = chain.quote(short_put, 'put_bid')
         net_debit = long_cost - short_credit  # Positive = cost
 
         if net_debit <= 0:
@@ -1377,8 +1358,8 @@ class HybridFixedBacktester:
 
         return {
             'actual_dte': actual_dte,
-            'put_short_strike': short_put['strike'],
-            'put_long_strike': long_put['strike'],
+            'put_short_strike': chain.strike_at(short_put),
+            'put_long_strike': chain.strike_at(long_put),
             'put_credit': -net_debit,  # Negative credit = debit
             'call_short_strike': 0,
             'call_long_strike': 0,
@@ -1661,53 +1642,39 @@ class HybridFixedBacktester:
         if not options:
             return None
 
-        available_dtes = list(set(o['dte'] for o in options))
-        if not available_dtes:
-            return None
-
-        actual_dte = min(available_dtes, key=lambda x: abs(x - target_dte))
-        dte_options = [o for o in options if o['dte'] == actual_dte]
-
-        if not dte_options:
-            return None
-
-        underlying = dte_options[0]['underlying_price']
+        chain = self.option_chain(options)
+        actual_dte = chain.nearest_dte(target_dte)
+        rows = chain.rows(actual_dte)
 
         # ATM strike (center strike)
         atm_strike = round(open_price / 5) * 5
 
-        # Find ATM options for short straddle
-        atm_options = [o for o in dte_options if abs(o['strike'] - atm_strike) < 2]
-        if not atm_options:
+        # First ATM row for the short straddle
+        atm = chain.first(chain.candidates(rows, near=atm_strike, within=2))
+        if atm is None:
             return None
 
-        atm = atm_options[0]
-
         # Short put and call at ATM
-        short_put_credit = atm.get('put_bid', 0) or 0
-        short_call_credit = atm.get('call_bid', 0) or 0
+        short_put_credit = chain.quote(atm, 'put_bid')
+        short_call_credit = chain.quote(atm, 'call_bid')
 
         # Long put below (wing)
         long_put_strike = atm_strike - self.spread_width
-        long_put_candidates = [o for o in dte_options
-                              if abs(o['strike'] - long_put_strike) < 2
-                              and o.get('put_ask', 0) and o['put_ask'] > 0]
-        if not long_put_candidates:
+        long_put = chain.closest(chain.candidates(rows, chain.above('put_ask', 0), near=long_put_strike, within=2),
+                                 long_put_strike)
+        if long_put is None:
             return None
-        long_put = min(long_put_candidates, key=lambda x: abs(x['strike'] - long_put_strike))
 
         # Long call above (wing)
         long_call_strike = atm_strike + self.spread_width
-        long_call_candidates = [o for o in dte_options
-                               if abs(o['strike'] - long_call_strike) < 2
-                               and o.get('call_ask', 0) and o['call_ask'] > 0]
-        if not long_call_candidates:
+        long_call = chain.closest(chain.candidates(rows, chain.above('call_ask', 0), near=long_call_strike, within=2),
+                                  long_call_strike)
+        if long_call is None:
             return None
-        long_call = min(long_call_candidates, key=lambda x: abs(x['strike'] - long_call_strike))
 
         # Calculate credits
-        put_credit = short_put_credit - (long_put.get('put_ask', 0) or 0)
-        call_credit = short_call_credit - (long_call.get('call_ask', 0) or 0)
+        put_credit = short_put_credit - chain.quote(long_put, 'put_ask')
+        call_credit = short_call_credit - chain.quote(long_call, 'call_ask')
         total_credit = put_credit + call_credit
 
         if total_credit <= 0:
@@ -1716,10 +1683,10 @@ class HybridFixedBacktester:
         return {
             'actual_dte': actual_dte,
             'put_short_strike': atm_strike,
-            'put_long_strike': long_put['strike'],
+            'put_long_strike': chain.strike_at(long_put),
             'put_credit': put_credit,
             'call_short_strike': atm_strike,
-            'call_long_strike': long_call['strike'],
+            'call_long_strike': chain.strike_at(long_call),
             'call_credit': call_credit,
             'total_credit': total_credit,
             'strategy_type': 'iron_butterfly'
@@ -1740,7 +1707,8 @@ class HybridFixedBacktester:
         if not options:
             return None
 
-        available_dtes = sorted(set(o['dte'] for o in options))
+        chain = self.option_chain(options)
+        available_dtes = sorted(chain.available_dtes)
         if len(available_dtes) < 2:
             return None  # Need at least 2 different DTEs for diagonal
 
@@ -1757,13 +1725,9 @@ class HybridFixedBacktester:
 
         long_dte = min(long_dte_candidates)  # Take the nearest long-term option
 
-        short_dte_options = [o for o in options if o['dte'] == short_dte]
-        long_dte_options = [o for o in options if o['dte'] == long_dte]
-
-        if not short_dte_options or not long_dte_options:
-            return None
-
-        underlying = short_dte_options[0]['underlying_price']
+        short_rows = chain.rows(short_dte)
+        long_rows = chain.rows(long_dte)
+        underlying = chain.underlying(short_dte)
 
         # Short call strike at specified distance above open (OTM)
         if use_raw_distance:
@@ -1772,31 +1736,23 @@ class HybridFixedBacktester:
             call_target = open_price + (self.sd_multiplier * strike_distance)
         call_target = round(call_target / 5) * 5
 
-        # Find OTM calls for short leg
-        otm_calls_short = [o for o in short_dte_options if o['strike'] > underlying
-                          and o.get('call_bid', 0) and o['call_bid'] > 0.05]
-
-        if not otm_calls_short:
+        # Short call at target SD among OTM calls
+        short_call = chain.closest(chain.candidates(short_rows, chain.above('call_bid', 0.05), above=underlying),
+                                   call_target)
+        if short_call is None:
             return None
 
-        # Short call at target SD
-        short_call = min(otm_calls_short, key=lambda x: abs(x['strike'] - call_target))
-
         # Long call: ATM or slightly ITM for protection (same strike or lower)
-        long_call_target = short_call['strike']  # Same strike = calendar, lower = true diagonal
-        long_call_candidates = [o for o in long_dte_options
-                               if o['strike'] <= long_call_target
-                               and o.get('call_ask', 0) and o['call_ask'] > 0]
-
-        if not long_call_candidates:
-            return None
+        long_call_target = chain.strike_at(short_call)  # Same strike = calendar, lower = true diagonal
 
         # Pick the highest strike that's at or below short strike
-        long_call = max(long_call_candidates, key=lambda x: x['strike'])
+        long_call = chain.highest(chain.candidates(long_rows, chain.above('call_ask', 0), at_most=long_call_target))
+        if long_call is None:
+            return None
 
         # Calculate debit (we pay for long, receive for short)
-        short_premium = short_call.get('call_bid', 0) or 0
-        long_premium = long_call.get('call_ask', 0) or 0
+        short_premium = chain.quote(short_call, 'call_bid')
+        long_premium = chain.quote(long_call, 'call_ask')
 
         net_debit = long_premium - short_premium  # Positive = we pay, Negative = credit
 
@@ -1815,8 +1771,8 @@ class HybridFixedBacktester:
             'put_short_strike': 0,
             'put_long_strike': 0,
             'put_credit': 0,
-            'call_short_strike': short_call['strike'],
-            'call_long_strike': long_call['strike'],
+            'call_short_strike': chain.strike_at(short_call),
+            'call_long_strike': chain.strike_at(long_call),
             'call_credit': -net_debit,  # Negative debit = positive credit equivalent
             'total_credit': -net_debit,
             'max_loss_override': max_loss,
@@ -1838,7 +1794,8 @@ class HybridFixedBacktester:
         if not options:
             return None
 
-        available_dtes = sorted(set(o['dte'] for o in options))
+        chain = self.option_chain(options)
+        available_dtes = sorted(chain.available_dtes)
         if len(available_dtes) < 2:
             return None
 
@@ -1854,13 +1811,9 @@ class HybridFixedBacktester:
 
         long_dte = min(long_dte_candidates)
 
-        short_dte_options = [o for o in options if o['dte'] == short_dte]
-        long_dte_options = [o for o in options if o['dte'] == long_dte]
-
-        if not short_dte_options or not long_dte_options:
-            return None
-
-        underlying = short_dte_options[0]['underlying_price']
+        short_rows = chain.rows(short_dte)
+        long_rows = chain.rows(long_dte)
+        underlying = chain.underlying(short_dte)
 
         # Short put strike at specified distance below open (OTM)
         if use_raw_distance:
@@ -1869,31 +1822,23 @@ class HybridFixedBacktester:
             put_target = open_price - (self.sd_multiplier * strike_distance)
         put_target = round(put_target / 5) * 5
 
-        # Find OTM puts for short leg
-        otm_puts_short = [o for o in short_dte_options if o['strike'] < underlying
-                         and o.get('put_bid', 0) and o['put_bid'] > 0.05]
-
-        if not otm_puts_short:
+        # Short put at target SD among OTM puts
+        short_put = chain.closest(chain.candidates(short_rows, chain.above('put_bid', 0.05), below=underlying),
+                                  put_target)
+        if short_put is None:
             return None
 
-        # Short put at target SD
-        short_put = min(otm_puts_short, key=lambda x: abs(x['strike'] - put_target))
-
         # Long put: ATM or slightly ITM for protection (same strike or higher)
-        long_put_target = short_put['strike']
-        long_put_candidates = [o for o in long_dte_options
-                              if o['strike'] >= long_put_target
-                              and o.get('put_ask', 0) and o['put_ask'] > 0]
-
-        if not long_put_candidates:
-            return None
+        long_put_target = chain.strike_at(short_put)
 
         # Pick the lowest strike that's at or above short strike
-        long_put = min(long_put_candidates, key=lambda x: x['strike'])
+        long_put = chain.lowest(chain.candidates(long_rows, chain.above('put_ask', 0), at_least=long_put_target))
+        if long_put is None:
+            return None
 
         # Calculate debit
-        short_premium = short_put.get('put_bid', 0) or 0
-        long_premium = long_put.get('put_ask', 0) or 0
+        short_premium = chain.quote(short_put, 'put_bid')
+        long_premium = chain.quote(long_put, 'put_ask')
 
         net_debit = long_premium - short_premium
 
@@ -1909,8 +1854,8 @@ class HybridFixedBacktester:
         return {
             'actual_dte': short_dte,
             'long_dte': long_dte,
-            'put_short_strike': short_put['strike'],
-            'put_long_strike': long_put['strike'],
+            'put_short_strike': chain.strike_at(short_put),
+            'put_long_strike': chain.strike_at(long_put),
             'put_credit': -net_debit,
             'call_short_strike': 0,
             'call_long_strike': 0,
@@ -2127,19 +2072,10 @@ class HybridFixedBacktester:
             call_distance = put_distance
 
         # Find options closest to target DTE
-        available_dtes = list(set(o['dte'] for o in options))
-        if not available_dtes:
-            self.debug_stats['strategy_failures']['no_dtes'] += 1
-            return None
-
-        actual_dte = min(available_dtes, key=lambda x: abs(x - target_dte))
-        dte_options = [o for o in options if o['dte'] == actual_dte]
-
-        if not dte_options:
-            self.debug_stats['strategy_failures']['no_dte_options'] += 1
-            return None
-
-        underlying = dte_options[0]['underlying_price']
+        chain = self.option_chain(options)
+        actual_dte = chain.nearest_dte(target_dte)
+        rows = chain.rows(actual_dte)
+        underlying = chain.underlying(actual_dte)
 
         # Target strikes at specified distance from OPEN price
         if use_raw_distance:
@@ -2153,47 +2089,41 @@ class HybridFixedBacktester:
         call_target = round(call_target / 5) * 5
 
         # Find OTM options
-        otm_puts = [o for o in dte_options if o['strike'] < underlying
-                   and o.get('put_bid', 0) and o['put_bid'] > 0.05]
-        otm_calls = [o for o in dte_options if o['strike'] > underlying
-                    and o.get('call_bid', 0) and o['call_bid'] > 0.05]
+        otm_puts = chain.candidates(rows, chain.above('put_bid', 0.05), below=underlying)
+        otm_calls = chain.candidates(rows, chain.above('call_bid', 0.05), above=underlying)
 
-        if not otm_puts:
+        if not len(otm_puts):
             self.debug_stats['strategy_failures']['no_otm_puts'] += 1
             return None
-        if not otm_calls:
+        if not len(otm_calls):
             self.debug_stats['strategy_failures']['no_otm_calls'] += 1
             return None
 
         # Short put at target
-        short_put = min(otm_puts, key=lambda x: abs(x['strike'] - put_target))
+        short_put = chain.closest(otm_puts, put_target)
 
         # Long put below
-        long_put_strike = short_put['strike'] - self.spread_width
-        long_put_candidates = [o for o in dte_options
-                              if abs(o['strike'] - long_put_strike) < 2
-                              and o.get('put_ask', 0) and o['put_ask'] > 0]
-        if not long_put_candidates:
+        long_put_strike = chain.strike_at(short_put) - self.spread_width
+        long_put = chain.closest(chain.candidates(rows, chain.above('put_ask', 0), near=long_put_strike, within=2),
+                                 long_put_strike)
+        if long_put is None:
             self.debug_stats['strategy_failures']['no_long_put'] += 1
             return None
-        long_put = min(long_put_candidates, key=lambda x: abs(x['strike'] - long_put_strike))
 
         # Short call at target
-        short_call = min(otm_calls, key=lambda x: abs(x['strike'] - call_target))
+        short_call = chain.closest(otm_calls, call_target)
 
         # Long call above
-        long_call_strike = short_call['strike'] + self.spread_width
-        long_call_candidates = [o for o in dte_options
-                               if abs(o['strike'] - long_call_strike) < 2
-                               and o.get('call_ask', 0) and o['call_ask'] > 0]
-        if not long_call_candidates:
+        long_call_strike = chain.strike_at(short_call) + self.spread_width
+        long_call = chain.closest(chain.candidates(rows, chain.above('call_ask', 0), near=long_call_strike, within=2),
+                                  long_call_strike)
+        if long_call is None:
             self.debug_stats['strategy_failures']['no_long_call'] += 1
             return None
-        long_call = min(long_call_candidates, key=lambda x: abs(x['strike'] - long_call_strike))
 
         # Calculate credits
-        put_credit = (short_put.get('put_bid', 0) or 0) - (long_put.get('put_ask', 0) or 0)
-        call_credit = (short_call.get('call_bid', 0) or 0) - (long_call.get('call_ask', 0) or 0)
+        put_credit = chain.quote(short_put, 'put_bid') - chain.quote(long_put, 'put_ask')
+        call_credit = chain.quote(short_call, 'call_bid') - chain.quote(long_call, 'call_ask')
 
         if put_credit <= 0:
             self.debug_stats['strategy_failures']['bad_put_credit'] += 1
@@ -2204,11 +2134,11 @@ class HybridFixedBacktester:
 
         return {
             'actual_dte': actual_dte,
-            'put_short_strike': short_put['strike'],
-            'put_long_strike': long_put['strike'],
+            'put_short_strike': chain.strike_at(short_put),
+            'put_long_strike': chain.strike_at(long_put),
             'put_credit': put_credit,
-            'call_short_strike': short_call['strike'],
-            'call_long_strike': long_call['strike'],
+            'call_short_strike': chain.strike_at(short_call),
+            'call_long_strike': chain.strike_at(long_call),
             'call_credit': call_credit,
             'total_credit': put_credit + call_credit,
         }
@@ -3450,6 +3380,9 @@ def main():
     parser.add_argument('--commission', type=float, default=None,
                        help='Override commission per leg (default: 0.65)')
 
+    parser.add_argument('--orat-cache', default=None,
+                       help='Read options from a local orat_options_eod export (see backtest/orat_eod_cache.py)')
+
     args = parser.parse_args()
 
     backtester = HybridFixedBacktester(
@@ -3473,6 +3406,7 @@ def main():
         # Cost overrides
         slippage_per_spread_override=args.slippage,
         commission_per_leg_override=args.commission,
+        orat_cache_dir=args.orat_cache,
     )
 
     results = backtester.run()
@@ -38,6 +38,8 @@ from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / '.env')
 
+from backtest.orat_eod_cache import get_orat_eod_cache
+
 try:
     import yfinance as yf
     YFINANCE_AVAILABLE = True
@@ -186,6 +188,7 @@ class HybridScalingBacktester:
         sd_multiplier: float = 1.0,
         risk_per_trade_pct: float = 5.0,  # More conservative for scaling
         ticker: str = "SPX",
+        orat_cache_dir: str = None,  # Local orat_options_eod export (default: ORAT_EOD_CACHE_DIR)
     ):
         self.start_date = start_date
         self.end_date = end_date or datetime.now().strftime('%Y-%m-%d')
@@ -195,6 +198,13 @@ class HybridScalingBacktester:
         self.risk_per_trade_pct = risk_per_trade_pct
         self.ticker = ticker
 
+        # Options chains come from the local columnar export when it covers the range
+        self.orat_cache = get_orat_eod_cache(orat_cache_dir)
+        if self.orat_cache is not None and not self.orat_cache.covers(self.ticker, self.start_date, self.end_date):
+            print(f"⚠️ ORAT cache at {self.orat_cache.root} does not cover {self.ticker} "
+                  f"{self.start_date} → {self.end_date}, using the database")
+            self.orat_cache = None
+
         # State
         self.equity = initial_capital
         self.high_water_mark = initial_capital
@@ -305,6 +315,9 @@ class HybridScalingBacktester:
 
     def get_trading_days(self) -> List[str]:
         """Get all trading days with options data"""
+        if self.orat_cache is not None:
+            return self.orat_cache.trading_days(self.ticker, self.start_date, self.end_date)
+
         conn = self.get_connection()
         cursor = conn.cursor()
 
@@ -324,6 +337,11 @@ class HybridScalingBacktester:
 
     def get_options_for_date(self, trade_date: str, min_dte: int, max_dte: int) -> List[Dict]:
         """Get options within DTE range"""
+        columns = ['strike', 'underlying_price', 'dte', 'put_bid', 'put_ask',
+                   'call_bid', 'call_ask', 'delta', 'put_iv', 'call_iv']
+        if self.orat_cache is not None:
+            return self.orat_cache.options(self.ticker, trade_date, min_dte, max_dte, columns=columns)
+
         conn = self.get_connection()
         cursor = conn.cursor()
 
@@ -340,9 +358,6 @@ class HybridScalingBacktester:
             ORDER BY dte, strike
         """, (self.ticker, trade_date, min_dte, max_dte))
 
-        columns = ['strike', 'underlying_price', 'dte', 'put_bid', 'put_ask',
-                   'call_bid', 'call_ask', 'delta', 'put_iv', 'call_iv']
-
         options = []
         for row in cursor.fetchall():
             opt = dict(zip(columns, row))
@@ -861,6 +876,8 @@ def main():
     parser.add_argument('--sd', type=float, default=1.0)
     parser.add_argument('--risk', type=float, default=5.0, help='Risk per trade percent (default: 5)')
     parser.add_argument('--ticker', default='SPX')
+    parser.add_argument('--orat-cache', default=None,
+                        help='Read options from a local orat_options_eod export (see backtest/orat_eod_cache.py)')
 
     args = parser.parse_args()
 
@@ -872,6 +889,7 @@ def main():
         sd_multiplier=args.sd,
         risk_per_trade_pct=args.risk,
         ticker=args.ticker,
+        orat_cache_dir=args.orat_cache,
     )
 
     results = backtester.run()
@@ -208,10 +208,10 @@ class VolatilitySurfaceAnalyzer:
         if not VOL_SURFACE_AVAILABLE:
             return False
 
-        self.surface = VolatilitySurface(self.spot, self.rf)
-
-        for dte, chain in chains.items():
-            self.surface.add_iv_chain(chain, dte)
+        # Reuse the surface across refreshes so fitted slices carry over
+        if self.surface is None:
+            self.surface = VolatilitySurface(self.spot, self.rf)
+        self.surface.update_chains(chains, spot_price=self.spot)
 
         return self.surface.fit(method='spline')
 
@@ -24,6 +24,7 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 import math
 import json
+import heapq
 
 import numpy as np
 import pandas as pd
@@ -34,6 +35,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 load_dotenv()
 
+from core.watchtower_state import StrikeGammaState
+
 logger = logging.getLogger(__name__)
 
 
@@ -208,6 +211,8 @@ class WatchtowerEngine:
     PIN_ZONE_PROXIMITY_PCT = 0.5  # % distance from likely pin
     GAMMA_SPIKE_THRESHOLD = 50.0  # % increase in 5 min for alert
     GAMMA_COLLAPSE_THRESHOLD = -20.0  # % decrease in 10 min for alert
+    HISTORY_MINUTES = 420  # Gamma history kept per strike (pre-market to close)
+    ROC_WINDOWS_MINUTES = (1, 5, 30, 60, 240)
 
     def __init__(self):
         """Initialize the WATCHTOWER engine"""
@@ -232,9 +237,14 @@ class WatchtowerEngine:
         self._previous_spot_price: Optional[float] = None
         self._max_gamma_change_pct: float = 50.0  # Max % change allowed without price move
 
+        # Incremental per-strike state (smoothing windows, gamma history ring,
+        # previous tick) in preallocated arrays keyed by strike index
+        self._strike_state = StrikeGammaState(window_size=self._gamma_window_size)
+
         # Market open baseline - stores first 5 minutes of readings for stable baseline
         self._market_open_baselines: Dict[float, List[float]] = {}  # strike -> [opening values]
         self._baseline_locked: bool = False  # Lock baseline after 5 minutes
+        self._baseline_medians: Dict[float, float] = {}  # strike -> median, filled once locked
 
         # Locked GEX levels at market open (like SpotGamma does for 0DTE)
         # OI doesn't change intraday, so GEX rankings should be stable
@@ -281,6 +291,8 @@ class WatchtowerEngine:
             max_change_pct: Maximum % change allowed in single reading without price move (default 50%)
         """
         self._gamma_smoothing_enabled = enabled
+        if window_size != self._gamma_window_size:
+            self._strike_state.reset_smoothing(window_size)
         self._gamma_window_size = window_size
         self._max_gamma_change_pct = max_change_pct
         logger.info(f"Gamma smoothing: enabled={enabled}, window={window_size}, max_change={max_change_pct}%")
@@ -291,9 +303,11 @@ class WatchtowerEngine:
         Call this when market opens to clear stale data.
         """
         self._gamma_window = {}
+        self._strike_state.reset_smoothing()
         self._previous_spot_price = None
         self._market_open_baselines = {}
         self._baseline_locked = False
+        self._baseline_medians = {}
         # Reset locked GEX levels for new trading day
         self._locked_gex_rankings = {}
         self._locked_gex_values = {}
@@ -432,7 +446,10 @@ class WatchtowerEngine:
         """
         from zoneinfo import ZoneInfo
         CENTRAL_TZ = ZoneInfo("America/Chicago")
-        now = datetime.now(CENTRAL_TZ)
+        self._update_market_open_baselines([strike], [gamma], datetime.now(CENTRAL_TZ))
+
+    def _update_market_open_baselines(self, strikes: List[float], gammas: List[float], now: datetime):
+        """Baseline update for a whole chain (one market-hours check per refresh)."""
         market_open = now.replace(hour=8, minute=30, second=0, microsecond=0)
 
         # Only collect baseline in first 5 minutes after open
@@ -443,10 +460,10 @@ class WatchtowerEngine:
             return
 
         # Add to baseline collection
-        if strike not in self._market_open_baselines:
-            self._market_open_baselines[strike] = []
-
-        self._market_open_baselines[strike].append(gamma)
+        for strike, gamma in zip(strikes, gammas):
+            if strike not in self._market_open_baselines:
+                self._market_open_baselines[strike] = []
+            self._market_open_baselines[strike].append(gamma)
 
     def get_market_open_baseline(self, strike: float) -> Optional[float]:
         """
@@ -457,12 +474,18 @@ class WatchtowerEngine:
         if strike not in self._market_open_baselines:
             return None
 
+        if self._baseline_locked and strike in self._baseline_medians:
+            return self._baseline_medians[strike]
+
         baselines = self._market_open_baselines[strike]
         if not baselines:
             return None
 
         # Use median for robustness
-        return float(np.median(baselines))
+        median = float(np.median(baselines))
+        if self._baseline_locked:
+            self._baseline_medians[strike] = median
+        return median
 
     def _get_ml_models(self):
         """Lazy load ML probability models"""
@@ -854,17 +877,25 @@ class WatchtowerEngine:
         if timestamp.tzinfo is None:
             timestamp = timestamp.replace(tzinfo=CENTRAL_TZ)
 
-        if strike not in self.history:
-            self.history[strike] = []
-
-        self.history[strike].append((timestamp, gamma))
-
         # Keep history for full trading day (7 hours = 420 minutes to cover pre-market to close)
-        cutoff = timestamp - timedelta(minutes=420)
-        self.history[strike] = [
-            (t, g) for t, g in self.history[strike]
-            if (t.replace(tzinfo=CENTRAL_TZ) if t.tzinfo is None else t) >= cutoff
-        ]
+        self._append_history(strike, gamma, timestamp, timestamp - timedelta(minutes=self.HISTORY_MINUTES))
+
+    def _append_history(self, strike: float, gamma: float, timestamp: datetime, cutoff: datetime):
+        """Append to self.history and drop the expired prefix (entries are in time order)."""
+        entries = self.history.get(strike)
+        if entries is None:
+            entries = self.history[strike] = []
+        entries.append((timestamp, gamma))
+
+        expired = 0
+        for t, _ in entries:
+            if t.tzinfo is None:
+                t = t.replace(tzinfo=cutoff.tzinfo)
+            if t >= cutoff:
+                break
+            expired += 1
+        if expired:
+            del entries[:expired]
 
     def identify_magnets(self, strikes: List[StrikeData], top_n: int = 3) -> List[Dict]:
         """
@@ -873,10 +904,8 @@ class WatchtowerEngine:
         Returns:
             List of dicts with strike and gamma info
         """
-        sorted_strikes = sorted(strikes, key=lambda s: abs(s.net_gamma), reverse=True)
-
         magnets = []
-        for i, strike_data in enumerate(sorted_strikes[:top_n]):
+        for i, strike_data in enumerate(heapq.nlargest(top_n, strikes, key=lambda s: abs(s.net_gamma))):
             magnets.append({
                 'rank': i + 1,
                 'strike': strike_data.strike,
@@ -906,6 +935,7 @@ class WatchtowerEngine:
         # Rank strikes by gamma
         sorted_by_gamma = sorted(strikes, key=lambda s: abs(s.net_gamma), reverse=True)
         gamma_ranks = {s.strike: i + 1 for i, s in enumerate(sorted_by_gamma)}
+        max_distance = max(abs(s.strike - spot_price) for s in strikes) or 1
 
         for strike_data in strikes:
             # Probability component (0-1, higher is better)
@@ -917,7 +947,6 @@ class WatchtowerEngine:
 
             # Proximity score (closer to spot is better)
             distance = abs(strike_data.strike - spot_price)
-            max_distance = max(abs(s.strike - spot_price) for s in strikes) or 1
             proximity_score = 1 - (distance / max_distance)
 
             # Combined score
@@ -1794,6 +1823,38 @@ class WatchtowerEngine:
 
         return alerts
 
+    @staticmethod
+    def _roc_from_reference(current: np.ndarray, reference: np.ndarray, has_prior: np.ndarray) -> List[float]:
+        """Chain version of calculate_roc: % change vs reference, 0 where unavailable."""
+        valid = has_prior & np.isfinite(reference) & (reference != 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roc = np.where(valid, (current - reference) / np.abs(reference) * 100, 0.0)
+        return [round(value, 2) for value in roc.tolist()]
+
+    def _roc_since_open_for_chain(self, strikes: List[float], idx: np.ndarray,
+                                  current: np.ndarray, now: datetime, cutoff_ts: float) -> List[float]:
+        """Chain version of calculate_roc_since_open (stable baseline, else first reading after open)."""
+        market_open = now.replace(hour=8, minute=30, second=0, microsecond=0)
+
+        # If it's before market open today, no trading day ROC available
+        if now < market_open:
+            return [0.0] * len(idx)
+
+        # Try to use stable baseline first (median of first 5 minutes)
+        open_gamma = np.full(len(idx), np.nan)
+        for i, strike in enumerate(strikes):
+            baseline = self.get_market_open_baseline(strike)
+            if baseline is not None:
+                open_gamma[i] = baseline
+
+        # Fall back to first recorded value if no stable baseline
+        missing = np.isnan(open_gamma)
+        if missing.any():
+            since_ts = max(market_open.timestamp(), cutoff_ts)
+            open_gamma[missing] = self._strike_state.first_value_since(idx[missing], since_ts)
+
+        return self._roc_from_reference(current, open_gamma, np.ones(len(idx), dtype=bool))
+
     def process_options_chain(self, options_data: Dict, spot_price: float,
                                vix: float, expiration: str) -> GammaSnapshot:
         """
@@ -1815,44 +1876,80 @@ class WatchtowerEngine:
 
         # Extract strikes and calculate metrics
         strikes_data = []
-        total_gamma = 0
-        total_net_gamma = 0
         gamma_flips = []
-
-        # Get previous strike data for comparison
-        previous_strikes = {}
-        if self.previous_snapshot:
-            for s in self.previous_snapshot.strikes:
-                previous_strikes[s.strike] = s
+        strike_rows = options_data.get('strikes', [])
 
         # Calculate expected move from ATM options
         expected_move = 0
         atm_strike = round(spot_price)  # Simplified ATM finding
 
-        # Process each strike from options data
-        for strike_info in options_data.get('strikes', []):
-            strike = strike_info.get('strike', 0)
-            call_gamma = strike_info.get('call_gamma', 0)
-            put_gamma = strike_info.get('put_gamma', 0)
-            call_oi = strike_info.get('call_oi', 0)
-            put_oi = strike_info.get('put_oi', 0)
+        # Per-strike state is updated for the whole chain at once: smoothing,
+        # history and ROC lookups are array operations keyed by strike index
+        state = self._strike_state
+        cutoff = timestamp - timedelta(minutes=self.HISTORY_MINUTES)
+        cutoff_ts = cutoff.timestamp()
+        if state.ticks == 0 and self.history:
+            # History restored from the database before the first refresh
+            state.seed(self.history, cutoff_ts)
+
+        strikes = [s.get('strike', 0) for s in strike_rows]
+        idx = state.indices(strikes)
+
+        # Calculate raw net gamma
+        raw_net_gamma = np.array([
+            self.calculate_net_gamma(s.get('call_gamma', 0), s.get('put_gamma', 0),
+                                     s.get('call_oi', 0), s.get('put_oi', 0))
+            for s in strike_rows
+        ], dtype=float)
+
+        # Apply smoothing to reduce noise from Tradier Greeks recalculations
+        # This uses median of recent readings and dampens suspicious large swings
+        if self._gamma_smoothing_enabled:
+            net_gammas = state.smooth(idx, raw_net_gamma, spot_price,
+                                      self._previous_spot_price, self._max_gamma_change_pct)
+        else:
+            net_gammas = raw_net_gamma
 
-            # Calculate raw net gamma
-            raw_net_gamma = self.calculate_net_gamma(call_gamma, put_gamma, call_oi, put_oi)
+        # Update market open baseline (first 5 minutes of trading)
+        net_gamma_list = net_gammas.tolist()
+        self._update_market_open_baselines(strikes, net_gamma_list, timestamp)
 
-            # Apply smoothing to reduce noise from Tradier Greeks recalculations
-            # This uses median of recent readings and dampens suspicious large swings
-            net_gamma = self._smooth_gamma_value(strike, raw_net_gamma, spot_price)
+        total_gamma = float(np.abs(net_gammas).sum())
+        total_net_gamma = float(net_gammas.sum())
 
-            # Update market open baseline (first 5 minutes of trading)
-            self._update_market_open_baseline(strike, net_gamma)
+        # Previous tick's gamma for flip detection (0 for strikes not in it)
+        if self.previous_snapshot:
+            prev_gammas = state.previous_gamma(idx)
+        else:
+            prev_gammas = np.zeros(len(idx))
+
+        # Update history for ROC calculation (ROC needs a prior reading in the window)
+        has_prior = state.has_prior(idx, cutoff_ts)
+        state.record(idx, net_gammas, timestamp.timestamp(), keep_since_ts=cutoff_ts)
+        for strike, net_gamma in zip(strikes, net_gamma_list):
+            self._append_history(strike, net_gamma, timestamp, cutoff)
+
+        # Calculate ROC at multiple timeframes
+        rocs = {}
+        for minutes in self.ROC_WINDOWS_MINUTES:
+            target_ts = (timestamp - timedelta(minutes=minutes)).timestamp()
+            old = state.value_at(idx, target_ts, cutoff_ts)
+            rocs[minutes] = self._roc_from_reference(net_gammas, old, has_prior)
+        rocs_trading_day = self._roc_since_open_for_chain(strikes, idx, net_gammas, timestamp, cutoff_ts)
+
+        # Calculate gamma change percentage
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gamma_change = np.where(prev_gammas != 0, (net_gammas - prev_gammas) / np.abs(prev_gammas) * 100, 0.0)
+        gamma_change = gamma_change.tolist()
+        prev_gammas = prev_gammas.tolist()
 
-            total_gamma += abs(net_gamma)
-            total_net_gamma += net_gamma
+        # Process each strike from options data
+        for i, strike_info in enumerate(strike_rows):
+            strike = strikes[i]
+            net_gamma = net_gamma_list[i]
+            prev_gamma = prev_gammas[i]
 
             # Check for gamma flip
-            prev_strike = previous_strikes.get(strike)
-            prev_gamma = prev_strike.net_gamma if prev_strike else 0
             flipped, flip_dir = self.detect_gamma_flip(net_gamma, prev_gamma)
 
             if flipped:
@@ -1863,29 +1960,19 @@ class WatchtowerEngine:
                     'gamma_after': net_gamma
                 })
 
-            # Update history for ROC calculation
-            self.update_history(strike, net_gamma, timestamp)
-
-            # Calculate ROC at multiple timeframes
-            history = self.history.get(strike, [])
-            roc_1min = self.calculate_roc(strike, net_gamma, history, minutes=1)
-            roc_5min = self.calculate_roc(strike, net_gamma, history, minutes=5)
-            roc_30min = self.calculate_roc(strike, net_gamma, history, minutes=30)
-            roc_1hr = self.calculate_roc(strike, net_gamma, history, minutes=60)
-            roc_4hr = self.calculate_roc(strike, net_gamma, history, minutes=240)
-            roc_trading_day = self.calculate_roc_since_open(net_gamma, history, strike=strike)
-
-            # Calculate gamma change percentage
-            gamma_change_pct = 0
-            if prev_gamma and prev_gamma != 0:
-                gamma_change_pct = ((net_gamma - prev_gamma) / abs(prev_gamma)) * 100
+            roc_1min = rocs[1][i]
+            roc_5min = rocs[5][i]
+            roc_30min = rocs[30][i]
+            roc_1hr = rocs[60][i]
+            roc_4hr = rocs[240][i]
+            roc_trading_day = rocs_trading_day[i]
 
             strike_data = StrikeData(
                 strike=strike,
                 net_gamma=net_gamma,
-                call_gamma=call_gamma,
-                put_gamma=put_gamma,
-                gamma_change_pct=round(gamma_change_pct, 2),
+                call_gamma=strike_info.get('call_gamma', 0),
+                put_gamma=strike_info.get('put_gamma', 0),
+                gamma_change_pct=round(gamma_change[i], 2),
                 roc_1min=roc_1min,
                 roc_5min=roc_5min,
                 roc_30min=roc_30min,
@@ -1922,8 +2009,8 @@ class WatchtowerEngine:
 
         # Build gamma_structure for ML predictions
         # Find magnets early (top 3 by gamma magnitude)
-        sorted_by_gamma = sorted(strikes_data, key=lambda s: abs(s.net_gamma), reverse=True)
-        top_magnets = [{'strike': s.strike, 'gamma': s.net_gamma} for s in sorted_by_gamma[:3]]
+        top_by_gamma = heapq.nlargest(3, strikes_data, key=lambda s: abs(s.net_gamma))
+        top_magnets = [{'strike': s.strike, 'gamma': s.net_gamma} for s in top_by_gamma]
 
         # Calculate flip point (weighted average of positive/negative gamma centers)
         positive_strikes = [s for s in strikes_data if s.net_gamma > 0]
@@ -0,0 +1,278 @@
+"""
+WATCHTOWER Strike State - Incremental per-strike gamma state
+============================================================
+
+Preallocated arrays behind WatchtowerEngine.process_options_chain. Every strike
+gets a fixed row index the first time it is seen; all per-strike state lives in
+numpy arrays addressed by that index:
+
+- Smoothing window: ring of the last N raw net gamma readings (median smoothing)
+- Gamma history: ring of tick columns on a shared time axis (ROC lookups)
+- Last tick: net gamma / tick number of the previous refresh (flip detection)
+
+A refresh is one vectorized pass over the chain instead of per-strike list
+scans, and strikes whose raw gamma has not changed (with a settled smoothing
+window) skip the smoothing step entirely.
+
+Author: AlphaGEX Team
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Initial tick columns in the history ring (~8.5h at a 15s refresh). The ring
+# grows if a faster refresh would overwrite readings still inside the window.
+DEFAULT_HISTORY_TICKS = 2048
+DEFAULT_STRIKE_CAPACITY = 256
+
+
+class StrikeGammaState:
+    """Per-strike smoothing window, gamma history ring and last-tick values."""
+
+    def __init__(self, window_size: int = 5, history_ticks: int = DEFAULT_HISTORY_TICKS,
+                 strike_capacity: int = DEFAULT_STRIKE_CAPACITY):
+        self.window_size = window_size
+        self.history_ticks = history_ticks
+        self._index: Dict[float, int] = {}
+        self._capacity = 0
+        self._n = 0
+
+        # Shared time axis for the history ring (epoch seconds per tick column)
+        self._times = np.full(history_ticks, -np.inf)
+        self._head = 0          # Next column to write
+        self._filled = 0        # Columns holding data
+        self.ticks = 0          # Ticks recorded since creation
+
+        self._allocate(strike_capacity)
+
+    # =========================================================================
+    # STRIKE INDEX
+    # =========================================================================
+
+    def _allocate(self, capacity: int):
+        """Grow every per-strike array to `capacity` rows, keeping existing rows."""
+        def grow(old, shape_tail, fill, dtype=float):
+            new = np.full((capacity,) + shape_tail, fill, dtype=dtype)
+            if old is not None:
+                new[:old.shape[0]] = old
+            return new
+
+        first = self._capacity == 0
+        self.strikes = grow(None if first else self.strikes, (), np.nan)
+        self.gamma = grow(None if first else self.gamma, (self.history_ticks,), np.nan)
+        self.window = grow(None if first else self.window, (self.window_size,), np.nan)
+        self.window_pos = grow(None if first else self.window_pos, (), 0, dtype=np.int64)
+        self.window_count = grow(None if first else self.window_count, (), 0, dtype=np.int64)
+        self.last_gamma = grow(None if first else self.last_gamma, (), 0.0)
+        self.last_tick = grow(None if first else self.last_tick, (), -1, dtype=np.int64)
+        self.last_time = grow(None if first else self.last_time, (), -np.inf)
+        self._capacity = capacity
+
+    def indices(self, strikes) -> np.ndarray:
+        """Row index for each strike, assigning rows to strikes seen for the first time."""
+        out = np.empty(len(strikes), dtype=np.int64)
+        for i, strike in enumerate(strikes):
+            idx = self._index.get(strike)
+            if idx is None:
+                if self._n == self._capacity:
+                    self._allocate(max(self._capacity * 2, 16))
+                idx = self._n
+                self._index[strike] = idx
+                self.strikes[idx] = strike
+                self._n += 1
+            out[i] = idx
+        return out
+
+    def __len__(self) -> int:
+        return self._n
+
+    # =========================================================================
+    # SMOOTHING
+    # =========================================================================
+
+    def reset_smoothing(self, window_size: int = None):
+        """Clear smoothing windows (new trading day or window size change)."""
+        if window_size is not None and window_size != self.window_size:
+            self.window_size = window_size
+            self.window = np.full((self._capacity, window_size), np.nan)
+        else:
+            self.window.fill(np.nan)
+        self.window_pos.fill(0)
+        self.window_count.fill(0)
+
+    def smooth(self, idx: np.ndarray, raw: np.ndarray, spot_price: float,
+               previous_spot: float, max_change_pct: float) -> np.ndarray:
+        """
+        Vectorized WatchtowerEngine._smooth_gamma_value over a chain.
+
+        Large gamma swings without a price move are dampened (70% previous,
+        30% new) before entering the window; the result is the window median
+        once it holds 3+ readings, the mean before that.
+        """
+        raw = np.asarray(raw, dtype=float)
+        w = self.window_size
+        count = self.window_count[idx]
+        pos = self.window_pos[idx]
+        last = self.window[idx, (pos - 1) % w]
+
+        # Unchanged strikes with a full window of that same value: nothing to do
+        settled = (count >= w) & (last == raw)
+        if settled.any():
+            settled[settled] = np.all(self.window[idx[settled]] == raw[settled, None], axis=1)
+        if settled.all():
+            return raw.copy()
+
+        active = ~settled
+        a_idx, a_raw, a_last = idx[active], raw[active].copy(), last[active]
+        a_count, a_pos = count[active], pos[active]
+
+        if previous_spot:
+            price_change_pct = abs((spot_price - previous_spot) / previous_spot) * 100
+            if price_change_pct < 0.1:
+                has_last = (a_count > 0) & (a_last != 0)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    change_pct = np.abs((a_raw - a_last) / np.abs(a_last)) * 100
+                dampen = has_last & (change_pct > max_change_pct)
+                if dampen.any():
+                    a_raw[dampen] = 0.7 * a_last[dampen] + 0.3 * a_raw[dampen]
+                    logger.debug(f"Dampened gamma spikes at {int(dampen.sum())} strikes "
+                                 f"with {price_change_pct:.2f}% price move")
+
+        self.window[a_idx, a_pos % w] = a_raw
+        self.window_pos[a_idx] = (a_pos + 1) % w
+        a_count = np.minimum(a_count + 1, w)
+        self.window_count[a_idx] = a_count
+
+        rows = self.window[a_idx]
+        smoothed_active = np.where(a_count >= 3, np.nanmedian(rows, axis=1), np.nanmean(rows, axis=1))
+
+        smoothed = raw.copy()
+        smoothed[active] = smoothed_active
+        return smoothed
+
+    # =========================================================================
+    # HISTORY RING
+    # =========================================================================
+
+    def previous_gamma(self, idx: np.ndarray) -> np.ndarray:
+        """Net gamma from the previous tick (0 for strikes absent from it)."""
+        return np.where(self.last_tick[idx] == self.ticks - 1, self.last_gamma[idx], 0.0)
+
+    def has_prior(self, idx: np.ndarray, cutoff_ts: float) -> np.ndarray:
+        """True where the strike already has a reading at/after cutoff_ts (before this tick)."""
+        return self.last_time[idx] >= cutoff_ts
+
+    def record(self, idx: np.ndarray, gamma: np.ndarray, ts: float, keep_since_ts: float = -np.inf):
+        """
+        Append one tick column; strikes not in idx are absent (NaN) for this tick.
+
+        The ring doubles instead of overwriting a column newer than keep_since_ts,
+        so faster refresh rates never shorten the ROC lookback.
+        """
+        if self._filled == self.history_ticks and self._times[self._head] >= keep_since_ts:
+            self._grow_history()
+
+        col = self._head
+        self._times[col] = ts
+        self.gamma[:, col] = np.nan
+        self.gamma[idx, col] = gamma
+        self._head = (col + 1) % self.history_ticks
+        self._filled = min(self._filled + 1, self.history_ticks)
+
+        self.last_gamma[idx] = gamma
+        self.last_tick[idx] = self.ticks
+        self.last_time[idx] = ts
+        self.ticks += 1
+
+    def _grow_history(self):
+        order = self._ordered_columns()
+        size = self.history_ticks * 2
+        times = np.full(size, -np.inf)
+        times[:len(order)] = self._times[order]
+        gamma = np.full((self._capacity, size), np.nan)
+        gamma[:, :len(order)] = self.gamma[:, order]
+        self._times, self.gamma = times, gamma
+        self._head = len(order)
+        self.history_ticks = size
+        logger.debug(f"WATCHTOWER strike state: history ring grown to {size} ticks")
+
+    def _ordered_columns(self) -> np.ndarray:
+        start = (self._head - self._filled) % self.history_ticks
+        return (start + np.arange(self._filled)) % self.history_ticks
+
+    def value_at(self, idx: np.ndarray, target_ts: float, min_ts: float) -> np.ndarray:
+        """
+        Latest gamma per strike recorded at or before target_ts (and not before
+        min_ts). NaN where there is none.
+        """
+        out = np.full(len(idx), np.nan)
+        if not self._filled:
+            return out
+        order = self._ordered_columns()
+        p = int(np.searchsorted(self._times[order], target_ts, side='right')) - 1
+        if p < 0:
+            return out
+
+        cols = order[:p + 1]
+        out = self.gamma[idx, cols[-1]].copy()
+        times = np.full(len(idx), self._times[cols[-1]])
+
+        missing = np.isnan(out)
+        if missing.any():
+            # Strike absent from that tick: walk back to its last reading
+            sub = self.gamma[np.ix_(idx[missing], cols)]
+            present = ~np.isnan(sub)
+            last = np.where(present.any(axis=1), p - np.argmax(present[:, ::-1], axis=1), -1)
+            found = last >= 0
+            vals = np.full(len(last), np.nan)
+            vals[found] = sub[np.nonzero(found)[0], last[found]]
+            out[missing] = vals
+            t = np.full(len(last), -np.inf)
+            t[found] = self._times[cols[last[found]]]
+            times[missing] = t
+
+        out[times < min_ts] = np.nan
+        return out
+
+    def first_value_since(self, idx: np.ndarray, since_ts: float) -> np.ndarray:
+        """Earliest gamma per strike recorded at or after since_ts. NaN where there is none."""
+        out = np.full(len(idx), np.nan)
+        if not self._filled:
+            return out
+        order = self._ordered_columns()
+        q = int(np.searchsorted(self._times[order], since_ts, side='left'))
+        if q >= len(order):
+            return out
+        sub = self.gamma[np.ix_(idx, order[q:])]
+        present = ~np.isnan(sub)
+        first = np.argmax(present, axis=1)
+        found = present.any(axis=1)
+        out[found] = sub[np.nonzero(found)[0], first[found]]
+        return out
+
+    def seed(self, history: Dict[float, List[Tuple[datetime, float]]], cutoff_ts: float = -np.inf):
+        """
+        Rebuild the ring from (time, gamma) lists, e.g. history restored from
+        the database on restart. Readings sharing a timestamp form one tick.
+        """
+        by_time: Dict[float, Tuple[List[float], List[float]]] = {}
+        for strike, entries in history.items():
+            for t, g in entries:
+                ts = t.timestamp()
+                if ts < cutoff_ts:
+                    continue
+                strikes, gammas = by_time.setdefault(ts, ([], []))
+                strikes.append(strike)
+                gammas.append(g)
+
+        for ts in sorted(by_time):
+            strikes, gammas = by_time[ts]
+            self.record(self.indices(strikes), np.asarray(gammas, dtype=float), ts, cutoff_ts)
+        # Restored readings are history only - there is no previous snapshot to diff against
+        self.last_tick.fill(-1)
+        return len(by_time)
@@ -0,0 +1,342 @@
+"""
+Incremental Bar Store
+=====================
+
+Local, persistent copy of Polygon aggregate bars for PolygonDataFetcher.
+
+Bars are kept per (symbol, timeframe, multiplier) together with the date
+ranges that have already been requested from Polygon, so a caller asking for
+any window only fetches the days that were never covered:
+
+    <root>/<SYMBOL>/<timeframe>_<multiplier>/
+        meta.json            symbol, timeframe, multiplier, bars file, covered ranges
+        bars-<version>.npy   structured array (t, day, open, high, low, close, volume)
+
+Rows are sorted by t (epoch ms, as Polygon returns it); day is the
+America/New_York session date of the bar, so a date-range slice is two
+binary searches on a memory-mapped array and an as-of lookup is one.
+meta.json is written last with os.replace and names the bars file it
+describes, so a reader never sees coverage for bars that were not written.
+
+Coverage only ever includes completed days. The current session is refetched
+when the last fetch of it is older than live_ttl seconds.
+
+Usage:
+    store = get_bar_store()                      # POLYGON_BAR_STORE_DIR or data/bar_store
+    series = store.series('I:VIX', 'day', 1)
+    for start, end in series.missing(date(2024, 1, 1), date(2024, 12, 31)):
+        series.add(fetch(start, end), start, end)
+    df = series.frame(date(2024, 1, 1), date(2024, 12, 31))
+    vix = series.asof(date(2024, 6, 14))
+
+Author: AlphaGEX Team
+"""
+
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bar_store')
+
+MARKET_TZ = ZoneInfo("America/New_York")
+
+BAR_DTYPE = np.dtype([
+    ('t', '<i8'),
+    ('day', 'datetime64[D]'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+])
+
+_POLYGON_FIELDS = (('open', 'o'), ('high', 'h'), ('low', 'l'), ('close', 'c'), ('volume', 'v'))
+
+
+def _as_day(value) -> np.datetime64:
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return np.datetime64(value, 'D')
+    return np.datetime64(str(value)[:10], 'D')
+
+
+def _today() -> np.datetime64:
+    return np.datetime64(datetime.now(MARKET_TZ).date(), 'D')
+
+
+def bars_from_polygon(results: List[Dict]) -> np.ndarray:
+    """Polygon aggs 'results' -> sorted BAR_DTYPE array (indices have no volume)."""
+    bars = np.zeros(len(results), dtype=BAR_DTYPE)
+    if not results:
+        return bars
+    bars['t'] = [r['t'] for r in results]
+    for name, key in _POLYGON_FIELDS:
+        bars[name] = [r.get(key, 0) or 0 for r in results]
+    sessions = pd.to_datetime(bars['t'], unit='ms', utc=True).tz_convert(MARKET_TZ)
+    bars['day'] = sessions.tz_localize(None).values.astype('datetime64[D]')
+    return bars[np.argsort(bars['t'], kind='stable')]
+
+
+def _merge_ranges(ranges: List[Tuple[np.datetime64, np.datetime64]]) -> List[Tuple[np.datetime64, np.datetime64]]:
+    """Union of inclusive day ranges, adjacent ranges joined."""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class BarSeries:
+    """Bars + covered day ranges for one (symbol, timeframe, multiplier)."""
+
+    def __init__(self, symbol: str, timeframe: str, multiplier: int,
+                 path: Optional[str] = None, live_ttl: float = 3600):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.multiplier = multiplier
+        self.path = path
+        self.live_ttl = live_ttl
+        self.bars = np.zeros(0, dtype=BAR_DTYPE)
+        self.coverage: List[Tuple[np.datetime64, np.datetime64]] = []
+        self._live_fetched_at: Optional[float] = None
+        self._meta_mtime = None
+        self._bars_file: Optional[str] = None
+        self._lock = threading.RLock()
+        self._reload()
+
+    # -------------------------------------------------------------------------
+    # Disk
+    # -------------------------------------------------------------------------
+
+    def _meta_path(self) -> Optional[str]:
+        return os.path.join(self.path, 'meta.json') if self.path else None
+
+    def _reload(self) -> None:
+        """(Re)load from disk when meta.json changed - e.g. written by another process."""
+        meta_path = self._meta_path()
+        if not meta_path:
+            return
+        try:
+            mtime = os.stat(meta_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._meta_mtime:
+            return
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            self.bars = np.load(os.path.join(self.path, meta['file']), mmap_mode='r')
+            self.coverage = [(np.datetime64(s, 'D'), np.datetime64(e, 'D')) for s, e in meta['coverage']]
+            self._bars_file = meta['file']
+            self._meta_mtime = mtime
+        except Exception as e:
+            logger.warning(f"Bar store: could not load {self.path}: {e}")
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            bars_file = f'bars-{uuid.uuid4().hex[:12]}.npy'
+            np.save(os.path.join(self.path, bars_file), np.ascontiguousarray(self.bars))
+            tmp_meta = os.path.join(self.path, f'.meta-{bars_file}.json')
+            with open(tmp_meta, 'w') as f:
+                json.dump({
+                    'symbol': self.symbol,
+                    'timeframe': self.timeframe,
+                    'multiplier': self.multiplier,
+                    'file': bars_file,
+                    'rows': int(len(self.bars)),
+                    'coverage': [[str(s), str(e)] for s, e in self.coverage],
+                    'updated_at': datetime.now().isoformat(),
+                }, f)
+            os.replace(tmp_meta, self._meta_path())
+            self._meta_mtime = os.stat(self._meta_path()).st_mtime_ns
+            self.bars = np.load(os.path.join(self.path, bars_file), mmap_mode='r')
+            # Open memory maps of the previous file stay valid after the unlink
+            previous, self._bars_file = self._bars_file, bars_file
+            if previous:
+                try:
+                    os.remove(os.path.join(self.path, previous))
+                except OSError:
+                    pass
+        except Exception as e:
+            # Keep serving from memory; the gap is simply refetched next run
+            logger.warning(f"Bar store: could not persist {self.path}: {e}")
+
+    # -------------------------------------------------------------------------
+    # Coverage
+    # -------------------------------------------------------------------------
+
+    def missing(self, start, end) -> List[Tuple[date, date]]:
+        """Inclusive day ranges within [start, end] that still need fetching."""
+        start, end = _as_day(start), _as_day(end)
+        today = _today()
+        with self._lock:
+            self._reload()
+            gaps = []
+            cursor = start
+            complete_end = min(end, today - 1)
+            for cov_start, cov_end in self.coverage:
+                if cursor > complete_end:
+                    break
+                if cov_end < cursor:
+                    continue
+                if cov_start > cursor:
+                    gaps.append((cursor, min(cov_start - 1, complete_end)))
+                cursor = max(cursor, cov_end + 1)
+            if cursor <= complete_end:
+                gaps.append((cursor, complete_end))
+
+            # The current session is never complete - refetch it once live_ttl has passed
+            if end >= today:
+                stale = self._live_fetched_at is None or time.time() - self._live_fetched_at > self.live_ttl
+                if stale:
+                    live_start = max(start, today)
+                    if gaps and gaps[-1][1] + 1 >= live_start:
+                        gaps[-1] = (gaps[-1][0], end)
+                    else:
+                        gaps.append((live_start, end))
+
+        return [(s.astype(date), e.astype(date)) for s, e in gaps]
+
+    def add(self, results: List[Dict], start, end, truncated: bool = False) -> np.ndarray:
+        """
+        Merge one Polygon response for [start, end] and mark the range covered.
+
+        New bars replace stored bars with the same timestamp. When the
+        response was cut off (truncated: Polygon sent a next_url), coverage
+        stops before the last returned day so the remainder is fetched next
+        time; a cut-off response with no bars covers nothing.
+        Returns the new bars.
+        """
+        start, end = _as_day(start), _as_day(end)
+        new = bars_from_polygon(results)
+        today = _today()
+        with self._lock:
+            self._reload()
+            if len(new):
+                combined = np.concatenate([np.asarray(self.bars), new])
+                # Keep the last occurrence of each timestamp (the fresh fetch)
+                order = np.argsort(combined['t'], kind='stable')
+                combined = combined[order]
+                keep = np.ones(len(combined), dtype=bool)
+                keep[:-1] = combined['t'][1:] != combined['t'][:-1]
+                self.bars = combined[keep]
+
+            covered_end = min(end, today - 1)
+            if truncated:
+                covered_end = min(covered_end, new['day'][-1] - 1) if len(new) else start - 1
+            if covered_end >= start:
+                self.coverage = _merge_ranges(self.coverage + [(start, covered_end)])
+            if end >= today and not truncated:
+                self._live_fetched_at = time.time()
+            self._save()
+        return new
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def slice(self, start, end) -> np.ndarray:
+        """Bars whose session day is within [start, end]."""
+        with self._lock:
+            self._reload()
+            bars = self.bars
+        days = bars['day']
+        lo = int(np.searchsorted(days, _as_day(start), side='left'))
+        hi = int(np.searchsorted(days, _as_day(end), side='right'))
+        return bars[lo:hi]
+
+    def frame(self, start, end) -> pd.DataFrame:
+        """[start, end] as the Open/High/Low/Close/Volume frame get_price_history returns."""
+        return bars_frame(self.slice(start, end))
+
+    def asof(self, day, field: str = 'close', max_gap_days: Optional[int] = None) -> Optional[float]:
+        """
+        Value of the last bar on or before day (binary search). None if there
+        is none, or if it is more than max_gap_days before day.
+        """
+        day = _as_day(day)
+        with self._lock:
+            self._reload()
+            bars = self.bars
+        i = int(np.searchsorted(bars['day'], day, side='right')) - 1
+        if i < 0:
+            return None
+        if max_gap_days is not None and (day - bars['day'][i]).astype(int) > max_gap_days:
+            return None
+        return float(bars[field][i])
+
+    def __len__(self) -> int:
+        return len(self.bars)
+
+
+def bars_frame(bars: np.ndarray) -> pd.DataFrame:
+    """BAR_DTYPE rows -> DataFrame indexed by naive UTC bar time."""
+    index = pd.DatetimeIndex(pd.to_datetime(np.asarray(bars['t']), unit='ms'), name='date')
+    return pd.DataFrame({
+        'Open': np.array(bars['open']),
+        'High': np.array(bars['high']),
+        'Low': np.array(bars['low']),
+        'Close': np.array(bars['close']),
+        'Volume': np.array(bars['volume']),
+    }, index=index)
+
+
+class BarStore:
+    """All bar series under one root. root=None keeps everything in memory."""
+
+    def __init__(self, root: Optional[str] = DEFAULT_STORE_DIR, live_ttl: float = 3600):
+        self.root = root
+        self.live_ttl = live_ttl
+        self._series: Dict[tuple, BarSeries] = {}
+        self._lock = threading.Lock()
+
+    def series(self, symbol: str, timeframe: str = 'day', multiplier: int = 1) -> BarSeries:
+        key = (symbol.upper(), timeframe, int(multiplier))
+        with self._lock:
+            if key not in self._series:
+                path = None
+                if self.root:
+                    safe_symbol = key[0].replace(':', '_').replace('/', '_')
+                    path = os.path.join(self.root, safe_symbol, f'{timeframe}_{int(multiplier)}')
+                self._series[key] = BarSeries(key[0], timeframe, int(multiplier), path, self.live_ttl)
+            return self._series[key]
+
+    def clear(self) -> None:
+        """Forget the in-memory series (files on disk are kept)."""
+        with self._lock:
+            self._series.clear()
+
+
+_store_instances: Dict[Optional[str], BarStore] = {}
+
+
+def get_bar_store(root: Optional[str] = None) -> BarStore:
+    """Shared store for root (default: POLYGON_BAR_STORE_DIR, else data/bar_store)."""
+    root = root or os.getenv('POLYGON_BAR_STORE_DIR') or DEFAULT_STORE_DIR
+    if root not in _store_instances:
+        store_root = root
+        try:
+            os.makedirs(root, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Bar store: {root} not writable ({e}), keeping bars in memory only")
+            store_root = None
+        _store_instances[root] = BarStore(store_root)
+    return _store_instances[root]
@@ -17,12 +17,16 @@ Data Sources:
 import os
 import time
 import logging
+import threading
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any, Tuple
 from dataclasses import dataclass, field
 from zoneinfo import ZoneInfo
 
+from data.max_pain import PainCurve, pain_curve
+
 logger = logging.getLogger(__name__)
 
 CENTRAL_TZ = ZoneInfo("America/Chicago")
@@ -241,6 +245,7 @@ class CryptoMarketSnapshot:
     # Open Interest (→ Gamma Walls)
     oi_levels: List[OpenInterestLevel] = field(default_factory=list)
     max_pain: Optional[float] = None
+    pain_curve: List[Dict] = field(default_factory=list)  # [{'strike', 'pain'}], min at max_pain
 
     # Liquidations (→ Price Magnets)
     liquidation_clusters: List[LiquidationCluster] = field(default_factory=list)
@@ -268,6 +273,58 @@ class CryptoMarketSnapshot:
     combined_confidence: str = "LOW"        # HIGH / MEDIUM / LOW
 
 
+# ---------------------------------------------------------------------------
+# Shared upstream rate budgets
+# ---------------------------------------------------------------------------
+
+class UpstreamBudget:
+    """Thread-safe token bucket shared by every client of one upstream.
+
+    Refills one request per `interval_s`, holding at most `burst` requests.
+    acquire() reserves the next slot under the lock and sleeps outside it,
+    so concurrent callers queue in order instead of racing a shared
+    last-request timestamp.
+    """
+
+    def __init__(self, interval_s: float, burst: int = 1):
+        self.interval_s = interval_s
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; returns seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) / self.interval_s)
+            self._last = now
+            self._tokens -= 1
+            wait = max(0.0, -self._tokens * self.interval_s)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_upstream_budgets: Dict[str, UpstreamBudget] = {}
+_upstream_budgets_lock = threading.Lock()
+
+
+def get_upstream_budget(name: str, interval_s: float, burst: int = 1) -> UpstreamBudget:
+    """Process-wide budget for one upstream API (created on first use)."""
+    with _upstream_budgets_lock:
+        if name not in _upstream_budgets:
+            _upstream_budgets[name] = UpstreamBudget(interval_s, burst)
+        return _upstream_budgets[name]
+
+
+# How often the crypto_snapshot_refresh scheduler job runs. Each run
+# re-warms the coins whose cached snapshot is within SNAPSHOT_REWARM_LEAD_S
+# of expiring, so bot reads keep hitting the (short, fixed) cache TTL.
+SNAPSHOT_REFRESH_INTERVAL_S = 30
+SNAPSHOT_REWARM_LEAD_S = 45
+
+
 # ---------------------------------------------------------------------------
 # CoinGlass API Client
 # ---------------------------------------------------------------------------
@@ -294,19 +351,16 @@ class CoinGlassClient:
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("COINGLASS_API_KEY", "")
-        self._last_request_time = 0
-        # CoinGlass paid plans are tier-throttled. Hobbyist = 30/min (one
-        # call per 2s). 2.5s padding fits with margin.
-        self._rate_limit_ms = 2500
+        # CoinGlass paid plans are tier-throttled. Hobbyist = 30/min. One
+        # call per 2.5s plus a burst of 5 (one snapshot's worth of calls)
+        # stays at or under 29 calls in any minute. Shared across threads.
+        self._budget = get_upstream_budget("coinglass", interval_s=2.5, burst=5)
         # Endpoints that returned "Upgrade plan" - skip on subsequent calls
         self._gated_endpoints: set = set()
 
     def _rate_limit(self):
         """Enforce rate limiting."""
-        elapsed = (time.time() - self._last_request_time) * 1000
-        if elapsed < self._rate_limit_ms:
-            time.sleep((self._rate_limit_ms - elapsed) / 1000)
-        self._last_request_time = time.time()
+        self._budget.acquire()
 
     def _is_gated_msg(self, msg: str) -> bool:
         m = (msg or "").lower()
@@ -748,14 +802,10 @@ class DeribitClient:
     BASE_URL = "https://www.deribit.com/api/v2/public"
 
     def __init__(self):
-        self._last_request_time = 0
-        self._rate_limit_ms = 100  # 10 req/sec
+        self._budget = get_upstream_budget("deribit", interval_s=0.1, burst=5)  # 10 req/sec
 
     def _rate_limit(self):
-        elapsed = (time.time() - self._last_request_time) * 1000
-        if elapsed < self._rate_limit_ms:
-            time.sleep((self._rate_limit_ms - elapsed) / 1000)
-        self._last_request_time = time.time()
+        self._budget.acquire()
 
     def _request(self, method: str, params: Optional[Dict] = None) -> Optional[Any]:
         """Make a Deribit public API request."""
@@ -859,32 +909,20 @@ class DeribitClient:
             ))
         return levels
 
+    def calculate_pain_curve(self, oi_levels: List[OpenInterestLevel]) -> PainCurve:
+        """Holder payout (USD) at every OI strike; see data/max_pain.py."""
+        return pain_curve(
+            [level.strike for level in oi_levels],
+            [level.call_oi for level in oi_levels],
+            [level.put_oi for level in oi_levels],
+        )
+
     def calculate_max_pain(self, oi_levels: List[OpenInterestLevel]) -> Optional[float]:
         """Calculate max pain - the price where most options expire worthless.
 
         This is the crypto equivalent of the GEX flip point.
         """
-        if not oi_levels:
-            return None
-
-        strikes = [level.strike for level in oi_levels]
-        min_pain = float("inf")
-        max_pain_strike = None
-
-        for candidate in strikes:
-            total_pain = 0
-            for level in oi_levels:
-                # Call pain: calls are worthless below strike
-                if candidate > level.strike:
-                    total_pain += (candidate - level.strike) * level.call_oi
-                # Put pain: puts are worthless above strike
-                if candidate < level.strike:
-                    total_pain += (level.strike - candidate) * level.put_oi
-            if total_pain < min_pain:
-                min_pain = total_pain
-                max_pain_strike = candidate
-
-        return max_pain_strike
+        return self.calculate_pain_curve(oi_levels).max_pain
 
 
 # ---------------------------------------------------------------------------
@@ -938,11 +976,18 @@ class CryptoDataProvider:
         # Per-symbol cache (supports multi-coin without eviction)
         self._snapshot_cache: Dict[str, CryptoMarketSnapshot] = {}
         self._snapshot_cache_time: Dict[str, float] = {}
-        # 90s TTL keeps us well under CoinGlass rate limits even when 5
-        # perp bots all scan together. Each snapshot does ~5 CoinGlass
-        # calls; with 2.5s padding that's ~12s per snapshot, so the
-        # cache window comfortably covers a single full refresh cycle.
+        # Executors and signals read spot_price from the snapshot as the live
+        # price, so the TTL stays short and fixed. Each entry is stamped when
+        # it is published; the scheduled refresh re-warms entries before they
+        # expire (rewarm_snapshots) instead of the TTL stretching to fit it.
         self._cache_ttl: int = 90  # seconds
+        self._coinglass_pool = ThreadPoolExecutor(
+            max_workers=self._COINGLASS_WORKERS, thread_name_prefix="crypto-coinglass")
+        self._fast_pool = ThreadPoolExecutor(
+            max_workers=self._FAST_WORKERS, thread_name_prefix="crypto-fetch")
+        # Symbols being refreshed right now -> Future of their snapshot
+        self._inflight: Dict[str, Future] = {}
+        self._refresh_lock = threading.Lock()
 
     def get_snapshot(self, symbol: str = "ETH") -> CryptoMarketSnapshot:
         """Get complete market microstructure snapshot.
@@ -950,13 +995,122 @@ class CryptoDataProvider:
         This is the main entry point - equivalent to WATCHTOWER's process_options_chain().
         Returns a CryptoMarketSnapshot with all signals derived.
         """
+        return self.get_snapshots([symbol])[symbol]
+
+    def get_snapshots(
+        self,
+        symbols: List[str],
+        max_age: Optional[float] = None,
+    ) -> Dict[str, Optional[CryptoMarketSnapshot]]:
+        """Snapshots for several symbols in one pass.
+
+        Every upstream call for every stale symbol (spot, CoinGlass funding /
+        L/S / OI / taker / liquidations, Deribit chain) is issued at once on
+        per-upstream worker pools, so a pass costs about one round trip plus
+        whatever the shared CoinGlass budget forces. Stale symbols are fetched
+        oldest first. A symbol already being refreshed by another caller is
+        waited on rather than fetched twice.
+
+        Args:
+            symbols: Coins to return snapshots for
+            max_age: Refetch cached snapshots older than this many seconds
+                (defaults to the cache TTL; never longer than it)
+        """
         now = time.time()
-        cached = self._snapshot_cache.get(symbol)
-        cached_time = self._snapshot_cache_time.get(symbol, 0)
-        if cached and (now - cached_time) < self._cache_ttl:
-            return cached
+        max_age = self._cache_ttl if max_age is None else min(max_age, self._cache_ttl)
+        results: Dict[str, Optional[CryptoMarketSnapshot]] = {}
+        owned: Dict[str, Future] = {}
+        waiting: Dict[str, Future] = {}
+
+        with self._refresh_lock:
+            unique = list(dict.fromkeys(symbols))
+            for symbol in sorted(unique, key=lambda s: self._snapshot_cache_time.get(s, 0)):
+                cached = self._snapshot_cache.get(symbol)
+                cached_time = self._snapshot_cache_time.get(symbol, 0)
+                if cached and (now - cached_time) < max_age:
+                    results[symbol] = cached
+                elif symbol in self._inflight:
+                    waiting[symbol] = self._inflight[symbol]
+                else:
+                    owned[symbol] = self._inflight[symbol] = Future()
+
+        if owned:
+            def publish(symbol: str, snapshot: Optional[CryptoMarketSnapshot]):
+                with self._refresh_lock:
+                    if snapshot is not None:
+                        self._snapshot_cache[symbol] = snapshot
+                        self._snapshot_cache_time[symbol] = time.time()
+                    self._inflight.pop(symbol, None)
+                results[symbol] = snapshot
+                owned[symbol].set_result(snapshot)
 
-        spot = self._get_spot_price(symbol)
+            try:
+                self._refresh(list(owned), publish)
+            finally:
+                for symbol, future in owned.items():
+                    if not future.done():
+                        publish(symbol, None)
+
+        for symbol, future in waiting.items():
+            results[symbol] = future.result()
+        return {symbol: results[symbol] for symbol in dict.fromkeys(symbols)}
+
+    def rewarm_snapshots(self, symbols: List[str]) -> Dict[str, Optional[CryptoMarketSnapshot]]:
+        """Refresh every symbol that is missing or within SNAPSHOT_REWARM_LEAD_S
+        of expiring, so bot reads between scheduled runs hit a fresh entry."""
+        return self.get_snapshots(symbols, max_age=self._cache_ttl - SNAPSHOT_REWARM_LEAD_S)
+
+    # Worker threads per upstream, shared by every refresh pass. CoinGlass
+    # calls spend most of their time queued on the shared budget, so they
+    # get their own pool and cannot starve the Deribit / spot requests.
+    _COINGLASS_WORKERS = 5
+    _FAST_WORKERS = 8
+    def _refresh(self, symbols: List[str], publish) -> None:
+        """Fetch fresh snapshots for symbols, calling publish(symbol, snapshot)
+        as each one is built (in symbols order) so early symbols are not held
+        back by the rest of the pass."""
+        pending = {
+            s: self._submit_fetches(s, self._coinglass_pool, self._fast_pool)
+            for s in symbols
+        }
+
+        for symbol, futures in pending.items():
+            try:
+                snapshot = self._build_snapshot(
+                    symbol, {name: f.result() for name, f in futures.items()}
+                )
+            except Exception as e:
+                logger.error(f"CryptoDataProvider: snapshot failed for {symbol}: {e}")
+                snapshot = None
+            publish(symbol, snapshot)
+
+    def _submit_fetches(
+        self,
+        symbol: str,
+        coinglass_pool: ThreadPoolExecutor,
+        fast_pool: ThreadPoolExecutor,
+    ) -> Dict[str, Future]:
+        """Start every upstream request one snapshot of symbol needs."""
+        futures = {"spot": fast_pool.submit(self._get_spot_price, symbol)}
+
+        # Only query Deribit options for currencies Deribit actually lists.
+        # Calling get_options_chain_data on unsupported symbols (XRP, DOGE,
+        # SHIB, AVAX, LINK, LTC, BCH) returns HTTP 400 and spams logs; the
+        # synthetic fallback in _build_snapshot handles those coins instead.
+        if self._deribit and symbol.upper() in self._DERIBIT_SUPPORTED:
+            futures["oi_levels"] = fast_pool.submit(self._deribit.get_options_chain_data, symbol)
+
+        if self._coinglass:
+            futures["funding_rate"] = coinglass_pool.submit(self._coinglass.get_funding_rate, symbol)
+            futures["ls_ratio"] = coinglass_pool.submit(self._coinglass.get_long_short_ratio, symbol)
+            futures["oi_snapshot"] = coinglass_pool.submit(self._coinglass.get_open_interest, symbol)
+            futures["taker_volume"] = coinglass_pool.submit(self._coinglass.get_taker_volume, symbol)
+            futures["liquidations"] = coinglass_pool.submit(self._coinglass.get_liquidation_data, symbol)
+        return futures
+
+    def _build_snapshot(self, symbol: str, fetched: Dict[str, Any]) -> Optional[CryptoMarketSnapshot]:
+        """Assemble a snapshot from _submit_fetches results and derive signals."""
+        spot = fetched.get("spot")
         if not spot or spot <= 0:
             logger.warning(f"CryptoDataProvider: No valid spot price for {symbol}")
             return None
@@ -966,14 +1120,14 @@ class CryptoDataProvider:
             timestamp=datetime.now(CENTRAL_TZ),
         )
 
-        # Fetch all data sources (with graceful fallbacks)
+        # CoinGlass sources (each None / [] when the request failed)
         if self._coinglass:
-            snapshot.funding_rate = self._coinglass.get_funding_rate(symbol)
-            snapshot.ls_ratio = self._coinglass.get_long_short_ratio(symbol)
-            snapshot.oi_snapshot = self._coinglass.get_open_interest(symbol)
-            snapshot.taker_volume = self._coinglass.get_taker_volume(symbol)
+            snapshot.funding_rate = fetched.get("funding_rate")
+            snapshot.ls_ratio = fetched.get("ls_ratio")
+            snapshot.oi_snapshot = fetched.get("oi_snapshot")
+            snapshot.taker_volume = fetched.get("taker_volume")
 
-            liquidations = self._coinglass.get_liquidation_data(symbol)
+            liquidations = fetched.get("liquidations")
             if liquidations and spot:
                 for liq in liquidations:
                     liq.distance_pct = abs(liq.price_level - spot) / spot * 100
@@ -992,18 +1146,15 @@ class CryptoDataProvider:
                         shorts_above, key=lambda x: x.short_liquidation_usd
                     ).price_level
 
-        # Only query Deribit options for currencies Deribit actually lists.
-        # Calling get_options_chain_data on unsupported symbols (XRP, DOGE,
-        # SHIB, AVAX, LINK, LTC, BCH) returns HTTP 400 and spams logs; the
-        # synthetic fallback below handles those coins instead.
-        if self._deribit and symbol.upper() in self._DERIBIT_SUPPORTED:
-            oi_levels = self._deribit.get_options_chain_data(symbol)
-            if oi_levels:
-                snapshot.oi_levels = oi_levels
-                snapshot.max_pain = self._deribit.calculate_max_pain(oi_levels)
+        oi_levels = fetched.get("oi_levels")
+        if oi_levels:
+            snapshot.oi_levels = oi_levels
+            curve = self._deribit.calculate_pain_curve(oi_levels)
+            snapshot.max_pain = curve.max_pain
+            snapshot.pain_curve = curve.to_list()
 
-                # Build crypto GEX from OI data
-                snapshot.crypto_gex = self._build_crypto_gex(symbol, spot, oi_levels)
+            # Build crypto GEX from OI data
+            snapshot.crypto_gex = self._build_crypto_gex(symbol, spot, oi_levels)
 
         # Synthetic fallback for coins without Deribit options (AVAX, XRP,
         # DOGE, SHIB, etc.). Approximates max_pain from liquidation clusters
@@ -1023,9 +1174,6 @@ class CryptoDataProvider:
 
         # Derive combined signals
         self._derive_signals(snapshot)
-
-        self._snapshot_cache[symbol] = snapshot
-        self._snapshot_cache_time[symbol] = now
         return snapshot
 
     def get_funding_rate(self, symbol: str = "ETH") -> Optional[FundingRate]:
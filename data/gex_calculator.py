@@ -25,6 +25,10 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
+from data.max_pain import PainCurve, pain_curve
+
 logger = logging.getLogger(__name__)
 
 # Texas Central Time - standard timezone for all AlphaGEX operations
@@ -312,6 +316,7 @@ class GEXResult:
     data_source: str
     timestamp: datetime
     strikes_data: List[Dict] = None  # Detailed per-strike data
+    pain_curve: List[Dict] = None  # Holder payout per strike ({'strike', 'pain'}), min at max_pain
 
 
 def calculate_gex_from_chain(
@@ -401,7 +406,8 @@ def calculate_gex_from_chain(
     gamma_flip = find_gamma_flip(strikes_gex, spot_price)
 
     # Calculate max pain
-    max_pain = calculate_max_pain(call_oi_by_strike, put_oi_by_strike, spot_price)
+    curve = max_pain_curve(call_oi_by_strike, put_oi_by_strike)
+    max_pain = spot_price if curve.max_pain is None else curve.max_pain
 
     # Net GEX is the SIGNED PER-STRIKE sum, NOT (total_call - total_put) of two
     # huge near-equal totals. The difference-of-totals form sign-flips minute to
@@ -443,7 +449,8 @@ def calculate_gex_from_chain(
         max_pain=max_pain,
         data_source='tradier_calculated',
         timestamp=datetime.now(),
-        strikes_data=strikes_data
+        strikes_data=strikes_data,
+        pain_curve=curve.to_list()
     )
 
 
@@ -489,6 +496,23 @@ def find_gamma_flip(strikes_gex: Dict, spot_price: float) -> float:
     return closest_strike
 
 
+def max_pain_curve(
+    call_oi: Dict[float, int],
+    put_oi: Dict[float, int]
+) -> PainCurve:
+    """
+    Dollar pain to option holders at every strike carrying call or put OI
+    (see data/max_pain.py). Empty curve when there is no OI.
+    """
+    strikes = list(set(call_oi) | set(put_oi))
+    return pain_curve(
+        strikes,
+        [call_oi.get(k, 0) for k in strikes],
+        [put_oi.get(k, 0) for k in strikes],
+        multiplier=100
+    )
+
+
 def calculate_max_pain(
     call_oi: Dict[float, int],
     put_oi: Dict[float, int],
@@ -496,44 +520,278 @@ def calculate_max_pain(
 ) -> float:
     """
     Calculate max pain - the strike where total dollar loss is minimized for option holders.
-    This is often a "magnet" price at expiration.
+    This is often a "magnet" price at expiration. Ties go to the lowest strike.
     """
-    if not call_oi and not put_oi:
-        return spot_price
+    strike = max_pain_curve(call_oi, put_oi).max_pain
+    return spot_price if strike is None else strike
+
+
+# =============================================================================
+# COLUMNAR (NUMPY) GEX PATH
+# =============================================================================
+#
+# Same math as calculate_gex_from_chain / compute_walls / find_gamma_flip /
+# calculate_max_pain, but over parallel arrays with a sort-based group-by
+# instead of per-contract dicts. Used by TradierGEXCalculator on full
+# multi-expiration chains; the dict path stays as the reference
+# implementation (see tests/test_gex_calculator.py parity tests).
+
+def option_chain_to_arrays(
+    contracts: Any
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert an options chain into parallel arrays in a single pass.
+
+    Args:
+        contracts: an OptionChain (all expirations are flattened), or an
+            iterable of OptionContract objects or contract dicts with
+            'strike', 'gamma', 'open_interest', 'option_type'.
+
+    Returns:
+        (strikes, gammas, open_interest, is_call) — float64, float64, float64
+        and bool arrays. Contracts that are neither calls nor puts are dropped.
+    """
+    if hasattr(contracts, 'chains'):
+        contracts = [c for chain in contracts.chains.values() for c in chain]
+    elif not isinstance(contracts, list):
+        contracts = list(contracts or [])
+
+    n = len(contracts)
+    strikes = np.zeros(n, dtype=np.float64)
+    gammas = np.zeros(n, dtype=np.float64)
+    open_interest = np.zeros(n, dtype=np.float64)
+    is_call = np.zeros(n, dtype=bool)
+    keep = np.zeros(n, dtype=bool)
+
+    for i, c in enumerate(contracts):
+        if isinstance(c, dict):
+            strike, gamma = c.get('strike', 0), c.get('gamma', 0)
+            oi, option_type = c.get('open_interest', 0), c.get('option_type', '')
+        else:
+            strike, gamma = c.strike, c.gamma
+            oi, option_type = c.open_interest, c.option_type
+        option_type = (option_type or '').lower()
+        if option_type not in ('call', 'put'):
+            continue
+        strikes[i] = float(strike or 0)
+        gammas[i] = float(gamma or 0)
+        open_interest[i] = int(oi or 0)
+        is_call[i] = option_type == 'call'
+        keep[i] = True
+
+    if not keep.all():
+        return strikes[keep], gammas[keep], open_interest[keep], is_call[keep]
+    return strikes, gammas, open_interest, is_call
+
+
+def compute_walls_from_arrays(
+    strikes: np.ndarray,
+    call_gamma: np.ndarray,
+    put_gamma: np.ndarray,
+    spot: float
+) -> Tuple[float, float]:
+    """
+    Vectorized compute_walls over per-strike arrays.
+
+    Identical rules (spot-side constraint, fallbacks, collision guard) and
+    tie-breaking (lowest strike wins) as compute_walls.
+
+    Args:
+        strikes: per-strike prices (any order, no duplicates).
+        call_gamma: per-strike call gamma/GEX (sign-agnostic).
+        put_gamma: per-strike put gamma/GEX (sign-agnostic).
+        spot: current spot price.
+
+    Returns:
+        (call_wall, put_wall)
+    """
+    strikes = np.asarray(strikes, dtype=np.float64)
+    valid = strikes > 0
+    if not valid.any():
+        return spot, spot
+
+    order = np.argsort(strikes[valid], kind='stable')
+    k = strikes[valid][order]
+    call_g = np.abs(np.asarray(call_gamma, dtype=np.float64)[valid][order])
+    put_g = np.abs(np.asarray(put_gamma, dtype=np.float64)[valid][order])
+
+    # ----- Call wall: argmax(call_gamma) over strikes >= spot -----
+    # Strikes are sorted, so ">= spot" is a suffix and "<= spot" a prefix.
+    lo = int(np.searchsorted(k, spot, side='left'))
+    hi = int(np.searchsorted(k, spot, side='right'))
+    call_wall = None
+    if lo < len(k):
+        idx = lo + int(np.argmax(call_g[lo:]))
+        if call_g[idx] > 0:
+            call_wall = float(k[idx])
+    if call_wall is None:
+        call_wall = float(k[hi]) if hi < len(k) else float(k[int(np.argmax(call_g))])
+
+    # ----- Put wall: argmax(put_gamma) over strikes <= spot -----
+    put_wall = None
+    if hi > 0:
+        idx = int(np.argmax(put_g[:hi]))
+        if put_g[idx] > 0:
+            put_wall = float(k[idx])
+    if put_wall is None:
+        put_wall = float(k[lo - 1]) if lo > 0 else float(k[int(np.argmax(put_g))])
+
+    # ----- Collision guard: never return call_wall == put_wall -----
+    if call_wall == put_wall:
+        above = int(np.searchsorted(k, call_wall, side='right'))
+        below = int(np.searchsorted(k, put_wall, side='left'))
+        if above < len(k):
+            call_wall = float(k[above])
+        elif below > 0:
+            put_wall = float(k[below - 1])
+        else:
+            call_wall = call_wall + 0.01
+            put_wall = put_wall - 0.01
 
-    all_strikes = set(call_oi.keys()) | set(put_oi.keys())
-    if not all_strikes:
+    return call_wall, put_wall
+
+
+def _gamma_flip_from_arrays(
+    strikes: np.ndarray,
+    net_gex: np.ndarray,
+    spot_price: float
+) -> float:
+    """find_gamma_flip over sorted per-strike arrays."""
+    if len(strikes) == 0:
         return spot_price
 
-    min_pain = float('inf')
-    max_pain_strike = spot_price
+    neg = net_gex < 0
+    crossings = np.flatnonzero(neg[:-1] != neg[1:])
+    if len(crossings):
+        i = int(crossings[0])
+        prev_net, net = float(net_gex[i]), float(net_gex[i + 1])
+        ratio = abs(prev_net) / (abs(prev_net) + abs(net))
+        return float(strikes[i]) + ratio * (float(strikes[i + 1]) - float(strikes[i]))
+
+    return float(strikes[int(np.argmin(np.abs(strikes - spot_price)))])
+
+
+def _max_pain_curve_from_arrays(
+    strikes: np.ndarray,
+    call_oi: np.ndarray,
+    put_oi: np.ndarray
+) -> PainCurve:
+    """
+    max_pain_curve over per-strike arrays, evaluated at every strike
+    carrying call or put OI.
+    """
+    has_oi = (call_oi > 0) | (put_oi > 0)
+    return pain_curve(strikes[has_oi], call_oi[has_oi], put_oi[has_oi], multiplier=100)
+
 
-    for test_strike in all_strikes:
-        total_pain = 0
+def calculate_gex_from_arrays(
+    symbol: str,
+    spot_price: float,
+    strikes: np.ndarray,
+    gammas: np.ndarray,
+    open_interest: np.ndarray,
+    is_call: np.ndarray,
+    contract_multiplier: int = 100
+) -> GEXResult:
+    """
+    Columnar equivalent of calculate_gex_from_chain.
+
+    Args:
+        symbol: Underlying symbol
+        spot_price: Current spot price
+        strikes: per-contract strikes
+        gammas: per-contract gamma (per share)
+        open_interest: per-contract open interest
+        is_call: per-contract flag, True for calls and False for puts
+        contract_multiplier: Usually 100 for equity options
+
+    Returns:
+        GEXResult with all GEX metrics (same fields and scale as the dict path)
+    """
+    strikes = np.asarray(strikes, dtype=np.float64)
+    if len(strikes) == 0 or spot_price <= 0:
+        return calculate_gex_from_chain(symbol, spot_price, [], contract_multiplier)
+
+    gammas = np.nan_to_num(np.asarray(gammas, dtype=np.float64))
+    open_interest = np.nan_to_num(np.asarray(open_interest, dtype=np.float64))
+    is_call = np.asarray(is_call, dtype=bool)
+
+    valid = (strikes > 0) & (gammas > 0) & (open_interest > 0)
+    strikes, gammas = strikes[valid], gammas[valid]
+    open_interest, is_call = open_interest[valid], is_call[valid]
+
+    # Same per-1%-move scale as calculate_gex_from_chain.
+    PER_1PCT = 0.01
+    gex = gammas * open_interest * contract_multiplier * (spot_price ** 2) * PER_1PCT
+
+    # Group by strike: unique() sorts, inverse maps each contract to its bucket.
+    unique_strikes, inverse = np.unique(strikes, return_inverse=True)
+    n = len(unique_strikes)
+    is_put = ~is_call
+    call_gex = np.bincount(inverse, weights=np.where(is_call, gex, 0.0), minlength=n)
+    put_gex = -np.bincount(inverse, weights=np.where(is_put, gex, 0.0), minlength=n)
+    call_oi = np.bincount(inverse, weights=np.where(is_call, open_interest, 0.0), minlength=n)
+    put_oi = np.bincount(inverse, weights=np.where(is_put, open_interest, 0.0), minlength=n)
+    net = call_gex + put_gex
+
+    gamma_flip = _gamma_flip_from_arrays(unique_strikes, net, spot_price)
+    curve = _max_pain_curve_from_arrays(unique_strikes, call_oi, put_oi)
+    max_pain = spot_price if curve.max_pain is None else curve.max_pain
+    call_wall_strike, put_wall_strike = compute_walls_from_arrays(
+        unique_strikes, call_gex, put_gex, spot_price
+    )
+
+    strikes_data = [
+        {'strike': s, 'call_gex': c, 'put_gex': p, 'net_gex': g}
+        for s, c, p, g in zip(
+            unique_strikes.tolist(), call_gex.tolist(), put_gex.tolist(), net.tolist()
+        )
+    ]
+
+    return GEXResult(
+        symbol=symbol,
+        spot_price=spot_price,
+        net_gex=float(net.sum()),
+        call_gex=float(call_gex.sum()),
+        put_gex=float(put_gex.sum()),  # Already negative
+        call_wall=call_wall_strike,
+        put_wall=put_wall_strike,
+        gamma_flip=gamma_flip,
+        flip_point=gamma_flip,
+        max_pain=max_pain,
+        data_source='tradier_calculated',
+        timestamp=datetime.now(),
+        strikes_data=strikes_data,
+        pain_curve=curve.to_list()
+    )
 
-        # Pain for call holders (lose money if price below strike)
-        for strike, oi in call_oi.items():
-            if test_strike < strike:
-                # Calls expire worthless
-                pass
-            else:
-                # Calls have intrinsic value
-                total_pain += (test_strike - strike) * oi * 100
 
-        # Pain for put holders (lose money if price above strike)
-        for strike, oi in put_oi.items():
-            if test_strike > strike:
-                # Puts expire worthless
-                pass
-            else:
-                # Puts have intrinsic value
-                total_pain += (strike - test_strike) * oi * 100
+def format_gex_result(result: GEXResult) -> Dict[str, Any]:
+    """Format a GEXResult like the TradingVolatilityAPI get_gex() response."""
+    return {
+        'symbol': result.symbol,
+        'spot_price': result.spot_price,
+        'net_gex': result.net_gex,
+        'call_gex': result.call_gex,
+        'put_gex': result.put_gex,
+        'call_wall': result.call_wall,
+        'put_wall': result.put_wall,
+        'gamma_flip': result.gamma_flip,
+        'flip_point': result.flip_point,
+        'max_pain': result.max_pain,
+        'data_source': 'tradier_calculated',
+        'collection_date': result.timestamp.strftime('%Y-%m-%d'),
+        'is_calculated': True
+    }
 
-        if total_pain < min_pain:
-            min_pain = total_pain
-            max_pain_strike = test_strike
 
-    return max_pain_strike
+def _snapshot_bus_enabled() -> bool:
+    """True when live GEX reads should go through data.market_snapshot."""
+    try:
+        from data.market_snapshot import MARKET_SNAPSHOT_BUS_ENABLED
+        return MARKET_SNAPSHOT_BUS_ENABLED
+    except ImportError:
+        return False
 
 
 class TradierGEXCalculator:
@@ -600,6 +858,18 @@ class TradierGEXCalculator:
             'collection_date': str
         }
         """
+        # Shared per-tick snapshot: every bot asking for this symbol in the
+        # same tick reuses one quote + chain fetch.
+        if _snapshot_bus_enabled():
+            try:
+                from data.market_snapshot import get_snapshot_bus
+                gex_data = get_snapshot_bus(self._sandbox).get_gex(symbol)
+                if gex_data:
+                    return gex_data
+                return {'error': f'Could not calculate GEX for {symbol}'}
+            except Exception as e:
+                logger.warning(f"Market snapshot GEX unavailable for {symbol}, fetching directly: {e}")
+
         # Check cache first
         if self._is_cache_valid(symbol):
             return self._cache[symbol]['data']
@@ -623,41 +893,14 @@ class TradierGEXCalculator:
             if not chain or not chain.chains:
                 return {'error': f'Could not get options chain for {symbol}'}
 
-            # Flatten all contracts into a list
-            all_contracts = []
-            for expiration, contracts in chain.chains.items():
-                for contract in contracts:
-                    all_contracts.append({
-                        'strike': contract.strike,
-                        'gamma': contract.gamma,
-                        'delta': contract.delta,
-                        'open_interest': contract.open_interest,
-                        'option_type': contract.option_type,
-                        'expiration': expiration
-                    })
-
-            if not all_contracts:
+            # Flatten all expirations into columnar arrays once
+            chain_arrays = option_chain_to_arrays(chain)
+            if len(chain_arrays[0]) == 0:
                 return {'error': f'No options data for {symbol}'}
 
-            # Calculate GEX
-            result = calculate_gex_from_chain(symbol, spot_price, all_contracts)
-
-            # Format response like TradingVolatilityAPI
-            gex_data = {
-                'symbol': result.symbol,
-                'spot_price': result.spot_price,
-                'net_gex': result.net_gex,
-                'call_gex': result.call_gex,
-                'put_gex': result.put_gex,
-                'call_wall': result.call_wall,
-                'put_wall': result.put_wall,
-                'gamma_flip': result.gamma_flip,
-                'flip_point': result.flip_point,
-                'max_pain': result.max_pain,
-                'data_source': 'tradier_calculated',
-                'collection_date': result.timestamp.strftime('%Y-%m-%d'),
-                'is_calculated': True
-            }
+            # Calculate GEX and format response like TradingVolatilityAPI
+            result = calculate_gex_from_arrays(symbol, spot_price, *chain_arrays)
+            gex_data = format_gex_result(result)
 
             # Cache the result
             self._cache[symbol] = {
@@ -719,7 +962,6 @@ class TradierGEXCalculator:
 
             # Calculate GEX by expiration
             expirations_data = []
-            all_contracts = []
 
             for expiration, contracts in chain.chains.items():
                 exp_gamma = sum(c.gamma * c.open_interest for c in contracts if c.gamma)
@@ -739,16 +981,8 @@ class TradierGEXCalculator:
                     'put_gamma': sum(c.gamma * c.open_interest for c in contracts if c.option_type == 'put' and c.gamma)
                 })
 
-                for contract in contracts:
-                    all_contracts.append({
-                        'strike': contract.strike,
-                        'gamma': contract.gamma,
-                        'open_interest': contract.open_interest,
-                        'option_type': contract.option_type
-                    })
-
             # Calculate overall GEX
-            result = calculate_gex_from_chain(symbol, spot_price, all_contracts)
+            result = calculate_gex_from_arrays(symbol, spot_price, *option_chain_to_arrays(chain))
 
             return {
                 'symbol': symbol,
@@ -757,6 +991,7 @@ class TradierGEXCalculator:
                 'call_wall': result.call_wall,
                 'put_wall': result.put_wall,
                 'max_pain': result.max_pain,
+                'pain_curve': result.pain_curve or [],
                 'net_gex': result.net_gex,
                 'strikes': result.strikes_data or [],
                 'expirations': sorted(expirations_data, key=lambda x: x['date']),
@@ -843,31 +1078,17 @@ class TradierGEXCalculator:
             if not zero_dte_contracts:
                 return {'error': f'No 0DTE options found for {symbol}'}
 
-            # Convert contracts to format for GEX calculation
+            # Convert contracts to columnar arrays for GEX calculation
             # Also calculate P/C ratio from open interest
-            options_data = []
-            total_call_oi = 0
-            total_put_oi = 0
-
-            for contract in zero_dte_contracts:
-                options_data.append({
-                    'strike': contract.strike,
-                    'gamma': contract.gamma,
-                    'open_interest': contract.open_interest,
-                    'option_type': contract.option_type
-                })
-                # Track OI for P/C ratio
-                oi = contract.open_interest or 0
-                if contract.option_type == 'call':
-                    total_call_oi += oi
-                elif contract.option_type == 'put':
-                    total_put_oi += oi
+            strikes, gammas, open_interest, is_call = option_chain_to_arrays(zero_dte_contracts)
+            total_call_oi = int(open_interest[is_call].sum())
+            total_put_oi = int(open_interest[~is_call].sum())
 
             # Calculate P/C ratio
             put_call_ratio = total_put_oi / total_call_oi if total_call_oi > 0 else 0
 
             # Calculate GEX for 0DTE only
-            result = calculate_gex_from_chain(symbol, spot_price, options_data)
+            result = calculate_gex_from_arrays(symbol, spot_price, strikes, gammas, open_interest, is_call)
 
             # Format gamma_array to match TradingVolatility API format
             gamma_array = []
@@ -913,6 +1134,7 @@ class TradierGEXCalculator:
                 'call_wall': call_wall_filtered,
                 'put_wall': put_wall_filtered,
                 'max_pain': result.max_pain,
+                'pain_curve': result.pain_curve or [],
                 'net_gex': result.net_gex,
                 'put_call_ratio': round(put_call_ratio, 3),
                 'total_call_oi': total_call_oi,
@@ -955,54 +1177,36 @@ class TradierGEXCalculator:
             return {'error': 'Tradier client not available'}
 
         try:
-            # Get spot price
-            quote = tradier.get_quote(symbol)
-            if not quote:
-                return {'error': f'Could not get quote for {symbol}'}
-
-            spot_price = float(quote.get('last', 0) or quote.get('close', 0) or 0)
-            if spot_price <= 0:
-                return {'error': f'Invalid spot price for {symbol}'}
-
             # Get options chain with Greeks - use get_multiple_chains to get ALL expirations
             # get_option_chain without expiration only returns the NEAREST expiration
-            # For "all expirations" comparison, we need multiple expirations
+            # For "all expirations" comparison, we need multiple expirations.
+            # The batch fetches the underlying quote once (last, else close),
+            # so the chain's underlying_price is the spot.
             chain = tradier.get_multiple_chains(symbol, num_expirations=8, greeks=True)
-            if not chain or not chain.chains:
+            spot_price = float(chain.underlying_price or 0) if chain else 0.0
+            if spot_price <= 0:
+                return {'error': f'Invalid spot price for {symbol}'}
+            if not chain.chains:
                 return {'error': f'No options chain for {symbol}'}
 
             logger.info(f"Fetched {len(chain.chains)} expirations for {symbol}: {list(chain.chains.keys())}")
 
-            # Combine ALL expirations
-            all_contracts = []
-            total_call_oi = 0
-            total_put_oi = 0
-            expirations_included = []
+            # Combine ALL expirations into columnar arrays in one pass
+            expirations_included = list(chain.chains.keys())
+            strikes, gammas, open_interest, is_call = option_chain_to_arrays(chain)
 
-            for expiration, contracts in chain.chains.items():
-                expirations_included.append(expiration)
-                for contract in contracts:
-                    all_contracts.append({
-                        'strike': contract.strike,
-                        'gamma': contract.gamma,
-                        'open_interest': contract.open_interest,
-                        'option_type': contract.option_type
-                    })
-                    # Track OI for P/C ratio
-                    oi = contract.open_interest or 0
-                    if contract.option_type == 'call':
-                        total_call_oi += oi
-                    elif contract.option_type == 'put':
-                        total_put_oi += oi
-
-            if not all_contracts:
+            if len(strikes) == 0:
                 return {'error': f'No options contracts found for {symbol}'}
 
+            # Track OI for P/C ratio
+            total_call_oi = int(open_interest[is_call].sum())
+            total_put_oi = int(open_interest[~is_call].sum())
+
             # Calculate P/C ratio
             put_call_ratio = total_put_oi / total_call_oi if total_call_oi > 0 else 0
 
             # Calculate GEX for ALL expirations
-            result = calculate_gex_from_chain(symbol, spot_price, all_contracts)
+            result = calculate_gex_from_arrays(symbol, spot_price, strikes, gammas, open_interest, is_call)
 
             # Format gamma_array to match TradingVolatility API format
             gamma_array = []
@@ -1048,6 +1252,7 @@ class TradierGEXCalculator:
                 'call_wall': call_wall_filtered,
                 'put_wall': put_wall_filtered,
                 'max_pain': result.max_pain,
+                'pain_curve': result.pain_curve or [],
                 'net_gex': result.net_gex,
                 'put_call_ratio': round(put_call_ratio, 3),
                 'total_call_oi': total_call_oi,
@@ -0,0 +1,445 @@
+"""
+Market Snapshot Bus - one shared market read per scheduler tick
+
+Every 5 minutes the scheduler fires FORTRESS, ANCHOR, SOLOMON, GIDEON, SAMSON,
+WATCHTOWER, ... and each bot used to pull the same SPY/SPX quote, VIX, option
+chain and GEX through its own fetcher. The bus fetches each of those once per
+tick and publishes the result as an immutable, versioned MarketSnapshot that
+every reader shares:
+
+    bus = get_snapshot_bus()
+    spot = bus.get_price('SPY')
+    gex = bus.get_gex('SPY')          # same dict shape as TradierGEXCalculator.get_gex
+    chain = bus.get_chain('SPY', '2025-01-17')
+
+The watch set is learned from reads: the first read of an item is a miss that
+fetches it once and adds it to the watch set; every later refresh fetches all
+watched items together (one batched quote call, one VIX read, chains
+concurrently, GEX derived from the already-fetched nearest chain).
+
+Refreshes are single-flight: when the snapshot is older than
+MARKET_SNAPSHOT_MAX_AGE the first reader refreshes and concurrent readers
+wait for that refresh instead of issuing their own requests. A failed refresh
+keeps serving the previous snapshot (counted as a stale serve); a partial one
+carries the previous entry forward for every quote, chain, GEX or VIX that
+came back missing.
+
+Env:
+    MARKET_SNAPSHOT_BUS_ENABLED  - 'false' to route reads straight to the fetchers
+    MARKET_SNAPSHOT_MAX_AGE      - seconds a snapshot stays fresh (default 60)
+"""
+
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from data.gex_calculator import (
+    calculate_gex_from_arrays,
+    format_gex_result,
+    option_chain_to_arrays,
+)
+
+logger = logging.getLogger(__name__)
+
+CENTRAL_TZ = ZoneInfo("America/Chicago")
+
+MARKET_SNAPSHOT_BUS_ENABLED = os.getenv('MARKET_SNAPSHOT_BUS_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+MARKET_SNAPSHOT_MAX_AGE = float(os.getenv('MARKET_SNAPSHOT_MAX_AGE', '60'))
+
+# (symbol, expiration); expiration None = nearest expiration
+ChainKey = Tuple[str, Optional[str]]
+
+
+def _empty_mapping() -> Mapping:
+    return MappingProxyType({})
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """
+    Immutable view of the market at one refresh.
+
+    Readers share the same objects - treat quotes, GEX dicts and chains as
+    read-only. A new version is published on every refresh or miss fill.
+    """
+    version: int = 0
+    taken_at: float = float('-inf')  # time.monotonic() of the refresh
+    timestamp: Optional[datetime] = None
+    quotes: Mapping[str, Dict[str, Any]] = field(default_factory=_empty_mapping)
+    vix: Optional[float] = None
+    gex: Mapping[str, Dict[str, Any]] = field(default_factory=_empty_mapping)
+    chains: Mapping[ChainKey, Any] = field(default_factory=_empty_mapping)
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        return (time.monotonic() if now is None else now) - self.taken_at
+
+
+def _quote_price(quote: Optional[Dict[str, Any]]) -> float:
+    if not quote:
+        return 0.0
+    return float(quote.get('last', 0) or quote.get('close', 0) or 0)
+
+
+@dataclass
+class _BusStats:
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    fetch_errors: int = 0
+    stale_serves: int = 0
+    carried_over: int = 0
+    last_refresh_ms: float = 0.0
+    by_kind: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def count(self, kind: str, hit: bool) -> None:
+        bucket = self.by_kind.setdefault(kind, {'hits': 0, 'misses': 0})
+        if hit:
+            self.hits += 1
+            bucket['hits'] += 1
+        else:
+            self.misses += 1
+            bucket['misses'] += 1
+
+
+class MarketSnapshotBus:
+    """
+    Process-wide shared market data with single-flight refresh.
+
+    Args:
+        fetcher: Object with get_quotes(symbols) and
+            get_option_chain(symbol, expiration, greeks, underlying_price)
+            (a TradierDataFetcher). Created lazily when None.
+        vix_source: Zero-arg callable returning VIX (default vix_fetcher.get_vix_price)
+        max_age: Seconds a snapshot stays fresh (default MARKET_SNAPSHOT_MAX_AGE)
+        sandbox: Tradier mode for the lazily created fetcher
+        max_workers: Concurrent chain fetches per refresh
+    """
+
+    def __init__(
+        self,
+        fetcher=None,
+        vix_source: Optional[Callable[[], float]] = None,
+        max_age: Optional[float] = None,
+        sandbox: Optional[bool] = None,
+        max_workers: int = 4
+    ):
+        self._fetcher = fetcher
+        self._vix_source = vix_source
+        self._sandbox = sandbox
+        self.max_age = MARKET_SNAPSHOT_MAX_AGE if max_age is None else float(max_age)
+        self._max_workers = max(1, max_workers)
+
+        self._snapshot = MarketSnapshot()
+        self._watch_quotes: set = set()
+        self._watch_gex: set = set()
+        self._watch_chains: set = set()
+        self._watch_vix = False
+
+        # _refresh_lock serializes network refreshes (single-flight);
+        # _publish_lock only guards the copy-on-write swap of _snapshot.
+        self._refresh_lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        self._stats = _BusStats()
+
+    # ==================== SOURCES ====================
+
+    def _get_fetcher(self):
+        if self._fetcher is None:
+            from data.tradier_data_fetcher import TradierDataFetcher
+            self._fetcher = TradierDataFetcher(sandbox=self._sandbox)
+        return self._fetcher
+
+    def _read_vix(self) -> Optional[float]:
+        source = self._vix_source
+        if source is None:
+            from data.vix_fetcher import get_vix_price
+            source = get_vix_price
+        vix = source()
+        return float(vix) if vix else None
+
+    def _fetch_quotes(self, symbols: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        symbols = sorted(set(symbols))
+        if not symbols:
+            return {}
+        try:
+            return dict(self._get_fetcher().get_quotes(symbols))
+        except Exception as e:
+            self._stats.fetch_errors += 1
+            logger.warning(f"Snapshot quote fetch failed for {symbols}: {e}")
+            return {}
+
+    def _fetch_chain(self, key: ChainKey, spot: float):
+        symbol, expiration = key
+        try:
+            chain = self._get_fetcher().get_option_chain(
+                symbol, expiration, greeks=True, underlying_price=spot or None
+            )
+        except Exception as e:
+            self._stats.fetch_errors += 1
+            logger.warning(f"Snapshot chain fetch failed for {symbol} {expiration or 'nearest'}: {e}")
+            return None
+        return chain if chain and chain.chains else None
+
+    def _fetch_vix(self) -> Optional[float]:
+        try:
+            return self._read_vix()
+        except Exception as e:
+            self._stats.fetch_errors += 1
+            logger.warning(f"Snapshot VIX fetch failed: {e}")
+            return None
+
+    @staticmethod
+    def _build_gex(symbol: str, spot: float, chain) -> Optional[Dict[str, Any]]:
+        if spot <= 0 or chain is None:
+            return None
+        arrays = option_chain_to_arrays(chain)
+        if len(arrays[0]) == 0:
+            return None
+        return format_gex_result(calculate_gex_from_arrays(symbol, spot, *arrays))
+
+    # ==================== SNAPSHOT LIFECYCLE ====================
+
+    def _has_watches(self) -> bool:
+        return bool(self._watch_quotes or self._watch_gex or self._watch_chains or self._watch_vix)
+
+    def _publish(self, **changes) -> MarketSnapshot:
+        with self._publish_lock:
+            current = self._snapshot
+            merged = {}
+            for name in ('quotes', 'gex', 'chains'):
+                if name in changes:
+                    merged[name] = MappingProxyType({**getattr(current, name), **changes.pop(name)})
+            if current.timestamp is None:
+                # First fill of a never-refreshed bus starts the freshness clock
+                changes.update(taken_at=time.monotonic(), timestamp=datetime.now(CENTRAL_TZ))
+            self._snapshot = replace(current, version=current.version + 1, **merged, **changes)
+            return self._snapshot
+
+    def snapshot(self) -> MarketSnapshot:
+        """Current snapshot, refreshed first (single-flight) if it is stale."""
+        snap = self._snapshot
+        if snap.age_seconds() <= self.max_age or not self._has_watches():
+            return snap
+        with self._refresh_lock:
+            snap = self._snapshot
+            if snap.age_seconds() <= self.max_age:
+                return snap  # another reader refreshed while we waited
+            try:
+                return self._refresh_locked()
+            except Exception as e:
+                self._stats.refresh_errors += 1
+                self._stats.stale_serves += 1
+                logger.error(f"Market snapshot refresh failed, serving v{snap.version}: {e}")
+                return snap
+
+    def refresh(self) -> MarketSnapshot:
+        """Fetch every watched item now and publish a new snapshot."""
+        with self._refresh_lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> MarketSnapshot:
+        started = time.monotonic()
+        gex_symbols = set(self._watch_gex)
+        chain_keys = set(self._watch_chains) | {(s, None) for s in gex_symbols}
+        quote_symbols = set(self._watch_quotes) | gex_symbols | {s for s, _ in chain_keys}
+
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix='market-snapshot') as pool:
+            vix_future = pool.submit(self._fetch_vix) if self._watch_vix else None
+            quotes = self._fetch_quotes(quote_symbols)
+            ordered = sorted(chain_keys, key=lambda k: (k[0], k[1] or ''))
+            fetched = pool.map(lambda k: self._fetch_chain(k, _quote_price(quotes.get(k[0]))), ordered)
+            chains = {k: c for k, c in zip(ordered, fetched) if c is not None}
+            vix = vix_future.result() if vix_future else None
+
+        gex = {}
+        for symbol in gex_symbols:
+            built = self._build_gex(symbol, _quote_price(quotes.get(symbol)), chains.get((symbol, None)))
+            if built:
+                gex[symbol] = built
+
+        previous = self._snapshot
+        if not (quotes or chains or gex or vix is not None):
+            # Nothing came back (fetchers log and swallow their errors):
+            # keep serving the previous snapshot rather than an empty one
+            self._stats.refresh_errors += 1
+            self._stats.stale_serves += 1
+            logger.warning(f"Market snapshot refresh fetched nothing, serving v{previous.version}")
+            return previous
+
+        # Partial refresh: carry forward whatever this round failed to fetch
+        carried = 0
+        for fresh, watched, old in ((quotes, quote_symbols, previous.quotes),
+                                    (chains, chain_keys, previous.chains),
+                                    (gex, gex_symbols, previous.gex)):
+            for key in watched:
+                if key not in fresh and key in old:
+                    fresh[key] = old[key]
+                    carried += 1
+        if vix is None and self._watch_vix and previous.vix is not None:
+            vix = previous.vix
+            carried += 1
+        self._stats.carried_over += carried
+
+        with self._publish_lock:
+            self._snapshot = MarketSnapshot(
+                version=self._snapshot.version + 1,
+                taken_at=time.monotonic(),
+                timestamp=datetime.now(CENTRAL_TZ),
+                quotes=MappingProxyType(quotes),
+                vix=vix,
+                gex=MappingProxyType(gex),
+                chains=MappingProxyType(chains),
+            )
+            snap = self._snapshot
+
+        self._stats.refreshes += 1
+        self._stats.last_refresh_ms = (time.monotonic() - started) * 1000
+        logger.debug(
+            f"Market snapshot v{snap.version}: {len(quotes)} quotes, {len(chains)} chains, "
+            f"{len(gex)} GEX, vix={vix} in {self._stats.last_refresh_ms:.0f}ms"
+        )
+        return snap
+
+    # ==================== READERS ====================
+
+    def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Raw Tradier quote dict for symbol, or None."""
+        quote = self.snapshot().quotes.get(symbol)
+        self._stats.count('quote', quote is not None)
+        if quote is not None:
+            return quote
+
+        self._watch_quotes.add(symbol)
+        fetched = self._fetch_quotes([symbol])
+        if symbol not in fetched:
+            return None
+        return self._publish(quotes=fetched).quotes[symbol]
+
+    def get_price(self, symbol: str) -> float:
+        """Last (or close) price for symbol; 0.0 if unavailable."""
+        return _quote_price(self.get_quote(symbol))
+
+    def get_vix(self) -> Optional[float]:
+        snap = self.snapshot()
+        self._stats.count('vix', snap.vix is not None)
+        if snap.vix is not None:
+            return snap.vix
+
+        self._watch_vix = True
+        vix = self._fetch_vix()
+        if vix is None:
+            return None
+        return self._publish(vix=vix).vix
+
+    def get_chain(self, symbol: str, expiration: Optional[str] = None):
+        """OptionChain for (symbol, expiration); expiration None = nearest."""
+        key = (symbol, expiration)
+        chain = self.snapshot().chains.get(key)
+        self._stats.count('chain', chain is not None)
+        if chain is not None:
+            return chain
+
+        self._watch_chains.add(key)
+        chain = self._fetch_chain(key, self.get_price(symbol))
+        if chain is None:
+            return None
+        return self._publish(chains={key: chain}).chains[key]
+
+    def get_gex(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """GEX for symbol's nearest expiration, shaped like TradierGEXCalculator.get_gex."""
+        gex = self.snapshot().gex.get(symbol)
+        self._stats.count('gex', gex is not None)
+        if gex is not None:
+            return gex
+
+        self._watch_gex.add(symbol)
+        spot, chain = self.get_price(symbol), self.get_chain(symbol)
+        gex = self._snapshot.gex.get(symbol)  # a refresh triggered above may have built it
+        if gex is not None:
+            return gex
+        gex = self._build_gex(symbol, spot, chain)
+        if gex is None:
+            return None
+        return self._publish(gex={symbol: gex}).gex[symbol]
+
+    # ==================== MONITORING ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        snap = self._snapshot
+        stats = self._stats
+        lookups = stats.hits + stats.misses
+        return {
+            'version': snap.version,
+            'age_seconds': round(snap.age_seconds(), 1) if snap.timestamp else None,
+            'taken_at': snap.timestamp.isoformat() if snap.timestamp else None,
+            'max_age_seconds': self.max_age,
+            'hits': stats.hits,
+            'misses': stats.misses,
+            'hit_rate': round(stats.hits / lookups, 4) if lookups else 0.0,
+            'by_kind': {k: dict(v) for k, v in stats.by_kind.items()},
+            'refreshes': stats.refreshes,
+            'refresh_errors': stats.refresh_errors,
+            'fetch_errors': stats.fetch_errors,
+            'stale_serves': stats.stale_serves,
+            'carried_over': stats.carried_over,
+            'last_refresh_ms': round(stats.last_refresh_ms, 1),
+            'watching': {
+                'quotes': sorted(self._watch_quotes),
+                'gex': sorted(self._watch_gex),
+                'chains': sorted(f"{s}:{e or 'nearest'}" for s, e in self._watch_chains),
+                'vix': self._watch_vix,
+            },
+        }
+
+
+# ==================== SINGLETON INSTANCES ====================
+
+# One bus per resolved Tradier mode (sandbox / production), so callers passing
+# sandbox=None and an explicit flag that resolves the same way share a bus.
+_buses: Dict[bool, MarketSnapshotBus] = {}
+_bus_aliases: Dict[Optional[bool], MarketSnapshotBus] = {}
+_buses_lock = threading.Lock()
+
+
+def get_snapshot_bus(sandbox: Optional[bool] = None) -> MarketSnapshotBus:
+    """Get the shared snapshot bus for a Tradier mode (None = env default)."""
+    bus = _bus_aliases.get(sandbox)
+    if bus is not None:
+        return bus
+    with _buses_lock:
+        if sandbox not in _bus_aliases:
+            from data.tradier_data_fetcher import TradierDataFetcher
+            fetcher = TradierDataFetcher(sandbox=sandbox)
+            if fetcher.sandbox not in _buses:
+                _buses[fetcher.sandbox] = MarketSnapshotBus(fetcher=fetcher, sandbox=fetcher.sandbox)
+            _bus_aliases[sandbox] = _buses[fetcher.sandbox]
+        return _bus_aliases[sandbox]
+
+
+def get_snapshot_stats() -> Dict[str, Any]:
+    """Stats for every bus created in this process, keyed by Tradier mode."""
+    return {
+        'enabled': MARKET_SNAPSHOT_BUS_ENABLED,
+        'buses': {
+            ('sandbox' if mode else 'production'): bus.get_stats()
+            for mode, bus in list(_buses.items())
+        },
+    }
+
+
+def refresh_all() -> int:
+    """Refresh every bus that has watched items; returns buses refreshed."""
+    refreshed = 0
+    for bus in list(_buses.values()):
+        if bus._has_watches():
+            bus.refresh()
+            refreshed += 1
+    return refreshed
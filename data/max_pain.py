@@ -0,0 +1,69 @@
+"""
+Max Pain
+
+Shared max-pain routine for the equity GEX path (data/gex_calculator.py) and
+the Deribit crypto path (data/crypto_data_provider.py).
+
+Max pain is the candidate strike K that minimizes what option holders are
+paid at expiry:
+
+    Pain(K) = sum_{s < K} (K - s) * call_oi(s) + sum_{s > K} (s - K) * put_oi(s)
+
+Strikes are sorted once; with prefix sums of call OI and call OI x strike,
+and suffix sums of put OI and put OI x strike, every candidate is evaluated
+in O(1), so the whole curve costs one sort instead of a strikes^2 loop.
+Ties resolve to the lowest strike.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class PainCurve:
+    """Total holder payout if expiry settles at each candidate strike"""
+    strikes: np.ndarray   # Sorted, unique candidate strikes
+    pain: np.ndarray      # Pain(K) per strike (same units as oi * strike * multiplier)
+
+    @property
+    def max_pain(self) -> Optional[float]:
+        if len(self.strikes) == 0:
+            return None
+        return float(self.strikes[int(np.argmin(self.pain))])
+
+    def to_list(self) -> List[Dict]:
+        """Per-strike curve for dashboards: [{'strike': ..., 'pain': ...}, ...]"""
+        return [{'strike': k, 'pain': p} for k, p in zip(self.strikes.tolist(), self.pain.tolist())]
+
+
+def pain_curve(strikes, call_oi, put_oi, multiplier: float = 1.0) -> PainCurve:
+    """
+    Pain at every strike in `strikes`.
+
+    Args:
+        strikes: Candidate strikes, any order; repeats are merged (OI summed)
+        call_oi: Call open interest per entry of strikes
+        put_oi: Put open interest per entry of strikes
+        multiplier: Contract multiplier applied to the pain values (100 for
+            equity options); does not move the max-pain strike
+    """
+    strikes = np.asarray(strikes, dtype=np.float64)
+    if len(strikes) == 0:
+        return PainCurve(strikes=strikes, pain=np.empty(0))
+
+    k, inverse = np.unique(strikes, return_inverse=True)
+    c = np.bincount(inverse, weights=np.asarray(call_oi, dtype=np.float64), minlength=len(k))
+    p = np.bincount(inverse, weights=np.asarray(put_oi, dtype=np.float64), minlength=len(k))
+
+    # Work relative to the lowest strike so the prefix sums stay small
+    x = k - k[0]
+    c_cum = np.cumsum(c)
+    cx_cum = np.cumsum(c * x)
+    # Puts at strikes >= K: reverse cumulative sums
+    p_rev = np.cumsum(p[::-1])[::-1]
+    px_rev = np.cumsum((p * x)[::-1])[::-1]
+
+    pain = (x * c_cum - cx_cum + px_rev - x * p_rev) * multiplier
+    return PainCurve(strikes=k, pain=pain)
@@ -39,7 +39,7 @@ import time
 import math
 import requests
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional, Dict, List, Tuple
 from functools import lru_cache
 from scipy.stats import norm
@@ -54,6 +54,13 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
 
+from data.bar_store import BarSeries, get_bar_store
+
+# Polygon's aggregates `limit`: caps the base aggregates scanned per request
+# (not the rows returned), so a multiplier > 1 request can stop well short of
+# it. A cut-off response is recognised by its next_url instead.
+AGGS_LIMIT = 50000
+
 # Data collection hook for ML storage
 try:
     from services.data_collector import DataCollector
@@ -126,6 +133,7 @@ class PolygonDataFetcher:
             print("⚠️  POLYGON_API_KEY not set - data fetching will fail")
 
         self.cache = PolygonDataCache()
+        self.bar_store = get_bar_store()
         self._detected_tier = None
 
     def get_price_history(
@@ -147,22 +155,106 @@ class PolygonDataFetcher:
         Returns:
             DataFrame with columns: Open, High, Low, Close, Volume
         """
-        if not self.api_key:
+        now = datetime.now(CENTRAL_TZ)
+        return self.get_bars(symbol, (now - timedelta(days=days)).date(), now.date(), timeframe, multiplier)
+
+    def get_bars(
+        self,
+        symbol: str,
+        start,
+        end,
+        timeframe: str = 'day',
+        multiplier: int = 1
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get bars for an arbitrary [start, end] date range.
+
+        Served from the local bar store (data/bar_store.py); only the days the
+        store has never covered - plus today's session once it is an hour old -
+        are fetched from Polygon, so overlapping windows cost no HTTP calls.
+
+        Args:
+            symbol: Stock symbol or index (e.g., 'SPY', 'I:VIX')
+            start, end: Inclusive dates (date, datetime or YYYY-MM-DD)
+            timeframe: 'minute', 'hour', 'day', 'week', 'month'
+            multiplier: Multiplier for timeframe
+
+        Returns:
+            DataFrame with columns: Open, High, Low, Close, Volume (None if no bars)
+        """
+        result = self.get_bar_series(symbol, start, end, timeframe, multiplier).frame(start, end)
+        if result.empty:
+            return None
+        return result
+
+    def get_bar_series(
+        self,
+        symbol: str,
+        start,
+        end,
+        timeframe: str = 'day',
+        multiplier: int = 1
+    ) -> BarSeries:
+        """
+        Bar store series for symbol with [start, end] filled in.
+
+        Fetches only the store's gaps in that range. Use this instead of
+        get_bars when a caller needs point lookups (BarSeries.asof) rather
+        than a DataFrame.
+        """
+        series = self.bar_store.series(symbol, timeframe, multiplier)
+        gaps = series.missing(start, end)
+        if gaps and not self.api_key:
             raise ValueError("POLYGON_API_KEY not configured")
 
-        # Check cache
-        cache_key = f"{symbol}_{days}_{timeframe}_{multiplier}"
-        cached = self.cache.get('price_history', cache_key)
-        if cached is not None:
-            print(f"✅ Using cached price data for {symbol}")
-            return cached
+        for gap_start, gap_end in gaps:
+            while True:
+                fetched = self._fetch_aggs(symbol, multiplier, timeframe, gap_start, gap_end)
+                if fetched is None:
+                    break
+                results, status, truncated = fetched
+                new_bars = series.add(results, gap_start, gap_end, truncated=truncated)
+                print(f"✅ Fetched {len(results)} bars for {symbol} {gap_start}..{gap_end} ({status})")
+
+                # Store in ML database for analysis (new bars only)
+                if DATA_COLLECTOR_AVAILABLE and len(new_bars):
+                    try:
+                        timestamps = pd.to_datetime(new_bars['t'], unit='ms')
+                        prices = [
+                            {'timestamp': ts, 'o': o, 'h': h, 'l': l, 'c': c, 'v': v}
+                            for ts, o, h, l, c, v in zip(
+                                timestamps, new_bars['open'].tolist(), new_bars['high'].tolist(),
+                                new_bars['low'].tolist(), new_bars['close'].tolist(), new_bars['volume'].tolist()
+                            )
+                        ]
+                        DataCollector.store_prices(prices, symbol, timeframe)
+                    except:
+                        pass  # Don't fail if storage fails
+
+                # Cut off (next_url) - continue from the last (possibly partial) day returned
+                next_start = new_bars['day'][-1].astype(date) if truncated and len(new_bars) else None
+                if next_start is None or next_start <= gap_start:
+                    break
+                gap_start = next_start
 
-        try:
-            to_date = datetime.now(CENTRAL_TZ).strftime('%Y-%m-%d')
-            from_date = (datetime.now(CENTRAL_TZ) - timedelta(days=days)).strftime('%Y-%m-%d')
+        return series
 
+    def _fetch_aggs(
+        self,
+        symbol: str,
+        multiplier: int,
+        timeframe: str,
+        from_date,
+        to_date
+    ) -> Optional[Tuple[List[Dict], str, bool]]:
+        """
+        One /v2/aggs range request. Returns (results, status, truncated), or
+        None on failure. truncated is True when Polygon returned a next_url,
+        i.e. the range was cut off before to_date.
+        """
+        try:
             url = f"{self.base_url}/v2/aggs/ticker/{symbol}/range/{multiplier}/{timeframe}/{from_date}/{to_date}"
-            params = {"apiKey": self.api_key, "sort": "asc", "limit": 50000}
+            params = {"apiKey": self.api_key, "sort": "asc", "limit": AGGS_LIMIT}
 
             response = requests.get(url, params=params, timeout=10)
 
@@ -171,51 +263,10 @@ class PolygonDataFetcher:
                 status = data.get('status', '')
 
                 # Accept both OK (paid) and DELAYED (free/starter)
-                if status in ['OK', 'DELAYED'] and data.get('results'):
-                    results = data['results']
-
-                    # Convert to DataFrame
-                    df = pd.DataFrame(results)
-                    df['date'] = pd.to_datetime(df['t'], unit='ms')
-                    df.set_index('date', inplace=True)
-
-                    # Rename columns to standard format
-                    df = df.rename(columns={
-                        'o': 'Open',
-                        'h': 'High',
-                        'l': 'Low',
-                        'c': 'Close',
-                        'v': 'Volume'
-                    })
-
-                    # Handle indices (like I:VIX) that don't have Volume data
-                    if 'Volume' in df.columns:
-                        result = df[['Open', 'High', 'Low', 'Close', 'Volume']]
-                    else:
-                        # Index data - no volume, add dummy column
-                        df['Volume'] = 0
-                        result = df[['Open', 'High', 'Low', 'Close', 'Volume']]
-
-                    # Cache the result
-                    self.cache.set('price_history', cache_key, result)
-
-                    # Store in ML database for analysis
-                    if DATA_COLLECTOR_AVAILABLE:
-                        try:
-                            prices = [
-                                {'timestamp': idx, 'o': row['Open'], 'h': row['High'],
-                                 'l': row['Low'], 'c': row['Close'], 'v': row['Volume']}
-                                for idx, row in result.iterrows()
-                            ]
-                            DataCollector.store_prices(prices, symbol, timeframe)
-                        except:
-                            pass  # Don't fail if storage fails
-
-                    print(f"✅ Fetched {len(result)} bars for {symbol} ({status})")
-                    return result
-                else:
-                    print(f"⚠️  Polygon.io status: {status}, results: {data.get('resultsCount', 0)}")
-                    return None
+                if status in ['OK', 'DELAYED']:
+                    return data.get('results') or [], status, bool(data.get('next_url'))
+                print(f"⚠️  Polygon.io status: {status}, results: {data.get('resultsCount', 0)}")
+                return None
             else:
                 print(f"❌ Polygon.io HTTP {response.status_code}: {response.text}")
                 return None
@@ -1322,6 +1373,10 @@ def fetch_vix_data() -> Dict:
 # Track VIX data availability globally for transparency
 _vix_fetch_stats = {'real': 0, 'fallback': 0, 'errors': []}
 
+# Days fetched on each side of a get_vix_for_date miss, so a backtest walking
+# dates in either direction only touches Polygon about once per year of dates
+VIX_BACKFILL_DAYS = 365
+
 # GEX data fetcher (uses TradingVolatilityAPI)
 _gex_api = None
 _gex_fetch_stats = {'real': 0, 'fallback': 0, 'errors': []}
@@ -1408,6 +1463,10 @@ def get_vix_for_date(date_str: str) -> float:
 
     CRITICAL for backtesting - ML needs REAL VIX, not hardcoded 15.
 
+    Lookups are served from the local bar store: the first miss fetches
+    VIX_BACKFILL_DAYS on either side of the date in one request, after which
+    every date in that window is a binary search with no HTTP call.
+
     Args:
         date_str: Date in YYYY-MM-DD format
 
@@ -1417,34 +1476,22 @@ def get_vix_for_date(date_str: str) -> float:
     global _vix_fetch_stats
 
     try:
-        # Parse target date and make timezone-aware
-        target_date = datetime.strptime(date_str, '%Y-%m-%d')
-        target_date = CENTRAL_TZ.localize(target_date)  # Make timezone-aware
-
-        # Get VIX history covering the target date
-        days_ago = (datetime.now(CENTRAL_TZ) - target_date).days + 5  # Buffer for weekends
-        days_ago = max(5, min(days_ago, 400))  # Limit to ~1 year of data
+        target_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+        today = datetime.now(CENTRAL_TZ).date()
+        start = target_date - timedelta(days=VIX_BACKFILL_DAYS)
+        end = min(today, target_date + timedelta(days=VIX_BACKFILL_DAYS))
 
         # CRITICAL FIX: VIX is an index - try multiple ticker formats
         # Polygon uses I:VIX for indices
-        df = None
         vix_tickers = ['I:VIX', 'VIX', 'VIXY']  # Try index format first, then fallbacks
 
         for ticker in vix_tickers:
-            df = polygon_fetcher.get_price_history(ticker, days=days_ago, timeframe='day')
-            if df is not None and not df.empty:
-                break
-
-        if df is not None and not df.empty:
-            # Find closest date
-            df.index = pd.to_datetime(df.index)
-            target = pd.Timestamp(target_date)
-
-            # Get exact match or closest prior date
-            prior_dates = df.index[df.index <= target]
-            if len(prior_dates) > 0:
-                closest_date = prior_dates[-1]
-                vix_value = float(df.loc[closest_date, 'Close'])
+            series = polygon_fetcher.bar_store.series(ticker, 'day')
+            if series.missing(target_date - timedelta(days=7), target_date):
+                series = polygon_fetcher.get_bar_series(ticker, start, max(start, end), timeframe='day')
+            # Exact match or closest prior date (weekends/holidays)
+            vix_value = series.asof(target_date, max_gap_days=7)
+            if vix_value is not None:
                 _vix_fetch_stats['real'] += 1
                 return vix_value
 
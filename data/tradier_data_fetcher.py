@@ -9,9 +9,13 @@ API Documentation: https://documentation.tradier.com/
 
 import os
 import json
+import time
 import asyncio
+import threading
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
@@ -24,6 +28,97 @@ logger = logging.getLogger(__name__)
 # Texas Central Time - standard timezone for all AlphaGEX operations
 CENTRAL_TZ = ZoneInfo("America/Chicago")
 
+# Request budget per API key. The sustained rate matches the old fixed 100ms
+# spacing (10 req/s); the burst and concurrency cap let a multi-expiration
+# chain fetch run in parallel instead of strictly one request at a time.
+TRADIER_REQUESTS_PER_SECOND = float(os.getenv('TRADIER_REQUESTS_PER_SECOND', '10'))
+TRADIER_REQUEST_BURST = int(os.getenv('TRADIER_REQUEST_BURST', '8'))
+TRADIER_MAX_CONCURRENT_REQUESTS = int(os.getenv('TRADIER_MAX_CONCURRENT_REQUESTS', '8'))
+
+
+class RequestBudget:
+    """
+    Token bucket plus in-flight cap shared by every client using one API key.
+
+    acquire() blocks until a token is available (sleeping outside the lock),
+    so concurrent callers are spread over the refill rate instead of being
+    serialized behind a global sleep.
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrent: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.last_update = time.monotonic()
+        self._lock = threading.Lock()
+        self._in_flight = threading.BoundedSemaphore(max(1, max_concurrent))
+
+    def acquire(self) -> None:
+        """Take one token, waiting for refill if the bucket is empty."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_update) * self.rate)
+                self.last_update = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self._in_flight.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._in_flight.release()
+        return False
+
+
+@dataclass
+class _TradierTransport:
+    """Pooled keep-alive session and request budget for one (base_url, api_key)."""
+    session: requests.Session
+    budget: RequestBudget
+
+
+_transports: Dict[Tuple[str, str], _TradierTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def _get_transport(base_url: str, api_key: str) -> _TradierTransport:
+    """Return the process-wide transport for this endpoint and key.
+
+    Every TradierDataFetcher instance (one per bot) shares it, so connections
+    are reused across bots and the rate budget is enforced per API key rather
+    than per instance.
+    """
+    key = (base_url, api_key)
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=TRADIER_MAX_CONCURRENT_REQUESTS,
+                pool_maxsize=TRADIER_MAX_CONCURRENT_REQUESTS,
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'Authorization': f'Bearer {api_key}',
+                'Accept': 'application/json'
+            })
+            transport = _TradierTransport(
+                session=session,
+                budget=RequestBudget(
+                    TRADIER_REQUESTS_PER_SECOND,
+                    TRADIER_REQUEST_BURST,
+                    TRADIER_MAX_CONCURRENT_REQUESTS,
+                ),
+            )
+            _transports[key] = transport
+        return transport
+
 
 class OrderSide(Enum):
     BUY_TO_OPEN = "buy_to_open"
@@ -191,22 +286,18 @@ class TradierDataFetcher:
             'Accept': 'application/json'
         }
 
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # 100ms between requests
+        # Pooled session + shared token-bucket rate limiting (per API key)
+        transport = _get_transport(self.base_url, self.api_key)
+        self.session = transport.session
+        self._budget = transport.budget
 
         logger.info(f"Tradier client initialized - Mode: {'SANDBOX' if self.sandbox else 'PRODUCTION'}")
         # Note: Production API is required for index options (SPX) data even when paper trading
         # This warning only applies when actually executing trades, not for data fetching
 
     def _rate_limit(self):
-        """Simple rate limiting"""
-        import time
-        now = time.time()
-        elapsed = now - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        """Wait for a token from the shared per-key request budget"""
+        self._budget.acquire()
 
     def _make_request(
         self,
@@ -217,22 +308,22 @@ class TradierDataFetcher:
         max_retries: int = 3
     ) -> Dict:
         """Make API request with retry logic and exponential backoff"""
-        import time
-        self._rate_limit()
-
         url = f"{self.base_url}/{endpoint}"
         last_exception = None
 
+        if method.upper() not in ('GET', 'POST', 'DELETE'):
+            raise ValueError(f"Unsupported method: {method}")
+
         for attempt in range(max_retries + 1):
             try:
-                if method.upper() == 'GET':
-                    response = requests.get(url, headers=self.headers, params=params, timeout=30)
-                elif method.upper() == 'POST':
-                    response = requests.post(url, headers=self.headers, params=params, data=data, timeout=30)
-                elif method.upper() == 'DELETE':
-                    response = requests.delete(url, headers=self.headers, params=params, timeout=30)
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
+                # Bounded in-flight requests + token bucket, then reuse a
+                # keep-alive connection from the shared pool.
+                with self._budget:
+                    self._rate_limit()
+                    response = self.session.request(
+                        method.upper(), url, headers=self.headers,
+                        params=params, data=data, timeout=30
+                    )
 
                 response.raise_for_status()
                 try:
@@ -300,6 +391,31 @@ class TradierDataFetcher:
 
         return {}
 
+    def get_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        """
+        Get real-time quotes for several symbols in one request.
+
+        Args:
+            symbols: Stock/index symbols (SPY, SPX, VIX, ...)
+
+        Returns:
+            Dict of symbol -> quote data; symbols Tradier did not return are omitted
+        """
+        symbols = [s for s in dict.fromkeys(symbols) if s]
+        if not symbols:
+            return {}
+        response = self._make_request('GET', 'markets/quotes', params={'symbols': ','.join(symbols)})
+        if response is None:
+            logger.warning(f"No response from quote API for {symbols}")
+            return {}
+        quotes = response.get('quotes', {}) or {}
+
+        quote_data = quotes.get('quote') or []
+        if isinstance(quote_data, dict):
+            quote_data = [quote_data]
+
+        return {q['symbol']: q for q in quote_data if isinstance(q, dict) and q.get('symbol')}
+
     def get_option_expirations(self, symbol: str) -> List[str]:
         """
         Get available option expiration dates for underlying.
@@ -344,7 +460,8 @@ class TradierDataFetcher:
         self,
         symbol: str,
         expiration: Optional[str] = None,
-        greeks: bool = True
+        greeks: bool = True,
+        underlying_price: Optional[float] = None
     ) -> OptionChain:
         """
         Get full options chain with Greeks.
@@ -353,13 +470,16 @@ class TradierDataFetcher:
             symbol: Underlying symbol (SPY, SPX)
             expiration: Specific expiration (YYYY-MM-DD) or None for nearest
             greeks: Include Greeks in response
+            underlying_price: Spot already fetched by the caller (batch fetches
+                pass one quote to every expiration); None = fetch a quote
 
         Returns:
             OptionChain with all contracts
         """
-        # Get underlying price first
-        quote = self.get_quote(symbol)
-        underlying_price = quote.get('last', 0) or quote.get('close', 0)
+        # Get underlying price first (unless the caller already has it)
+        if underlying_price is None:
+            quote = self.get_quote(symbol)
+            underlying_price = quote.get('last', 0) or quote.get('close', 0)
 
         # Get expiration if not specified
         if not expiration:
@@ -516,27 +636,50 @@ class TradierDataFetcher:
         self,
         symbol: str,
         num_expirations: int = 4,
-        greeks: bool = True
+        greeks: bool = True,
+        concurrent: bool = True
     ) -> OptionChain:
         """
         Get options chains for multiple expirations.
 
+        The underlying quote is fetched once for the whole batch. With
+        concurrent=True the per-expiration chains are fetched in parallel,
+        bounded by the shared per-key request budget.
+
         Args:
             symbol: Underlying symbol
-            num_expirations: Number of nearest expirations to fetch
+            num_expirations: Number of nearest expirations to fetch (None = all)
             greeks: Include Greeks
+            concurrent: Fetch expirations in parallel (False = one at a time)
 
         Returns:
             OptionChain with multiple expiration chains
         """
-        expirations = self.get_option_expirations(symbol)[:num_expirations]
-
-        quote = self.get_quote(symbol)
+        if concurrent:
+            # The quote and the expiration list don't depend on each other.
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                quote_future = pool.submit(self.get_quote, symbol)
+                expirations = self.get_option_expirations(symbol)
+                quote = quote_future.result()
+        else:
+            expirations = self.get_option_expirations(symbol)
+            quote = self.get_quote(symbol)
+        if num_expirations is not None:
+            expirations = expirations[:num_expirations]
         underlying_price = quote.get('last', 0) or quote.get('close', 0)
 
+        def fetch(exp: str) -> OptionChain:
+            return self.get_option_chain(symbol, exp, greeks, underlying_price=underlying_price)
+
+        if concurrent and len(expirations) > 1:
+            workers = min(len(expirations), TRADIER_MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tradier-chain') as pool:
+                chains = list(pool.map(fetch, expirations))
+        else:
+            chains = [fetch(exp) for exp in expirations]
+
         all_chains = {}
-        for exp in expirations:
-            chain = self.get_option_chain(symbol, exp, greeks)
+        for exp, chain in zip(expirations, chains):
             if exp in chain.chains:
                 all_chains[exp] = chain.chains[exp]
 
@@ -547,6 +690,19 @@ class TradierDataFetcher:
             last_updated=datetime.now(CENTRAL_TZ)
         )
 
+    def get_all_expirations(
+        self,
+        symbol: str,
+        greeks: bool = True,
+        concurrent: bool = True
+    ) -> OptionChain:
+        """
+        Get options chains for every listed expiration.
+
+        Same as get_multiple_chains with no expiration cap.
+        """
+        return self.get_multiple_chains(symbol, num_expirations=None, greeks=greeks, concurrent=concurrent)
+
     def find_atm_options(
         self,
         symbol: str,
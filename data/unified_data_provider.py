@@ -608,18 +608,44 @@ def get_data_provider() -> UnifiedDataProvider:
 
 # ==================== CONVENIENCE FUNCTIONS ====================
 
+def _snapshot_bus():
+    """Shared per-tick market snapshot, or None when disabled/unavailable."""
+    try:
+        from data.market_snapshot import MARKET_SNAPSHOT_BUS_ENABLED, get_snapshot_bus
+        return get_snapshot_bus() if MARKET_SNAPSHOT_BUS_ENABLED else None
+    except Exception as e:
+        logger.debug(f"Market snapshot bus unavailable: {e}")
+        return None
+
+
 def get_quote(symbol: str) -> Optional[Quote]:
     """Quick quote lookup"""
     return get_data_provider().get_quote(symbol)
 
 
 def get_price(symbol: str) -> float:
-    """Quick price lookup"""
+    """Quick price lookup (shared snapshot first, then provider priority order)"""
+    bus = _snapshot_bus()
+    if bus:
+        try:
+            price = bus.get_price(symbol)
+            if price > 0:
+                return price
+        except Exception as e:
+            logger.warning(f"Snapshot price failed for {symbol}: {e}")
     return get_data_provider().get_price(symbol)
 
 
 def get_options_chain(symbol: str, expiration: Optional[str] = None) -> Optional[OptionChain]:
-    """Quick options chain lookup"""
+    """Quick options chain lookup (shared snapshot first)"""
+    bus = _snapshot_bus()
+    if bus:
+        try:
+            chain = bus.get_chain(symbol, expiration)
+            if chain:
+                return chain
+        except Exception as e:
+            logger.warning(f"Snapshot chain failed for {symbol}: {e}")
     return get_data_provider().get_options_chain(symbol, expiration)
 
 
@@ -629,7 +655,15 @@ def get_gex(symbol: str) -> Optional[GEXData]:
 
 
 def get_vix() -> float:
-    """Quick VIX lookup"""
+    """Quick VIX lookup (shared snapshot first)"""
+    bus = _snapshot_bus()
+    if bus:
+        try:
+            vix = bus.get_vix()
+            if vix:
+                return vix
+        except Exception as e:
+            logger.warning(f"Snapshot VIX failed: {e}")
     return get_data_provider().get_vix()
 
 
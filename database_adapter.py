@@ -265,7 +265,8 @@ class PostgreSQLCursor:
 
         # If sql is a Composed object (from psycopg2.sql), execute directly without transformation
         # Composed objects are already safely constructed and shouldn't be modified
-        if isinstance(sql, (psycopg2_sql.Composed, psycopg2_sql.SQL)):
+        # Pre-rendered bytes (psycopg2.extras.execute_values) are executed as-is too.
+        if isinstance(sql, (psycopg2_sql.Composed, psycopg2_sql.SQL, bytes)):
             if params:
                 self._cursor.execute(sql, params)
             else:
@@ -326,6 +327,15 @@ class PostgreSQLCursor:
         self._cursor.executemany(sql, params_list)
         return self
 
+    def mogrify(self, sql, params=None):
+        """Return the query string after argument binding"""
+        return self._cursor.mogrify(sql, params)
+
+    @property
+    def connection(self):
+        """Return the raw psycopg2 connection (used by psycopg2.extras helpers)"""
+        return self._cursor.connection
+
     def fetchone(self):
         """Fetch one row"""
         return self._cursor.fetchone()
@@ -1,8 +1,12 @@
 """Database adapters and utilities for AlphaGEX trading system."""
 
 from .autonomous_database_logger import AutonomousDatabaseLogger, get_database_logger
+from .write_behind import WriteBehindQueue, flush_write_behind, get_write_behind
 
 __all__ = [
     'AutonomousDatabaseLogger',
     'get_database_logger',
+    'WriteBehindQueue',
+    'flush_write_behind',
+    'get_write_behind',
 ]
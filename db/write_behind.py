@@ -0,0 +1,402 @@
+"""
+Write-Behind Queue - batched, off-thread inserts for append-only log tables
+
+Scan activity, per-bot activity logs and equity snapshots are written on
+every bot scan. Writing them inline means a connection checkout, an INSERT
+and a commit (plus pool contention) inside the trading decision. This module
+takes those rows off the hot path:
+
+- enqueue() touches no connection; it appends the row to an in-memory queue
+  and returns immediately
+- a single daemon flusher drains the queue when BATCH_SIZE rows are pending
+  or FLUSH_INTERVAL seconds after the oldest pending row, whichever is first
+- rows with the same INSERT statement are grouped and written with one
+  multi-row INSERT per page (psycopg2 execute_values), one connection and one
+  commit per flush
+- a batch that fails is retried row by row so one bad row never drops its
+  neighbours
+
+Back-pressure: the queue is bounded by MAX_PENDING rows. A producer that
+finds it full wakes the flusher and waits up to ENQUEUE_WAIT seconds for
+room, then drops the row (counted in get_stats()['dropped']) rather than
+stall a scan.
+
+Shutdown: flush_write_behind() drains the queue synchronously. It is
+registered with atexit and called by the scheduler and API shutdown paths
+before the connection pool is closed.
+
+Usage:
+    from db.write_behind import get_write_behind
+
+    get_write_behind().enqueue('''
+        INSERT INTO agape_activity_log (timestamp, level, action, message)
+        VALUES (%s, %s, %s, %s)
+    ''', (now, "INFO", "SCAN", "No signal"))
+"""
+
+import atexit
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from psycopg2.extras import execute_values
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    execute_values = None
+    PSYCOPG2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Flush when this many rows are pending...
+BATCH_SIZE = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "200"))
+# ...or this many seconds after the oldest pending row was queued
+FLUSH_INTERVAL = float(os.getenv("WRITE_BEHIND_FLUSH_INTERVAL", "1.0"))
+# Queue bound; producers wait ENQUEUE_WAIT seconds for room, then drop
+MAX_PENDING = int(os.getenv("WRITE_BEHIND_MAX_PENDING", "20000"))
+ENQUEUE_WAIT = 0.05
+
+_INSERT_RE = re.compile(r"^\s*INSERT\s+INTO\s+(\w+)", re.IGNORECASE)
+_VALUES_RE = re.compile(r"\bVALUES\s*\(", re.IGNORECASE)
+
+
+class _Statement:
+    """An INSERT ... VALUES (...) statement split for execute_values."""
+
+    __slots__ = ("sql", "table", "batch_sql", "template")
+
+    def __init__(self, sql: str):
+        match = _INSERT_RE.match(sql)
+        values = _VALUES_RE.search(sql)
+        if not match or not values:
+            raise ValueError("write-behind only accepts INSERT ... VALUES (...) statements")
+
+        # Find the parenthesis closing the VALUES row
+        start = values.end() - 1
+        depth = 0
+        for end in range(start, len(sql)):
+            if sql[end] == "(":
+                depth += 1
+            elif sql[end] == ")":
+                depth -= 1
+                if depth == 0:
+                    break
+        else:
+            raise ValueError("unbalanced VALUES clause")
+
+        self.sql = sql
+        self.table = match.group(1).lower()
+        self.batch_sql = f"{sql[:start]}%s{sql[end + 1:]}"
+        self.template = sql[start:end + 1]
+
+
+class WriteBehindQueue:
+    """Bounded in-memory queue with a background batch flusher."""
+
+    def __init__(
+        self,
+        connect: Optional[Callable] = None,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_pending: int = MAX_PENDING,
+        enqueue_wait: float = ENQUEUE_WAIT,
+    ):
+        self._connect = connect
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, max_pending)
+        self.enqueue_wait = enqueue_wait
+
+        self._rows: Deque[Tuple[_Statement, tuple]] = deque()
+        self._cond = threading.Condition()
+        self._oldest: Optional[float] = None
+        self._inflight = 0
+        self._flush_requested = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._statements: Dict[str, _Statement] = {}
+        self._prepare_hooks: Dict[str, Callable] = {}
+        self._prepared: set = set()
+
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "failed": 0,
+            "dropped": 0,
+            "batches": 0,
+            "last_flush_ms": 0.0,
+            "max_pending_seen": 0,
+        }
+        self._table_written: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def register_prepare(self, table: str, hook: Callable) -> None:
+        """Run hook(cursor) once, before the first batch written to table.
+
+        Used for CREATE TABLE / ALTER TABLE ... IF NOT EXISTS that should not
+        run on every row.
+        """
+        with self._cond:
+            self._prepare_hooks[table.lower()] = hook
+            self._prepared.discard(table.lower())
+
+    def enqueue(self, sql: str, params: Sequence[Any]) -> bool:
+        """Queue one INSERT row. Returns False if the row was dropped."""
+        stmt = self._statements.get(sql)
+        if stmt is None:
+            stmt = _Statement(sql)
+            self._statements[sql] = stmt
+
+        with self._cond:
+            if self._stopped:
+                stopped = True
+            else:
+                stopped = False
+                if len(self._rows) >= self.max_pending:
+                    deadline = time.monotonic() + self.enqueue_wait
+                    while len(self._rows) >= self.max_pending:
+                        self._flush_requested = True
+                        self._cond.notify_all()
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._stats["dropped"] += 1
+                            if self._stats["dropped"] % 1000 == 1:
+                                logger.warning(
+                                    f"Write-behind queue full ({self.max_pending} rows), "
+                                    f"dropped {self._stats['dropped']} rows so far"
+                                )
+                            return False
+                        self._cond.wait(remaining)
+
+                self._rows.append((stmt, tuple(params)))
+                self._stats["enqueued"] += 1
+                pending = len(self._rows)
+                if pending > self._stats["max_pending_seen"]:
+                    self._stats["max_pending_seen"] = pending
+                if self._oldest is None:
+                    self._oldest = time.monotonic()
+                if pending >= self.batch_size:
+                    self._cond.notify_all()
+                self._ensure_thread()
+
+        if stopped:
+            # Late rows after shutdown are written inline rather than lost
+            self._write([(stmt, tuple(params))])
+        return True
+
+    # ------------------------------------------------------------------
+    # Flush control
+    # ------------------------------------------------------------------
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Block until everything queued so far is written (or timeout)."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                rows = list(self._rows)
+                self._rows.clear()
+                self._oldest = None
+                inline = True
+            else:
+                inline = False
+                self._flush_requested = True
+                self._cond.notify_all()
+                while self._rows or self._inflight:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+        if inline and rows:
+            self._write(rows)
+        return True
+
+    def stop(self, timeout: float = 10.0) -> bool:
+        """Flush, stop the flusher thread and write later rows inline."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return flushed
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._rows) + self._inflight
+            stats["tables"] = dict(self._table_written)
+        return stats
+
+    # ------------------------------------------------------------------
+    # Flusher
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        # Caller holds self._cond
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="write-behind-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._rows and (
+                        self._flush_requested
+                        or self._stopped
+                        or len(self._rows) >= self.batch_size
+                        or time.monotonic() - self._oldest >= self.flush_interval
+                    ):
+                        break
+                    if self._stopped:
+                        self._cond.notify_all()
+                        return
+                    if self._flush_requested and not self._rows:
+                        self._flush_requested = False
+                        self._cond.notify_all()
+                    timeout = None
+                    if self._rows:
+                        timeout = self.flush_interval - (time.monotonic() - self._oldest)
+                    self._cond.wait(timeout)
+
+                rows = list(self._rows)
+                self._rows.clear()
+                self._oldest = None
+                self._flush_requested = False
+                self._inflight = len(rows)
+                # Room for producers waiting on a full queue
+                self._cond.notify_all()
+
+            try:
+                self._write(rows)
+            except Exception as e:
+                logger.error(f"Write-behind flush failed: {e}")
+            finally:
+                with self._cond:
+                    self._inflight = 0
+                    self._cond.notify_all()
+
+    def _get_connection(self):
+        if self._connect is not None:
+            return self._connect()
+        from database_adapter import get_connection
+        return get_connection()
+
+    def _write(self, rows: List[Tuple[_Statement, tuple]]) -> None:
+        """Write rows grouped by statement, one connection for the flush."""
+        started = time.perf_counter()
+        groups: Dict[str, List[tuple]] = {}
+        statements: Dict[str, _Statement] = {}
+        for stmt, params in rows:
+            groups.setdefault(stmt.sql, []).append(params)
+            statements[stmt.sql] = stmt
+
+        written = failed = 0
+        conn = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            for sql, batch in groups.items():
+                stmt = statements[sql]
+                self._prepare(conn, cursor, stmt.table)
+                try:
+                    self._insert_batch(cursor, stmt, batch)
+                    conn.commit()
+                    ok = len(batch)
+                except Exception as e:
+                    conn.rollback()
+                    logger.warning(f"Write-behind batch into {stmt.table} failed ({e}), retrying row by row")
+                    ok = self._insert_rows(conn, cursor, stmt, batch)
+                written += ok
+                failed += len(batch) - ok
+                with self._cond:
+                    self._table_written[stmt.table] = self._table_written.get(stmt.table, 0) + ok
+        except Exception as e:
+            failed = len(rows) - written
+            logger.error(f"Write-behind could not write {failed} rows: {e}")
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+        with self._cond:
+            self._stats["written"] += written
+            self._stats["failed"] += failed
+            self._stats["batches"] += 1
+            self._stats["last_flush_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    def _prepare(self, conn, cursor, table: str) -> None:
+        hook = self._prepare_hooks.get(table)
+        if hook is None or table in self._prepared:
+            return
+        try:
+            hook(cursor)
+            conn.commit()
+        except Exception as e:
+            logger.debug(f"Write-behind prepare for {table} (non-critical): {e}")
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+        self._prepared.add(table)
+
+    def _insert_batch(self, cursor, stmt: _Statement, batch: List[tuple]) -> None:
+        if len(batch) == 1 or not PSYCOPG2_AVAILABLE:
+            for params in batch:
+                cursor.execute(stmt.sql, params)
+            return
+        execute_values(cursor, stmt.batch_sql, batch,
+                       template=stmt.template, page_size=self.batch_size)
+
+    def _insert_rows(self, conn, cursor, stmt: _Statement, batch: List[tuple]) -> int:
+        ok = 0
+        for params in batch:
+            try:
+                cursor.execute(stmt.sql, params)
+                conn.commit()
+                ok += 1
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Write-behind insert into {stmt.table} failed: {e}")
+        return ok
+
+
+# =============================================================================
+# SINGLETON
+# =============================================================================
+
+_write_behind: Optional[WriteBehindQueue] = None
+_write_behind_lock = threading.Lock()
+
+
+def get_write_behind() -> WriteBehindQueue:
+    """Get the process-wide write-behind queue."""
+    global _write_behind
+    if _write_behind is None:
+        with _write_behind_lock:
+            if _write_behind is None:
+                _write_behind = WriteBehindQueue()
+    return _write_behind
+
+
+def flush_write_behind(timeout: float = 10.0) -> bool:
+    """Drain the process-wide queue. Safe to call if it was never used."""
+    if _write_behind is None:
+        return True
+    return _write_behind.stop(timeout)
+
+
+atexit.register(flush_write_behind)
@@ -12,12 +12,20 @@ The IV solver uses Newton-Raphson with a Brent fallback. Returns None when:
   - Mid price is below intrinsic value
   - Mid price is above strike + spot (impossible)
   - Newton fails to converge in 30 iterations and Brent finds no root
+
+Each scalar function has an array-native ``*_array`` twin (bottom of this
+module) that broadcasts over NumPy inputs, so a whole chain can be priced or
+IV-solved in one call. Rejections that return None in the scalar solver are
+NaN in ``implied_vol_array``.
 """
 from __future__ import annotations
 
 import math
 from typing import Optional
 
+import numpy as np
+from scipy.special import erf as _erf
+
 DEFAULT_R = 0.05  # continuous risk-free rate
 SQRT_2PI = math.sqrt(2.0 * math.pi)
 
@@ -208,3 +216,233 @@ def derive_spot_from_parity(call_mid: float, put_mid: float, strike: float, t_ye
     essentially 1, but we include it for correctness.
     """
     return call_mid - put_mid + strike * math.exp(-r * t_years)
+
+
+# ---------------------------------------------------------------------------
+# Array-native versions
+#
+# Same formulas and edge-case rules as the scalar functions above, evaluated
+# lane-wise over broadcast NumPy arrays. `r` stays a scalar.
+# ---------------------------------------------------------------------------
+
+_SQRT2 = math.sqrt(2.0)
+
+
+def _norm_cdf_array(x: np.ndarray) -> np.ndarray:
+    return 0.5 * (1.0 + _erf(x / _SQRT2))
+
+
+def _norm_pdf_array(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / SQRT_2PI
+
+
+def _d1_array(spot, strike, t_years, sigma, r):
+    """(d1, sqrt_t); lanes with t<=0 / sigma<=0 / spot<=0 produce garbage
+    that callers mask out with np.where."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sqrt_t = np.sqrt(np.maximum(t_years, 0.0))
+        d1 = (np.log(spot / strike) + (r + 0.5 * sigma * sigma) * t_years) / (sigma * sqrt_t)
+    return d1, sqrt_t
+
+
+def bs_price_array(spot, strike, t_years, sigma, is_call, r: float = DEFAULT_R) -> np.ndarray:
+    """Vectorized bs_price. Returns intrinsic where t_years<=0 or sigma<=0."""
+    spot, strike, t_years, sigma, is_call = np.broadcast_arrays(
+        np.asarray(spot, dtype=float), np.asarray(strike, dtype=float),
+        np.asarray(t_years, dtype=float), np.asarray(sigma, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+    intrinsic = np.where(is_call, np.maximum(spot - strike, 0.0), np.maximum(strike - spot, 0.0))
+    d1, sqrt_t = _d1_array(spot, strike, t_years, sigma, r)
+    d2 = d1 - sigma * sqrt_t
+    disc_k = strike * np.exp(-r * t_years)
+    with np.errstate(invalid="ignore"):
+        call = spot * _norm_cdf_array(d1) - disc_k * _norm_cdf_array(d2)
+        put = disc_k * _norm_cdf_array(-d2) - spot * _norm_cdf_array(-d1)
+    live = (t_years > 0) & (sigma > 0)
+    return np.where(live, np.where(is_call, call, put), intrinsic)
+
+
+def bs_vega_array(spot, strike, t_years, sigma, r: float = DEFAULT_R) -> np.ndarray:
+    """Vectorized bs_vega. 0 where t_years<=0 or sigma<=0."""
+    spot, strike, t_years, sigma = np.broadcast_arrays(
+        np.asarray(spot, dtype=float), np.asarray(strike, dtype=float),
+        np.asarray(t_years, dtype=float), np.asarray(sigma, dtype=float),
+    )
+    d1, sqrt_t = _d1_array(spot, strike, t_years, sigma, r)
+    live = (t_years > 0) & (sigma > 0)
+    with np.errstate(invalid="ignore"):
+        return np.where(live, spot * _norm_pdf_array(d1) * sqrt_t, 0.0)
+
+
+def bs_gamma_array(spot, strike, t_years, sigma, r: float = DEFAULT_R) -> np.ndarray:
+    """Vectorized bs_gamma. 0 where t_years<=0, sigma<=0 or spot<=0."""
+    spot, strike, t_years, sigma = np.broadcast_arrays(
+        np.asarray(spot, dtype=float), np.asarray(strike, dtype=float),
+        np.asarray(t_years, dtype=float), np.asarray(sigma, dtype=float),
+    )
+    d1, sqrt_t = _d1_array(spot, strike, t_years, sigma, r)
+    live = (t_years > 0) & (sigma > 0) & (spot > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(live, _norm_pdf_array(d1) / (spot * sigma * sqrt_t), 0.0)
+
+
+def bs_delta_array(spot, strike, t_years, sigma, is_call, r: float = DEFAULT_R) -> np.ndarray:
+    """Vectorized bs_delta. Intrinsic delta (±1 / 0) in the degenerate region."""
+    spot, strike, t_years, sigma, is_call = np.broadcast_arrays(
+        np.asarray(spot, dtype=float), np.asarray(strike, dtype=float),
+        np.asarray(t_years, dtype=float), np.asarray(sigma, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+    d1, _ = _d1_array(spot, strike, t_years, sigma, r)
+    with np.errstate(invalid="ignore"):
+        n_d1 = _norm_cdf_array(d1)
+    live = (t_years > 0) & (sigma > 0) & (spot > 0)
+    intrinsic = np.where(
+        is_call,
+        np.where(spot > strike, 1.0, 0.0),
+        np.where(spot < strike, -1.0, 0.0),
+    )
+    return np.where(live, np.where(is_call, n_d1, n_d1 - 1.0), intrinsic)
+
+
+def bs_charm_array(spot, strike, t_years, sigma, r: float = DEFAULT_R) -> np.ndarray:
+    """Vectorized bs_charm (per year). 0 where t_years<=0, sigma<=0 or spot<=0."""
+    spot, strike, t_years, sigma = np.broadcast_arrays(
+        np.asarray(spot, dtype=float), np.asarray(strike, dtype=float),
+        np.asarray(t_years, dtype=float), np.asarray(sigma, dtype=float),
+    )
+    d1, sqrt_t = _d1_array(spot, strike, t_years, sigma, r)
+    live = (t_years > 0) & (sigma > 0) & (spot > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        charm = _norm_pdf_array(d1) * (
+            (r + 0.5 * sigma * sigma) / (sigma * sqrt_t) - d1 / (2.0 * t_years)
+        )
+    return np.where(live, charm, 0.0)
+
+
+def _price_and_d1(spot, disc_k, log_sk, t_years, sqrt_t, sigma, is_call, r):
+    """Solver kernel: price and d1 for pre-validated 1-D lanes (t>0, sigma>0)."""
+    vol_t = sigma * sqrt_t
+    d1 = (log_sk + (r + 0.5 * sigma * sigma) * t_years) / vol_t
+    d2 = d1 - vol_t
+    call = spot * _norm_cdf_array(d1) - disc_k * _norm_cdf_array(d2)
+    put = disc_k * _norm_cdf_array(-d2) - spot * _norm_cdf_array(-d1)
+    return np.where(is_call, call, put), d1
+
+
+def implied_vol_array(
+    market_price,
+    spot,
+    strike,
+    t_years,
+    is_call,
+    r: float = DEFAULT_R,
+    initial_sigma: float = 0.30,
+    max_iter: int = 30,
+    tol: float = 1e-5,
+) -> np.ndarray:
+    """Vectorized implied_vol: Newton over all lanes at once, then a masked
+    bisection (the scalar `_brent_iv`) over lanes Newton did not converge.
+
+    Returns a float array shaped like the broadcast inputs; NaN wherever the
+    scalar solver returns None (t<=0, below intrinsic, at/above strike+spot,
+    no root in [1e-3, 5]) and for non-finite prices.
+    """
+    price, spot, strike, t_years, is_call = np.broadcast_arrays(
+        np.asarray(market_price, dtype=float), np.asarray(spot, dtype=float),
+        np.asarray(strike, dtype=float), np.asarray(t_years, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+    shape = price.shape
+    out = np.full(price.size, np.nan)
+
+    price, spot, strike, t_years, is_call = (
+        a.ravel() for a in (price, spot, strike, t_years, is_call)
+    )
+    intrinsic = np.where(is_call, np.maximum(spot - strike, 0.0), np.maximum(strike - spot, 0.0))
+    ok = (
+        np.isfinite(price)
+        & (t_years > 0)
+        & (price >= intrinsic - 1e-6)
+        & (price < strike + spot)
+    )
+    lanes = np.flatnonzero(ok)
+    if lanes.size == 0:
+        return out.reshape(shape)
+
+    # Work only on the accepted lanes; per-lane constants computed once.
+    price, spot, strike, t_years, is_call = (
+        a[lanes] for a in (price, spot, strike, t_years, is_call)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_sk = np.log(spot / strike)
+    sqrt_t = np.sqrt(t_years)
+    disc_k = strike * np.exp(-r * t_years)
+    solved = np.full(lanes.size, np.nan)
+
+    # --- Newton-Raphson, lane-wise identical to the scalar loop ---
+    sigma = np.full(lanes.size, max(initial_sigma, 1e-3))
+    active = np.arange(lanes.size)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_iter):
+            if active.size == 0:
+                break
+            s = sigma[active]
+            px, d1 = _price_and_d1(spot[active], disc_k[active], log_sk[active], t_years[active],
+                                   sqrt_t[active], s, is_call[active], r)
+            diff = px - price[active]
+            done = np.abs(diff) < tol
+            solved[active[done]] = s[done]
+
+            v = spot[active] * _norm_pdf_array(d1) * sqrt_t[active]
+            stalled = ~done & (v < 1e-8)  # scalar `break` -> Brent fallback
+            step = ~done & ~stalled
+            s_new = np.clip(s - diff / v, 0.001, 5.0)
+            conv = step & (np.abs(s_new - s) < tol)
+            solved[active[conv]] = s_new[conv]
+
+            keep = step & ~conv
+            sigma[active[keep]] = s_new[keep]
+            active = active[keep]
+
+        # --- Bisection fallback over the lanes Newton left unsolved ---
+        todo = np.flatnonzero(np.isnan(solved))
+        if todo.size:
+            solved[todo] = _brent_iv_array(
+                price[todo], spot[todo], disc_k[todo], log_sk[todo],
+                t_years[todo], sqrt_t[todo], is_call[todo], r,
+            )
+
+    out[lanes] = solved
+    return out.reshape(shape)
+
+
+def _brent_iv_array(price, spot, disc_k, log_sk, t_years, sqrt_t, is_call, r: float) -> np.ndarray:
+    """Masked, lane-wise `_brent_iv` (60 bisection steps on [1e-3, 5])."""
+    n = price.shape[0]
+    lo = np.full(n, 1e-3)
+    hi = np.full(n, 5.0)
+    args = (spot, disc_k, log_sk, t_years, sqrt_t)
+    p_lo = _price_and_d1(*args, lo, is_call, r)[0] - price
+    p_hi = _price_and_d1(*args, hi, is_call, r)[0] - price
+    out = np.full(n, np.nan)
+    active = np.flatnonzero(~(p_lo * p_hi > 0))  # no root in interval -> NaN
+    mid = np.empty(n)
+    for _ in range(60):
+        if active.size == 0:
+            break
+        m = 0.5 * (lo[active] + hi[active])
+        mid[active] = m
+        p_mid = _price_and_d1(*(a[active] for a in args), m, is_call[active], r)[0] - price[active]
+        hit = np.abs(p_mid) < 1e-5
+        out[active[hit]] = m[hit]
+
+        lower = ~hit & (p_lo[active] * p_mid < 0)
+        upper = ~hit & ~lower
+        hi[active[lower]], p_hi[active[lower]] = m[lower], p_mid[lower]
+        lo[active[upper]], p_lo[active[upper]] = m[upper], p_mid[upper]
+        active = active[~hit]
+    # Lanes that exhausted the iterations return the last midpoint, as the scalar does.
+    out[active] = mid[active]
+    return out
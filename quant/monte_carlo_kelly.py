@@ -55,6 +55,35 @@ class SimulationResult:
     trough_equity: float
 
 
+@dataclass
+class SimulationBatch:
+    """Monte Carlo paths at one Kelly fraction, one array entry per path"""
+    kelly_fraction: float
+    final_equity: np.ndarray
+    max_drawdown_pct: np.ndarray
+    num_trades: np.ndarray
+    ruin: np.ndarray
+    peak_equity: np.ndarray
+    trough_equity: np.ndarray
+
+    def to_results(self) -> List[SimulationResult]:
+        return [
+            SimulationResult(final_equity=float(e), max_drawdown_pct=float(dd), num_trades=int(n),
+                             ruin=bool(r), peak_equity=float(pk), trough_equity=float(tr))
+            for e, dd, n, r, pk, tr in zip(self.final_equity, self.max_drawdown_pct, self.num_trades,
+                                           self.ruin, self.peak_equity, self.trough_equity)
+        ]
+
+
+@dataclass
+class PathDraws:
+    """Per-path parameters and trade outcomes, shared by every Kelly fraction tested on them"""
+    win_rate: np.ndarray     # (num_simulations,)
+    avg_win: np.ndarray      # (num_simulations,)
+    avg_loss: np.ndarray     # (num_simulations,)
+    wins: np.ndarray         # (num_simulations, num_trades_per_sim) bool
+
+
 @dataclass
 class KellyStressTest:
     """Complete stress test results"""
@@ -145,7 +174,7 @@ class MonteCarloKelly:
         self.num_simulations = num_simulations
         self.num_trades_per_sim = num_trades_per_sim
         self.random_seed = random_seed
-        np.random.seed(random_seed)
+        self.rng = np.random.default_rng(random_seed)
 
     def calculate_kelly(
         self,
@@ -233,6 +262,8 @@ class MonteCarloKelly:
         2. Win with probability win_rate
         3. If win: gain avg_win% of risked amount
         4. If loss: lose avg_loss% of risked amount
+
+        Scalar reference for simulate_paths(), which runs every path at once.
         """
         equity = 1.0  # Start with $1
         peak = 1.0
@@ -245,7 +276,7 @@ class MonteCarloKelly:
             risk_amount = equity * kelly_fraction
 
             # Win or lose
-            if np.random.random() < win_rate:
+            if self.rng.random() < win_rate:
                 # Win
                 pnl = risk_amount * (avg_win / 100)
             else:
@@ -275,6 +306,80 @@ class MonteCarloKelly:
             trough_equity=trough
         )
 
+    def draw_paths(
+        self,
+        estimate: KellyEstimate,
+        vary_parameters: bool = True
+    ) -> PathDraws:
+        """
+        Draw every path's parameters and win/loss sequence in one shot.
+
+        If vary_parameters=True, samples win_rate and payoffs per path from
+        distributions to account for parameter uncertainty.
+        """
+        n = self.num_simulations
+        if vary_parameters:
+            # Sample from uncertainty distribution
+            # Use truncated normal to keep in valid range
+            win_rate = np.clip(self.rng.normal(estimate.win_rate, estimate.win_rate_std, n),
+                               0.2, 0.9)  # Realistic bounds
+            avg_win = np.maximum(1, self.rng.normal(estimate.avg_win, estimate.avg_win_std, n))
+            avg_loss = np.maximum(1, self.rng.normal(estimate.avg_loss, estimate.avg_loss_std, n))
+        else:
+            win_rate = np.full(n, float(estimate.win_rate))
+            avg_win = np.full(n, float(estimate.avg_win))
+            avg_loss = np.full(n, float(estimate.avg_loss))
+
+        wins = self.rng.random((n, self.num_trades_per_sim)) < win_rate[:, None]
+        return PathDraws(win_rate=win_rate, avg_win=avg_win, avg_loss=avg_loss, wins=wins)
+
+    def simulate_paths(self, kelly_fraction: float, draws: PathDraws) -> SimulationBatch:
+        """
+        simulate_path() for every drawn path at once.
+
+        Equity is the cumulative product of per-trade growth factors. A path
+        stops at its first close below RUIN_THRESHOLD, so everything after
+        that trade is frozen at the ruin equity before the running peak,
+        trough and drawdown are taken.
+        """
+        growth = np.where(draws.wins,
+                          1 + kelly_fraction * (draws.avg_win / 100)[:, None],
+                          1 - kelly_fraction * (draws.avg_loss / 100)[:, None])
+        equity = np.cumprod(growth, axis=1)
+
+        ruined = equity < self.RUIN_THRESHOLD
+        ruin = ruined.any(axis=1)
+        last = np.where(ruin, ruined.argmax(axis=1), equity.shape[1] - 1)
+        final_equity = equity[np.arange(len(equity)), last]
+        after_ruin = np.arange(equity.shape[1])[None, :] > last[:, None]
+        equity = np.where(after_ruin, final_equity[:, None], equity)
+
+        peak = np.maximum(1.0, np.maximum.accumulate(equity, axis=1))
+        max_drawdown = ((peak - equity) / peak).max(axis=1)
+
+        return SimulationBatch(
+            kelly_fraction=kelly_fraction,
+            final_equity=final_equity,
+            max_drawdown_pct=max_drawdown * 100,
+            num_trades=last + 1,
+            ruin=ruin,
+            peak_equity=peak[:, -1],
+            trough_equity=np.minimum(1.0, equity.min(axis=1))
+        )
+
+    def simulate_fractions(
+        self,
+        kelly_fractions,
+        estimate: KellyEstimate,
+        vary_parameters: bool = True
+    ) -> List[SimulationBatch]:
+        """
+        Evaluate a vector of Kelly fractions on one set of drawn paths
+        (common random numbers, so fractions are compared like for like).
+        """
+        draws = self.draw_paths(estimate, vary_parameters)
+        return [self.simulate_paths(float(f), draws) for f in np.atleast_1d(kelly_fractions)]
+
     def run_simulation(
         self,
         kelly_fraction: float,
@@ -287,56 +392,40 @@ class MonteCarloKelly:
         If vary_parameters=True, samples win_rate and payoffs from
         distributions to account for parameter uncertainty.
         """
-        results = []
-
-        for _ in range(self.num_simulations):
-            if vary_parameters:
-                # Sample from uncertainty distribution
-                # Use truncated normal to keep in valid range
-                win_rate = np.clip(
-                    np.random.normal(estimate.win_rate, estimate.win_rate_std),
-                    0.2, 0.9  # Realistic bounds
-                )
-                avg_win = max(1, np.random.normal(estimate.avg_win, estimate.avg_win_std))
-                avg_loss = max(1, np.random.normal(estimate.avg_loss, estimate.avg_loss_std))
-            else:
-                win_rate = estimate.win_rate
-                avg_win = estimate.avg_win
-                avg_loss = estimate.avg_loss
-
-            result = self.simulate_path(kelly_fraction, win_rate, avg_win, avg_loss)
-            results.append(result)
-
-        return results
+        return self.simulate_fractions([kelly_fraction], estimate, vary_parameters)[0].to_results()
 
     def analyze_results(
         self,
-        results: List[SimulationResult]
+        results
     ) -> Dict:
-        """Analyze simulation results for risk metrics"""
-        final_equities = [r.final_equity for r in results]
-        max_drawdowns = [r.max_drawdown_pct for r in results]
-        ruin_count = sum(1 for r in results if r.ruin)
-        dd_50_count = sum(1 for r in results if r.max_drawdown_pct >= 50)
+        """Analyze simulation results (List[SimulationResult] or SimulationBatch) for risk metrics"""
+        if isinstance(results, SimulationBatch):
+            final_equities = results.final_equity
+            max_drawdowns = results.max_drawdown_pct
+            ruin = results.ruin
+        else:
+            final_equities = np.array([r.final_equity for r in results])
+            max_drawdowns = np.array([r.max_drawdown_pct for r in results])
+            ruin = np.array([r.ruin for r in results], dtype=bool)
+        n = len(final_equities)
 
         # Value at Risk (5th percentile of final equity)
         var_95 = np.percentile(final_equities, 5)
 
         # Conditional VaR (mean of worst 5%)
-        sorted_equities = sorted(final_equities)
-        worst_n = max(1, len(sorted_equities) // 20)  # Strict 5%
-        cvar_95 = np.mean(sorted_equities[:worst_n])
+        worst_n = max(1, n // 20)  # Strict 5%
+        cvar_95 = np.mean(np.partition(final_equities, worst_n - 1)[:worst_n])
 
         return {
-            'prob_ruin': ruin_count / len(results),
-            'prob_50pct_dd': dd_50_count / len(results),
+            'prob_ruin': int(ruin.sum()) / n,
+            'prob_50pct_dd': int((max_drawdowns >= 50).sum()) / n,
             'median_final_equity': np.median(final_equities),
             'mean_final_equity': np.mean(final_equities),
             'std_final_equity': np.std(final_equities),
             'var_95': var_95,
             'cvar_95': cvar_95,
             'median_max_dd': np.median(max_drawdowns),
-            'max_max_dd': max(max_drawdowns)
+            'max_max_dd': float(np.max(max_drawdowns))
         }
 
     def find_safe_kelly(
@@ -348,18 +437,18 @@ class MonteCarloKelly:
         Find Kelly fraction where probability of ruin < (1 - target_survival).
 
         Uses binary search to find the largest Kelly where
-        at least target_survival% of simulations avoid ruin.
+        at least target_survival% of simulations avoid ruin. Every step
+        reuses one set of drawn paths, so the search sees a consistent
+        ruin curve instead of fresh noise at each midpoint.
         """
         low = 0.01
         high = 0.50  # Max 50% Kelly
         best_safe = low
+        draws = self.draw_paths(estimate, vary_parameters=True)
 
         for _ in range(10):  # Binary search iterations
             mid = (low + high) / 2
-            results = self.run_simulation(mid, estimate, vary_parameters=True)
-            analysis = self.analyze_results(results)
-
-            survival_rate = 1 - analysis['prob_ruin']
+            survival_rate = 1 - self.simulate_paths(mid, draws).ruin.mean()
 
             if survival_rate >= target_survival:
                 best_safe = mid
@@ -402,13 +491,10 @@ class MonteCarloKelly:
         # Conservative = half of safe
         kelly_conservative = kelly_safe / 2
 
-        # Run simulations at optimal Kelly
-        results_optimal = self.run_simulation(kelly_optimal, estimate, vary_parameters=True)
-        analysis_optimal = self.analyze_results(results_optimal)
-
-        # Run simulations at safe Kelly
-        results_safe = self.run_simulation(kelly_safe, estimate, vary_parameters=True)
-        analysis_safe = self.analyze_results(results_safe)
+        # Run simulations at optimal and safe Kelly
+        batch_optimal, batch_safe = self.simulate_fractions([kelly_optimal, kelly_safe], estimate)
+        analysis_optimal = self.analyze_results(batch_optimal)
+        analysis_safe = self.analyze_results(batch_safe)
 
         # Build recommendation
         if kelly_optimal <= 0:
@@ -512,8 +598,8 @@ def validate_current_sizing(
 
     # Run simulation at current Kelly
     estimate = mc.estimate_uncertainty(win_rate, avg_win, avg_loss, sample_size)
-    results = mc.run_simulation(current_kelly, estimate, vary_parameters=True)
-    analysis = mc.analyze_results(results)
+    batch = mc.simulate_fractions([current_kelly], estimate, vary_parameters=True)[0]
+    analysis = mc.analyze_results(batch)
 
     is_safe = current_kelly <= stress_test.kelly_safe
     is_conservative = current_kelly <= stress_test.kelly_conservative
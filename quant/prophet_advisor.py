@@ -1382,6 +1382,204 @@ RECOMMENDATIONS:
         return result
 
 
+# =============================================================================
+# PROCESS-WIDE MODEL CACHE
+# =============================================================================
+# Bots construct their own ProphetAdvisor instances (and call get_*_advice
+# every scan). Without a shared cache each instance pulled and unpickled the
+# whole model blob at init and again on every version change. The cache keeps
+# one deserialized copy per process, keyed by the prophet_trained_models row
+# id, and checks the active row with a tiny id-only query at most once per
+# PROPHET_MODEL_CHECK_SECONDS. Instances compare stamps (no DB) and re-point
+# at the cached objects only when the active row actually changed.
+
+PROPHET_MODEL_CHECK_SECONDS = float(os.getenv('PROPHET_MODEL_CHECK_SECONDS', '60'))
+
+
+@dataclass(frozen=True)
+class CachedProphetModel:
+    """One deserialized prophet_trained_models row (shared, read-only)."""
+    stamp: Any                     # prophet_trained_models.id (row identity)
+    model_version: str
+    saved: Dict[str, Any]          # unpickled model_data payload
+    training_metrics: Optional[TrainingMetrics]
+    has_gex_features: bool
+    trained_at: Optional[datetime]
+    loaded_at: datetime
+
+
+class ProphetModelCache:
+    """
+    Shares the active Prophet model across every ProphetAdvisor in the process.
+
+    get() is the hot-path call: a monotonic-clock comparison, plus one
+    id-only query when the check interval has elapsed. The blob is fetched
+    and unpickled only when the active row id differs from the cached one.
+    publish() is the local stand-in for a change notification: the process
+    that saves a model installs it directly, without a round trip.
+    """
+
+    def __init__(self, check_interval_seconds: float = PROPHET_MODEL_CHECK_SECONDS):
+        self.check_interval_seconds = check_interval_seconds
+        self._entry: Optional[CachedProphetModel] = None
+        self._last_check: Optional[float] = None
+        self._lock = threading.Lock()
+        self.stats = {'version_checks': 0, 'deserializations': 0, 'published': 0}
+
+    @property
+    def entry(self) -> Optional[CachedProphetModel]:
+        return self._entry
+
+    def get(self, force_check: bool = False) -> Optional[CachedProphetModel]:
+        """Active model, re-checking the DB stamp when the interval has elapsed."""
+        if not force_check and self._check_is_fresh():
+            return self._entry
+
+        with self._lock:
+            if not force_check and self._check_is_fresh():
+                return self._entry  # another thread checked while we waited
+            self._last_check = time.monotonic()
+            self.stats['version_checks'] += 1
+
+            stamp = self._fetch_active_stamp()
+            if stamp is None or (self._entry is not None and self._entry.stamp == stamp):
+                return self._entry
+
+            loaded = self._fetch_model(stamp)
+            if loaded is not None:
+                self._entry = loaded
+            return self._entry
+
+    def publish(self, entry: CachedProphetModel) -> None:
+        """Install a model this process just saved."""
+        with self._lock:
+            self._entry = entry
+            self._last_check = time.monotonic()
+            self.stats['published'] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entry = None
+            self._last_check = None
+
+    def _check_is_fresh(self) -> bool:
+        return (
+            self._last_check is not None
+            and time.monotonic() - self._last_check < self.check_interval_seconds
+        )
+
+    def _fetch_active_stamp(self) -> Optional[Any]:
+        """id of the active model row (served by idx_prophet_trained_models_active)."""
+        if not DB_AVAILABLE:
+            return None
+        with get_db_connection() as conn:
+            if conn is None:
+                return None
+            try:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id
+                    FROM prophet_trained_models
+                    WHERE is_active = TRUE
+                    ORDER BY created_at DESC
+                    LIMIT 1
+                """)
+                row = cursor.fetchone()
+                return row[0] if row else None
+            except Exception as e:
+                logger.debug(f"Prophet model version check failed: {e}")
+                return None
+
+    def _fetch_model(self, stamp: Any) -> Optional[CachedProphetModel]:
+        """Load and deserialize one model row by id."""
+        with get_db_connection() as conn:
+            if conn is None:
+                return None
+            try:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT model_version, model_data, training_metrics, has_gex_features, created_at
+                    FROM prophet_trained_models
+                    WHERE id = %s
+                """, (stamp,))
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                model_version, model_data, metrics_json, has_gex, created_at = row
+
+                saved = pickle.loads(model_data)
+                self.stats['deserializations'] += 1
+
+                metrics = None
+                if metrics_json:
+                    metrics_dict = json.loads(metrics_json) if isinstance(metrics_json, str) else metrics_json
+                    metrics = TrainingMetrics(**metrics_dict)
+
+                # Handle both timezone-aware and naive datetimes
+                if created_at is not None and getattr(created_at, 'tzinfo', None) is not None:
+                    created_at = created_at.replace(tzinfo=None)
+
+                return CachedProphetModel(
+                    stamp=stamp,
+                    model_version=model_version,
+                    saved=saved,
+                    training_metrics=metrics,
+                    has_gex_features=bool(has_gex),
+                    trained_at=created_at,
+                    loaded_at=datetime.now(),
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load Prophet model {stamp} from database: {e}")
+                return None
+
+
+_model_cache = ProphetModelCache()
+
+
+def get_model_cache() -> ProphetModelCache:
+    """Process-wide Prophet model cache."""
+    return _model_cache
+
+
+def preload_prophet_model() -> Optional[str]:
+    """
+    Warm the model cache at process boot so the first advice call of the day
+    only runs predict. Returns the loaded model version (None if no model).
+    """
+    entry = _model_cache.get(force_check=True)
+    if entry is not None:
+        logger.info(f"Prophet model v{entry.model_version} preloaded (row {entry.stamp})")
+        return entry.model_version
+    return None
+
+
+def _convert_numpy(val):
+    """Convert numpy scalars/arrays to Python natives for psycopg2/json."""
+    try:
+        import numpy as np
+        if isinstance(val, (np.integer, np.int64, np.int32)):
+            return int(val)
+        elif isinstance(val, (np.floating, np.float64, np.float32)):
+            return float(val)
+        elif isinstance(val, np.bool_):
+            return bool(val)
+        elif isinstance(val, np.ndarray):
+            return val.tolist()
+    except ImportError:
+        pass
+    return val
+
+
+def _convert_dict_numpy(d):
+    if d is None:
+        return None
+    if isinstance(d, dict):
+        return {k: _convert_dict_numpy(v) for k, v in d.items()}
+    elif isinstance(d, list):
+        return [_convert_dict_numpy(item) for item in d]
+    return _convert_numpy(d)
+
+
 # =============================================================================
 # PROPHET ADVISOR
 # =============================================================================
@@ -1578,8 +1776,10 @@ class ProphetAdvisor:
         # =========================================================================
         self._model_loaded_at: Optional[datetime] = None  # When model was loaded into memory
         self._model_trained_at: Optional[datetime] = None  # When model was last trained
-        self._last_version_check: Optional[datetime] = None  # Throttle version checks
-        self._version_check_interval_seconds = 300  # Check for new model every 5 minutes
+        self._model_stamp = None  # prophet_trained_models.id this instance is using
+
+        # Base predictions precomputed by get_advice_batch for the calling thread
+        self._batch_local = threading.local()
 
         # OMEGA mode - trust ML Advisor, use Prophet for adaptation only
         self.omega_mode = omega_mode
@@ -1870,68 +2070,32 @@ class ProphetAdvisor:
         """Check if model is considered fresh (< max_age_hours old)"""
         return self._get_hours_since_training() < max_age_hours
 
-    def _get_db_model_version(self) -> Optional[str]:
-        """Get the current active model version from database"""
-        if not DB_AVAILABLE:
-            return None
-
-        with get_db_connection() as conn:
-            if conn is None:
-                return None
-            try:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT model_version
-                    FROM prophet_trained_models
-                    WHERE is_active = TRUE
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """)
-                row = cursor.fetchone()
-                return row[0] if row else None
-            except Exception as e:
-                logger.debug(f"Failed to check DB model version: {e}")
-                return None
-
     def _check_and_reload_model_if_stale(self) -> bool:
         """
-        Check if a newer model exists in DB and reload if so.
+        Switch to a newer model if the active DB row changed.
 
         This fixes Issue #1: Model staleness after retraining.
-        Called before every prediction to ensure fresh model is used.
+        Called before every prediction. The process-wide cache throttles the
+        (id-only) DB check and deserializes each new model once per process,
+        so on the hot path this is a clock comparison and an id comparison.
 
         Returns:
             True if model was reloaded, False otherwise
         """
-        # Throttle version checks to avoid DB spam (every 5 minutes)
-        now = datetime.now()
-        if self._last_version_check is not None:
-            seconds_since_check = (now - self._last_version_check).total_seconds()
-            if seconds_since_check < self._version_check_interval_seconds:
-                return False
-
-        self._last_version_check = now
-
-        # Check DB for newer version
-        db_version = self._get_db_model_version()
-        if db_version is None:
+        entry = get_model_cache().get()
+        if entry is None or entry.stamp == self._model_stamp:
             return False
 
-        # If DB has different version, reload
-        if db_version != self.model_version:
-            logger.info(f"Prophet detected new model version in DB: {db_version} (current: {self.model_version})")
-            old_version = self.model_version
-            if self._load_model_from_db():
-                self.live_log.log("MODEL_RELOAD", f"Auto-reloaded model: {old_version} → {self.model_version}", {
-                    "old_version": old_version,
-                    "new_version": self.model_version,
-                    "hours_since_training": self._get_hours_since_training()
-                })
-                return True
-            else:
-                logger.warning(f"Failed to reload new model version {db_version}")
-
-        return False
+        old_version = self.model_version
+        logger.info(f"Prophet detected new active model: v{entry.model_version} "
+                    f"(row {entry.stamp}, current: v{old_version})")
+        self._apply_cached_model(entry)
+        self.live_log.log("MODEL_RELOAD", f"Auto-reloaded model: {old_version} → {self.model_version}", {
+            "old_version": old_version,
+            "new_version": self.model_version,
+            "hours_since_training": self._get_hours_since_training()
+        })
+        return True
 
     def _add_staleness_to_prediction(self, prediction: ProphetPrediction) -> ProphetPrediction:
         """
@@ -1994,77 +2158,37 @@ class ProphetAdvisor:
         if not DB_AVAILABLE:
             return False
 
-        with get_db_connection() as conn:
-            if conn is None:
-                return False
-            try:
-                cursor = conn.cursor()
-
-                # Check if table exists
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables
-                        WHERE table_name = 'prophet_trained_models'
-                    )
-                """)
-                if not cursor.fetchone()[0]:
-                    return False
-
-                # Get the most recent active model (including created_at for staleness tracking)
-                cursor.execute("""
-                    SELECT model_version, model_data, training_metrics, has_gex_features, created_at
-                    FROM prophet_trained_models
-                    WHERE is_active = TRUE
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """)
-                row = cursor.fetchone()
-
-                if row:
-                    model_version, model_data, metrics_json, has_gex, created_at = row
-
-                    # Deserialize model data
-                    saved = pickle.loads(model_data)
-                    self.model = saved.get('model')
-                    self.calibrated_model = saved.get('calibrated_model')
-                    self.scaler = saved.get('scaler')
-                    self.model_version = model_version
-                    self._has_gex_features = has_gex or False
-                    # V3 metadata
-                    self._feature_version = saved.get('feature_version', 2)
-                    self._trained_feature_cols = saved.get('feature_cols', self.FEATURE_COLS_V2)
-                    self._base_rate = saved.get('base_rate')
-                    self._update_thresholds_from_base_rate()
-                    self.is_trained = True
-
-                    # Track when model was trained and loaded (Issue #1 fix)
-                    self._model_loaded_at = datetime.now()
-                    if created_at:
-                        # Handle both timezone-aware and naive datetimes
-                        if hasattr(created_at, 'tzinfo') and created_at.tzinfo is not None:
-                            self._model_trained_at = created_at.replace(tzinfo=None)
-                        else:
-                            self._model_trained_at = created_at
-                    else:
-                        self._model_trained_at = self._model_loaded_at
-
-                    # Restore training metrics
-                    if metrics_json:
-                        if isinstance(metrics_json, str):
-                            metrics_dict = json.loads(metrics_json)
-                        else:
-                            metrics_dict = metrics_json
-                        self.training_metrics = TrainingMetrics(**metrics_dict)
-
-                    hours_since = self._get_hours_since_training()
-                    logger.info(f"Loaded Prophet model v{self.model_version} from DATABASE "
-                               f"(trained {hours_since:.1f}h ago)")
-                    return True
+        entry = get_model_cache().get()
+        if entry is None:
+            return False
 
-            except Exception as e:
-                logger.warning(f"Failed to load model from database: {e}")
+        self._apply_cached_model(entry)
+        hours_since = self._get_hours_since_training()
+        logger.info(f"Loaded Prophet model v{self.model_version} from DATABASE "
+                   f"(trained {hours_since:.1f}h ago)")
+        return True
+
+    def _apply_cached_model(self, entry: CachedProphetModel) -> None:
+        """Point this instance at a cached model (shared objects, no unpickle)."""
+        saved = entry.saved
+        self.model = saved.get('model')
+        self.calibrated_model = saved.get('calibrated_model')
+        self.scaler = saved.get('scaler')
+        self.model_version = entry.model_version
+        self._has_gex_features = entry.has_gex_features
+        # V3 metadata
+        self._feature_version = saved.get('feature_version', 2)
+        self._trained_feature_cols = saved.get('feature_cols', self.FEATURE_COLS_V2)
+        self._base_rate = saved.get('base_rate')
+        self._update_thresholds_from_base_rate()
+        self.is_trained = True
+        if entry.training_metrics is not None:
+            self.training_metrics = entry.training_metrics
+        self._model_stamp = entry.stamp
 
-        return False
+        # Track when model was trained and loaded (Issue #1 fix)
+        self._model_loaded_at = entry.loaded_at
+        self._model_trained_at = entry.trained_at or entry.loaded_at
 
     def _save_model(self):
         """Save trained model to BOTH database (for Render) and local file (backup)"""
@@ -2123,18 +2247,26 @@ class ProphetAdvisor:
                     )
                 """)
 
+                # Version checks read only the active row id
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_prophet_trained_models_active
+                    ON prophet_trained_models (created_at DESC)
+                    WHERE is_active = TRUE
+                """)
+
                 # Deactivate previous active models (only update those that are currently active)
                 cursor.execute("UPDATE prophet_trained_models SET is_active = FALSE WHERE is_active = TRUE")
 
                 # Serialize model data (includes V3 metadata)
-                model_data = pickle.dumps({
+                saved = {
                     'model': self.model,
                     'calibrated_model': self.calibrated_model,
                     'scaler': self.scaler,
                     'feature_version': self._feature_version,
                     'feature_cols': self._trained_feature_cols,
                     'base_rate': self._base_rate,
-                })
+                }
+                model_data = pickle.dumps(saved)
 
                 # Serialize training metrics
                 metrics_json = json.dumps(self.training_metrics.__dict__) if self.training_metrics else None
@@ -2144,15 +2276,32 @@ class ProphetAdvisor:
                     INSERT INTO prophet_trained_models
                     (model_version, model_data, training_metrics, has_gex_features, is_active)
                     VALUES (%s, %s, %s, %s, TRUE)
+                    RETURNING id, created_at
                 """, (
                     self.model_version,
                     model_data,
                     metrics_json,
                     self._has_gex_features
                 ))
+                model_id, created_at = cursor.fetchone()
 
                 conn.commit()
 
+                # Every advisor in this process switches on its next advice call
+                now = datetime.now()
+                get_model_cache().publish(CachedProphetModel(
+                    stamp=model_id,
+                    model_version=self.model_version,
+                    saved=saved,
+                    training_metrics=self.training_metrics,
+                    has_gex_features=bool(self._has_gex_features),
+                    trained_at=created_at.replace(tzinfo=None) if created_at else now,
+                    loaded_at=now,
+                ))
+                self._model_stamp = model_id
+                self._model_loaded_at = now
+                self._model_trained_at = now
+
                 logger.info(f"Saved Prophet model v{self.model_version} to DATABASE (persists across deploys)")
                 return True
 
@@ -4084,6 +4233,153 @@ class ProphetAdvisor:
     # BASE PREDICTION
     # =========================================================================
 
+    # =========================================================================
+    # BATCH ADVICE (one scoring pass per tick for the whole fleet)
+    # =========================================================================
+
+    # Advice method each bot's scan path calls, and the bot name that method
+    # routes to the sub-models with (FAITH/GRACE score as FORTRESS, SAMSON as ANCHOR)
+    BATCH_ADVICE_ROUTES = {
+        'FORTRESS': ('get_fortress_advice', 'FORTRESS'),
+        'FAITH': ('get_fortress_advice', 'FORTRESS'),
+        'GRACE': ('get_fortress_advice', 'FORTRESS'),
+        'ANCHOR': ('get_anchor_advice', 'ANCHOR'),
+        'SAMSON': ('get_anchor_advice', 'ANCHOR'),
+        'SOLOMON': ('get_solomon_advice', 'SOLOMON'),
+        'GIDEON': ('get_solomon_advice', 'GIDEON'),
+        'LAZARUS': ('get_lazarus_advice', 'LAZARUS'),
+        'CORNERSTONE': ('get_cornerstone_advice', 'CORNERSTONE'),
+    }
+
+    def get_advice_batch(
+        self,
+        contexts_by_bot: Dict[Any, MarketContext],
+        advice_kwargs: Optional[Dict[str, Dict[str, Any]]] = None,
+        trade_date: Optional[str] = None,
+    ) -> Dict[str, ProphetPrediction]:
+        """
+        Get advice for several bots from a single scoring pass.
+
+        All contexts are stacked into one feature matrix per model (IC sub-model,
+        Directional sub-model, combined model) and scored with one predict_proba
+        call each, so the ML cost of a tick stays flat as bots are added. Each
+        bot's own advice method then runs as usual (VIX rules, GEX walls, Claude
+        validation) on the precomputed base prediction, so results are identical
+        to calling get_<bot>_advice one bot at a time.
+
+        Args:
+            contexts_by_bot: Bot name (str or BotName) -> MarketContext
+            advice_kwargs: Optional per-bot keyword arguments for that bot's advice
+                method, e.g. {'FORTRESS': {'vix_hard_skip': 32.0}}
+            trade_date: When given, every prediction is persisted with one
+                multi-row INSERT into prophet_predictions
+
+        Returns:
+            Bot name -> ProphetPrediction. Unknown bots and bots whose advice
+            method raised are omitted (and logged).
+        """
+        self._check_and_reload_model_if_stale()
+        advice_kwargs = advice_kwargs or {}
+
+        requests = []
+        for bot, context in contexts_by_bot.items():
+            bot_name = bot.value if isinstance(bot, BotName) else str(bot).upper()
+            route = self.BATCH_ADVICE_ROUTES.get(bot_name)
+            if route is None:
+                logger.warning(f"get_advice_batch: no advice route for bot {bot_name} - skipped")
+                continue
+            requests.append((bot_name, route, context))
+
+        scored = self._get_base_predictions_batch([(route[1], context) for _, route, context in requests])
+        batched = {
+            (route[1], id(context)): pred
+            for (_, route, context), pred in zip(requests, scored)
+        }
+
+        results: Dict[str, ProphetPrediction] = {}
+        self._batch_local.predictions = batched
+        try:
+            for bot_name, (method_name, model_bot), context in requests:
+                kwargs = dict(advice_kwargs.get(bot_name, {}))
+                if method_name == 'get_solomon_advice':
+                    kwargs.setdefault('bot_name', model_bot)
+                try:
+                    prediction = getattr(self, method_name)(context, **kwargs)
+                except Exception as e:
+                    logger.error(f"get_advice_batch: {bot_name} advice failed: {e}")
+                    continue
+                # FAITH/GRACE/SAMSON are scored through another bot's advice
+                # method; the prediction belongs to the bot that asked for it
+                prediction.bot_name = BotName(bot_name)
+                results[bot_name] = prediction
+        finally:
+            self._batch_local.predictions = None
+
+        self.live_log.log("PREDICT_BATCH", f"Batch advice for {len(results)} bots", {
+            "bots": list(results),
+            "model_version": self.model_version,
+        })
+
+        if trade_date and results:
+            self.store_predictions_batch(
+                [(results[bot_name], context) for bot_name, _, context in requests if bot_name in results],
+                trade_date,
+            )
+
+        return results
+
+    def _get_base_predictions_batch(self, requests: List[Tuple[Optional[str], MarketContext]]) -> List[Dict[str, Any]]:
+        """
+        Vectorized _get_base_prediction over (bot_name, context) pairs.
+
+        Rows routed to a trained sub-model are stacked and scored per sub-model;
+        everything else (unmapped bots, untrained sub-models, unusable sub-model
+        output) goes through the combined model in one more call.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+
+        # Phase 3: group rows by sub-model
+        by_model: Dict[str, List[int]] = {}
+        sub_models = getattr(self, '_sub_models', {})
+        for i, (bot_name, _) in enumerate(requests):
+            model_type = self.STRATEGY_MODEL_MAP.get(bot_name) if bot_name else None
+            sub = sub_models.get(model_type) if model_type else None
+            if sub is not None and sub['is_trained']:
+                by_model.setdefault(model_type, []).append(i)
+
+        for model_type, indices in by_model.items():
+            sub = sub_models[model_type]
+            rows = [self._sub_model_feature_row(requests[i][1], model_type, sub['feature_cols']) for i in indices]
+            proba = self._predict_proba_rows(sub['scaler'], sub['calibrated_model'] or sub['model'], rows)
+            if proba is None:
+                continue
+            for i, row_proba in zip(indices, proba):
+                results[i] = self._sub_model_prediction_from_proba(row_proba, model_type, sub)
+
+        remaining = [i for i, pred in enumerate(results) if pred is None]
+        if not remaining:
+            return results
+
+        proba = None
+        if self.is_trained:
+            rows = []
+            trained_cols = None
+            for i in remaining:
+                row, trained_cols = self._base_feature_row(requests[i][1])
+                rows.append(row)
+            proba = self._predict_proba_rows(self.scaler, self.calibrated_model or self.model, rows)
+
+        if proba is None:
+            for i in remaining:
+                results[i] = self._fallback_prediction(requests[i][1])
+            return results
+
+        feature_importance = dict(zip(trained_cols, self.model.feature_importances_))
+        top_factors = sorted(feature_importance.items(), key=lambda x: -x[1])[:3]
+        for i, row_proba in zip(remaining, proba):
+            results[i] = self._prediction_from_proba(row_proba, top_factors, 'combined_v3')
+        return results
+
     def _get_base_prediction(self, context: MarketContext, bot_name: str = None) -> Dict[str, Any]:
         """Get base ML prediction from context.
 
@@ -4092,6 +4388,13 @@ class ProphetAdvisor:
 
         V2: Supports V3 features (cyclical day, VRP) with backward compat for V2/V1 models.
         """
+        # Batch tick: get_advice_batch already scored this context
+        batched = getattr(getattr(self, '_batch_local', None), 'predictions', None)
+        if batched is not None:
+            pred = batched.get((bot_name, id(context)))
+            if pred is not None:
+                return pred
+
         # Phase 3: Try sub-model first
         if bot_name and hasattr(self, '_sub_models'):
             sub_pred = self._get_sub_model_prediction(context, bot_name)
@@ -4102,7 +4405,17 @@ class ProphetAdvisor:
         if not self.is_trained:
             return self._fallback_prediction(context)
 
-        # Prepare features based on which version the model was trained with
+        row, trained_cols = self._base_feature_row(context)
+        proba = self._predict_proba_rows(self.scaler, self.calibrated_model or self.model, [row])
+        if proba is None:
+            return self._fallback_prediction(context)
+
+        feature_importance = dict(zip(trained_cols, self.model.feature_importances_))
+        top_factors = sorted(feature_importance.items(), key=lambda x: -x[1])[:3]
+        return self._prediction_from_proba(proba[0], top_factors, 'combined_v3')
+
+    def _base_feature_row(self, context: MarketContext) -> Tuple[List[float], List[str]]:
+        """Feature row for the combined model, in the column order it was trained with."""
         gex_regime_positive = 1 if context.gex_regime == GEXRegime.POSITIVE else 0
         gex_between_walls = 1 if context.gex_between_walls else 0
         feature_version = getattr(self, '_feature_version', 2)
@@ -4121,7 +4434,7 @@ class ProphetAdvisor:
             vrp_ratio = 0.10 + 0.004 * min(context.vix, 50)  # Scales: VIX10→0.14, VIX20→0.18, VIX30→0.22, VIX40→0.26
             volatility_risk_premium = context.expected_move_pct * vrp_ratio
 
-            features = np.array([[
+            return [
                 context.vix,
                 context.vix_percentile_30d,
                 context.vix_change_1d,
@@ -4135,11 +4448,10 @@ class ProphetAdvisor:
                 gex_regime_positive,
                 context.gex_distance_to_flip_pct,
                 gex_between_walls,
-            ]])
-            trained_cols = self.FEATURE_COLS
+            ], self.FEATURE_COLS
         elif self._has_gex_features:
             # V2: integer day, win_rate_30d, no VRP
-            features = np.array([[
+            return [
                 context.vix,
                 context.vix_percentile_30d,
                 context.vix_change_1d,
@@ -4151,47 +4463,41 @@ class ProphetAdvisor:
                 gex_regime_positive,
                 context.gex_distance_to_flip_pct,
                 gex_between_walls,
-            ]])
-            trained_cols = self.FEATURE_COLS_V2
-        else:
-            # V1: no GEX
-            features = np.array([[
-                context.vix,
-                context.vix_percentile_30d,
-                context.vix_change_1d,
-                context.day_of_week,
-                context.price_change_1d,
-                context.expected_move_pct,
-                context.win_rate_30d,
-            ]])
-            trained_cols = self.FEATURE_COLS_V1
+            ], self.FEATURE_COLS_V2
+        # V1: no GEX
+        return [
+            context.vix,
+            context.vix_percentile_30d,
+            context.vix_change_1d,
+            context.day_of_week,
+            context.price_change_1d,
+            context.expected_move_pct,
+            context.win_rate_30d,
+        ], self.FEATURE_COLS_V1
 
-        # Scale and predict
-        features_scaled = self.scaler.transform(features)
-
-        if self.calibrated_model:
-            proba_result = self.calibrated_model.predict_proba(features_scaled)
-        else:
-            proba_result = self.model.predict_proba(features_scaled)
+    @staticmethod
+    def _predict_proba_rows(scaler, model, rows: List[List[float]]) -> Optional['np.ndarray']:
+        """Scale and score a stack of feature rows in one predict_proba call.
 
-        # Safe access to predict_proba results (expected shape: (1, 2) for binary classifier)
+        Returns an (n, 2) array, or None if the classifier output is unusable
+        (callers fall back exactly as the single-row path always has).
+        """
+        features_scaled = scaler.transform(np.array(rows, dtype=float))
+        proba_result = model.predict_proba(features_scaled)
         if proba_result is None or len(proba_result) == 0:
-            return self._fallback_prediction(context)
-        proba = proba_result[0]
-        if len(proba) < 2:
-            return self._fallback_prediction(context)
-
-        win_probability = float(proba[1])
-
-        # Feature importance
-        feature_importance = dict(zip(trained_cols, self.model.feature_importances_))
-        top_factors = sorted(feature_importance.items(), key=lambda x: -x[1])[:3]
+            return None
+        proba_result = np.asarray(proba_result)
+        if proba_result.ndim != 2 or proba_result.shape[1] < 2:
+            return None
+        return proba_result
 
+    @staticmethod
+    def _prediction_from_proba(proba, top_factors: List[Tuple[str, float]], model_used: str) -> Dict[str, Any]:
         return {
-            'win_probability': win_probability,
-            'top_factors': top_factors,
+            'win_probability': float(proba[1]),
+            'top_factors': list(top_factors),
             'probabilities': {'win': float(proba[1]), 'loss': float(proba[0])},
-            'model_used': 'combined_v3',
+            'model_used': model_used,
         }
 
     def _fallback_prediction(self, context: MarketContext) -> Dict[str, Any]:
@@ -5030,7 +5336,15 @@ class ProphetAdvisor:
         if sub is None or not sub['is_trained']:
             return None
 
-        # Build feature vector for this sub-model
+        rows = [self._sub_model_feature_row(context, model_type, sub['feature_cols'])]
+        proba = self._predict_proba_rows(sub['scaler'], sub['calibrated_model'] or sub['model'], rows)
+        if proba is None:
+            return None
+        return self._sub_model_prediction_from_proba(proba[0], model_type, sub)
+
+    @staticmethod
+    def _sub_model_feature_row(context: MarketContext, model_type: str, feature_cols: List[str]) -> List[float]:
+        """Feature row for an IC or Directional sub-model, in feature_cols order."""
         gex_regime_positive = 1 if context.gex_regime == GEXRegime.POSITIVE else 0
         gex_between_walls = 1 if context.gex_between_walls else 0
         day_sin = math.sin(2 * math.pi * context.day_of_week / 5)
@@ -5083,42 +5397,192 @@ class ProphetAdvisor:
             base_features['direction_confidence'] = 0.5
 
         # Build feature vector in correct column order
-        feature_vector = []
-        for col in sub['feature_cols']:
-            feature_vector.append(base_features.get(col, 0.0))
-
-        features = np.array([feature_vector])
-        features_scaled = sub['scaler'].transform(features)
-
-        if sub['calibrated_model']:
-            proba_result = sub['calibrated_model'].predict_proba(features_scaled)
-        else:
-            proba_result = sub['model'].predict_proba(features_scaled)
-
-        if proba_result is None or len(proba_result) == 0:
-            return None
-        proba = proba_result[0]
-        if len(proba) < 2:
-            return None
-
-        win_probability = float(proba[1])
+        return [base_features.get(col, 0.0) for col in feature_cols]
 
+    def _sub_model_prediction_from_proba(self, proba, model_type: str, sub: Dict[str, Any]) -> Dict[str, Any]:
         feature_importance = dict(zip(sub['feature_cols'], sub['model'].feature_importances_))
         top_factors = sorted(feature_importance.items(), key=lambda x: -x[1])[:3]
 
-        return {
-            'win_probability': win_probability,
-            'top_factors': top_factors,
-            'probabilities': {'win': float(proba[1]), 'loss': float(proba[0])},
-            'model_used': model_type,
-            'model_version': sub['model_version'],
-            'feature_count': len(sub['feature_cols']),
-        }
+        prediction = self._prediction_from_proba(proba, top_factors, model_type)
+        prediction['model_version'] = sub['model_version']
+        prediction['feature_count'] = len(sub['feature_cols'])
+        return prediction
 
     # =========================================================================
     # DATABASE PERSISTENCE
     # =========================================================================
 
+    # Column list / per-row placeholder shared by store_prediction and store_predictions_batch
+    _PREDICTION_INSERT_COLUMNS = """
+        trade_date, bot_name, spot_price, vix, gex_net, gex_normalized, gex_regime,
+        gex_flip_point, gex_call_wall, gex_put_wall, day_of_week,
+        advice, win_probability, confidence, suggested_risk_pct,
+        suggested_sd_multiplier, model_version,
+        use_gex_walls, suggested_put_strike, suggested_call_strike,
+        reasoning, top_factors, probabilities, claude_analysis,
+        position_id, strategy_recommendation,
+        scan_timestamp, model_type, strategy_type
+    """
+    _PREDICTION_INSERT_TEMPLATE = (
+        "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, "
+        "%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, "
+        "%s, %s, "
+        "NOW(), %s, %s)"
+    )
+
+    def _ensure_predictions_table(self, cursor) -> None:
+        """Ensure prophet_predictions has all required columns (migration-safe)."""
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS prophet_predictions (
+            id SERIAL PRIMARY KEY,
+            timestamp TIMESTAMPTZ DEFAULT NOW(),
+            trade_date DATE NOT NULL,
+            bot_name TEXT NOT NULL,
+            prediction_time TIMESTAMPTZ DEFAULT NOW(),
+
+            -- Market Context
+            spot_price REAL,
+            vix REAL,
+            gex_net REAL,
+            gex_normalized REAL,
+            gex_regime TEXT,
+            gex_flip_point REAL,
+            gex_call_wall REAL,
+            gex_put_wall REAL,
+            day_of_week INTEGER,
+
+            -- Prediction Details
+            advice TEXT,
+            win_probability REAL,
+            confidence REAL,
+            suggested_risk_pct REAL,
+            suggested_sd_multiplier REAL,
+            model_version TEXT,
+
+            -- GEX-Specific (FORTRESS)
+            use_gex_walls BOOLEAN DEFAULT FALSE,
+            suggested_put_strike REAL,
+            suggested_call_strike REAL,
+
+            -- Explanation & Transparency
+            reasoning TEXT,
+            top_factors JSONB,
+            probabilities JSONB,
+
+            -- Claude AI Analysis (full transparency)
+            claude_analysis JSONB,
+
+            -- Outcomes (filled after trade closes)
+            prediction_used BOOLEAN DEFAULT FALSE,
+            actual_outcome TEXT,
+            actual_pnl REAL,
+            outcome_date DATE,
+
+            UNIQUE(trade_date, bot_name)
+            )
+        """)
+
+        # Migration: Add missing columns to existing tables
+        migration_columns = [
+            ("claude_analysis", "JSONB"),
+            ("prediction_used", "BOOLEAN DEFAULT FALSE"),
+            ("actual_outcome", "TEXT"),
+            ("actual_pnl", "REAL"),
+            ("outcome_date", "DATE"),
+            ("prediction_time", "TIMESTAMPTZ DEFAULT NOW()"),
+            # Feedback loop enhancements (Migration 023)
+            ("position_id", "VARCHAR(100)"),
+            ("strategy_recommendation", "VARCHAR(20)"),
+            ("direction_predicted", "VARCHAR(10)"),
+            ("direction_correct", "BOOLEAN"),
+            # Multi-prediction support (Migration 027)
+            ("scan_timestamp", "TIMESTAMPTZ DEFAULT NOW()"),
+            ("model_type", "VARCHAR(50) DEFAULT 'combined_v3'"),
+            ("strategy_type", "VARCHAR(20)"),
+            ("feature_snapshot", "JSONB"),
+        ]
+        for col_name, col_type in migration_columns:
+            try:
+                cursor.execute(f"ALTER TABLE prophet_predictions ADD COLUMN IF NOT EXISTS {col_name} {col_type}")
+            except Exception as e:
+                # Column already exists or other migration error - log but continue
+                logger.debug(f"Migration column {col_name}: {e}")
+
+    def _prediction_row(
+        self,
+        prediction: ProphetPrediction,
+        context: MarketContext,
+        trade_date: str,
+        position_id: str = None,
+        strategy_recommendation: str = None
+    ) -> tuple:
+        """Parameter tuple for one prophet_predictions row (see _PREDICTION_INSERT_TEMPLATE)."""
+        # Serialize top_factors as JSON (convert numpy types)
+        top_factors_json = json.dumps([
+            {"feature": f[0], "importance": _convert_numpy(f[1])}
+            for f in (prediction.top_factors or [])
+        ]) if prediction.top_factors else None
+
+        # Serialize probabilities as JSON (convert numpy types)
+        probabilities_json = json.dumps(_convert_dict_numpy(prediction.probabilities)) if prediction.probabilities else None
+
+        # Serialize Claude analysis as JSON (full transparency)
+        claude_json = None
+        if prediction.claude_analysis:
+            ca = prediction.claude_analysis
+            claude_json = json.dumps(_convert_dict_numpy({
+                "analysis": ca.analysis,
+                "confidence_adjustment": ca.confidence_adjustment,
+                "risk_factors": ca.risk_factors,
+                "opportunities": ca.opportunities,
+                "recommendation": ca.recommendation,
+                "override_advice": ca.override_advice,
+                "tokens_used": ca.tokens_used,
+                "input_tokens": ca.input_tokens,
+                "output_tokens": ca.output_tokens,
+                "response_time_ms": ca.response_time_ms,
+                "model_used": ca.model_used,
+                # Store raw prompt/response for full transparency
+                "raw_prompt": ca.raw_prompt[:2000] if ca.raw_prompt else None,
+                "raw_response": ca.raw_response[:5000] if ca.raw_response else None,
+            }))
+
+        # Determine strategy_type from bot name
+        strategy_type = 'DIRECTIONAL' if prediction.bot_name.value in (
+            'SOLOMON', 'GIDEON', 'LAZARUS', 'CORNERSTONE'
+        ) else 'IRON_CONDOR'
+
+        return (
+            trade_date,
+            prediction.bot_name.value,
+            _convert_numpy(context.spot_price),
+            _convert_numpy(context.vix),
+            _convert_numpy(context.gex_net),
+            _convert_numpy(context.gex_normalized),
+            context.gex_regime.value,
+            _convert_numpy(context.gex_flip_point),
+            _convert_numpy(context.gex_call_wall),
+            _convert_numpy(context.gex_put_wall),
+            _convert_numpy(context.day_of_week),
+            prediction.advice.value,
+            _convert_numpy(prediction.win_probability),
+            _convert_numpy(prediction.confidence),
+            _convert_numpy(prediction.suggested_risk_pct),
+            _convert_numpy(prediction.suggested_sd_multiplier),
+            prediction.model_version,
+            prediction.use_gex_walls,
+            _convert_numpy(prediction.suggested_put_strike),
+            _convert_numpy(prediction.suggested_call_strike),
+            prediction.reasoning,
+            top_factors_json,
+            probabilities_json,
+            claude_json,
+            position_id,
+            strategy_recommendation,
+            getattr(prediction, '_model_type', 'combined_v3'),
+            strategy_type,
+        )
+
     def store_prediction(
         self,
         prediction: ProphetPrediction,
@@ -5143,31 +5607,6 @@ class ProphetAdvisor:
         Note: Per Option C, this should only be called when a position is actually opened,
         not on every scan. This ensures 1:1 prediction-to-position mapping.
         """
-        # Helper to convert numpy types to Python native types
-        def _convert_numpy(val):
-            try:
-                import numpy as np
-                if isinstance(val, (np.integer, np.int64, np.int32)):
-                    return int(val)
-                elif isinstance(val, (np.floating, np.float64, np.float32)):
-                    return float(val)
-                elif isinstance(val, np.bool_):
-                    return bool(val)
-                elif isinstance(val, np.ndarray):
-                    return val.tolist()
-            except ImportError:
-                pass
-            return val
-
-        def _convert_dict_numpy(d):
-            if d is None:
-                return None
-            if isinstance(d, dict):
-                return {k: _convert_dict_numpy(v) for k, v in d.items()}
-            elif isinstance(d, list):
-                return [_convert_dict_numpy(item) for item in d]
-            return _convert_numpy(d)
-
         if not DB_AVAILABLE:
             logger.warning("Database not available")
             return False
@@ -5178,170 +5617,17 @@ class ProphetAdvisor:
             try:
                 cursor = conn.cursor()
 
-                # Ensure table has all required columns (migration-safe)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS prophet_predictions (
-                    id SERIAL PRIMARY KEY,
-                    timestamp TIMESTAMPTZ DEFAULT NOW(),
-                    trade_date DATE NOT NULL,
-                    bot_name TEXT NOT NULL,
-                    prediction_time TIMESTAMPTZ DEFAULT NOW(),
-
-                    -- Market Context
-                    spot_price REAL,
-                    vix REAL,
-                    gex_net REAL,
-                    gex_normalized REAL,
-                    gex_regime TEXT,
-                    gex_flip_point REAL,
-                    gex_call_wall REAL,
-                    gex_put_wall REAL,
-                    day_of_week INTEGER,
-
-                    -- Prediction Details
-                    advice TEXT,
-                    win_probability REAL,
-                    confidence REAL,
-                    suggested_risk_pct REAL,
-                    suggested_sd_multiplier REAL,
-                    model_version TEXT,
-
-                    -- GEX-Specific (FORTRESS)
-                    use_gex_walls BOOLEAN DEFAULT FALSE,
-                    suggested_put_strike REAL,
-                    suggested_call_strike REAL,
-
-                    -- Explanation & Transparency
-                    reasoning TEXT,
-                    top_factors JSONB,
-                    probabilities JSONB,
-
-                    -- Claude AI Analysis (full transparency)
-                    claude_analysis JSONB,
-
-                    -- Outcomes (filled after trade closes)
-                    prediction_used BOOLEAN DEFAULT FALSE,
-                    actual_outcome TEXT,
-                    actual_pnl REAL,
-                    outcome_date DATE,
-
-                    UNIQUE(trade_date, bot_name)
-                    )
-                """)
-
-                # Migration: Add missing columns to existing tables
-                migration_columns = [
-                    ("claude_analysis", "JSONB"),
-                    ("prediction_used", "BOOLEAN DEFAULT FALSE"),
-                    ("actual_outcome", "TEXT"),
-                    ("actual_pnl", "REAL"),
-                    ("outcome_date", "DATE"),
-                    ("prediction_time", "TIMESTAMPTZ DEFAULT NOW()"),
-                    # Feedback loop enhancements (Migration 023)
-                    ("position_id", "VARCHAR(100)"),
-                    ("strategy_recommendation", "VARCHAR(20)"),
-                    ("direction_predicted", "VARCHAR(10)"),
-                    ("direction_correct", "BOOLEAN"),
-                    # Multi-prediction support (Migration 027)
-                    ("scan_timestamp", "TIMESTAMPTZ DEFAULT NOW()"),
-                    ("model_type", "VARCHAR(50) DEFAULT 'combined_v3'"),
-                    ("strategy_type", "VARCHAR(20)"),
-                    ("feature_snapshot", "JSONB"),
-                ]
-                for col_name, col_type in migration_columns:
-                    try:
-                        cursor.execute(f"ALTER TABLE prophet_predictions ADD COLUMN IF NOT EXISTS {col_name} {col_type}")
-                    except Exception as e:
-                        # Column already exists or other migration error - log but continue
-                        logger.debug(f"Migration column {col_name}: {e}")
-
+                self._ensure_predictions_table(cursor)
                 conn.commit()
 
-                # Serialize top_factors as JSON (convert numpy types)
-                top_factors_json = json.dumps([
-                    {"feature": f[0], "importance": _convert_numpy(f[1])}
-                    for f in (prediction.top_factors or [])
-                ]) if prediction.top_factors else None
-
-                # Serialize probabilities as JSON (convert numpy types)
-                probabilities_json = json.dumps(_convert_dict_numpy(prediction.probabilities)) if prediction.probabilities else None
-
-                # Serialize Claude analysis as JSON (full transparency)
-                claude_json = None
-                if prediction.claude_analysis:
-                    ca = prediction.claude_analysis
-                    claude_json = json.dumps(_convert_dict_numpy({
-                        "analysis": ca.analysis,
-                        "confidence_adjustment": ca.confidence_adjustment,
-                        "risk_factors": ca.risk_factors,
-                        "opportunities": ca.opportunities,
-                        "recommendation": ca.recommendation,
-                        "override_advice": ca.override_advice,
-                        "tokens_used": ca.tokens_used,
-                        "input_tokens": ca.input_tokens,
-                        "output_tokens": ca.output_tokens,
-                        "response_time_ms": ca.response_time_ms,
-                        "model_used": ca.model_used,
-                        # Store raw prompt/response for full transparency
-                        "raw_prompt": ca.raw_prompt[:2000] if ca.raw_prompt else None,
-                        "raw_response": ca.raw_response[:5000] if ca.raw_response else None,
-                    }))
-
                 # Migration 027: Plain INSERT — store every prediction, no overwrites.
                 # Old behavior: ON CONFLICT DO UPDATE → only 1 prediction per bot per day.
                 # New behavior: Multiple predictions per day, linked by position_id when available.
-                # Determine strategy_type from bot name
-                strategy_type = 'DIRECTIONAL' if prediction.bot_name.value in (
-                    'SOLOMON', 'GIDEON', 'LAZARUS', 'CORNERSTONE'
-                ) else 'IRON_CONDOR'
-
-                cursor.execute("""
-                    INSERT INTO prophet_predictions (
-                        trade_date, bot_name, spot_price, vix, gex_net, gex_normalized, gex_regime,
-                        gex_flip_point, gex_call_wall, gex_put_wall, day_of_week,
-                        advice, win_probability, confidence, suggested_risk_pct,
-                        suggested_sd_multiplier, model_version,
-                        use_gex_walls, suggested_put_strike, suggested_call_strike,
-                        reasoning, top_factors, probabilities, claude_analysis,
-                        position_id, strategy_recommendation,
-                        scan_timestamp, model_type, strategy_type
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                        %s, %s,
-                        NOW(), %s, %s
-                    )
+                cursor.execute(f"""
+                    INSERT INTO prophet_predictions ({self._PREDICTION_INSERT_COLUMNS})
+                    VALUES {self._PREDICTION_INSERT_TEMPLATE}
                     RETURNING id
-                """, (
-                    trade_date,
-                    prediction.bot_name.value,
-                    _convert_numpy(context.spot_price),
-                    _convert_numpy(context.vix),
-                    _convert_numpy(context.gex_net),
-                    _convert_numpy(context.gex_normalized),
-                    context.gex_regime.value,
-                    _convert_numpy(context.gex_flip_point),
-                    _convert_numpy(context.gex_call_wall),
-                    _convert_numpy(context.gex_put_wall),
-                    _convert_numpy(context.day_of_week),
-                    prediction.advice.value,
-                    _convert_numpy(prediction.win_probability),
-                    _convert_numpy(prediction.confidence),
-                    _convert_numpy(prediction.suggested_risk_pct),
-                    _convert_numpy(prediction.suggested_sd_multiplier),
-                    prediction.model_version,
-                    prediction.use_gex_walls,
-                    _convert_numpy(prediction.suggested_put_strike),
-                    _convert_numpy(prediction.suggested_call_strike),
-                    prediction.reasoning,
-                    top_factors_json,
-                    probabilities_json,
-                    claude_json,
-                    position_id,
-                    strategy_recommendation,
-                    getattr(prediction, '_model_type', 'combined_v3'),
-                    strategy_type,
-                ))
+                """, self._prediction_row(prediction, context, trade_date, position_id, strategy_recommendation))
 
                 # Issue #3 fix: Fetch the returned prediction_id for linking
                 row = cursor.fetchone()
@@ -5395,6 +5681,72 @@ class ProphetAdvisor:
                 logger.error(f"Failed to store prediction: {e}")
                 return False
 
+    def store_predictions_batch(
+        self,
+        entries: List[Tuple[ProphetPrediction, MarketContext]],
+        trade_date: str,
+    ) -> List[Optional[int]]:
+        """
+        Store many predictions with a single multi-row INSERT.
+
+        Used by get_advice_batch so a fleet tick costs one round trip instead of
+        one per bot. Rows are identical to store_prediction's (no position_id -
+        scan-time predictions are linked later by update_outcome). A row that
+        hits a unique constraint (e.g. the legacy UNIQUE(trade_date, bot_name)
+        on tables created before Migration 027) is skipped on its own instead
+        of failing the whole tick.
+
+        Returns:
+            prediction_ids in the same order as entries, None for a skipped
+            row ([] if the insert failed)
+        """
+        if not entries:
+            return []
+        if not DB_AVAILABLE:
+            logger.warning("Database not available")
+            return []
+
+        from psycopg2.extras import execute_values
+
+        with get_db_connection() as conn:
+            if conn is None:
+                return []
+            try:
+                cursor = conn.cursor()
+                self._ensure_predictions_table(cursor)
+                conn.commit()
+
+                rows = execute_values(
+                    cursor,
+                    f"INSERT INTO prophet_predictions ({self._PREDICTION_INSERT_COLUMNS}) VALUES %s "
+                    "ON CONFLICT DO NOTHING RETURNING id, bot_name",
+                    [self._prediction_row(prediction, context, trade_date) for prediction, context in entries],
+                    template=self._PREDICTION_INSERT_TEMPLATE,
+                    page_size=len(entries),
+                    fetch=True,
+                )
+                conn.commit()
+
+                # Skipped rows return nothing, so match ids back by bot
+                # (get_advice_batch stores at most one prediction per bot)
+                ids_by_bot = {bot: prediction_id for prediction_id, bot in rows}
+                prediction_ids = []
+                for prediction, _ in entries:
+                    prediction_id = ids_by_bot.get(prediction.bot_name.value)
+                    if prediction_id is not None:
+                        prediction.prediction_id = prediction_id
+                    prediction_ids.append(prediction_id)
+
+                skipped = [p.bot_name.value for p, _ in entries if p.bot_name.value not in ids_by_bot]
+                if skipped:
+                    logger.warning(f"Prophet batch: skipped conflicting rows for {', '.join(skipped)}")
+                logger.info(f"Stored {len(ids_by_bot)} Prophet predictions in one batch")
+                return prediction_ids
+
+            except Exception as e:
+                logger.error(f"Failed to store prediction batch: {e}")
+                return []
+
     def update_outcome(
         self,
         trade_date: str,
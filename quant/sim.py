@@ -3,11 +3,20 @@
 Walks a minute-indexed mark-series from entry_minute to eod_minute, returning
 the first triggered exit. Distilled from backtest/helios_intraday/_simulate_intraday
 with HeliosConfig replaced by explicit threshold parameters.
+
+``simulate_intraday_grid`` evaluates the same first-trigger rules for many
+entries x many (pt, sl, grace, trailing) combos at once. Marks are laid out on
+a shared minute axis (``MarkArray``, NaN = no mark) and every exit rule becomes
+a first-crossing lookup: one boolean matrix per distinct threshold, a reverse
+running-min turns it into "next trigger at or after minute m", and each combo
+only gathers from those tables at its start / grace / trail-arm position.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional, Protocol
+from typing import Dict, Optional, Protocol, Sequence, Union
+
+import numpy as np
 
 
 class _BarsLike(Protocol):
@@ -28,6 +37,43 @@ class MarkSeries:
     def mark_at(self, minute: int) -> Optional[float]:
         return self.marks.get(minute)
 
+    def to_array(self) -> "MarkArray":
+        return MarkArray.from_marks(self.marks)
+
+
+@dataclass(frozen=True, eq=False)
+class MarkArray:
+    """Marks on a contiguous minute axis starting at start_minute; NaN = no mark."""
+    start_minute: int
+    values: np.ndarray
+
+    @classmethod
+    def from_marks(cls, marks: Dict[int, float]) -> "MarkArray":
+        if not marks:
+            return cls(start_minute=0, values=np.empty(0))
+        minutes = np.fromiter(marks.keys(), dtype=np.int64, count=len(marks))
+        first = int(minutes.min())
+        values = np.full(int(minutes.max()) - first + 1, np.nan)
+        values[minutes - first] = np.fromiter(marks.values(), dtype=float, count=len(marks))
+        return cls(start_minute=first, values=values)
+
+    def mark_at(self, minute: int) -> Optional[float]:
+        i = minute - self.start_minute
+        if i < 0 or i >= len(self.values):
+            return None
+        v = self.values[i]
+        return None if np.isnan(v) else float(v)
+
+    def window(self, first_minute: int, last_minute: int) -> np.ndarray:
+        """Marks for first_minute..last_minute inclusive, NaN outside the series."""
+        out = np.full(max(last_minute - first_minute + 1, 0), np.nan)
+        lo = max(first_minute, self.start_minute)
+        hi = min(last_minute, self.start_minute + len(self.values) - 1)
+        if hi >= lo:
+            out[lo - first_minute:hi - first_minute + 1] = \
+                self.values[lo - self.start_minute:hi - self.start_minute + 1]
+        return out
+
 
 def simulate_intraday(
     *,
@@ -91,3 +137,161 @@ def simulate_intraday(
             )
 
     return IntradayResult(exit_minute=eod_minute, exit_reason="EOD", realized_pct=0.0)
+
+
+# Codes in IntradayGrid.exit_code
+EXIT_REASONS = ("PT", "PT_GRACE", "SL", "TRAIL", "EOD")
+_PT, _PT_GRACE, _SL, _TRAIL, _EOD = range(len(EXIT_REASONS))
+
+_ParamLike = Union[float, Sequence[Optional[float]], np.ndarray, None]
+
+
+@dataclass(frozen=True, eq=False)
+class IntradayGrid:
+    """simulate_intraday outcomes for every (entry, combo) pair; arrays are (n_entries, n_combos)."""
+    exit_minute: np.ndarray
+    exit_code: np.ndarray
+    realized_pct: np.ndarray
+
+    @property
+    def shape(self):
+        return self.exit_minute.shape
+
+    @property
+    def exit_reason(self) -> np.ndarray:
+        return np.asarray(EXIT_REASONS, dtype=object)[self.exit_code]
+
+    def result(self, entry: int, combo: int) -> IntradayResult:
+        return IntradayResult(
+            exit_minute=int(self.exit_minute[entry, combo]),
+            exit_reason=EXIT_REASONS[self.exit_code[entry, combo]],
+            realized_pct=float(self.realized_pct[entry, combo]),
+        )
+
+
+def _as_mark_array(bars: _BarsLike, first_minute: int, last_minute: int) -> MarkArray:
+    if isinstance(bars, MarkArray):
+        return bars
+    if isinstance(bars, MarkSeries):
+        return bars.to_array()
+    values = [bars.mark_at(m) for m in range(first_minute, last_minute + 1)]
+    return MarkArray(first_minute, np.array([np.nan if v is None else v for v in values], dtype=float))
+
+
+def _param(value: _ParamLike) -> np.ndarray:
+    """Combo parameter as a float array; None (trailing disabled) becomes NaN."""
+    if value is None:
+        return np.array([np.nan])
+    if np.isscalar(value):
+        return np.array([float(value)])
+    return np.array([np.nan if v is None else v for v in value], dtype=float)
+
+
+def _next_true(mask: np.ndarray) -> np.ndarray:
+    """(..., T) bool -> (..., T+1) index of the first True at or after each column, T if none."""
+    n = mask.shape[-1]
+    idx = np.where(mask, np.arange(n), n)
+    idx = np.concatenate([idx, np.full(mask.shape[:-1] + (1,), n)], axis=-1)
+    return np.minimum.accumulate(idx[..., ::-1], axis=-1)[..., ::-1]
+
+
+def _first_crossings(hit_for, values: np.ndarray, rows: np.ndarray, pos: np.ndarray,
+                     n_cols: int) -> np.ndarray:
+    """
+    First trigger at/after pos for each (entry, combo). hit_for(v) returns the
+    (n_entries, T) trigger matrix for one distinct threshold value; combos
+    sharing a value share its next-trigger table.
+    """
+    out = np.full(pos.shape, n_cols, dtype=np.int64)
+    enabled = ~np.isnan(values)
+    if not enabled.any():
+        return out
+    uniq, inverse = np.unique(values[enabled], return_inverse=True)
+    tables = np.stack([_next_true(hit_for(v)) for v in uniq])
+    combos = np.nonzero(enabled)[0]
+    out[:, combos] = tables[inverse[None, :], rows[:, None], pos[:, combos]]
+    return out
+
+
+def simulate_intraday_grid(
+    *,
+    debits: Union[float, Sequence[float], np.ndarray],
+    entry_minutes: Union[int, Sequence[int], np.ndarray],
+    eod_minute: Union[int, Sequence[int], np.ndarray],
+    bars: Sequence[_BarsLike],
+    pt_pct: _ParamLike,
+    sl_pct: _ParamLike,
+    sl_grace_minutes: _ParamLike = 0,
+    trailing_activate_pct: _ParamLike = None,
+    trailing_stop_pct: _ParamLike = None,
+) -> IntradayGrid:
+    """
+    simulate_intraday for every entry x parameter combo.
+
+    Entry arguments (debits, entry_minutes, eod_minute, bars) broadcast over
+    entries; exit parameters broadcast over combos, with None / NaN in either
+    trailing parameter disabling the trail for that combo. Result [e, c] is
+    identical to the scalar simulate_intraday for entry e with combo c.
+    """
+    n_entries = len(bars)
+    debits = np.broadcast_to(np.asarray(debits, dtype=float), (n_entries,))
+    entry = np.broadcast_to(np.asarray(entry_minutes, dtype=np.int64), (n_entries,))
+    eod = np.broadcast_to(np.asarray(eod_minute, dtype=np.int64), (n_entries,))
+    pt, sl, grace, act, stop = np.broadcast_arrays(*(
+        _param(p) for p in (pt_pct, sl_pct, sl_grace_minutes, trailing_activate_pct, trailing_stop_pct)
+    ))
+    trailing = ~np.isnan(act) & ~np.isnan(stop)
+    act = np.where(trailing, act, np.nan)
+    stop = np.where(trailing, stop, np.nan)
+    n_combos = len(pt)
+    shape = (n_entries, n_combos)
+    if n_entries == 0:
+        return IntradayGrid(np.empty(shape, dtype=np.int64), np.empty(shape, dtype=np.int8), np.empty(shape))
+
+    # Marks for every entry on one shared minute axis, NaN outside [entry, eod]
+    first = int(entry.min())
+    last = max(int(eod.max()), first)
+    n_cols = last - first + 1
+    cols = np.arange(n_cols)
+    marks = np.stack([_as_mark_array(b, e, d).window(first, last) for b, e, d in zip(bars, entry, eod)])
+    start = entry - first
+    end = eod - first
+    marks[(cols < start[:, None]) | (cols > end[:, None])] = np.nan
+
+    present = ~np.isnan(marks)
+    peak = np.fmax(np.fmax.accumulate(marks, axis=1), debits[:, None])
+    rows = np.arange(n_entries)
+    start_pos = np.broadcast_to(np.minimum(start, n_cols)[:, None], shape)
+
+    with np.errstate(invalid='ignore'):
+        pt_hit = _first_crossings(
+            lambda v: marks >= (debits * (1.0 + v / 100.0))[:, None], pt, rows, start_pos, n_cols)
+        arm = _first_crossings(
+            lambda v: present & (peak >= (debits * (1.0 + v / 100.0))[:, None]), act, rows, start_pos, n_cols)
+        trail_hit = _first_crossings(
+            lambda v: marks <= peak * (1.0 - v / 100.0), stop, rows, arm, n_cols)
+        sl_start = np.clip(start[:, None] + np.ceil(np.maximum(grace, 0)).astype(np.int64)[None, :], 0, n_cols)
+        sl_hit = _first_crossings(
+            lambda v: marks <= (debits * (1.0 - v / 100.0))[:, None], sl, rows, sl_start, n_cols)
+    # The stop-loss only applies until the trail arms
+    sl_hit = np.where(sl_hit < arm, sl_hit, n_cols)
+
+    eod_pos = np.full(n_entries, n_cols, dtype=np.int64)
+    in_window = (end >= start) & (end < n_cols)
+    eod_pos[in_window] = np.where(present[rows[in_window], end[in_window]], end[in_window], n_cols)
+    eod_hit = np.broadcast_to(eod_pos[:, None], shape)
+
+    exit_pos = np.minimum.reduce([pt_hit, trail_hit, sl_hit, eod_hit])
+    triggered = exit_pos < n_cols
+    in_grace = (exit_pos - start[:, None]) < grace[None, :]
+    code = np.select(
+        [pt_hit == exit_pos, trail_hit == exit_pos, sl_hit == exit_pos],
+        [np.where(in_grace, _PT_GRACE, _PT), _TRAIL, _SL],
+        _EOD,
+    ).astype(np.int8)
+
+    exit_marks = marks[rows[:, None], np.minimum(exit_pos, n_cols - 1)]
+    realized = np.where(triggered, (exit_marks / debits[:, None] - 1.0) * 100.0, 0.0)
+    exit_minute = np.where(triggered, exit_pos + first, eod[:, None])
+    code[~triggered] = _EOD
+    return IntradayGrid(exit_minute=exit_minute.astype(np.int64), exit_code=code, realized_pct=realized)
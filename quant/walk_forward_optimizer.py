@@ -18,6 +18,16 @@ This prevents:
 - Selection bias from cherry-picking parameters
 - False confidence from in-sample results
 
+Grid evaluation:
+- Window slices are row bounds found by binary search on the (sorted)
+  index, not boolean masks over the full history
+- strategy_func(slice, params) results are memoized per (row bounds,
+  params), so overlapping windows and repeat runs reuse them
+- workers > 1 fans evaluations out over a process pool (a thread pool when
+  strategy_func can't be pickled, e.g. a closure)
+- search='halving' runs successive halving: every combo on the most recent
+  part of the train window, only the top 1/eta on progressively more data
+
 Author: AlphaGEX Quant
 Date: 2025-12-03
 """
@@ -25,10 +35,17 @@ Date: 2025-12-03
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Any, Dict, List, Optional, Tuple, Callable
 from dataclasses import dataclass
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import product
 import json
+import logging
+import math
+import pickle
+
+logger = logging.getLogger(__name__)
 
 # Database
 try:
@@ -38,6 +55,13 @@ except ImportError:
     DB_AVAILABLE = False
 
 
+# Minimum rows for a window to be optimized (train) / tested (OOS)
+MIN_TRAIN_ROWS = 10
+MIN_TEST_ROWS = 5
+
+EMPTY_METRICS = {'win_rate': 0, 'trades': 0}
+
+
 @dataclass
 class WalkForwardWindow:
     """Single train/test window"""
@@ -89,6 +113,140 @@ class WalkForwardResult:
         }
 
 
+def _params_key(params: Dict) -> str:
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def _train_score(metrics: Dict) -> float:
+    return metrics.get('win_rate', 0) * metrics.get('trades', 0)
+
+
+class _Slicer:
+    """data.iloc[lo:hi], built once per distinct row bounds."""
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self._slices: Dict[Tuple[int, int], pd.DataFrame] = {}
+
+    def __call__(self, lo: int, hi: int) -> pd.DataFrame:
+        if (lo, hi) not in self._slices:
+            self._slices[(lo, hi)] = self.data.iloc[lo:hi]
+        return self._slices[(lo, hi)]
+
+
+def _evaluate(strategy_func: Callable, slicer: _Slicer, task: Tuple[int, int, Dict]):
+    lo, hi, params = task
+    try:
+        return True, strategy_func(slicer(lo, hi), params)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+
+# Worker-process state for process-pool evaluation
+_worker_func: Optional[Callable] = None
+_worker_slicer: Optional[_Slicer] = None
+
+
+def _init_eval_worker(strategy_func: Callable, data: pd.DataFrame) -> None:
+    global _worker_func, _worker_slicer
+    _worker_func, _worker_slicer = strategy_func, _Slicer(data)
+
+
+def _evaluate_in_worker(task: Tuple[int, int, Dict]):
+    return _evaluate(_worker_func, _worker_slicer, task)
+
+
+class GridEvaluator:
+    """
+    Runs strategy_func(data.iloc[lo:hi], params) for batches of
+    (lo, hi, params) tasks - serially or on a pool - memoizing results by
+    (lo, hi, params) in `cache` (pass a shared dict to keep results across
+    runs on the same data). Failed evaluations come back as None and are
+    counted.
+    """
+
+    def __init__(self, strategy_func: Callable, historical_data: pd.DataFrame,
+                 workers: int = 1, cache: Optional[Dict] = None, cache_results: bool = True):
+        data = historical_data
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index(kind='stable')
+        self.strategy_func = strategy_func
+        self.data = data
+        self.slicer = _Slicer(data)
+        self.cache_results = cache_results
+        self.cache: Dict[Tuple[int, int, str], Tuple[bool, Any]] = cache if cache is not None else {}
+        self.evaluations = 0
+        self.rows_evaluated = 0
+        self.cache_hits = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self._pool = None
+        if workers > 1:
+            try:
+                pickle.dumps(strategy_func)
+                self._pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_eval_worker,
+                                                 initargs=(strategy_func, data))
+            except Exception:
+                logger.info("walk-forward: strategy_func is not picklable, evaluating on threads")
+                self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._workers = workers
+
+    def __enter__(self) -> 'GridEvaluator':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def bounds(self, start: datetime, end: datetime) -> Tuple[int, int]:
+        """Row bounds of start <= index <= end."""
+        index = self.data.index
+        return int(index.searchsorted(start, side='left')), int(index.searchsorted(end, side='right'))
+
+    def run(self, tasks: List[Tuple[int, int, Dict]]) -> List[Optional[Dict]]:
+        """Metrics per task (None when strategy_func raised), in task order."""
+        keys = [(lo, hi, _params_key(params)) for lo, hi, params in tasks]
+        pending: Dict[Tuple[int, int, str], Tuple[int, int, Dict]] = {}
+        for key, task in zip(keys, tasks):
+            if key in self.cache or key in pending:
+                self.cache_hits += 1
+            else:
+                pending[key] = task
+
+        if pending:
+            todo = list(pending.values())
+            if self._pool is None:
+                outcomes = [_evaluate(self.strategy_func, self.slicer, t) for t in todo]
+            elif isinstance(self._pool, ProcessPoolExecutor):
+                chunksize = max(1, len(todo) // (self._workers * 4))
+                outcomes = list(self._pool.map(_evaluate_in_worker, todo, chunksize=chunksize))
+            else:
+                outcomes = list(self._pool.map(lambda t: _evaluate(self.strategy_func, self.slicer, t), todo))
+            self.evaluations += len(todo)
+            self.rows_evaluated += sum(hi - lo for lo, hi, _ in todo)
+            for key, (ok, value) in zip(pending, outcomes):
+                if not ok:
+                    self.failures += 1
+                    self.last_error = value
+                self.cache[key] = (ok, value)
+
+        results = []
+        for key in keys:
+            ok, value = self.cache[key]
+            results.append(value if ok else None)
+        if not self.cache_results:
+            self.cache.clear()
+        return results
+
+    def stats(self) -> Dict:
+        return {'evaluations': self.evaluations, 'rows_evaluated': self.rows_evaluated,
+                'cache_hits': self.cache_hits, 'failures': self.failures, 'last_error': self.last_error}
+
+
 class WalkForwardOptimizer:
     """
     Walk-Forward Optimization for strategy parameters.
@@ -115,7 +273,11 @@ class WalkForwardOptimizer:
         train_days: int = 60,
         test_days: int = 20,
         step_days: int = 20,
-        min_trades_per_window: int = 5
+        min_trades_per_window: int = 5,
+        workers: int = 1,
+        search: str = 'grid',
+        halving_eta: int = 3,
+        cache_results: bool = True
     ):
         """
         Initialize walk-forward optimizer.
@@ -126,12 +288,37 @@ class WalkForwardOptimizer:
             test_days: Days in test window (OOS)
             step_days: Days to step forward each iteration
             min_trades_per_window: Minimum trades required per window
+            workers: Parallel evaluations of (window, params) combos (1 = serial)
+            search: 'grid' (every combo on the full train window) or 'halving'
+            halving_eta: Successive-halving keep ratio (top 1/eta per rung)
+            cache_results: Memoize strategy_func per (window slice, params), kept
+                across runs with the same strategy_func and historical_data
+                objects; strategy_func must then be a pure function of its
+                inputs and the data must not be modified in place
         """
+        if search not in ('grid', 'halving'):
+            raise ValueError(f"search must be 'grid' or 'halving', got {search!r}")
         self.symbol = symbol
         self.train_days = train_days
         self.test_days = test_days
         self.step_days = step_days
         self.min_trades_per_window = min_trades_per_window
+        self.workers = workers
+        self.search = search
+        self.halving_eta = max(2, halving_eta)
+        self.cache_results = cache_results
+        self.last_run_stats: Dict = {}
+        self._cache_owner: Optional[Tuple[Callable, pd.DataFrame]] = None
+        self._eval_cache: Dict = {}
+
+    def _evaluator(self, strategy_func: Callable, historical_data: pd.DataFrame) -> GridEvaluator:
+        """Evaluator sharing the memo cache while strategy_func and historical_data are unchanged."""
+        owner = self._cache_owner
+        if owner is None or owner[0] is not strategy_func or owner[1] is not historical_data:
+            self._cache_owner = (strategy_func, historical_data)
+            self._eval_cache = {}
+        return GridEvaluator(strategy_func, historical_data, self.workers,
+                             cache=self._eval_cache, cache_results=self.cache_results)
 
     def create_windows(
         self,
@@ -192,77 +379,134 @@ class WalkForwardOptimizer:
         Returns:
             WindowResult with optimal params and IS/OOS metrics
         """
-        # Filter data to train window
-        train_data = historical_data[
-            (historical_data.index >= window.train_start) &
-            (historical_data.index <= window.train_end)
-        ]
-
-        test_data = historical_data[
-            (historical_data.index >= window.test_start) &
-            (historical_data.index <= window.test_end)
-        ]
-
-        if len(train_data) < 10 or len(test_data) < 5:
-            return WindowResult(
-                window=window,
-                train_metrics={'win_rate': 0, 'trades': 0},
-                test_metrics={'win_rate': 0, 'trades': 0},
-                optimal_params={},
-                degradation_pct=100.0
-            )
+        with self._evaluator(strategy_func, historical_data) as evaluator:
+            result = self.optimize_windows([window], param_grid, evaluator)[0]
+        self.last_run_stats = evaluator.stats()
+        return result
 
-        # Grid search on training data
-        best_params = {}
-        best_train_metric = -np.inf
-
-        # Generate all parameter combinations
-        from itertools import product
+    def optimize_windows(
+        self,
+        windows: List[WalkForwardWindow],
+        param_grid: Dict[str, List],
+        evaluator: GridEvaluator
+    ) -> List[WindowResult]:
+        """
+        Optimize every window, batching each search step across all windows
+        so a pool stays busy. Ties on the train score go to the earlier combo
+        in param_grid order, as in a serial grid search.
+        """
         param_names = list(param_grid.keys())
-        param_values = list(param_grid.values())
+        combos = [dict(zip(param_names, combo)) for combo in product(*param_grid.values())]
 
-        for combo in product(*param_values):
-            params = dict(zip(param_names, combo))
+        train_bounds = [evaluator.bounds(w.train_start, w.train_end) for w in windows]
+        test_bounds = [evaluator.bounds(w.test_start, w.test_end) for w in windows]
+        active = [i for i in range(len(windows))
+                  if train_bounds[i][1] - train_bounds[i][0] >= MIN_TRAIN_ROWS
+                  and test_bounds[i][1] - test_bounds[i][0] >= MIN_TEST_ROWS]
 
-            # Run strategy on train data
-            try:
-                train_metrics = strategy_func(train_data, params)
-                train_score = train_metrics.get('win_rate', 0) * train_metrics.get('trades', 0)
-
-                if train_score > best_train_metric:
-                    best_train_metric = train_score
-                    best_params = params
-                    best_train_metrics = train_metrics
-            except Exception as e:
+        # Grid search on training data
+        if self.search == 'halving':
+            best = self._successive_halving(active, combos, train_bounds, evaluator)
+        else:
+            tasks = [(*train_bounds[i], params) for i in active for params in combos]
+            metrics = evaluator.run(tasks)
+            best = {i: self._best_combo(combos, metrics[k * len(combos):(k + 1) * len(combos)])
+                    for k, i in enumerate(active)}
+        best = {i: b for i, b in best.items() if b is not None}
+
+        # Test optimal params on OOS data
+        tested = list(best)
+        test_metrics = evaluator.run([(*test_bounds[i], combos[best[i][0]]) for i in tested])
+        oos = {i: m if m is not None else dict(EMPTY_METRICS) for i, m in zip(tested, test_metrics)}
+
+        if evaluator.failures:
+            logger.warning("walk-forward: %d of %d strategy evaluations failed (last: %s)",
+                           evaluator.failures, evaluator.evaluations, evaluator.last_error)
+
+        results = []
+        for i, window in enumerate(windows):
+            if i not in best:
+                results.append(WindowResult(
+                    window=window,
+                    train_metrics=dict(EMPTY_METRICS),
+                    test_metrics=dict(EMPTY_METRICS),
+                    optimal_params={},
+                    degradation_pct=100.0
+                ))
                 continue
 
-        if not best_params:
-            return WindowResult(
+            combo_idx, best_train_metrics = best[i]
+            test_metrics_i = oos[i]
+
+            # Calculate degradation
+            is_wr = best_train_metrics.get('win_rate', 0)
+            oos_wr = test_metrics_i.get('win_rate', 0)
+            degradation = ((is_wr - oos_wr) / is_wr * 100) if is_wr > 0 else 100.0
+
+            results.append(WindowResult(
                 window=window,
-                train_metrics={'win_rate': 0, 'trades': 0},
-                test_metrics={'win_rate': 0, 'trades': 0},
-                optimal_params={},
-                degradation_pct=100.0
-            )
+                train_metrics=best_train_metrics,
+                test_metrics=test_metrics_i,
+                optimal_params=combos[combo_idx],
+                degradation_pct=degradation
+            ))
+        return results
+
+    @staticmethod
+    def _best_combo(combos: List[Dict], metrics: List[Optional[Dict]]) -> Optional[Tuple[int, Dict]]:
+        """(combo index, metrics) with the highest train score; None if every combo failed."""
+        best, best_score = None, -np.inf
+        for idx, m in enumerate(metrics):
+            if m is None or not combos[idx]:
+                continue
+            score = _train_score(m)
+            if score > best_score:
+                best, best_score = (idx, m), score
+        return best
 
-        # Test optimal params on OOS data
-        try:
-            test_metrics = strategy_func(test_data, best_params)
-        except Exception:
-            test_metrics = {'win_rate': 0, 'trades': 0}
-
-        # Calculate degradation
-        is_wr = best_train_metrics.get('win_rate', 0)
-        oos_wr = test_metrics.get('win_rate', 0)
-        degradation = ((is_wr - oos_wr) / is_wr * 100) if is_wr > 0 else 100.0
-
-        return WindowResult(
-            window=window,
-            train_metrics=best_train_metrics,
-            test_metrics=test_metrics,
-            optimal_params=best_params,
-            degradation_pct=degradation
-        )
+    def _successive_halving(
+        self,
+        active: List[int],
+        combos: List[Dict],
+        train_bounds: List[Tuple[int, int]],
+        evaluator: GridEvaluator
+    ) -> Dict[int, Optional[Tuple[int, Dict]]]:
+        """
+        Successive halving per window: rung r scores the surviving combos on
+        the most recent ceil(rows / eta^(K-r)) train rows (at least
+        MIN_TRAIN_ROWS) and keeps the top 1/eta; the last rung uses the
+        full train window and picks the winner.
+        """
+        eta = self.halving_eta
+        rungs = int(math.log(max(len(combos), 1)) / math.log(eta) + 1e-9)
+        survivors = {i: list(range(len(combos))) for i in active}
+
+        for rung in range(rungs + 1):
+            sizes = {}
+            for i in active:
+                lo, hi = train_bounds[i]
+                sizes[i] = max(min(MIN_TRAIN_ROWS, hi - lo), math.ceil((hi - lo) / eta ** (rungs - rung)))
+            tasks = [(train_bounds[i][1] - sizes[i], train_bounds[i][1], combos[c])
+                     for i in active for c in survivors[i]]
+            metrics = evaluator.run(tasks)
+
+            k = 0
+            for i in active:
+                scored = []
+                for c in survivors[i]:
+                    if metrics[k] is not None:
+                        scored.append((c, metrics[k]))
+                    k += 1
+                if rung == rungs:
+                    by_combo = [None] * len(combos)
+                    for c, m in scored:
+                        by_combo[c] = m
+                    survivors[i] = self._best_combo(combos, by_combo)
+                else:
+                    # Stable sort keeps param_grid order among equal scores
+                    scored.sort(key=lambda cm: -_train_score(cm[1]))
+                    survivors[i] = [c for c, _ in scored[:max(1, len(scored) // eta)]]
+        return survivors
 
     def run_walk_forward(
         self,
@@ -305,12 +549,9 @@ class WalkForwardOptimizer:
             )
 
         # Run optimization on each window
-        window_results = []
-        for window in windows:
-            result = self.optimize_window(
-                window, strategy_func, param_grid, historical_data
-            )
-            window_results.append(result)
+        with self._evaluator(strategy_func, historical_data) as evaluator:
+            window_results = self.optimize_windows(windows, param_grid, evaluator)
+        self.last_run_stats = evaluator.stats()
 
         # Aggregate results
         valid_results = [r for r in window_results if r.train_metrics.get('trades', 0) >= self.min_trades_per_window]
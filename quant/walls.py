@@ -4,6 +4,11 @@ For a given (trade_date, expiration_date, minute), pulls the full strike chain
 at that minute, computes per-strike gamma * OI, and identifies the call wall
 (largest call gamma above spot) and put support (largest put gamma below spot).
 
+``compute_day_walls`` does this for every target minute of a day at once: the
+day slice and OI are loaded with one query each and all minutes are solved in
+a single vectorized pass, returning a minute-indexed ``DayWalls`` table.
+``compute_intraday_walls`` is the one-minute view over it.
+
 This is the same wall mechanic that 0DTE traders watch live — but reconstructed
 from historical data instead of relying on a snapshot from yesterday's close.
 """
@@ -13,11 +18,12 @@ import datetime as dt
 import logging
 import os
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import psycopg2
 
-from quant.bs import bs_gamma, derive_spot_from_parity, implied_vol
+from quant.bs import bs_gamma_array, derive_spot_from_parity, implied_vol_array
 
 logger = logging.getLogger(__name__)
 
@@ -39,17 +45,20 @@ class Walls:
     by_strike: List[StrikeGamma]
 
 
-def _load_chain_at_minute(
+def _load_day_slice(
     conn,
     trade_date: dt.date,
     expiration_date: dt.date,
-    target_minute: int,
-) -> Dict[Tuple[float, str], Tuple[float, float]]:
-    """Return {(strike, right): (mid_price, time_to_close)} for all strikes at
-    the bar closest to target_minute on trade_date.
-
-    Anchors minute 0 to the FIRST bar of the day (typical 9:30 ET / 8:30 CT).
-    target_minute=0 means use the open bars; target_minute=60 = ~10:30 ET, etc.
+    minutes: Optional[Sequence[int]] = None,
+) -> Dict[str, np.ndarray]:
+    """Load every quoted bar for (trade_date, expiration) in one query.
+
+    Returns column arrays ``minute``, ``strike``, ``is_call`` and ``mid`` for
+    rows with a usable two-sided quote. Minutes are anchored to the FIRST bar
+    of the day (typical 9:30 ET / 8:30 CT): minute 0 is the open bars,
+    minute 60 is ~10:30 ET, etc. Bars that do not sit on a whole minute from
+    the first bar are dropped. ``minutes`` restricts the slice to those
+    target minutes; None loads the whole day.
     """
     sql = """
         WITH first_bar AS (
@@ -57,25 +66,45 @@ def _load_chain_at_minute(
             FROM helios_options_intraday
             WHERE trade_date = %s AND expiration_date = %s
         )
-        SELECT strike, "right", bar_time, bid, ask
+        SELECT EXTRACT(EPOCH FROM (b.bar_time - first_bar.first_t)) AS offset_s,
+               strike, "right", bid, ask
         FROM helios_options_intraday b, first_bar
         WHERE b.trade_date = %s AND b.expiration_date = %s
-          AND b.bar_time = first_bar.first_t + (%s * INTERVAL '1 minute')
           AND b.bid IS NOT NULL AND b.ask IS NOT NULL
-        ORDER BY strike, "right"
     """
+    params: list = [trade_date, expiration_date, trade_date, expiration_date]
+    if minutes is not None:
+        sql += """
+          AND b.bar_time IN (
+              SELECT first_bar.first_t + (m * INTERVAL '1 minute')
+              FROM first_bar, unnest(%s::int[]) AS m
+          )
+        """
+        params.append([int(m) for m in minutes])
+    sql += ' ORDER BY offset_s, strike, "right"'
+
     cur = conn.cursor()
-    cur.execute(sql, (trade_date, expiration_date, trade_date, expiration_date, target_minute))
+    cur.execute(sql, params)
     rows = cur.fetchall()
     cur.close()
 
-    out: Dict[Tuple[float, str], Tuple[float, float]] = {}
-    for strike, right, bar_time, bid, ask in rows:
-        if bid is None or ask is None or bid <= 0 or ask <= bid:
-            continue
-        mid = (float(bid) + float(ask)) / 2.0
-        out[(float(strike), right)] = (mid, 0.0)  # t_years filled in by caller
-    return out
+    if not rows:
+        empty = np.empty(0)
+        return {"minute": empty.astype(np.int64), "strike": empty, "is_call": empty.astype(bool), "mid": empty}
+
+    offset_s = np.array([r[0] for r in rows], dtype=float)
+    strike = np.array([r[1] for r in rows], dtype=float)
+    is_call = np.array([r[2] == "C" for r in rows], dtype=bool)
+    bid = np.array([r[3] for r in rows], dtype=float)
+    ask = np.array([r[4] for r in rows], dtype=float)
+
+    keep = (bid > 0) & (ask > bid) & (offset_s % 60 == 0)
+    return {
+        "minute": (offset_s[keep] // 60).astype(np.int64),
+        "strike": strike[keep],
+        "is_call": is_call[keep],
+        "mid": (bid[keep] + ask[keep]) / 2.0,
+    }
 
 
 def _load_oi_for_chain(
@@ -96,99 +125,225 @@ def _load_oi_for_chain(
     return out
 
 
-def _estimate_spot_from_chain(
-    chain: Dict[Tuple[float, str], Tuple[float, float]],
-    t_years: float,
-) -> Optional[float]:
-    """Use put-call parity at the most ATM strike that has both legs.
+@dataclass(frozen=True, eq=False)
+class DayWalls:
+    """Minute-indexed wall table for one (trade_date, expiration).
 
-    Picks the strike where call_mid + put_mid is smallest (= closest to ATM,
-    where extrinsic is minimized for both legs).
+    Row i describes target minute ``minutes[i]``; only minutes with a usable
+    chain (parity spot, OI, at least one solved IV) get a row. NaN in the
+    level columns means "no such level" (None in ``Walls``). The per-strike
+    gamma grid is kept so ``walls_at`` can rebuild the full ``Walls`` view.
     """
-    strikes_with_both = []
-    for k, _ in chain.keys():
-        if (k, "C") in chain and (k, "P") in chain:
-            cm = chain[(k, "C")][0]
-            pm = chain[(k, "P")][0]
-            strikes_with_both.append((cm + pm, k, cm, pm))
-    if not strikes_with_both:
+    minutes: np.ndarray        # (M,) int, ascending
+    spot: np.ndarray           # (M,)
+    call_wall: np.ndarray      # (M,)
+    put_support: np.ndarray    # (M,)
+    flip_point: np.ndarray     # (M,)
+    strikes: np.ndarray        # (S,) strike grid, ascending
+    call_gamma_oi: np.ndarray  # (M, S)
+    put_gamma_oi: np.ndarray   # (M, S)
+    present: np.ndarray        # (M, S) strike had a solved contract at that minute
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    def _row(self, minute: int) -> Optional[int]:
+        i = int(np.searchsorted(self.minutes, minute))
+        if i < len(self.minutes) and self.minutes[i] == minute:
+            return i
         return None
-    strikes_with_both.sort(key=lambda x: x[0])
-    _, k, cm, pm = strikes_with_both[0]
-    return derive_spot_from_parity(cm, pm, k, t_years)
 
+    def walls_at(self, minute: int) -> Optional[Walls]:
+        """The ``Walls`` for one target minute (None if that minute had no usable chain)."""
+        i = self._row(minute)
+        if i is None:
+            return None
+        cols = np.flatnonzero(self.present[i])
+        call_g = self.call_gamma_oi[i, cols].tolist()
+        put_g = self.put_gamma_oi[i, cols].tolist()
+        by_strike = [
+            StrikeGamma(strike=k, call_gamma_oi=cg, put_gamma_oi=pg, net_gamma=cg - pg)
+            for k, cg, pg in zip(self.strikes[cols].tolist(), call_g, put_g)
+        ]
+
+        def level(value: float) -> Optional[float]:
+            return None if np.isnan(value) else float(value)
+
+        return Walls(
+            spot=float(self.spot[i]),
+            call_wall=level(self.call_wall[i]),
+            put_support=level(self.put_support[i]),
+            flip_point=level(self.flip_point[i]),
+            by_strike=by_strike,
+        )
 
-def compute_intraday_walls(
+
+def _first_true(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(column of first True per row, row has any True)."""
+    return np.argmax(mask, axis=1), mask.any(axis=1)
+
+
+def build_day_walls(
+    minute: np.ndarray,
+    strike: np.ndarray,
+    is_call: np.ndarray,
+    mid: np.ndarray,
+    oi: Dict[Tuple[float, str], int],
+    t_years_at_open: Union[float, Sequence[float], np.ndarray] = 1.0 / 365.0,
+    minutes: Optional[Sequence[int]] = None,
+) -> Optional[DayWalls]:
+    """Vectorized wall computation over a whole day slice.
+
+    Inputs are the column arrays from ``_load_day_slice`` plus the chain OI.
+    Spot comes from put-call parity at the most ATM strike of each minute;
+    every contract with OI is IV-solved and gamma-weighted in one pass; walls
+    and flip points are then reduced per minute on a (minute x strike) grid.
+
+    ``t_years_at_open`` is the time-to-expiry in years at each target minute:
+    a scalar applies to every minute, an array must align with ``minutes``
+    (or with the sorted distinct minutes in the slice when ``minutes`` is None).
+
+    Returns None if no minute has a usable chain.
+    """
+    if len(minute) == 0 or not oi:
+        return None
+
+    minute = np.asarray(minute, dtype=np.int64)
+    if minutes is None:
+        day_minutes = np.unique(minute)
+        t_by_minute = np.broadcast_to(np.asarray(t_years_at_open, dtype=float), day_minutes.shape)
+    else:
+        # Align a per-minute t with the sorted, de-duplicated minute list
+        requested = [int(m) for m in minutes]
+        t_requested = np.broadcast_to(np.asarray(t_years_at_open, dtype=float), (len(requested),))
+        t_lookup = dict(zip(requested, t_requested.tolist()))
+        day_minutes = np.array(sorted(t_lookup), dtype=np.int64)
+        t_by_minute = np.array([t_lookup[m] for m in day_minutes.tolist()], dtype=float)
+
+    in_day = np.isin(minute, day_minutes)
+    minute, strike, is_call, mid = minute[in_day], strike[in_day], is_call[in_day], mid[in_day]
+    if len(minute) == 0:
+        return None
+
+    m_idx = np.searchsorted(day_minutes, minute)
+    grid, k_idx = np.unique(strike, return_inverse=True)
+    n_min, n_k = len(day_minutes), len(grid)
+    cell = m_idx * n_k + k_idx
+
+    # --- Spot per minute: put-call parity at the strike with min(call + put) ---
+    call_rows, put_rows = np.flatnonzero(is_call), np.flatnonzero(~is_call)
+    _, ci, pi = np.intersect1d(cell[call_rows], cell[put_rows], assume_unique=False, return_indices=True)
+    ci, pi = call_rows[ci], put_rows[pi]
+    spot_by_minute = np.full(n_min, np.nan)
+    if len(ci):
+        straddle = mid[ci] + mid[pi]
+        order = np.lexsort((k_idx[ci], straddle, m_idx[ci]))  # ties -> lowest strike
+        first = order[np.unique(m_idx[ci][order], return_index=True)[1]]
+        for c, p in zip(ci[first].tolist(), pi[first].tolist()):
+            mi = m_idx[c]
+            spot_by_minute[mi] = derive_spot_from_parity(mid[c], mid[p], strike[c], t_by_minute[mi])
+
+    # --- One IV solve + gamma over every contract with OI at a priced minute ---
+    contracts = np.array([oi.get((k, "C" if c else "P"), 0) for k, c in zip(strike.tolist(), is_call.tolist())],
+                         dtype=float)
+    row_spot = spot_by_minute[m_idx]
+    use = (contracts > 0) & (row_spot > 0)
+    if not use.any():
+        return None
+    row_spot, row_t = row_spot[use], t_by_minute[m_idx[use]]
+    iv = implied_vol_array(mid[use], row_spot, strike[use], row_t, is_call[use])
+    solved = ~np.isnan(iv)
+    if not solved.any():
+        return None
+
+    sel = np.flatnonzero(use)[solved]
+    row_spot, row_t, iv = row_spot[solved], row_t[solved], iv[solved]
+    gamma_per_share = bs_gamma_array(row_spot, strike[sel], row_t, iv)
+    # gamma * OI * 100 (contract multiplier) * spot * spot * 0.01
+    # = dollar gamma per 1% spot move; common GEX convention
+    dollar_gamma = gamma_per_share * contracts[sel] * 100.0 * row_spot * row_spot * 0.01
+
+    size = n_min * n_k
+    call_g = np.bincount(cell[sel], weights=np.where(is_call[sel], dollar_gamma, 0.0), minlength=size).reshape(n_min, n_k)
+    put_g = np.bincount(cell[sel], weights=np.where(is_call[sel], 0.0, dollar_gamma), minlength=size).reshape(n_min, n_k)
+    present = (np.bincount(cell[sel], minlength=size) > 0).reshape(n_min, n_k)
+
+    rows = np.flatnonzero(present.any(axis=1))
+    if len(rows) == 0:
+        return None
+    spot = spot_by_minute[rows]
+    call_g, put_g, present = call_g[rows], put_g[rows], present[rows]
+
+    # --- Walls: largest gamma on each side of spot ---
+    above = present & (grid[None, :] >= spot[:, None]) & (call_g > 0)
+    below = present & (grid[None, :] <= spot[:, None]) & (put_g > 0)
+    call_col, has_call = _first_true(above & (call_g == np.where(above, call_g, -np.inf).max(axis=1, keepdims=True)))
+    put_col, has_put = _first_true(below & (put_g == np.where(below, put_g, -np.inf).max(axis=1, keepdims=True)))
+
+    # --- Flip point: first strike where cumulative net gamma crosses zero ---
+    net = np.where(present, call_g - put_g, 0.0)
+    cumulative = np.cumsum(net, axis=1)
+    before = np.concatenate([np.zeros((len(rows), 1)), cumulative[:, :-1]], axis=1)
+    crosses = present & (((before <= 0) & (0 < cumulative)) | ((before >= 0) & (0 > cumulative)))
+    flip_col, has_flip = _first_true(crosses)
+
+    return DayWalls(
+        minutes=day_minutes[rows],
+        spot=spot,
+        call_wall=np.where(has_call, grid[call_col], np.nan),
+        put_support=np.where(has_put, grid[put_col], np.nan),
+        flip_point=np.where(has_flip, grid[flip_col], np.nan),
+        strikes=grid,
+        call_gamma_oi=call_g,
+        put_gamma_oi=put_g,
+        present=present,
+    )
+
+
+def compute_day_walls(
     db_url: str,
     trade_date: dt.date,
     expiration_date: dt.date,
-    target_minute: int = 0,
-    t_years_at_open: float = 1.0 / 365.0,
-) -> Optional[Walls]:
-    """Build the wall structure for one (trade_date, expiration, minute).
+    minutes: Optional[Sequence[int]] = None,
+    t_years_at_open: Union[float, Sequence[float], np.ndarray] = 1.0 / 365.0,
+) -> Optional[DayWalls]:
+    """Wall table for every target minute of one (trade_date, expiration).
 
-    `t_years_at_open` is the time-to-expiry in years AT the target minute. For
-    a 1DTE (expiring next session), it's roughly 1/365. For 0DTE same-day it's
-    the remaining hours / (8760).
-
-    Returns None if no usable chain exists.
+    One query for the intraday slice and one for OI, regardless of how many
+    minutes are requested. ``minutes=None`` covers every bar of the day.
     """
     conn = psycopg2.connect(db_url)
     try:
-        chain = _load_chain_at_minute(conn, trade_date, expiration_date, target_minute)
-        if not chain:
+        day = _load_day_slice(conn, trade_date, expiration_date, minutes)
+        if len(day["minute"]) == 0:
             return None
         oi = _load_oi_for_chain(conn, trade_date, expiration_date)
     finally:
         conn.close()
 
-    if not chain or not oi:
-        return None
+    return build_day_walls(
+        day["minute"], day["strike"], day["is_call"], day["mid"], oi,
+        t_years_at_open=t_years_at_open, minutes=minutes,
+    )
 
-    spot = _estimate_spot_from_chain(chain, t_years_at_open)
-    if spot is None or spot <= 0:
-        return None
 
-    by_strike: Dict[float, Dict[str, float]] = {}
-    for (strike, right), (mid, _) in chain.items():
-        contracts = oi.get((strike, right), 0)
-        if contracts <= 0:
-            continue
-        is_call = right == "C"
-        iv = implied_vol(mid, spot, strike, t_years_at_open, is_call)
-        if iv is None:
-            continue
-        gamma_per_share = bs_gamma(spot, strike, t_years_at_open, iv)
-        # gamma * OI * 100 (contract multiplier) * spot * spot * 0.01
-        # = dollar gamma per 1% spot move; common GEX convention
-        dollar_gamma = gamma_per_share * contracts * 100.0 * spot * spot * 0.01
-        by_strike.setdefault(strike, {"C": 0.0, "P": 0.0})
-        by_strike[strike]["C" if is_call else "P"] += dollar_gamma
-
-    if not by_strike:
-        return None
+def compute_intraday_walls(
+    db_url: str,
+    trade_date: dt.date,
+    expiration_date: dt.date,
+    target_minute: int = 0,
+    t_years_at_open: float = 1.0 / 365.0,
+) -> Optional[Walls]:
+    """Build the wall structure for one (trade_date, expiration, minute).
+
+    `t_years_at_open` is the time-to-expiry in years AT the target minute. For
+    a 1DTE (expiring next session), it's roughly 1/365. For 0DTE same-day it's
+    the remaining hours / (8760).
 
-    strikes_list: List[StrikeGamma] = []
-    for k in sorted(by_strike.keys()):
-        cg = by_strike[k]["C"]
-        pg = by_strike[k]["P"]
-        strikes_list.append(StrikeGamma(strike=k, call_gamma_oi=cg, put_gamma_oi=pg, net_gamma=cg - pg))
-
-    # Wall identification — largest gamma on each side of spot
-    call_above = [s for s in strikes_list if s.strike >= spot and s.call_gamma_oi > 0]
-    put_below = [s for s in strikes_list if s.strike <= spot and s.put_gamma_oi > 0]
-
-    call_wall = max(call_above, key=lambda s: s.call_gamma_oi).strike if call_above else None
-    put_support = max(put_below, key=lambda s: s.put_gamma_oi).strike if put_below else None
-
-    # Flip point — strike where cumulative net gamma crosses zero
-    flip = None
-    cumulative = 0.0
-    for s in strikes_list:
-        new = cumulative + s.net_gamma
-        if cumulative <= 0 < new or cumulative >= 0 > new:
-            flip = s.strike
-            break
-        cumulative = new
-
-    return Walls(spot=spot, call_wall=call_wall, put_support=put_support, flip_point=flip, by_strike=strikes_list)
+    Thin view over ``compute_day_walls``; sweeps over many minutes of a day
+    should call that directly. Returns None if no usable chain exists.
+    """
+    day = compute_day_walls(
+        db_url, trade_date, expiration_date, minutes=[target_minute], t_years_at_open=t_years_at_open,
+    )
+    return day.walls_at(target_minute) if day is not None else None
@@ -0,0 +1,367 @@
+"""
+Scheduler executor pools, start-offset staggering and per-job latency histograms.
+
+AutonomousTraderScheduler registers ~80 APScheduler jobs. With one default
+10-thread executor, a long ML training run or VACUUM holds threads the
+5-minute bot scans need, and ~30 scans landing on the same boundary queue
+behind each other (the misfire/jitter the scheduler comments describe).
+
+This module gives the scheduler:
+
+- Named executor pools with their own worker limits, so a pool can only
+  starve itself:
+      scans        5-min bot scans, position monitors, snapshot pre-warm
+      training     ML training / validation (CPU-bound, kept small)
+      maintenance  DB retention, VACUUM, equity snapshots, trade sync, reports
+      default      everything else (EOD processing, sandbox closers, ...)
+  Override worker counts with SCHEDULER_POOL_<NAME>_WORKERS.
+
+- Deterministic start offsets: jobs that share an interval/cron boundary get
+  a stable per-job offset (crc32 of the job id) inside
+  SCHEDULER_STAGGER_SECONDS, so they fire spread out but at the same second
+  every tick and across restarts. Jobs with an explicit next_run_time or a
+  cron 'second' are left alone; STAGGER_EXEMPT jobs always fire on the
+  boundary (the market snapshot pre-warm must run before the scans).
+
+- Per-job runtime and lag histograms (lag = actual start - scheduled run
+  time, which includes time queued for a pool worker), plus missed and
+  max-instance skips. get_job_metrics().snapshot() is what the API serves.
+
+Training jobs stay on threads (not a process pool): they are bound methods
+of the scheduler, which holds locks and DB handles and cannot be pickled.
+Their small dedicated pool is what keeps them off the scan workers.
+"""
+
+import os
+import time
+import zlib
+import logging
+import threading
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from apscheduler.events import (
+        EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED,
+    )
+    from apscheduler.executors.base import run_job
+    from apscheduler.executors.pool import ThreadPoolExecutor
+    from apscheduler.schedulers.background import BackgroundScheduler
+    from apscheduler.triggers.cron import CronTrigger
+    from apscheduler.triggers.interval import IntervalTrigger
+    APSCHEDULER_AVAILABLE = True
+except ImportError:
+    APSCHEDULER_AVAILABLE = False
+
+
+# ============================================================================
+# POOL CONFIGURATION
+# ============================================================================
+
+POOL_SCANS = 'scans'
+POOL_TRAINING = 'training'
+POOL_MAINTENANCE = 'maintenance'
+POOL_DEFAULT = 'default'
+
+_DEFAULT_POOL_WORKERS = {
+    POOL_SCANS: 16,
+    POOL_TRAINING: 2,
+    POOL_MAINTENANCE: 3,
+    POOL_DEFAULT: 10,
+}
+
+POOL_WORKERS = {
+    pool: int(os.getenv(f'SCHEDULER_POOL_{pool.upper()}_WORKERS', workers))
+    for pool, workers in _DEFAULT_POOL_WORKERS.items()
+}
+
+SCHEDULER_STAGGER_SECONDS = int(os.getenv('SCHEDULER_STAGGER_SECONDS', '45'))
+
+_SCAN_JOBS = {
+    'market_snapshot_prewarm', 'valor_position_monitor',
+    'watchtower_commentary', 'vix_signal_generation',
+}
+_TRAINING_JOBS = {'auto_validation', 'proverbs_feedback_loop'}
+_MAINTENANCE_JOBS = {
+    'db_retention', 'weekly_vacuum', 'reports_purge', 'equity_snapshots',
+    'trade_sync', 'bot_reports', 'scheduler_metrics_flush',
+}
+
+# Always fire exactly on the boundary (offset 0)
+STAGGER_EXEMPT = {'market_snapshot_prewarm'}
+
+
+def classify_job(job_id: str) -> str:
+    """Executor pool name for a scheduler job id."""
+    if job_id in _SCAN_JOBS or job_id.endswith('_trading'):
+        return POOL_SCANS
+    if job_id in _TRAINING_JOBS or job_id.endswith('_training'):
+        return POOL_TRAINING
+    if job_id in _MAINTENANCE_JOBS:
+        return POOL_MAINTENANCE
+    return POOL_DEFAULT
+
+
+# ============================================================================
+# STAGGERING
+# ============================================================================
+
+def stagger_offset(job_id: str, spread_seconds: int) -> int:
+    """Stable offset in [1, spread_seconds] for job_id (0 if exempt or no spread)."""
+    if job_id in STAGGER_EXEMPT or spread_seconds <= 0:
+        return 0
+    return 1 + zlib.crc32(job_id.encode('utf-8')) % spread_seconds
+
+
+def stagger_trigger(trigger, job_id: str, spread_seconds: int = SCHEDULER_STAGGER_SECONDS):
+    """
+    Return a trigger equivalent to `trigger` but offset by the job's stagger.
+
+    IntervalTrigger: aligned to the interval boundary (epoch multiples) plus
+    the offset, capped at half the interval. CronTrigger: the offset becomes
+    the 'second' field unless one was set explicitly; every other field is
+    passed through as resolved (so an hour-only cron keeps minute=0 rather
+    than widening to '*'). Anything else (string aliases, date triggers) is
+    returned unchanged.
+    """
+    if not APSCHEDULER_AVAILABLE:
+        return trigger
+
+    if isinstance(trigger, IntervalTrigger):
+        interval = trigger.interval_length
+        offset = stagger_offset(job_id, min(spread_seconds, int(interval // 2)))
+        now = time.time()
+        boundary = now - (now % interval)
+        start = datetime.fromtimestamp(boundary + offset, tz=timezone.utc).astimezone(trigger.timezone)
+        return IntervalTrigger(
+            seconds=interval, start_date=start, end_date=trigger.end_date,
+            timezone=trigger.timezone, jitter=trigger.jitter,
+        )
+
+    if isinstance(trigger, CronTrigger):
+        second = next(f for f in trigger.fields if f.name == 'second')
+        if not second.is_default:
+            return trigger
+        # Resolved expressions, defaults included: CronTrigger would otherwise
+        # fill unset fields above the new 'second' with '*'
+        fields = {f.name: str(f) for f in trigger.fields if f.name != 'second'}
+        offset = stagger_offset(job_id, min(spread_seconds, 59))
+        if offset == 0:
+            return trigger
+        return CronTrigger(
+            second=offset, start_date=trigger.start_date, end_date=trigger.end_date,
+            timezone=trigger.timezone, jitter=trigger.jitter, **fields,
+        )
+
+    return trigger
+
+
+# ============================================================================
+# LATENCY HISTOGRAMS
+# ============================================================================
+
+# Upper bounds in milliseconds; the last bucket is open-ended.
+HISTOGRAM_BUCKETS_MS = (
+    50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000, 60_000, 120_000, 300_000,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds). Not thread-safe on its own."""
+
+    def __init__(self, buckets=HISTOGRAM_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        value_ms = max(0.0, float(value_ms))
+        self.counts[bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (max for the open bucket)."""
+        if self.count == 0:
+            return None
+        target = q * self.count
+        running = 0
+        for i, n in enumerate(self.counts):
+            running += n
+            if running >= target and n:
+                return float(self.buckets[i]) if i < len(self.buckets) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{b}" for b in self.buckets] + ['inf']
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 1) if self.count else None,
+            'max_ms': round(self.max_ms, 1),
+            'p50_ms': self.quantile(0.50),
+            'p95_ms': self.quantile(0.95),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class JobMetrics:
+    """Per-job runtime/lag histograms and skip counters for the scheduler."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+
+    def _job(self, job_id: str, pool: Optional[str] = None) -> Dict[str, Any]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            job = self._jobs[job_id] = {
+                'pool': pool or classify_job(job_id),
+                'runtime': LatencyHistogram(),
+                'lag': LatencyHistogram(),
+                'errors': 0,
+                'missed': 0,
+                'skipped_max_instances': 0,
+                'last_run': None,
+            }
+        return job
+
+    def record_run(self, job_id: str, pool: str, runtime_ms: float, lag_ms: float, ok: bool) -> None:
+        with self._lock:
+            job = self._job(job_id, pool)
+            job['runtime'].observe(runtime_ms)
+            job['lag'].observe(lag_ms)
+            if not ok:
+                job['errors'] += 1
+            job['last_run'] = datetime.now(timezone.utc).isoformat()
+
+    def record_skip(self, job_id: str, reason: str) -> None:
+        with self._lock:
+            self._job(job_id)[reason] += 1
+
+    def listener(self, event) -> None:
+        """APScheduler listener for EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES."""
+        if event.code == EVENT_JOB_MISSED:
+            self.record_skip(event.job_id, 'missed')
+        elif event.code == EVENT_JOB_MAX_INSTANCES:
+            self.record_skip(event.job_id, 'skipped_max_instances')
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            jobs = {
+                job_id: {
+                    'pool': job['pool'],
+                    'runtime': job['runtime'].to_dict(),
+                    'lag': job['lag'].to_dict(),
+                    'errors': job['errors'],
+                    'missed': job['missed'],
+                    'skipped_max_instances': job['skipped_max_instances'],
+                    'last_run': job['last_run'],
+                }
+                for job_id, job in sorted(self._jobs.items())
+            }
+        return {
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'pools': dict(POOL_WORKERS),
+            'stagger_seconds': SCHEDULER_STAGGER_SECONDS,
+            'buckets_ms': list(HISTOGRAM_BUCKETS_MS),
+            'jobs': jobs,
+        }
+
+
+_job_metrics: Optional[JobMetrics] = None
+
+
+def get_job_metrics() -> JobMetrics:
+    """Process-wide job metrics (shared by the scheduler and the API route)."""
+    global _job_metrics
+    if _job_metrics is None:
+        _job_metrics = JobMetrics()
+    return _job_metrics
+
+
+# ============================================================================
+# EXECUTOR + SCHEDULER
+# ============================================================================
+
+if APSCHEDULER_AVAILABLE:
+
+    class TimedThreadPoolExecutor(ThreadPoolExecutor):
+        """Thread pool executor that records per-job runtime and start lag."""
+
+        def __init__(self, pool_name: str, metrics: JobMetrics, max_workers: int = 10):
+            super().__init__(
+                max_workers=max_workers,
+                pool_kwargs={'thread_name_prefix': f'sched-{pool_name}'},
+            )
+            self.pool_name = pool_name
+            self.metrics = metrics
+
+        def _do_submit_job(self, job, run_times):
+            pool_name, metrics = self.pool_name, self.metrics
+
+            def timed_run_job(job, jobstore_alias, run_times, logger_name):
+                lag_ms = (datetime.now(timezone.utc) - run_times[-1]).total_seconds() * 1000
+                started = time.perf_counter()
+                events = run_job(job, jobstore_alias, run_times, logger_name)
+                runtime_ms = (time.perf_counter() - started) * 1000
+                ok = not any(getattr(e, 'exception', None) for e in events)
+                metrics.record_run(job.id, pool_name, runtime_ms, lag_ms, ok)
+                return events
+
+            def callback(f):
+                exc = f.exception()
+                if exc:
+                    self._run_job_error(job.id, exc, exc.__traceback__)
+                else:
+                    self._run_job_success(job.id, f.result())
+
+            f = self._pool.submit(
+                timed_run_job, job, job._jobstore_alias, run_times, self._logger.name
+            )
+            f.add_done_callback(callback)
+
+    def build_executors(metrics: JobMetrics) -> Dict[str, TimedThreadPoolExecutor]:
+        """One timed thread pool per named pool, sized from POOL_WORKERS."""
+        return {
+            pool: TimedThreadPoolExecutor(pool, metrics, max_workers=workers)
+            for pool, workers in POOL_WORKERS.items()
+        }
+
+    class PooledBackgroundScheduler(BackgroundScheduler):
+        """
+        BackgroundScheduler that routes jobs to named pools and staggers triggers.
+
+        add_job() keeps its normal signature; when a job id is given and no
+        executor is chosen explicitly, the job goes to classify_job(id) and its
+        interval/cron trigger gets the job's deterministic start offset.
+        """
+
+        def __init__(self, metrics: Optional[JobMetrics] = None,
+                     stagger_seconds: int = SCHEDULER_STAGGER_SECONDS, **options):
+            self.job_metrics = metrics or get_job_metrics()
+            self.stagger_seconds = stagger_seconds
+            options.setdefault('executors', build_executors(self.job_metrics))
+            super().__init__(**options)
+            self.add_listener(self.job_metrics.listener, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+
+        def add_job(self, func, trigger=None, *args, **kwargs):
+            job_id = kwargs.get('id')
+            if job_id:
+                if kwargs.get('executor', 'default') == 'default':
+                    kwargs['executor'] = classify_job(job_id)
+                if 'next_run_time' not in kwargs and not isinstance(trigger, str):
+                    trigger = stagger_trigger(trigger, job_id, self.stagger_seconds)
+            return super().add_job(func, trigger, *args, **kwargs)
+
+        def get_pool_assignments(self) -> Dict[str, List[str]]:
+            """Job ids per executor pool (for status/diagnostics)."""
+            pools: Dict[str, List[str]] = {}
+            for job in self.get_jobs():
+                pools.setdefault(job.executor, []).append(job.id)
+            return pools
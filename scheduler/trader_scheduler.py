@@ -68,6 +68,15 @@ except ImportError:
     IntervalTrigger = None
     print("Warning: APScheduler not installed. Autonomous trading scheduler will be disabled.")
 
+# Named executor pools, staggered triggers and per-job latency histograms
+try:
+    from scheduler.job_pools import PooledBackgroundScheduler, get_job_metrics
+    JOB_POOLS_AVAILABLE = True
+except ImportError:
+    JOB_POOLS_AVAILABLE = False
+    PooledBackgroundScheduler = None
+    get_job_metrics = None
+
 from datetime import datetime
 from zoneinfo import ZoneInfo
 import logging
@@ -367,11 +376,13 @@ try:
         calculate_spread_mark_to_market,
         build_occ_symbol,
         get_option_quotes_batch,
+        get_fleet_mark_to_market,
     )
     MTM_AVAILABLE = True
 except ImportError:
     calculate_ic_mark_to_market = None
     calculate_spread_mark_to_market = None
+    get_fleet_mark_to_market = None
     print("Warning: Mark-to-market not available. Equity snapshots will use trader instance values.")
 
 # Import decision logger for comprehensive logging
@@ -578,7 +589,8 @@ try:
     from quant.prophet_advisor import (
         ProphetAdvisor, MarketContext as ProphetMarketContext, GEXRegime, TradingAdvice,
         BotName as ProphetBotName, TradeOutcome,  # Issue #2: LAZARUS feedback loop
-        auto_train as prophet_auto_train  # Migration 023: Feedback loop integration
+        auto_train as prophet_auto_train,  # Migration 023: Feedback loop integration
+        preload_prophet_model
     )
     PROPHET_AVAILABLE = True
 except ImportError:
@@ -588,6 +600,7 @@ except ImportError:
     GEXRegime = None
     TradingAdvice = None
     prophet_auto_train = None
+    preload_prophet_model = None
 
 # Import Proverbs Enhanced for strategy-level feedback
 try:
@@ -633,6 +646,19 @@ except ImportError:
     VIXHedgeManager = None
     print("Warning: VIX Hedge Manager not available. VIX signal generation will be disabled.")
 
+# Import shared market snapshot bus (one quote/VIX/chain/GEX fetch per tick for all bots)
+try:
+    from data.market_snapshot import (
+        MARKET_SNAPSHOT_BUS_ENABLED, get_snapshot_stats, refresh_all as refresh_market_snapshots
+    )
+    MARKET_SNAPSHOT_AVAILABLE = True
+except ImportError:
+    MARKET_SNAPSHOT_AVAILABLE = False
+    MARKET_SNAPSHOT_BUS_ENABLED = False
+    get_snapshot_stats = None
+    refresh_market_snapshots = None
+    print("Warning: Market snapshot bus not available. Bots will fetch market data individually.")
+
 # Setup logging
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
@@ -671,6 +697,14 @@ class AutonomousTraderScheduler:
         except Exception as e:
             logger.warning(f"Bot table initialization skipped: {e}")
 
+        # Warm the process-wide Prophet model cache once, before the bots below
+        # construct their ProphetAdvisor instances (they share the loaded model).
+        if PROPHET_AVAILABLE:
+            try:
+                preload_prophet_model()
+            except Exception as e:
+                logger.warning(f"Prophet model preload skipped: {e}")
+
         # LAZARUS - 0DTE SPY/SPX Options Trader
         # Capital: $400,000 (40% of total)
         # CRITICAL: Wrap in try-except to prevent scheduler crash if LAZARUS init fails
@@ -3319,6 +3353,26 @@ class AutonomousTraderScheduler:
         except Exception as e:
             logger.error(f"VALOR DB WATCHDOG error: {e}")
 
+    def scheduled_crypto_snapshot_refresh(self):
+        """
+        Crypto market snapshots - re-warm AGAPE coins about to expire, every 30s.
+
+        Refetches (concurrently, oldest first) every coin whose cached snapshot
+        is missing or close to the provider's short TTL, so the AGAPE bots'
+        get_snapshot() calls hit a fresh entry, or wait on this in-flight
+        refresh instead of each running its own CoinGlass/Deribit calls.
+        """
+        try:
+            from data.crypto_data_provider import get_crypto_data_provider
+            from ai.perp_brief_daily_runner import PERP_TICKERS
+
+            snapshots = get_crypto_data_provider().rewarm_snapshots(PERP_TICKERS)
+            missing = [s for s, snap in snapshots.items() if snap is None]
+            if missing:
+                logger.warning(f"CRYPTO SNAPSHOTS: no snapshot for {', '.join(missing)}")
+        except Exception as e:
+            logger.error(f"ERROR in crypto snapshot refresh: {str(e)}")
+
     def scheduled_agape_logic(self):
         """
         AGAPE ETH Micro Futures - runs every 5 minutes during CME crypto hours.
@@ -4112,6 +4166,52 @@ class AutonomousTraderScheduler:
             logger.error(f"ERROR in AGAPE-BCH-FUTURES EOD: {str(e)}")
             logger.error(traceback.format_exc())
 
+    def scheduled_market_snapshot_logic(self):
+        """
+        MARKET SNAPSHOT pre-warm - runs every 5 minutes during market hours
+
+        Refreshes the shared market snapshot (quotes, VIX, chains, GEX) for
+        everything the bots read last tick, so the FORTRESS/ANCHOR/SOLOMON/...
+        jobs firing this tick all read the same snapshot instead of each
+        fetching it from Tradier.
+        """
+        if not (MARKET_SNAPSHOT_AVAILABLE and MARKET_SNAPSHOT_BUS_ENABLED):
+            return
+        if not self.is_market_open():
+            return
+        try:
+            refreshed = refresh_market_snapshots()
+            logger.debug(f"MARKET_SNAPSHOT: refreshed {refreshed} bus(es)")
+        except Exception as e:
+            logger.warning(f"MARKET_SNAPSHOT: pre-warm failed (bots will refresh on read): {e}")
+
+    def scheduled_job_metrics_flush(self):
+        """
+        Persist per-job runtime/lag histograms to autonomous_config
+        ('scheduler_job_metrics') for the API route and remote diagnostics.
+        """
+        if not JOB_POOLS_AVAILABLE or not get_connection:
+            return
+        conn = None
+        try:
+            conn = get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO autonomous_config (key, value) VALUES ('scheduler_job_metrics', %s) "
+                "ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value",
+                (json.dumps(get_job_metrics().snapshot()),)
+            )
+            conn.commit()
+            cursor.close()
+        except Exception as e:
+            logger.debug(f"SCHEDULER: job metrics flush failed: {e}")
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
     def scheduled_watchtower_logic(self):
         """
         WATCHTOWER (0DTE Gamma Live) commentary generation - runs every 5 minutes during market hours
@@ -5814,6 +5914,15 @@ class AutonomousTraderScheduler:
                 'gideon': ('gideon_positions', 'gideon_equity_snapshots', 'gideon_starting_capital', 100000, 'gideon_trader'),
             }
 
+            # Mark every open position across the fleet once for this tick: one deduped,
+            # chunked quote fetch instead of a quote call per position per bot
+            fleet_mtm = None
+            if MTM_AVAILABLE:
+                try:
+                    fleet_mtm = get_fleet_mark_to_market()
+                except Exception as mtm_err:
+                    logger.warning(f"EQUITY_SNAPSHOTS: fleet MTM calculation failed: {mtm_err}")
+
             for bot_name, (pos_table, snap_table, cap_key, default_cap, trader_attr) in bots_config.items():
                 try:
                     # Get starting capital from config
@@ -5850,81 +5959,15 @@ class AutonomousTraderScheduler:
                     unrealized_pnl = 0
                     mtm_method = 'none'
 
-                    if open_count > 0 and MTM_AVAILABLE:
-                        try:
-                            # Iron Condor bots: FORTRESS, SAMSON, ANCHOR
-                            if bot_name in ['fortress', 'samson', 'anchor']:
-                                # Query IC positions with all MTM fields
-                                underlying = 'SPY' if bot_name == 'fortress' else 'SPX'
-                                cursor.execute(f"""
-                                    SELECT position_id, total_credit, contracts, spread_width,
-                                           put_short_strike, put_long_strike, call_short_strike, call_long_strike,
-                                           expiration
-                                    FROM {pos_table}
-                                    WHERE status = 'open'
-                                """)
-                                open_positions = cursor.fetchall()
-
-                                for pos in open_positions:
-                                    pos_id, credit, contracts, spread_w, put_short, put_long, call_short, call_long, exp = pos
-                                    if not all([credit, contracts, put_short, put_long, call_short, call_long, exp]):
-                                        continue
-                                    try:
-                                        exp_str = str(exp) if not isinstance(exp, str) else exp
-                                        mtm = calculate_ic_mark_to_market(
-                                            underlying=underlying,
-                                            expiration=exp_str,
-                                            put_short_strike=float(put_short),
-                                            put_long_strike=float(put_long),
-                                            call_short_strike=float(call_short),
-                                            call_long_strike=float(call_long),
-                                            contracts=int(contracts),
-                                            entry_credit=float(credit),
-                                            use_cache=True
-                                        )
-                                        if mtm.get('success') and mtm.get('unrealized_pnl') is not None:
-                                            unrealized_pnl += mtm['unrealized_pnl']
-                                            mtm_method = 'mark_to_market'
-                                    except Exception as pos_err:
-                                        logger.debug(f"EQUITY_SNAPSHOTS: {bot_name.upper()} MTM failed for {pos_id}: {pos_err}")
-
-                            # Directional spread bots: SOLOMON, GIDEON
-                            elif bot_name in ['solomon', 'gideon']:
-                                cursor.execute(f"""
-                                    SELECT position_id, spread_type, entry_debit, contracts,
-                                           long_strike, short_strike, max_profit, max_loss, expiration
-                                    FROM {pos_table}
-                                    WHERE status = 'open'
-                                """)
-                                open_positions = cursor.fetchall()
-
-                                for pos in open_positions:
-                                    pos_id, spread_type, debit, contracts, long_strike, short_strike, max_profit, max_loss, exp = pos
-                                    if not all([debit, contracts, long_strike, short_strike, exp]):
-                                        continue
-                                    try:
-                                        exp_str = str(exp) if not isinstance(exp, str) else exp
-                                        mtm = calculate_spread_mark_to_market(
-                                            underlying='SPY',
-                                            expiration=exp_str,
-                                            long_strike=float(long_strike),
-                                            short_strike=float(short_strike),
-                                            spread_type=spread_type,
-                                            contracts=int(contracts),
-                                            entry_debit=float(debit),
-                                            use_cache=True
-                                        )
-                                        if mtm.get('success') and mtm.get('unrealized_pnl') is not None:
-                                            unrealized_pnl += mtm['unrealized_pnl']
-                                            mtm_method = 'mark_to_market'
-                                    except Exception as pos_err:
-                                        logger.debug(f"EQUITY_SNAPSHOTS: {bot_name.upper()} MTM failed for {pos_id}: {pos_err}")
-
-                            if mtm_method == 'mark_to_market':
-                                logger.info(f"EQUITY_SNAPSHOTS: {bot_name.upper()} MTM unrealized=${unrealized_pnl:.2f}")
-                        except Exception as mtm_err:
-                            logger.warning(f"EQUITY_SNAPSHOTS: {bot_name.upper()} MTM calculation failed: {mtm_err}")
-                            mtm_method = 'failed'
+                    if open_count > 0 and fleet_mtm is not None:
+                        bot_mtm = fleet_mtm.get(bot_name, {})
+                        mtm_method = bot_mtm.get('method', 'none')
+                        if mtm_method == 'mark_to_market':
+                            unrealized_pnl = bot_mtm['unrealized_pnl']
+                            logger.info(
+                                f"EQUITY_SNAPSHOTS: {bot_name.upper()} MTM unrealized=${unrealized_pnl:.2f} "
+                                f"({bot_mtm['marked']}/{bot_mtm['open_positions']} positions marked)"
+                            )
 
                     # Fallback to trader instance if MTM failed or unavailable
                     if mtm_method != 'mark_to_market' and open_count > 0:
@@ -6287,7 +6330,14 @@ class AutonomousTraderScheduler:
         # whose first dispatch lands 1+s late under multi-worker contention is
         # discarded ("Run time of job ... was missed by 0:00:01"). 60s of grace
         # absorbs observed 1.1–7.4s jitter without exceeding the 5-min interval.
-        self.scheduler = BackgroundScheduler(
+        #
+        # PooledBackgroundScheduler routes each job id to a named executor pool
+        # (scans / training / maintenance / default) so a slow training run
+        # cannot hold the threads the 5-min scans need, staggers jobs sharing a
+        # boundary by a stable per-job offset, and records runtime/lag
+        # histograms (see scheduler/job_pools.py).
+        scheduler_cls = PooledBackgroundScheduler if JOB_POOLS_AVAILABLE else BackgroundScheduler
+        self.scheduler = scheduler_cls(
             timezone='America/Chicago',
             job_defaults={
                 'misfire_grace_time': 60,
@@ -6339,6 +6389,23 @@ class AutonomousTraderScheduler:
         else:
             logger.warning("⚠️ CORNERSTONE not available - wheel trading disabled")
 
+        # =================================================================
+        # MARKET SNAPSHOT PRE-WARM: registered ahead of the 5-min bot jobs so
+        # its tick fires first; bots reading the same tick share the snapshot.
+        # =================================================================
+        if MARKET_SNAPSHOT_AVAILABLE and MARKET_SNAPSHOT_BUS_ENABLED:
+            self.scheduler.add_job(
+                self.scheduled_market_snapshot_logic,
+                trigger=IntervalTrigger(
+                    minutes=5,
+                    timezone='America/Chicago'
+                ),
+                id='market_snapshot_prewarm',
+                name='MARKET SNAPSHOT - Shared quote/VIX/GEX pre-warm (5-min intervals)',
+                replace_existing=True
+            )
+            logger.info("✅ MARKET SNAPSHOT pre-warm job scheduled (every 5 min)")
+
         # =================================================================
         # FORTRESS JOB: Aggressive Iron Condor - runs every 5 minutes
         # Scans continuously for optimal 0DTE Iron Condor entry timing
@@ -6779,6 +6846,30 @@ class AutonomousTraderScheduler:
         else:
             logger.warning("⚠️ VALOR not available - MES futures trading disabled")
 
+        # =================================================================
+        # CRYPTO SNAPSHOT JOB: re-warm expiring AGAPE coin snapshots - every 30s
+        # Registered ahead of the AGAPE bots so their 5-minute cycles find
+        # a fresh (or in-flight) snapshot instead of refetching per bot.
+        # =================================================================
+        try:
+            from data.crypto_data_provider import SNAPSHOT_REFRESH_INTERVAL_S
+
+            self.scheduler.add_job(
+                self.scheduled_crypto_snapshot_refresh,
+                trigger=IntervalTrigger(
+                    seconds=SNAPSHOT_REFRESH_INTERVAL_S,
+                    timezone='America/Chicago'
+                ),
+                id='crypto_snapshot_refresh',
+                name='Crypto Snapshots - Re-warm AGAPE coins (30-sec intervals, 24/7)',
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
+            )
+            logger.info("✅ Crypto snapshot refresh job scheduled (every 30s, 24/7)")
+        except Exception as _e:
+            logger.error(f"❌ Crypto snapshot refresh registration failed: {_e}", exc_info=True)
+
         # =================================================================
         # AGAPE JOB: ETH Micro Futures - runs every 5 minutes
         # Crypto trades nearly 24/7 (CME: Sun 5PM - Fri 4PM CT)
@@ -7723,6 +7814,24 @@ class AutonomousTraderScheduler:
         )
         logger.info("✅ VACUUM job scheduled (WEEKLY on Sunday at 2:00 AM CT)")
 
+        # =================================================================
+        # JOB METRICS FLUSH: persist per-job runtime/lag histograms every minute
+        # The scheduler may run in a separate worker from the API, so the
+        # /api/trader/scheduler/job-metrics route reads them from the DB.
+        # =================================================================
+        if JOB_POOLS_AVAILABLE:
+            self.scheduler.add_job(
+                self.scheduled_job_metrics_flush,
+                trigger=IntervalTrigger(
+                    minutes=1,
+                    timezone='America/Chicago'
+                ),
+                id='scheduler_metrics_flush',
+                name='SCHEDULER - Job runtime/lag metrics flush (1-min intervals)',
+                replace_existing=True
+            )
+            logger.info("✅ SCHEDULER metrics flush job scheduled (every 1 min)")
+
         # =================================================================
         # TRADIER SANDBOX EOD CLOSE: Bulletproof position closer
         # Runs INDEPENDENTLY of any bot — queries actual Tradier sandbox accounts
@@ -8098,6 +8207,22 @@ class AutonomousTraderScheduler:
             'used_by': ['WATCHTOWER', 'GLORY']
         }
 
+        # Executor pool assignments (per-job histograms: /api/trader/scheduler/job-metrics)
+        if self.is_running and JOB_POOLS_AVAILABLE and isinstance(self.scheduler, PooledBackgroundScheduler):
+            try:
+                status['executor_pools'] = {
+                    pool: len(job_ids) for pool, job_ids in self.scheduler.get_pool_assignments().items()
+                }
+            except Exception as e:
+                logger.warning(f"Error getting executor pools: {e}")
+
+        # Shared market snapshot hit/miss and staleness
+        if MARKET_SNAPSHOT_AVAILABLE:
+            try:
+                status['market_snapshot'] = get_snapshot_stats()
+            except Exception as e:
+                status['market_snapshot'] = {'error': str(e)}
+
         return status
 
     def get_recent_logs(self, lines: int = 50) -> list:
@@ -8342,7 +8467,14 @@ def run_standalone():
         except Exception as e:
             logger.error(f"[SHUTDOWN] Position check failed: {e}")
 
-        # Step 3: Close database connection pool
+        # Step 3: Flush queued scan/activity log rows, then close database connection pool
+        try:
+            from db.write_behind import flush_write_behind
+            logger.info("[SHUTDOWN] Flushing write-behind log queue...")
+            flush_write_behind()
+        except Exception as e:
+            logger.error(f"[SHUTDOWN] Write-behind flush failed: {e}")
+
         try:
             from database_adapter import close_pool
             logger.info("[SHUTDOWN] Closing database connection pool...")
@@ -0,0 +1,51 @@
+import datetime as dt
+from dataclasses import dataclass
+from backtest.blaze_gex_0dte.loader import bars_to_daychain
+from backtest.blaze_gex_0dte.parallel import prefetched, run_chunk, run_days
+from backtest.blaze_gex_0dte.runner import replay_daychain
+from trading.helios.models import JoshuaConfig
+
+DATES = [dt.date(2024, 3, 11) + dt.timedelta(days=i) for i in range(12)]
+
+@dataclass
+class FakeJob:
+    """Synthetic chain per date; every 4th date has no session."""
+    connected: bool = False
+
+    def connect(self):
+        self.connected = True
+
+    def close(self):
+        self.connected = False
+
+    def load(self, d):
+        assert self.connected
+        if d.day % 4 == 0:
+            return None
+        drift = (d.day % 5) * 0.2
+        rows = []
+        for m in range(0, 400, 5):
+            s = 0.002 * m * (1 if d.day % 2 else -1) + drift
+            rows += [
+                (m, 499.0, "C", 1.6 + s, 1.7 + s), (m, 499.0, "P", 0.5 - s / 2, 0.6 - s / 2),
+                (m, 500.0, "C", 1.0 + s, 1.1 + s), (m, 500.0, "P", 1.0 - s / 2, 1.1 - s / 2),
+                (m, 501.0, "C", 0.5 + s, 0.6 + s), (m, 501.0, "P", 1.6 - s / 2, 1.7 - s / 2),
+            ]
+        oi = {(499.0, "C"): 100, (499.0, "P"): 9000, (500.0, "C"): 900,
+              (500.0, "P"): 900, (501.0, "C"): 9000, (501.0, "P"): 100}
+        return bars_to_daychain(d, rows, oi)
+
+    def replay(self, day):
+        return replay_daychain(day, JoshuaConfig())
+
+def test_prefetched_preserves_order():
+    assert list(prefetched([3, 1, 2], lambda x: x * 10)) == [(3, 30), (1, 10), (2, 20)]
+    assert list(prefetched([], lambda x: x)) == []
+
+def test_parallel_matches_sequential_in_date_order():
+    job = FakeJob()
+    job.connect()
+    sequential = [t for _d, out in run_chunk(job, DATES) for t in out]
+    parallel = run_days(FakeJob(), list(reversed(DATES)), workers=2, chunk_days=2)
+    assert parallel == sequential
+    assert [t.trade_date for t in parallel] == sorted(t.trade_date for t in parallel)
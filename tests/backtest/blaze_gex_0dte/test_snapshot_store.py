@@ -0,0 +1,43 @@
+import datetime as dt
+from backtest.blaze_gex_0dte.loader import bars_to_daychain
+from backtest.blaze_gex_0dte.reconstruct import build_snapshots
+from backtest.blaze_gex_0dte.snapshot_store import SnapshotStore
+
+D = dt.date(2024, 3, 15)
+
+def _day():
+    rows = []
+    for m in range(0, 4):
+        rows += [
+            (m, 499.0, "C", 1.6, 1.7), (m, 499.0, "P", 0.5, 0.6),
+            (m, 500.0, "C", 1.0 + 0.01 * m, 1.1), (m, 500.0, "P", 1.0, 1.1),
+            (m, 501.0, "C", 0.5, 0.6), (m, 501.0, "P", 1.6, None),
+        ]
+    oi = {(499.0,"C"):100,(499.0,"P"):100,(500.0,"C"):5000,
+          (500.0,"P"):5000,(501.0,"C"):100,(501.0,"P"):100}
+    return bars_to_daychain(D, rows, oi)
+
+def test_built_once_then_served_from_disk(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    loads = []
+    def load():
+        loads.append(1)
+        return _day()
+    first = store.get_or_build(D, 0, "v1", load)
+    second = SnapshotStore(str(tmp_path)).get_or_build(D, 0, "v1", load)
+    assert len(loads) == 1
+    assert second.day.bars == _day().bars and second.day.oi == _day().oi
+    assert second.snapshots == first.snapshots == build_snapshots(_day())
+
+def test_new_data_version_rebuilds(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    store.get_or_build(D, 0, "v1", _day)
+    store.get_or_build(D, 0, "v2", _day)
+    store.get_or_build(D, 1, "v1", _day)
+    assert store.builds == 3 and store.hits == 0
+
+def test_empty_session_is_cached(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    assert store.get_or_build(D, 0, "v1", lambda: None) is None
+    assert store.get_or_build(D, 0, "v1", lambda: 1 / 0) is None
+    assert store.hits == 1
@@ -48,3 +48,24 @@ def test_replay_day_fires_wall_fade_up_to_cap():
     out = replay_day(snaps, config=JoshuaConfig(), spot_mark_provider=lambda **kw: 0.80)
     assert len(out) == 3
     assert all(t.setup == "wall_fade" for t in out)
+
+
+def test_replay_day_marks_use_last_snapshot_per_minute():
+    base = dt.datetime(2026, 5, 1, 14, 30, tzinfo=dt.timezone.utc)
+    snaps = []
+    for i in range(30):
+        ts = base + dt.timedelta(minutes=i)
+        snaps.append(_snap(spot=500.0, net_gex=2.0e9, regime="HIGH_POSITIVE", sigma=5.0,
+                           call_wall=501.0, ts=ts))
+        # Second snapshot in the same minute carries the mark that counts
+        snaps.append(_snap(spot=490.0 if i == 10 else 500.0, net_gex=2.0e9, regime="HIGH_POSITIVE",
+                           sigma=5.0, call_wall=501.0, ts=ts))
+    cfg = replace(JoshuaConfig(), max_trades_per_setup_per_day=1)
+
+    def provider(*, snapshot, debit, **kw):
+        return debit * 2 if snapshot.spot < 495.0 else debit
+
+    out = replay_day(snaps, config=cfg, spot_mark_provider=provider)
+    assert len(out) == 1
+    assert out[0].exit_reason == "PT"
+    assert out[0].exit_minute == 70  # 14:40 UTC -> 60 + 10 minutes after the CT open
@@ -1,7 +1,10 @@
-"""Tests for quant.sim.simulate_intraday."""
+"""Tests for quant.sim.simulate_intraday and simulate_intraday_grid."""
+import itertools
+
+import numpy as np
 import pytest
 
-from quant.sim import simulate_intraday, MarkSeries
+from quant.sim import MarkArray, MarkSeries, simulate_intraday, simulate_intraday_grid
 
 
 def test_pt_hit():
@@ -48,3 +51,72 @@ def test_trail_activates_and_exits():
     )
     assert out.exit_reason == "TRAIL"
     assert out.exit_minute == 4
+
+
+def test_mark_array_round_trip():
+    arr = MarkSeries({3: 1.0, 5: 1.2}).to_array()
+    assert arr.start_minute == 3
+    assert [arr.mark_at(m) for m in range(2, 7)] == [None, 1.0, None, 1.2, None]
+    assert np.isnan(arr.window(4, 6)).tolist() == [True, False, True]
+
+
+def test_grid_pt_grace_and_disabled_trail():
+    marks = {0: 1.0, 1: 1.10, 2: 1.25, 3: 1.30}
+    grid = simulate_intraday_grid(
+        debits=1.0, entry_minutes=0, eod_minute=10, bars=[MarkSeries(marks)],
+        pt_pct=20.0, sl_pct=30.0, sl_grace_minutes=[0, 5],
+        trailing_activate_pct=[5.0, None], trailing_stop_pct=8.0,
+    )
+    assert grid.shape == (1, 2)
+    assert grid.exit_reason.tolist() == [["PT", "PT_GRACE"]]
+    assert grid.exit_minute.tolist() == [[2, 2]]
+
+
+def test_grid_fractional_grace_matches_scalar():
+    bars = MarkSeries({0: 1.0, **{m: 0.6 for m in range(1, 8)}})
+    kwargs = dict(debit=1.0, entry_minute=0, eod_minute=7, bars=bars, pt_pct=50.0, sl_pct=30.0)
+    grid = simulate_intraday_grid(
+        debits=1.0, entry_minutes=0, eod_minute=7, bars=[bars],
+        pt_pct=50.0, sl_pct=30.0, sl_grace_minutes=[2.5],
+    )
+    # Minute 2 is still inside a 2.5 minute grace; the stop fires at minute 3
+    assert grid.result(0, 0) == simulate_intraday(**kwargs, sl_grace_minutes=2.5)
+    assert grid.exit_minute.tolist() == [[3]]
+
+
+def test_grid_matches_scalar_walk():
+    rng = np.random.default_rng(11)
+
+    class Bars:  # plain mark_at() provider, neither MarkSeries nor MarkArray
+        def __init__(self, marks):
+            self.marks = marks
+
+        def mark_at(self, minute):
+            return self.marks.get(minute)
+
+    bars, debits, entries = [], [], []
+    for i in range(6):
+        mark, marks = 0.5, {}
+        for m in range(40):
+            mark = max(0.01, mark + rng.normal(0, 0.03))
+            if rng.random() < 0.8:
+                marks[m] = mark
+        bars.append([MarkSeries, MarkArray.from_marks, Bars][i % 3](marks))
+        debits.append(0.5)
+        entries.append(int(rng.integers(0, 30)))
+
+    combos = list(itertools.product([10.0, 40.0], [15.0, 40.0], [0, 4], [None, 3.0], [5.0, 10.0]))
+    pt, sl, grace, act, stop = map(list, zip(*combos))
+    grid = simulate_intraday_grid(
+        debits=debits, entry_minutes=entries, eod_minute=35, bars=bars,
+        pt_pct=pt, sl_pct=sl, sl_grace_minutes=grace,
+        trailing_activate_pct=act, trailing_stop_pct=stop,
+    )
+
+    for e, c in itertools.product(range(len(bars)), range(len(combos))):
+        expected = simulate_intraday(
+            debit=debits[e], entry_minute=entries[e], eod_minute=35, bars=bars[e],
+            pt_pct=pt[c], sl_pct=sl[c], sl_grace_minutes=grace[c],
+            trailing_activate_pct=act[c], trailing_stop_pct=stop[c],
+        )
+        assert grid.result(e, c) == expected
@@ -0,0 +1,193 @@
+"""
+Incremental Bar Store Tests
+
+Tests for the persistent Polygon bar store (data/bar_store.py) and
+PolygonDataFetcher.get_price_history / get_vix_for_date reading from it.
+Polygon is a mocked requests.get; the store lives in tmp_path.
+
+Run with: pytest tests/test_bar_store.py -v
+"""
+
+import os
+import sys
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.bar_store import BarStore, MARKET_TZ
+
+
+def _daily_results(start: date, end: date, base: float = 15.0):
+    """Polygon day aggs (weekdays only) with close = base + day-of-month / 100."""
+    results = []
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            ts = int(datetime(day.year, day.month, day.day, tzinfo=MARKET_TZ).timestamp() * 1000)
+            close = base + day.day / 100
+            results.append({'t': ts, 'o': close, 'h': close + 1, 'l': close - 1, 'c': close})
+        day += timedelta(days=1)
+    return results
+
+
+def _polygon_get(calls):
+    """requests.get stand-in serving _daily_results for the URL's date range."""
+    def fake_get(url, params=None, timeout=None):
+        from_date, to_date = url.rstrip('/').split('/')[-2:]
+        calls.append((date.fromisoformat(from_date), date.fromisoformat(to_date)))
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {
+            'status': 'OK',
+            'results': _daily_results(date.fromisoformat(from_date), date.fromisoformat(to_date)),
+        }
+        return response
+    return fake_get
+
+
+class TestBarSeries:
+    """Coverage tracking, slicing and persistence"""
+
+    def test_only_gaps_are_missing(self, tmp_path):
+        series = BarStore(str(tmp_path)).series('SPY')
+        assert series.missing('2024-01-01', '2024-01-31') == [(date(2024, 1, 1), date(2024, 1, 31))]
+
+        series.add(_daily_results(date(2024, 1, 10), date(2024, 1, 20)), '2024-01-10', '2024-01-20')
+
+        assert series.missing('2024-01-01', '2024-01-31') == [
+            (date(2024, 1, 1), date(2024, 1, 9)),
+            (date(2024, 1, 21), date(2024, 1, 31)),
+        ]
+        assert series.missing('2024-01-12', '2024-01-18') == []
+
+    def test_slice_and_asof(self, tmp_path):
+        series = BarStore(str(tmp_path)).series('I:VIX')
+        series.add(_daily_results(date(2024, 3, 1), date(2024, 3, 31)), '2024-03-01', '2024-03-31')
+
+        df = series.frame('2024-03-11', '2024-03-15')
+        assert list(df.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+        assert len(df) == 5
+        assert df['Close'].iloc[0] == pytest.approx(15.11)
+        assert (df['Volume'] == 0).all()
+
+        assert series.asof('2024-03-15') == pytest.approx(15.15)
+        assert series.asof('2024-03-17') == pytest.approx(15.15)  # Sunday -> Friday close
+        assert series.asof('2024-02-01') is None
+        assert series.asof('2024-04-30', max_gap_days=7) is None
+
+    def test_refetched_bars_replace_stored(self, tmp_path):
+        series = BarStore(str(tmp_path)).series('SPY')
+        series.add(_daily_results(date(2024, 3, 4), date(2024, 3, 8)), '2024-03-04', '2024-03-08')
+        series.add(_daily_results(date(2024, 3, 8), date(2024, 3, 8), base=20.0), '2024-03-08', '2024-03-08')
+
+        assert len(series) == 5
+        assert series.asof('2024-03-08') == pytest.approx(20.08)
+
+    def test_persisted_across_stores(self, tmp_path):
+        BarStore(str(tmp_path)).series('I:VIX').add(
+            _daily_results(date(2024, 3, 1), date(2024, 3, 31)), '2024-03-01', '2024-03-31')
+
+        reopened = BarStore(str(tmp_path)).series('I:VIX')
+        assert reopened.missing('2024-03-01', '2024-03-31') == []
+        assert len(reopened.frame('2024-03-01', '2024-03-31')) == 21
+        assert len([f for f in os.listdir(tmp_path / 'I_VIX' / 'day_1') if f.startswith('bars-')]) == 1
+
+    def test_truncated_response_leaves_last_day_uncovered(self, tmp_path):
+        series = BarStore(str(tmp_path)).series('SPY', 'minute')
+        series.add(_daily_results(date(2024, 3, 4), date(2024, 3, 6)), '2024-03-04', '2024-03-29', truncated=True)
+
+        assert series.missing('2024-03-04', '2024-03-29') == [(date(2024, 3, 6), date(2024, 3, 29))]
+
+    def test_today_is_never_covered_but_throttled(self, tmp_path):
+        today = datetime.now(MARKET_TZ).date()
+        series = BarStore(None, live_ttl=3600).series('SPY')
+        series.add([], today - timedelta(days=5), today)
+
+        assert series.coverage[-1][1] == pd.Timestamp(today - timedelta(days=1)).to_datetime64().astype('datetime64[D]')
+        assert series.missing(today - timedelta(days=5), today) == []
+        series.live_ttl = 0
+        assert series.missing(today - timedelta(days=5), today) == [(today, today)]
+
+
+class TestFetcherUsesStore:
+    """get_price_history / get_vix_for_date only fetch what the store lacks"""
+
+    def setup_method(self):
+        from data import polygon_data_fetcher
+        self.module = polygon_data_fetcher
+
+    def _fetcher(self, tmp_path):
+        fetcher = self.module.PolygonDataFetcher()
+        fetcher.api_key = 'test_key'
+        fetcher.bar_store = BarStore(str(tmp_path))
+        return fetcher
+
+    def test_overlapping_windows_fetch_only_new_days(self, tmp_path):
+        fetcher = self._fetcher(tmp_path)
+        calls = []
+        with patch.object(self.module.requests, 'get', side_effect=_polygon_get(calls)), \
+                patch.object(self.module, 'DATA_COLLECTOR_AVAILABLE', False):
+            first = fetcher.get_bars('SPY', '2024-01-01', '2024-03-31')
+            second = fetcher.get_bars('SPY', '2024-02-01', '2024-04-30')
+            third = fetcher.get_bars('SPY', '2024-01-15', '2024-04-15')
+
+        assert calls == [(date(2024, 1, 1), date(2024, 3, 31)), (date(2024, 4, 1), date(2024, 4, 30))]
+        assert first.index[0] < second.index[0]
+        assert len(third) > 0
+
+    def test_vix_for_many_dates_is_one_request(self, tmp_path):
+        fetcher = self._fetcher(tmp_path)
+        calls = []
+        with patch.object(self.module.requests, 'get', side_effect=_polygon_get(calls)), \
+                patch.object(self.module, 'polygon_fetcher', fetcher):
+            values = [self.module.get_vix_for_date(f'2023-06-{d:02d}') for d in range(1, 29)]
+
+        assert len(calls) == 1
+        assert values[14] == pytest.approx(15.15)   # Thursday 2023-06-15
+        assert values[16] == pytest.approx(15.16)   # Saturday -> Friday close
+
+    def test_cut_off_response_is_detected_by_next_url(self, tmp_path):
+        fetcher = self._fetcher(tmp_path)
+        calls = []
+        serve = _polygon_get(calls)
+
+        def cut_off_first(url, params=None, timeout=None):
+            response = serve(url, params, timeout)
+            if len(calls) == 1:
+                # Far fewer rows than AGGS_LIMIT, but Polygon says there is more
+                body = response.json.return_value
+                body['results'] = body['results'][:3]
+                body['next_url'] = 'https://api.polygon.io/v2/aggs/cursor'
+            return response
+
+        with patch.object(self.module.requests, 'get', side_effect=cut_off_first), \
+                patch.object(self.module, 'DATA_COLLECTOR_AVAILABLE', False):
+            df = fetcher.get_bars('SPY', '2024-03-04', '2024-03-29', 'hour', 4)
+
+        # Continues from the last returned day instead of marking the gap covered
+        assert calls == [(date(2024, 3, 4), date(2024, 3, 29)), (date(2024, 3, 6), date(2024, 3, 29))]
+        assert len(df) == 20
+        assert fetcher.bar_store.series('SPY', 'hour', 4).missing('2024-03-04', '2024-03-29') == []
+
+    def test_cut_off_response_without_bars_covers_nothing(self, tmp_path):
+        series = BarStore(str(tmp_path)).series('SPY')
+        series.add([], '2024-03-04', '2024-03-29', truncated=True)
+        assert series.missing('2024-03-04', '2024-03-29') == [(date(2024, 3, 4), date(2024, 3, 29))]
+
+    def test_covered_range_served_without_api_key(self, tmp_path):
+        fetcher = self._fetcher(tmp_path)
+        fetcher.bar_store.series('SPY').add(
+            _daily_results(date(2024, 3, 1), date(2024, 3, 31)), '2024-03-01', '2024-03-31')
+        fetcher.api_key = None
+
+        with patch.object(self.module.requests, 'get') as mock_get:
+            df = fetcher.get_bars('SPY', '2024-03-04', '2024-03-08')
+        mock_get.assert_not_called()
+        assert len(df) == 5
+
+        with pytest.raises(ValueError):
+            fetcher.get_bars('SPY', '2024-04-01', '2024-04-05')
@@ -0,0 +1,230 @@
+"""
+Crypto Data Provider Tests
+
+Concurrent snapshot refresh in CryptoDataProvider (data/crypto_data_provider.py):
+per-snapshot fan-out, multi-symbol passes, single-flight refreshes and the
+shared upstream rate budget. Upstreams are replaced by slow in-memory fakes.
+
+Run with: pytest tests/test_crypto_data_provider.py -v
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.crypto_data_provider import (
+    CryptoDataProvider,
+    DeribitClient,
+    FundingRate,
+    OpenInterestLevel,
+    SNAPSHOT_REWARM_LEAD_S,
+    UpstreamBudget,
+)
+
+DELAY = 0.2
+
+
+class _FakeCoinGlass:
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _call(self, name, symbol, value):
+        with self._lock:
+            self.calls.append((name, symbol))
+        time.sleep(DELAY)
+        return value
+
+    def get_funding_rate(self, symbol):
+        return self._call("funding", symbol, FundingRate(
+            symbol=symbol, rate=0.0001, predicted_rate=0.0001, exchange="test",
+            interval_hours=8, annualized_rate=0.1, timestamp=None))
+
+    def get_long_short_ratio(self, symbol):
+        return self._call("ls", symbol, None)
+
+    def get_open_interest(self, symbol):
+        return self._call("oi", symbol, None)
+
+    def get_taker_volume(self, symbol):
+        return self._call("taker", symbol, None)
+
+    def get_liquidation_data(self, symbol):
+        return self._call("liq", symbol, [])
+
+
+class _FakeDeribit(DeribitClient):
+    def get_index_price(self, symbol):
+        time.sleep(DELAY)
+        return 3000.0
+
+    def get_options_chain_data(self, symbol):
+        time.sleep(DELAY)
+        return [OpenInterestLevel(strike=k, call_oi=c, put_oi=p, net_oi=c - p, total_oi=c + p,
+                                  call_volume=0, put_volume=0)
+                for k, c, p in ((2900.0, 10, 50), (3000.0, 40, 40), (3100.0, 60, 5))]
+
+
+def _provider():
+    provider = CryptoDataProvider()
+    provider._coinglass = _FakeCoinGlass()
+    provider._deribit = _FakeDeribit()
+    return provider
+
+
+class TestSnapshotFanOut:
+    """Upstream requests for a snapshot run concurrently"""
+
+    def test_single_snapshot_is_one_round_trip(self):
+        provider = _provider()
+        start = time.monotonic()
+        snap = provider.get_snapshot("ETH")
+        elapsed = time.monotonic() - start
+
+        assert snap.spot_price == 3000.0
+        assert snap.funding_rate.rate == 0.0001
+        assert snap.max_pain == 3000.0
+        assert len(snap.pain_curve) == 3
+        assert snap.crypto_gex is not None
+        # Seven sequential calls would take 7 * DELAY
+        assert elapsed < 3 * DELAY
+
+    def test_get_snapshots_refreshes_all_symbols_in_one_pass(self):
+        provider = _provider()
+        start = time.monotonic()
+        snaps = provider.get_snapshots(["ETH", "BTC"])
+        elapsed = time.monotonic() - start
+
+        assert set(snaps) == {"ETH", "BTC"}
+        assert all(s is not None and s.symbol == sym for sym, s in snaps.items())
+        assert len(provider._coinglass.calls) == 10
+        # 10 CoinGlass calls on 5 workers, Deribit / spot alongside them
+        assert elapsed < 4 * DELAY
+
+    def test_cached_symbols_are_not_refetched(self):
+        provider = _provider()
+        first = provider.get_snapshot("ETH")
+        calls = len(provider._coinglass.calls)
+        assert provider.get_snapshots(["ETH"])["ETH"] is first
+        assert len(provider._coinglass.calls) == calls
+
+    def test_missing_spot_returns_none_and_is_not_cached(self):
+        provider = _provider()
+        provider._get_spot_price = lambda symbol: None
+        assert provider.get_snapshot("ETH") is None
+        assert "ETH" not in provider._snapshot_cache
+        assert provider._inflight == {}
+
+
+class TestSingleFlight:
+    """Concurrent callers share one refresh per symbol"""
+
+    def test_concurrent_callers_share_refresh(self):
+        provider = _provider()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(provider.get_snapshot("ETH")))
+                   for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 4
+        assert all(r is results[0] for r in results)
+        assert [c for c in provider._coinglass.calls if c[0] == "funding"] == [("funding", "ETH")]
+
+
+class TestUpstreamBudget:
+    """Token bucket shared across threads"""
+
+    def test_burst_then_interval(self):
+        budget = UpstreamBudget(interval_s=0.05, burst=3)
+        waits = [budget.acquire() for _ in range(5)]
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert all(w > 0 for w in waits[3:])
+
+    def test_threads_queue_on_one_budget(self):
+        budget = UpstreamBudget(interval_s=0.05, burst=1)
+        start = time.monotonic()
+        threads = [threading.Thread(target=budget.acquire) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # 1 immediate + 4 spaced slots
+        assert time.monotonic() - start >= 4 * 0.05 * 0.9
+
+
+class _BudgetedCoinGlass(_FakeCoinGlass):
+    """CoinGlass fake that queues every call on a (scaled) rate budget."""
+
+    def __init__(self, budget):
+        super().__init__()
+        self._budget = budget
+
+    def _call(self, name, symbol, value):
+        self._budget.acquire()
+        with self._lock:
+            self.calls.append((name, symbol))
+        return value
+
+
+class TestCacheFreshness:
+    """Short fixed TTL, publish-time stamps and re-warming before expiry"""
+
+    def test_entries_stamped_when_published(self):
+        # 4 coins * 5 calls on a 0.05s budget with burst 5: ~0.75s pass
+        budget = UpstreamBudget(interval_s=0.05, burst=5)
+        provider = _provider()
+        provider._coinglass = _BudgetedCoinGlass(budget)
+        symbols = ["ETH", "BTC", "SOL", "MATIC"]
+
+        start = time.time()
+        provider.get_snapshots(symbols)
+        end = time.time()
+
+        # Each entry is stamped when it was published, not when the pass began
+        stamps = [provider._snapshot_cache_time[s] for s in symbols]
+        assert stamps == sorted(stamps)
+        assert stamps[-1] - start >= 0.5 * (end - start)
+
+    def test_ttl_is_not_stretched_by_large_passes(self):
+        provider = _provider()
+        ttl = provider._cache_ttl
+        provider.get_snapshots(["ETH", "BTC", "SOL", "MATIC"])
+        assert provider._cache_ttl == ttl == 90
+
+    def test_rewarm_refreshes_only_entries_near_expiry(self):
+        provider = _provider()
+        provider.get_snapshots(["ETH", "BTC"])
+        now = time.time()
+        provider._snapshot_cache_time["ETH"] = now - (provider._cache_ttl - SNAPSHOT_REWARM_LEAD_S + 1)
+        provider._snapshot_cache_time["BTC"] = now - 1
+        provider._coinglass.calls.clear()
+
+        provider.rewarm_snapshots(["ETH", "BTC"])
+
+        assert {symbol for _, symbol in provider._coinglass.calls} == {"ETH"}
+        assert time.time() - provider._snapshot_cache_time["ETH"] < 1
+
+    def test_stalest_symbols_are_fetched_first(self):
+        provider = _provider()
+        provider.get_snapshots(["ETH", "BTC"])
+        provider._snapshot_cache_time["ETH"] = 2.0
+        provider._snapshot_cache_time["BTC"] = 1.0
+        provider._coinglass.calls.clear()
+
+        provider.get_snapshots(["ETH", "BTC"])
+
+        assert [s for name, s in provider._coinglass.calls if name == "funding"][0] == "BTC"
+
+    def test_pools_are_reused_across_refreshes(self):
+        provider = _provider()
+        pools = (provider._coinglass_pool, provider._fast_pool)
+        provider.get_snapshot("ETH")
+        provider._snapshot_cache.clear()
+        provider.get_snapshot("ETH")
+        assert (provider._coinglass_pool, provider._fast_pool) == pools
@@ -190,5 +190,117 @@ class TestStrikeRangeValidation:
             assert min_strike < max_strike
 
 
+class TestColumnarGEXParity:
+    """Columnar (NumPy) GEX path must match the dict implementation"""
+
+    @staticmethod
+    def _random_chain(seed, n_strikes=60, spot=5850.0):
+        import random
+        rng = random.Random(seed)
+        contracts = []
+        for i in range(n_strikes):
+            strike = spot - n_strikes * 2.5 + i * 5
+            for option_type in ('call', 'put'):
+                # Several expirations per strike so the group-by has work to do
+                for _ in range(rng.randint(1, 3)):
+                    contracts.append({
+                        'strike': strike,
+                        'gamma': rng.choice([0.0, rng.uniform(0.0001, 0.01)]),
+                        'open_interest': rng.choice([0, rng.randint(1, 20000)]),
+                        'option_type': option_type,
+                    })
+        return contracts
+
+    @staticmethod
+    def _assert_same(dict_result, array_result):
+        assert array_result.net_gex == pytest.approx(dict_result.net_gex, rel=1e-9, abs=1e-6)
+        assert array_result.call_gex == pytest.approx(dict_result.call_gex, rel=1e-9)
+        assert array_result.put_gex == pytest.approx(dict_result.put_gex, rel=1e-9)
+        assert array_result.call_wall == dict_result.call_wall
+        assert array_result.put_wall == dict_result.put_wall
+        assert array_result.gamma_flip == pytest.approx(dict_result.gamma_flip, rel=1e-9)
+        assert array_result.max_pain == dict_result.max_pain
+        assert array_result.data_source == dict_result.data_source
+        assert len(array_result.strikes_data) == len(dict_result.strikes_data)
+        for a, d in zip(array_result.strikes_data, dict_result.strikes_data):
+            assert a['strike'] == d['strike']
+            assert a['net_gex'] == pytest.approx(d['net_gex'], rel=1e-9, abs=1e-6)
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_parity_random_chains(self, seed):
+        from data.gex_calculator import (
+            calculate_gex_from_chain, calculate_gex_from_arrays, option_chain_to_arrays
+        )
+
+        contracts = self._random_chain(seed)
+        spot = 5850.0 + (seed % 7) * 3.3
+        expected = calculate_gex_from_chain('SPX', spot, contracts)
+        actual = calculate_gex_from_arrays('SPX', spot, *option_chain_to_arrays(contracts))
+        self._assert_same(expected, actual)
+
+    def test_parity_option_chain_objects(self, mock_option_chain):
+        from data.gex_calculator import (
+            calculate_gex_from_chain, calculate_gex_from_arrays, option_chain_to_arrays
+        )
+        from data.tradier_data_fetcher import OptionChain, OptionContract
+
+        contracts = [
+            OptionContract(
+                symbol=c['symbol'], underlying='SPY', strike=c['strike'],
+                expiration=c['expiration'], option_type=c['option_type'],
+                open_interest=c['open_interest'], gamma=c['gamma'],
+            )
+            for c in mock_option_chain
+        ]
+        chain = OptionChain(underlying='SPY', underlying_price=585.0,
+                            chains={contracts[0].expiration: contracts})
+
+        expected = calculate_gex_from_chain('SPY', 585.0, mock_option_chain)
+        actual = calculate_gex_from_arrays('SPY', 585.0, *option_chain_to_arrays(chain))
+        self._assert_same(expected, actual)
+
+    def test_parity_sparse_and_empty(self):
+        from data.gex_calculator import (
+            calculate_gex_from_chain, calculate_gex_from_arrays, option_chain_to_arrays
+        )
+
+        single = [{'strike': 100.0, 'gamma': 0.02, 'open_interest': 10, 'option_type': 'call'}]
+        self._assert_same(
+            calculate_gex_from_chain('X', 100.0, single),
+            calculate_gex_from_arrays('X', 100.0, *option_chain_to_arrays(single)),
+        )
+
+        no_oi = [{'strike': 100.0, 'gamma': 0.02, 'open_interest': 0, 'option_type': 'put'}]
+        self._assert_same(
+            calculate_gex_from_chain('X', 100.0, no_oi),
+            calculate_gex_from_arrays('X', 100.0, *option_chain_to_arrays(no_oi)),
+        )
+
+        empty = calculate_gex_from_arrays('X', 100.0, *option_chain_to_arrays([]))
+        assert empty.data_source == 'empty'
+        assert empty.call_wall == empty.put_wall == 100.0
+
+    def test_compute_walls_from_arrays_matches_compute_walls(self):
+        import random
+        from data.gex_calculator import compute_walls, compute_walls_from_arrays
+
+        rng = random.Random(7)
+        for _ in range(200):
+            strikes = sorted(rng.sample(range(90, 111), rng.randint(1, 8)))
+            rows = [
+                {'strike': float(s),
+                 'call_gamma': rng.choice([0.0, 1.0, 2.0]),
+                 'put_gamma': -rng.choice([0.0, 1.0, 2.0])}
+                for s in strikes
+            ]
+            spot = rng.choice([89.0, 100.0, 100.5, 112.0, float(strikes[0])])
+            assert compute_walls_from_arrays(
+                [r['strike'] for r in rows],
+                [r['call_gamma'] for r in rows],
+                [r['put_gamma'] for r in rows],
+                spot,
+            ) == compute_walls(rows, spot)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
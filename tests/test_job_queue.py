@@ -0,0 +1,124 @@
+"""
+Job Queue Tests
+
+Claiming, priorities, wakeups and stale-claim recovery in
+backend/services/job_queue.py, against a mocked database connection.
+
+Run with: pytest tests/test_job_queue.py -v
+"""
+
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services import job_queue
+from backend.services.job_queue import JobListener, JobType, LANES
+
+
+def _mock_connection(fetchone=None, fetchall=None, rowcount=1):
+    conn = MagicMock()
+    cursor = MagicMock()
+    cursor.fetchone.return_value = fetchone
+    cursor.fetchall.return_value = fetchall or []
+    cursor.rowcount = rowcount
+    conn.cursor.return_value = cursor
+    return conn, cursor
+
+
+def _sql(cursor, i=0):
+    return ' '.join(cursor.execute.call_args_list[i][0][0].split())
+
+
+class TestClaim:
+    """claim_job is one atomic SKIP LOCKED statement per lane"""
+
+    def setup_method(self):
+        job_queue._table_ready = True
+
+    def test_claim_locks_with_skip_locked_in_priority_order(self):
+        conn, cursor = _mock_connection(fetchone={'job_id': 'j1', 'job_type': 'backtest', 'config': {}})
+        with patch.object(job_queue, 'get_connection', return_value=conn):
+            job = job_queue.claim_job('w1', LANES['short'])
+
+        sql = _sql(cursor)
+        assert sql.startswith('UPDATE background_jobs SET status')
+        assert 'FOR UPDATE SKIP LOCKED' in sql
+        assert 'ORDER BY priority ASC NULLS LAST, created_at ASC' in sql
+        assert 'RETURNING job_id, job_type, config' in sql
+        params = cursor.execute.call_args[0][1]
+        assert params[0] == 'running' and params[1] == 'w1'
+        assert params[3] == ['backtest', 'spx_backtest']
+        assert job == {'job_id': 'j1', 'job_type': 'backtest', 'config': {}}
+        conn.commit.assert_called_once()
+
+    def test_empty_lane_returns_none(self):
+        conn, cursor = _mock_connection(fetchone=None)
+        with patch.object(job_queue, 'get_connection', return_value=conn):
+            assert job_queue.claim_job('w1') is None
+        assert cursor.execute.call_args[0][1][3] is None
+
+    def test_ml_training_queues_behind_backtests(self):
+        assert job_queue.DEFAULT_PRIORITY[JobType.BACKTEST] < job_queue.DEFAULT_PRIORITY[JobType.ML_TRAINING]
+        assert JobType.ML_TRAINING not in LANES['short']
+        assert set(LANES['any']) == set(JobType)
+
+
+class TestEnqueue:
+    """enqueue_job stores the priority and notifies listeners in the same transaction"""
+
+    def test_enqueue_notifies(self):
+        job_queue._table_ready = True
+        conn, cursor = _mock_connection()
+        with patch.object(job_queue, 'get_connection', return_value=conn):
+            job_id = job_queue.enqueue_ml_training_job({'x': 1})
+
+        assert job_id.startswith('ml_training_')
+        insert_params = cursor.execute.call_args_list[0][0][1]
+        assert insert_params[-1] == job_queue.DEFAULT_PRIORITY[JobType.ML_TRAINING]
+        assert _sql(cursor, 1) == 'SELECT pg_notify(%s, %s)'
+        assert cursor.execute.call_args_list[1][0][1] == (job_queue.JOB_CHANNEL, 'ml_training')
+        conn.commit.assert_called_once()
+
+
+class TestStaleRecovery:
+    """requeue_stale_jobs requeues dead claims and wakes workers"""
+
+    def test_requeued_jobs_notify(self):
+        rows = [{'job_id': 'a', 'job_type': 'backtest', 'status': 'pending'},
+                {'job_id': 'b', 'job_type': 'ml_training', 'status': 'failed'}]
+        conn, cursor = _mock_connection(fetchall=rows)
+        with patch.object(job_queue, 'get_connection', return_value=conn):
+            assert job_queue.requeue_stale_jobs(stale_after_seconds=60, max_attempts=3) == 2
+
+        assert 'FOR UPDATE SKIP LOCKED' in _sql(cursor)
+        notifies = [c[0][1] for c in cursor.execute.call_args_list[1:]]
+        assert notifies == [(job_queue.JOB_CHANNEL, 'backtest')]
+
+    def test_completion_is_guarded_by_claim(self):
+        conn, cursor = _mock_connection(rowcount=0)
+        with patch.object(job_queue, 'get_connection', return_value=conn):
+            job_queue.complete_job('a', {'ok': True}, worker_id='w1')
+        assert 'worker_id = %s' in _sql(cursor)
+        assert cursor.execute.call_args[0][1][-2:] == ('w1', 'w1')
+
+
+class TestListener:
+    """LISTEN wakeups with a polling fallback"""
+
+    def test_without_database_falls_back_to_sleep(self):
+        listener = JobListener(database_url='')
+        start = time.monotonic()
+        assert listener.wait(0.05) == []
+        assert time.monotonic() - start >= 0.05
+
+    def test_returns_notification_payloads(self):
+        listener = JobListener(database_url='postgres://unused')
+        conn = MagicMock()
+        conn.notifies = [MagicMock(payload='backtest')]
+        listener._conn = conn
+        with patch.object(job_queue.select, 'select', return_value=([conn], [], [])):
+            assert listener.wait(5) == ['backtest']
+        assert conn.notifies == []
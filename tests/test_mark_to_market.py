@@ -4,6 +4,8 @@ Tests for mark-to-market option pricing calculations.
 Tests the mid-price P&L calculation for Iron Condors and vertical spreads.
 """
 
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -299,3 +301,181 @@ class TestMissingQuotes:
 
         assert result['success'] is False
         assert 'call_long' in result['error']
+
+
+IC_QUOTES = {
+    'SPXW260126P05900000': {'bid': 0.40, 'ask': 0.80, 'last': 0.50},
+    'SPXW260126P05890000': {'bid': 0.10, 'ask': 0.30, 'last': 0.15},
+    'SPXW260126C06100000': {'bid': 1.80, 'ask': 2.20, 'last': 1.90},
+    'SPXW260126C06110000': {'bid': 0.20, 'ask': 0.40, 'last': 0.25},
+}
+
+
+def _ic_position(bot='anchor', position_id='IC-1', contracts=1, credit=3.50):
+    from trading.mark_to_market import MTMPosition
+    return MTMPosition(
+        bot=bot, position_id=position_id, underlying='SPX', expiration='2026-01-26',
+        structure='iron_condor',
+        strikes={'put_short': 5900, 'put_long': 5890, 'call_short': 6100, 'call_long': 6110},
+        contracts=contracts, entry_price=credit,
+    )
+
+
+class TestQuoteCache:
+    """Tests for the bounded LRU/TTL quote cache."""
+
+    def test_lru_eviction(self):
+        from trading.mark_to_market import QuoteCache
+
+        cache = QuoteCache(max_entries=2, ttl_seconds=30)
+        cache.put('A', {'bid': 1})
+        cache.put('B', {'bid': 2})
+        assert cache.get('A') == {'bid': 1}  # A is now most recently used
+        cache.put('C', {'bid': 3})
+
+        assert 'B' not in cache
+        assert 'A' in cache and 'C' in cache
+        assert cache.stats()['evictions'] == 1
+
+    def test_ttl_expiry_counts_as_miss(self):
+        from trading.mark_to_market import QuoteCache
+
+        cache = QuoteCache(max_entries=10, ttl_seconds=30)
+        cache.put('A', {'bid': 1})
+        with patch('trading.mark_to_market.time.time', return_value=time.time() + 31):
+            assert cache.get('A') is None
+
+        stats = cache.stats()
+        assert stats['expired'] == 1
+        assert stats['misses'] == 1
+        assert stats['total_entries'] == 0
+
+
+class TestBatchQuotes:
+    """Tests for deduped, chunked quote fetching."""
+
+    def setup_method(self):
+        from trading.mark_to_market import clear_quote_cache
+        clear_quote_cache()
+
+    def test_chunks_and_dedupes(self):
+        from trading import mark_to_market
+
+        requested = []
+
+        def fake_request(method, endpoint, params=None):
+            symbols = params['symbols'].split(',')
+            requested.append(symbols)
+            return {'quotes': {'quote': [{'symbol': s, 'bid': 1.0, 'ask': 1.2} for s in symbols]}}
+
+        client = MagicMock()
+        client._make_request.side_effect = fake_request
+        symbols = [f'SPY260126C{500000 + i * 1000:08d}' for i in range(25)]
+
+        with patch.object(mark_to_market, '_get_tradier_client', return_value=client), \
+                patch.object(mark_to_market, 'QUOTE_CHUNK_SIZE', 10):
+            quotes = mark_to_market.get_option_quotes_batch(symbols + symbols[:5])
+            again = mark_to_market.get_option_quotes_batch(symbols)
+
+        assert sorted(len(chunk) for chunk in requested) == [5, 10, 10]
+        assert set(quotes) == set(symbols)
+        assert again == quotes  # second call served entirely from cache
+        assert mark_to_market.get_cache_stats()['hits'] == 25
+
+
+class TestMarkPositions:
+    """Tests for the vectorized fleet marking pass."""
+
+    def test_matches_single_position_ic(self):
+        from trading.mark_to_market import mark_positions, calculate_ic_mark_to_market
+
+        with patch('trading.mark_to_market.get_option_quotes_batch', return_value=IC_QUOTES):
+            [fleet] = mark_positions([_ic_position(contracts=2)])
+            single = calculate_ic_mark_to_market(
+                underlying='SPX', expiration='2026-01-26',
+                put_short_strike=5900, put_long_strike=5890,
+                call_short_strike=6100, call_long_strike=6110,
+                contracts=2, entry_credit=3.50, use_cache=False
+            )
+
+        assert fleet['success'] is True
+        assert fleet['current_value'] == pytest.approx(single['current_value'])
+        assert fleet['unrealized_pnl'] == pytest.approx(single['unrealized_pnl'])
+        assert fleet['leg_prices']['put_short_mid'] == pytest.approx(0.60)
+
+    def test_matches_single_position_spread(self):
+        from trading.mark_to_market import MTMPosition, mark_positions, calculate_spread_mark_to_market
+
+        quotes = {
+            'SPY260126C00590000': {'bid': 3.00, 'ask': 3.20, 'last': 3.10},
+            'SPY260126C00595000': {'bid': 1.00, 'ask': 1.20, 'last': 1.10},
+        }
+        position = MTMPosition(
+            bot='solomon', position_id='SP-1', underlying='SPY', expiration='2026-01-26',
+            structure='spread', strikes={'long': 590, 'short': 595},
+            contracts=3, entry_price=1.50, spread_type='BULL_CALL',
+        )
+        with patch('trading.mark_to_market.get_option_quotes_batch', return_value=quotes):
+            [fleet] = mark_positions([position])
+            single = calculate_spread_mark_to_market(
+                underlying='SPY', expiration='2026-01-26', long_strike=590, short_strike=595,
+                spread_type='BULL_CALL', contracts=3, entry_debit=1.50, use_cache=False
+            )
+
+        assert fleet['unrealized_pnl'] == pytest.approx(single['unrealized_pnl'])
+        assert fleet['unrealized_pnl'] == pytest.approx(150.0)
+
+    def test_one_fetch_of_unique_legs_across_bots(self):
+        from trading.mark_to_market import mark_positions
+
+        positions = [_ic_position(bot, f'{bot}-{i}') for bot in ('anchor', 'samson') for i in range(5)]
+        with patch('trading.mark_to_market.get_option_quotes_batch', return_value=IC_QUOTES) as batch:
+            results = mark_positions(positions)
+
+        batch.assert_called_once()
+        assert sorted(batch.call_args[0][0]) == sorted(IC_QUOTES)
+        assert all(r['success'] for r in results)
+        assert [r['bot'] for r in results] == [p.bot for p in positions]
+
+    def test_missing_leg_fails_only_that_position(self):
+        from trading.mark_to_market import MTMPosition, mark_positions
+
+        other = MTMPosition(
+            bot='gideon', position_id='SP-2', underlying='SPY', expiration='2026-01-26',
+            structure='spread', strikes={'long': 590, 'short': 595},
+            contracts=1, entry_price=1.00, spread_type='BEAR_PUT',
+        )
+        with patch('trading.mark_to_market.get_option_quotes_batch', return_value=IC_QUOTES):
+            ic, spread = mark_positions([_ic_position(), other])
+
+        assert ic['success'] is True
+        assert spread['success'] is False
+        assert 'long' in spread['error'] and 'short' in spread['error']
+
+
+class TestFleetMarkToMarket:
+    """Tests for loading and aggregating the fleet."""
+
+    def setup_method(self):
+        from trading.mark_to_market import clear_quote_cache
+        clear_quote_cache()
+
+    def test_per_bot_totals(self):
+        from trading import mark_to_market
+
+        ic_row = ('IC-1', 3.50, 1, 5900, 5890, 6100, 6110, '2026-01-26', None)
+        cursor = MagicMock()
+        cursor.fetchall.side_effect = lambda: [ic_row] if 'anchor' in cursor.execute.call_args[0][0] else []
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+
+        with patch('database_adapter.get_connection', return_value=conn), \
+                patch.object(mark_to_market, 'get_option_quotes_batch', return_value=IC_QUOTES):
+            fleet = mark_to_market.get_fleet_mark_to_market()
+            again = mark_to_market.get_fleet_mark_to_market()
+
+        assert again is fleet  # shared within max_age
+        assert fleet['anchor']['method'] == 'mark_to_market'
+        assert fleet['anchor']['unrealized_pnl'] == pytest.approx(140.0)
+        assert fleet['fortress']['method'] == 'none'
+        assert cursor.execute.call_count == len(mark_to_market.FLEET_MTM_BOTS)
@@ -0,0 +1,237 @@
+"""
+Market Snapshot Bus Tests
+
+Tests for the shared per-tick market snapshot (data/market_snapshot.py).
+
+Run with: pytest tests/test_market_snapshot.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.market_snapshot import MarketSnapshotBus
+from data.tradier_data_fetcher import OptionChain, OptionContract
+
+
+class FakeFetcher:
+    """Counts calls; returns a small SPY chain around 585."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.quote_calls = []
+        self.chain_calls = []
+        self.lock = threading.Lock()
+
+    def get_quotes(self, symbols):
+        time.sleep(self.delay)
+        with self.lock:
+            self.quote_calls.append(tuple(symbols))
+        return {s: {'symbol': s, 'last': 585.0 if s == 'SPY' else 5850.0} for s in symbols}
+
+    def get_option_chain(self, symbol, expiration=None, greeks=True, underlying_price=None):
+        time.sleep(self.delay)
+        with self.lock:
+            self.chain_calls.append((symbol, expiration, underlying_price))
+        exp = expiration or '2024-12-20'
+        contracts = [
+            OptionContract(symbol=f'{symbol}{k}{t[0]}', underlying=symbol, strike=k, expiration=exp,
+                           option_type=t, open_interest=oi, gamma=g)
+            for k, t, oi, g in [(580, 'put', 500, 0.03), (585, 'call', 400, 0.05),
+                                (585, 'put', 300, 0.05), (590, 'call', 800, 0.03)]
+        ]
+        return OptionChain(underlying=symbol, underlying_price=underlying_price or 0, chains={exp: contracts})
+
+
+def make_bus(fetcher=None, max_age=60.0, vix=18.5):
+    vix_calls = []
+
+    def vix_source():
+        vix_calls.append(1)
+        return vix
+
+    bus = MarketSnapshotBus(fetcher=fetcher or FakeFetcher(), vix_source=vix_source, max_age=max_age)
+    return bus, vix_calls
+
+
+class TestSnapshotReads:
+    """Miss -> fetch once -> hit for every later reader"""
+
+    def test_quote_miss_then_hit(self):
+        fetcher = FakeFetcher()
+        bus, _ = make_bus(fetcher)
+
+        assert bus.get_price('SPY') == 585.0
+        assert bus.get_price('SPY') == 585.0
+        assert len(fetcher.quote_calls) == 1
+
+        stats = bus.get_stats()
+        assert stats['misses'] == 1 and stats['hits'] == 1
+        assert stats['watching']['quotes'] == ['SPY']
+
+    def test_vix_fetched_once(self):
+        bus, vix_calls = make_bus()
+        assert bus.get_vix() == 18.5
+        assert bus.get_vix() == 18.5
+        assert len(vix_calls) == 1
+
+    def test_gex_matches_calculator_format(self):
+        from data.gex_calculator import (
+            calculate_gex_from_arrays, format_gex_result, option_chain_to_arrays
+        )
+        fetcher = FakeFetcher()
+        bus, _ = make_bus(fetcher)
+
+        gex = bus.get_gex('SPY')
+        chain = fetcher.get_option_chain('SPY', underlying_price=585.0)
+        expected = format_gex_result(calculate_gex_from_arrays('SPY', 585.0, *option_chain_to_arrays(chain)))
+
+        for key in ('net_gex', 'call_wall', 'put_wall', 'gamma_flip', 'max_pain', 'data_source'):
+            assert gex[key] == expected[key]
+        # Chain fetch reused the snapshot quote instead of re-quoting
+        assert fetcher.chain_calls[0] == ('SPY', None, 585.0)
+        assert bus.get_gex('SPY') is gex
+
+    def test_snapshot_is_read_only(self):
+        bus, _ = make_bus()
+        bus.get_price('SPY')
+        snap = bus.snapshot()
+        with pytest.raises(TypeError):
+            snap.quotes['QQQ'] = {}
+
+
+class TestSnapshotRefresh:
+    """Versioning, batching and single-flight refresh"""
+
+    def test_refresh_batches_watched_items(self):
+        fetcher = FakeFetcher()
+        bus, vix_calls = make_bus(fetcher)
+        bus.get_price('SPX')
+        bus.get_gex('SPY')
+        bus.get_vix()
+        fetcher.quote_calls.clear()
+        fetcher.chain_calls.clear()
+
+        before = bus.snapshot().version
+        snap = bus.refresh()
+
+        assert snap.version == before + 1
+        assert fetcher.quote_calls == [('SPX', 'SPY')]  # one batched quote call
+        assert fetcher.chain_calls == [('SPY', None, 585.0)]
+        assert len(vix_calls) == 2
+        assert set(snap.gex) == {'SPY'}
+
+    def test_stale_snapshot_single_flight(self):
+        fetcher = FakeFetcher(delay=0.05)
+        bus, _ = make_bus(fetcher, max_age=0.5)
+        bus.get_gex('SPY')
+        fetcher.quote_calls.clear()
+        fetcher.chain_calls.clear()
+        refreshes = bus.get_stats()['refreshes']
+        time.sleep(0.6)  # snapshot is now stale for every reader
+
+        barrier = threading.Barrier(8)
+        results = []
+
+        def bot():
+            barrier.wait()
+            results.append(bus.get_gex('SPY')['net_gex'])
+
+        threads = [threading.Thread(target=bot) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(results) == 8 and len(set(results)) == 1
+        assert len(fetcher.quote_calls) == 1
+        assert len(fetcher.chain_calls) == 1
+        assert bus.get_stats()['refreshes'] == refreshes + 1
+
+    def test_failed_refresh_serves_previous_snapshot(self):
+        fetcher = FakeFetcher()
+        bus, _ = make_bus(fetcher, max_age=0.0)
+        assert bus.get_price('SPY') == 585.0
+        good = bus._snapshot
+
+        def boom(*args, **kwargs):
+            raise RuntimeError('refresh exploded')
+
+        bus._refresh_locked = boom
+        time.sleep(0.01)
+        assert bus.snapshot() is good
+        stats = bus.get_stats()
+        assert stats['refresh_errors'] == 1 and stats['stale_serves'] == 1
+
+    def test_fetch_errors_are_counted_not_raised(self):
+        class Broken(FakeFetcher):
+            def get_quotes(self, symbols):
+                raise ConnectionError('tradier down')
+
+        bus, _ = make_bus(Broken())
+        assert bus.get_price('SPY') == 0.0
+        assert bus.get_gex('SPY') is None
+        assert bus.get_stats()['fetch_errors'] >= 1
+
+    def test_empty_refresh_keeps_previous_snapshot(self):
+        fetcher = FakeFetcher()
+        bus, _ = make_bus(fetcher, vix=None)
+        bus.get_gex('SPY')
+        good = bus._snapshot
+
+        def down(*args, **kwargs):
+            raise ConnectionError('tradier down')
+
+        fetcher.get_quotes = down
+        fetcher.get_option_chain = down
+        assert bus.refresh() is good
+        assert bus._snapshot is good
+        assert bus.get_gex('SPY') is good.gex['SPY']
+        stats = bus.get_stats()
+        assert stats['refresh_errors'] == 1 and stats['stale_serves'] == 1
+
+    def test_partial_refresh_carries_missing_entries_over(self):
+        fetcher = FakeFetcher()
+        bus, _ = make_bus(fetcher)
+        bus.get_price('SPX')
+        bus.get_gex('SPY')
+        bus.get_vix()
+        old = bus._snapshot
+
+        # SPX quote and the SPY chain come back missing, VIX fails
+        fetcher.get_quotes = lambda symbols: {'SPY': {'symbol': 'SPY', 'last': 586.0}}
+        fetcher.get_option_chain = lambda *args, **kwargs: None
+        bus._vix_source = lambda: None
+
+        snap = bus.refresh()
+        assert snap.version == old.version + 1
+        assert snap.quotes['SPY']['last'] == 586.0
+        assert snap.quotes['SPX'] is old.quotes['SPX']
+        assert snap.chains[('SPY', None)] is old.chains[('SPY', None)]
+        assert snap.gex['SPY'] is old.gex['SPY']
+        assert snap.vix == old.vix
+        assert bus.get_stats()['carried_over'] == 4
+
+
+class TestTradierBatchQuotes:
+    """TradierDataFetcher.get_quotes issues one request for many symbols"""
+
+    def test_get_quotes_single_request(self):
+        from data.tradier_data_fetcher import TradierDataFetcher
+        fetcher = TradierDataFetcher(api_key='snapshot-key', account_id='acct', sandbox=True)
+        calls = []
+
+        def fake(method, endpoint, params=None, data=None, max_retries=3):
+            calls.append(params['symbols'])
+            return {'quotes': {'quote': [{'symbol': 'SPY', 'last': 585.0}, {'symbol': 'SPX', 'last': 5850.0}]}}
+
+        fetcher._make_request = fake
+        quotes = fetcher.get_quotes(['SPY', 'SPX', 'SPY'])
+
+        assert calls == ['SPY,SPX']
+        assert quotes['SPX']['last'] == 5850.0
@@ -0,0 +1,126 @@
+"""
+Max Pain Tests
+
+Parity of the shared prefix-sum routine (data/max_pain.py) with the
+strikes^2 loops it replaced in the GEX and Deribit crypto paths.
+
+Run with: pytest tests/test_max_pain.py -v
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.max_pain import pain_curve
+from data.gex_calculator import calculate_max_pain, calculate_gex_from_chain
+from data.crypto_data_provider import DeribitClient, OpenInterestLevel
+
+
+def _loop_pain(strikes, call_oi, put_oi, candidate):
+    """Pain at one candidate, summed the way the original loops did."""
+    pain = 0.0
+    for k, c, p in zip(strikes, call_oi, put_oi):
+        if candidate > k:
+            pain += (candidate - k) * c
+        if candidate < k:
+            pain += (k - candidate) * p
+    return pain
+
+
+def _random_chain(rng):
+    n = int(rng.integers(1, 60))
+    step = float(rng.choice([0.5, 1.0, 5.0, 250.0]))
+    base = float(rng.choice([5.0, 580.0, 5800.0, 95000.0]))
+    strikes = base + step * rng.choice(np.arange(-40, 41), size=n, replace=False)
+    # Sparse OI with exact zeros, and small integers so ties actually happen
+    call_oi = rng.integers(0, 6, size=n) * rng.integers(0, 2, size=n)
+    put_oi = rng.integers(0, 6, size=n) * rng.integers(0, 2, size=n)
+    return strikes.tolist(), call_oi.tolist(), put_oi.tolist()
+
+
+class TestPainCurve:
+    """Prefix-sum curve against the direct per-candidate sum"""
+
+    @pytest.mark.parametrize('seed', range(200))
+    def test_curve_matches_loop(self, seed):
+        strikes, call_oi, put_oi = _random_chain(np.random.default_rng(seed))
+        curve = pain_curve(strikes, call_oi, put_oi)
+
+        assert curve.strikes.tolist() == sorted(strikes)
+        expected = [_loop_pain(strikes, call_oi, put_oi, k) for k in curve.strikes.tolist()]
+        np.testing.assert_allclose(curve.pain, expected, rtol=1e-9, atol=1e-6)
+
+        # Lowest strike among those with the minimal pain
+        best = min(expected)
+        assert curve.max_pain == min(k for k, v in zip(curve.strikes.tolist(), expected) if v == best)
+
+    def test_duplicate_strikes_are_merged(self):
+        curve = pain_curve([100.0, 105.0, 100.0], [1, 0, 2], [0, 4, 0])
+        assert curve.strikes.tolist() == [100.0, 105.0]
+        assert curve.pain.tolist() == [20.0, 15.0]
+        assert curve.max_pain == 105.0
+
+    def test_multiplier_scales_pain_only(self):
+        strikes, call_oi, put_oi = [90.0, 100.0, 110.0], [3, 1, 2], [1, 4, 2]
+        plain, scaled = pain_curve(strikes, call_oi, put_oi), pain_curve(strikes, call_oi, put_oi, multiplier=100)
+        np.testing.assert_allclose(scaled.pain, plain.pain * 100)
+        assert scaled.max_pain == plain.max_pain
+
+    def test_empty(self):
+        assert pain_curve([], [], []).max_pain is None
+        assert pain_curve([], [], []).to_list() == []
+
+
+class TestCallSites:
+    """GEX and Deribit call sites keep the original strike choice"""
+
+    @pytest.mark.parametrize('seed', range(50))
+    def test_gex_calculate_max_pain(self, seed):
+        strikes, call_oi, put_oi = _random_chain(np.random.default_rng(seed))
+        calls = {k: c for k, c in zip(strikes, call_oi) if c}
+        puts = {k: p for k, p in zip(strikes, put_oi) if p}
+        result = calculate_max_pain(calls, puts, 500.0)
+        if not calls and not puts:
+            assert result == 500.0
+            return
+
+        candidates = sorted(set(calls) | set(puts))
+        pains = [_loop_pain(list(calls) + list(puts), list(calls.values()) + [0] * len(puts),
+                            [0] * len(calls) + list(puts.values()), k) * 100 for k in candidates]
+        assert result == candidates[pains.index(min(pains))]
+
+    def test_gex_result_pain_curve(self):
+        chain = [
+            {'strike': 95.0, 'gamma': 0.02, 'open_interest': 300, 'option_type': 'put'},
+            {'strike': 100.0, 'gamma': 0.05, 'open_interest': 100, 'option_type': 'call'},
+            {'strike': 100.0, 'gamma': 0.05, 'open_interest': 100, 'option_type': 'put'},
+            {'strike': 105.0, 'gamma': 0.02, 'open_interest': 300, 'option_type': 'call'},
+        ]
+        result = calculate_gex_from_chain('SPY', 100.0, chain)
+        assert [p['strike'] for p in result.pain_curve] == [95.0, 100.0, 105.0]
+        assert min(result.pain_curve, key=lambda p: p['pain'])['strike'] == result.max_pain == 100.0
+        assert result.pain_curve[0]['pain'] == 5 * 100 * 100
+
+    @pytest.mark.parametrize('seed', range(50))
+    def test_deribit_calculate_max_pain(self, seed):
+        strikes, call_oi, put_oi = _random_chain(np.random.default_rng(seed))
+        levels = sorted(
+            (OpenInterestLevel(strike=k, call_oi=c, put_oi=p, net_oi=c - p, total_oi=c + p,
+                               call_volume=0, put_volume=0)
+             for k, c, p in zip(strikes, call_oi, put_oi)),
+            key=lambda level: level.strike,
+        )
+        client = DeribitClient.__new__(DeribitClient)
+
+        # Original loop: ascending levels, strict <, so ties keep the lowest strike
+        best, best_pain = None, float('inf')
+        for level in levels:
+            pain = _loop_pain(strikes, call_oi, put_oi, level.strike)
+            if pain < best_pain:
+                best, best_pain = level.strike, pain
+        assert client.calculate_max_pain(levels) == best
+        assert client.calculate_max_pain([]) is None
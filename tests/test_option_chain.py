@@ -0,0 +1,105 @@
+"""
+Option Chain Array Tests
+
+Tests for the sorted column view of a day's chain (backtest/option_chain.py)
+and the HybridFixedBacktester finders that select strikes from it.
+
+Run with: pytest tests/test_option_chain.py -v
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtest.option_chain import CHAIN_COLUMNS, OptionChain
+from backtest.orat_eod_cache import chain_rows, row_order
+
+
+def _opt(dte, strike, put_bid=1.0, put_ask=1.1, call_bid=1.0, call_ask=1.1, underlying=5000.0):
+    return {'dte': dte, 'strike': strike, 'underlying_price': underlying,
+            'put_bid': put_bid, 'put_ask': put_ask, 'call_bid': call_bid, 'call_ask': call_ask}
+
+
+class TestOptionChain:
+    """Candidate filters and tie-breaking match the list-based finders"""
+
+    def test_rows_are_sorted_per_dte(self):
+        chain = OptionChain.from_rows([_opt(1, 5010), _opt(0, 5005), _opt(1, 4990), _opt(0, 4995)])
+        rows = chain.rows(0)
+        assert chain.strike[rows].tolist() == [4995.0, 5005.0]
+        assert chain.strike[chain.rows(1)].tolist() == [4990.0, 5010.0]
+
+    def test_closest_tie_goes_to_first_input_row(self):
+        options = [_opt(0, 5010, put_bid=2.0), _opt(0, 4990, put_bid=3.0)]
+        chain = OptionChain.from_rows(options)
+        i = chain.closest(chain.candidates(chain.rows(0)), 5000)
+        assert chain.strike_at(i) == min(options, key=lambda o: abs(o['strike'] - 5000))['strike'] == 5010.0
+
+    def test_missing_quotes_never_pass_filters(self):
+        chain = OptionChain.from_rows([_opt(0, 4990, put_bid=None), _opt(0, 4980, put_bid=0.05),
+                                       _opt(0, 4970, put_bid=0.06)])
+        idx = chain.candidates(chain.rows(0), chain.above('put_bid', 0.05), below=5000)
+        assert chain.strike[idx].tolist() == [4970.0]
+        assert chain.quote(chain.first(chain.candidates(chain.rows(0), near=4990, within=2)), 'put_bid') == 0
+
+    def test_underlying_is_first_input_row_of_dte(self):
+        chain = OptionChain.from_rows([_opt(0, 5010, underlying=5001.0), _opt(0, 4990, underlying=4999.0)])
+        assert chain.underlying(0) == 5001.0
+
+    def test_column_build_matches_row_build(self):
+        options = sorted([_opt(d, k, put_bid=(None if k == 4995 else 1.0)) for d in (0, 2, 5)
+                          for k in (4990, 4995, 5000, 5005)], key=lambda o: (o['dte'], o['strike']))
+        columns = {c: np.array([np.nan if o[c] is None else o[c] for o in options]) for c in CHAIN_COLUMNS}
+        order = row_order(columns, 2)
+        rows = chain_rows(columns, order, CHAIN_COLUMNS)
+        a, b = OptionChain.from_rows(rows), OptionChain(columns, order)
+        assert a.available_dtes == b.available_dtes
+        assert np.array_equal(a.pos, b.pos)
+        assert np.array_equal(a.put_bid, b.put_bid, equal_nan=True)
+
+
+class TestHybridFixedFinders:
+    """Finders select the same strikes as the original list scans"""
+
+    def _backtester(self):
+        from backtest.zero_dte_hybrid_fixed import HybridFixedBacktester
+        bt = HybridFixedBacktester.__new__(HybridFixedBacktester)
+        bt.sd_multiplier = 1.0
+        bt.spread_width = 10.0
+        bt.debug_stats = {'strategy_failures': {k: 0 for k in (
+            'no_options', 'no_dtes', 'no_dte_options', 'no_otm_puts', 'no_otm_calls',
+            'no_long_put', 'no_long_call', 'bad_put_credit', 'bad_call_credit')}}
+        bt._option_chain = None
+        return bt
+
+    def _chain(self):
+        options = []
+        for k in range(4900, 5105, 5):
+            otm = abs(k - 5000) / 10.0
+            options.append(_opt(0, float(k), put_bid=max(0.0, 5 - otm * 0.4), put_ask=max(0.05, 5.2 - otm * 0.4),
+                                call_bid=max(0.0, 5 - otm * 0.4), call_ask=max(0.05, 5.2 - otm * 0.4)))
+        return options
+
+    def test_iron_condor_strikes(self):
+        result = self._backtester().find_iron_condor(self._chain(), 5000.0, 50.0, target_dte=0, use_raw_distance=True)
+        assert (result['put_short_strike'], result['put_long_strike']) == (4950.0, 4940.0)
+        assert (result['call_short_strike'], result['call_long_strike']) == (5050.0, 5060.0)
+        assert result['total_credit'] > 0
+
+    def test_chain_is_built_once_per_options_list(self):
+        bt, options = self._backtester(), self._chain()
+        bt.find_bull_put_spread(options, 5000.0, 50.0, 0, True)
+        chain = bt._option_chain[1]
+        bt.find_bear_call_spread(options, 5000.0, 50.0, 0, True)
+        assert bt._option_chain[1] is chain
+        bt.find_bear_call_spread(list(options), 5000.0, 50.0, 0, True)
+        assert bt._option_chain[1] is not chain
+
+    def test_missing_long_leg_counts_failure(self):
+        options = [o for o in self._chain() if o['strike'] != 4940.0]
+        bt = self._backtester()
+        assert bt.find_iron_condor(options, 5000.0, 50.0, target_dte=0, use_raw_distance=True) is None
+        assert bt.debug_stats['strategy_failures']['no_long_put'] == 1
@@ -0,0 +1,142 @@
+"""
+ORAT EOD Columnar Cache Tests
+
+Tests for the local orat_options_eod export and its reader
+(backtest/orat_eod_cache.py), and the hybrid backtesters reading from it.
+
+Run with: pytest tests/test_orat_eod_cache.py -v
+"""
+
+import json
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backtest.orat_eod_cache import CACHE_COLUMNS, OratEodCache, export_year
+
+
+def _row(trade_date, dte, strike, put_bid=1.0):
+    # (trade_date, strike, underlying_price, dte, put_bid, put_ask, call_bid, call_ask,
+    #  delta, put_iv, call_iv, gamma, call_oi, put_oi)
+    put_ask = None if put_bid is None else put_bid + 0.1
+    return (trade_date, Decimal(str(strike)), Decimal('5000.5'), dte, put_bid, put_ask,
+            1.5, 1.6, 0.5, 0.2, None, 0.01, 100, 200)
+
+
+ROWS = sorted(
+    [_row(date(2024, 3, d), dte, k) for d in (14, 15) for dte in (0, 1, 4, 8) for k in (4990, 5000, 5010)]
+    + [_row(date(2024, 3, 15), 2, 5005, put_bid=None)],
+    key=lambda r: (r[0], r[3], r[1]),
+)
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self._rows = list(rows)
+        self.itersize = None
+
+    def execute(self, sql, params):
+        ticker, start, end = params
+        self._rows = [r for r in self._rows if start <= r[0] < end]
+
+    def fetchmany(self, size):
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+    def close(self):
+        pass
+
+
+class _FakeConn:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def cursor(self, name=None):
+        return _FakeCursor(self.rows)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    assert export_year(_FakeConn(ROWS), 'SPX', 2024, str(tmp_path)) == len(ROWS)
+    return OratEodCache(str(tmp_path))
+
+
+class TestOratEodCache:
+    """Export round trip and chain lookups"""
+
+    def test_trading_days_and_coverage(self, cache):
+        assert cache.trading_days('SPX', '2024-01-01', '2024-12-31') == ['2024-03-14', '2024-03-15']
+        assert cache.trading_days('SPX', '2024-03-15', '2024-03-15') == ['2024-03-15']
+        assert cache.covers('SPX', '2024-01-01', '2024-06-30')
+        assert not cache.covers('SPX', '2023-06-01', '2024-06-30')
+
+    def test_stale_export_does_not_cover_later_days(self, tmp_path):
+        export_year(_FakeConn(ROWS), 'SPX', 2024, str(tmp_path))
+        meta_path = tmp_path / 'SPX' / '2024' / 'meta.json'
+        meta = json.loads(meta_path.read_text())
+        assert meta['max_trade_date'] == '2024-03-15'
+        # Exported mid-year, the Wednesday after the last trade date
+        meta['exported_at'] = '2024-03-20T18:00:00'
+        meta_path.write_text(json.dumps(meta))
+
+        cache = OratEodCache(str(tmp_path))
+        assert cache.covers('SPX', '2024-01-01', '2024-03-15')
+        assert cache.covers('SPX', '2024-03-01', '2024-03-19')
+        assert not cache.covers('SPX', '2024-01-01', '2024-03-20')
+        assert not cache.covers('SPX', '2024-01-01', '2024-06-30')
+
+    def test_export_without_max_trade_date_reads_index(self, tmp_path):
+        export_year(_FakeConn(ROWS), 'SPX', 2024, str(tmp_path))
+        meta_path = tmp_path / 'SPX' / '2024' / 'meta.json'
+        meta = json.loads(meta_path.read_text())
+        del meta['max_trade_date']
+        meta['exported_at'] = '2024-03-16T08:00:00'
+        meta_path.write_text(json.dumps(meta))
+
+        cache = OratEodCache(str(tmp_path))
+        assert cache.covers('SPX', '2024-03-01', '2024-03-15')
+        assert not cache.covers('SPX', '2024-03-01', '2024-03-18')
+
+    def test_options_match_query_rows(self, cache):
+        options = cache.options('SPX', '2024-03-15', 0, 4)
+        expected = [r for r in ROWS if r[0] == date(2024, 3, 15) and 0 <= r[3] <= 4]
+
+        assert [(o['dte'], o['strike']) for o in options] == [(r[3], float(r[1])) for r in expected]
+        first = options[0]
+        assert set(first) == set(CACHE_COLUMNS)
+        assert first['underlying_price'] == 5000.5 and first['call_iv'] is None
+        assert isinstance(first['dte'], int) and isinstance(first['put_oi'], float)
+        assert [o['put_bid'] for o in options if o['dte'] == 2] == [None]
+
+    def test_nearest_dte_ordering(self, cache):
+        options = cache.options('SPX', '2024-03-15', 0, 8, columns=['dte', 'strike'], nearest_dte=2)
+        keys = [(abs(o['dte'] - 2), o['strike']) for o in options]
+        assert keys == sorted(keys)
+        assert options[0] == {'dte': 2, 'strike': 5005.0}
+
+    def test_missing_day_or_window_is_empty(self, cache):
+        assert cache.options('SPX', '2024-03-16', 0, 8) == []
+        assert cache.options('SPX', '2024-03-15', 5, 7) == []
+        assert cache.options('SPX', '2025-01-02', 0, 8) == []
+
+
+class TestBacktesterIntegration:
+    """HybridFixedBacktester reads chains from the cache without a database"""
+
+    def test_hybrid_fixed_uses_cache(self, cache, monkeypatch):
+        from backtest.zero_dte_hybrid_fixed import HybridFixedBacktester
+
+        bt = HybridFixedBacktester(start_date='2024-03-01', end_date='2024-03-31',
+                                   orat_cache_dir=cache.root)
+        monkeypatch.setattr(bt, 'get_connection', lambda: pytest.fail("database used"))
+        bt.debug_mode = False
+
+        assert bt.get_trading_days() == ['2024-03-14', '2024-03-15']
+        options = bt.get_options_for_date('2024-03-15', 1)
+        assert {o['dte'] for o in options} == {0, 1, 2, 4, 8}
+        assert options[0]['dte'] == 1
@@ -373,6 +373,233 @@ class TestStrategyRecommendationLogic:
             pytest.skip("Prophet advisor not available")
 
 
+class TestProphetModelCache:
+    """Process-wide model cache: id-only version checks, one unpickle per model"""
+
+    @staticmethod
+    def _fake_db(rows):
+        """get_db_connection stand-in serving prophet_trained_models from `rows` (id -> row)."""
+        import pickle
+        from contextlib import contextmanager
+        calls = {'stamp': 0, 'blob': 0}
+
+        class Cursor:
+            def execute(self, sql, params=None):
+                self.sql, self.params = sql, params
+
+            def fetchone(self):
+                if 'WHERE id = %s' in self.sql:
+                    calls['blob'] += 1
+                    version, payload = rows['data'][self.params[0]]
+                    return (version, pickle.dumps(payload), None, True, None)
+                calls['stamp'] += 1
+                return (rows['active'],) if rows['active'] is not None else None
+
+        class Conn:
+            def cursor(self):
+                return Cursor()
+
+        @contextmanager
+        def get_db_connection():
+            yield Conn()
+
+        return get_db_connection, calls
+
+    @staticmethod
+    def _payload(tag):
+        return {'model': tag, 'calibrated_model': tag, 'scaler': None,
+                'feature_version': 3, 'feature_cols': ['vix'], 'base_rate': 0.8}
+
+    def test_version_check_only_deserializes_on_change(self):
+        from quant.prophet_advisor import ProphetModelCache
+
+        rows = {'active': 1, 'data': {1: ('2.0.0', self._payload('m1')), 2: ('2.0.0', self._payload('m2'))}}
+        fake_db, calls = self._fake_db(rows)
+        cache = ProphetModelCache(check_interval_seconds=0)
+
+        with patch('quant.prophet_advisor.DB_AVAILABLE', True), \
+             patch('quant.prophet_advisor.get_db_connection', fake_db):
+            first = cache.get()
+            assert cache.get() is first            # same row: stamp query only
+            rows['active'] = 2                     # retrain, same version string
+            second = cache.get()
+
+        assert first.saved['model'] == 'm1' and second.saved['model'] == 'm2'
+        assert calls['blob'] == 2
+        assert calls['stamp'] == 3
+        assert cache.stats['deserializations'] == 2
+
+    def test_check_interval_throttles_db(self):
+        from quant.prophet_advisor import ProphetModelCache
+
+        rows = {'active': 1, 'data': {1: ('2.0.0', self._payload('m1'))}}
+        fake_db, calls = self._fake_db(rows)
+        cache = ProphetModelCache(check_interval_seconds=3600)
+
+        with patch('quant.prophet_advisor.DB_AVAILABLE', True), \
+             patch('quant.prophet_advisor.get_db_connection', fake_db):
+            for _ in range(5):
+                cache.get()
+
+        assert calls == {'stamp': 1, 'blob': 1}
+
+    def test_advisors_share_cached_model_and_follow_new_row(self):
+        from quant.prophet_advisor import ProphetAdvisor, ProphetModelCache
+
+        rows = {'active': 7, 'data': {7: ('2.0.0', self._payload('m7')), 8: ('2.0.0', self._payload('m8'))}}
+        fake_db, calls = self._fake_db(rows)
+        cache = ProphetModelCache(check_interval_seconds=0)
+
+        with patch('quant.prophet_advisor.DB_AVAILABLE', True), \
+             patch('quant.prophet_advisor.get_db_connection', fake_db), \
+             patch('quant.prophet_advisor._model_cache', cache):
+            a = ProphetAdvisor(enable_claude=False)
+            b = ProphetAdvisor(enable_claude=False)
+            assert a.model == 'm7' and a.model is b.model
+            assert a._check_and_reload_model_if_stale() is False
+
+            rows['active'] = 8
+            assert a._check_and_reload_model_if_stale() is True
+            assert b._check_and_reload_model_if_stale() is True
+            assert a.model == 'm8' and a.model is b.model
+
+        assert calls['blob'] == 2
+
+
+class TestAdviceBatch:
+    """get_advice_batch: one predict_proba per model per tick, same advice as per-bot calls"""
+
+    BOTS = ['FORTRESS', 'FAITH', 'ANCHOR', 'SAMSON', 'SOLOMON', 'GIDEON', 'LAZARUS', 'CORNERSTONE']
+
+    class _CountingModel:
+        def __init__(self, model):
+            self.model = model
+            self.calls = []
+            self.feature_importances_ = model.feature_importances_
+
+        def predict_proba(self, X):
+            self.calls.append(len(X))
+            return self.model.predict_proba(X)
+
+    @classmethod
+    def _fit(cls, n_features, seed):
+        import numpy as np
+        from sklearn.ensemble import GradientBoostingClassifier
+        from sklearn.preprocessing import StandardScaler
+
+        rng = np.random.default_rng(seed)
+        X = rng.normal(size=(300, n_features))
+        y = (X[:, 0] + X[:, 1] + rng.normal(size=300) > 0).astype(int)
+        scaler = StandardScaler().fit(X)
+        model = GradientBoostingClassifier(n_estimators=20, random_state=seed).fit(scaler.transform(X), y)
+        return scaler, cls._CountingModel(model)
+
+    @pytest.fixture
+    def advisor(self):
+        from quant.prophet_advisor import ProphetAdvisor
+
+        with patch('quant.prophet_advisor.DB_AVAILABLE', False):
+            advisor = ProphetAdvisor(enable_claude=False)
+            advisor.scaler, advisor.model = self._fit(len(advisor.FEATURE_COLS), 1)
+            advisor.calibrated_model = None
+            advisor.is_trained = True
+            advisor._feature_version = 3
+            advisor._has_gex_features = True
+            # IC sub-model trained, Directional not: directional bots use the combined model
+            ic = advisor._sub_models['ic_model']
+            ic['scaler'], ic['model'] = self._fit(len(ic['feature_cols']), 2)
+            ic.update(calibrated_model=None, is_trained=True)
+            yield advisor
+
+    def _contexts(self):
+        from quant.prophet_advisor import MarketContext, GEXRegime
+        return {
+            bot: MarketContext(
+                spot_price=580 + 2 * i, vix=14 + 1.5 * i, vix_change_1d=i - 3,
+                gex_regime=GEXRegime.POSITIVE if i % 2 else GEXRegime.NEGATIVE,
+                gex_normalized=0.1 * i, gex_call_wall=595, gex_put_wall=575, day_of_week=i % 5,
+            )
+            for i, bot in enumerate(self.BOTS)
+        }
+
+    def test_one_predict_call_per_model(self, advisor):
+        results = advisor.get_advice_batch(self._contexts())
+
+        assert set(results) == set(self.BOTS)
+        assert advisor._sub_models['ic_model']['model'].calls == [4]  # FORTRESS, FAITH, ANCHOR, SAMSON
+        assert advisor.model.calls == [4]  # SOLOMON, GIDEON, LAZARUS, CORNERSTONE
+        assert advisor._batch_local.predictions is None
+
+    def test_matches_per_bot_advice(self, advisor):
+        contexts = self._contexts()
+        batch = advisor.get_advice_batch(contexts)
+
+        single = {
+            'FORTRESS': advisor.get_fortress_advice(contexts['FORTRESS']),
+            'ANCHOR': advisor.get_anchor_advice(contexts['ANCHOR']),
+            'GIDEON': advisor.get_solomon_advice(contexts['GIDEON'], bot_name='GIDEON'),
+            'LAZARUS': advisor.get_lazarus_advice(contexts['LAZARUS']),
+            'CORNERSTONE': advisor.get_cornerstone_advice(contexts['CORNERSTONE']),
+        }
+        for bot, pred in single.items():
+            assert batch[bot].advice == pred.advice, bot
+            assert batch[bot].win_probability == pytest.approx(pred.win_probability), bot
+
+    def _store(self, advisor, skip=()):
+        """Run get_advice_batch with a fake DB; bots in skip hit a unique conflict."""
+        from contextlib import contextmanager
+        inserts = []
+
+        class Cursor:
+            def execute(self, sql, params=None):
+                pass
+
+        class Conn:
+            def cursor(self):
+                return Cursor()
+
+            def commit(self):
+                pass
+
+        @contextmanager
+        def fake_db():
+            yield Conn()
+
+        def fake_execute_values(cursor, sql, rows, template=None, page_size=100, fetch=False):
+            inserts.append((sql, rows, page_size))
+            return [(100 + i, row[1]) for i, row in enumerate(rows) if row[1] not in skip]
+
+        with patch('quant.prophet_advisor.DB_AVAILABLE', True), \
+             patch('quant.prophet_advisor.get_db_connection', fake_db), \
+             patch('psycopg2.extras.execute_values', fake_execute_values):
+            results = advisor.get_advice_batch(self._contexts(), trade_date='2025-01-06')
+        return results, inserts
+
+    def test_persists_with_one_insert(self, advisor):
+        results, inserts = self._store(advisor)
+
+        assert len(inserts) == 1
+        sql, rows, page_size = inserts[0]
+        assert 'INSERT INTO prophet_predictions' in sql
+        assert 'ON CONFLICT DO NOTHING' in sql
+        assert len(rows) == page_size == len(self.BOTS)
+        assert sorted(p.prediction_id for p in results.values()) == list(range(100, 100 + len(self.BOTS)))
+
+    def test_predictions_persisted_under_requesting_bot(self, advisor):
+        results, inserts = self._store(advisor)
+
+        persisted = [row[1] for row in inserts[0][1]]
+        assert persisted == self.BOTS
+        assert results['FAITH'].bot_name.value == 'FAITH'
+        assert results['SAMSON'].bot_name.value == 'SAMSON'
+
+    def test_conflicting_row_does_not_drop_the_tick(self, advisor):
+        results, _ = self._store(advisor, skip={'FAITH'})
+
+        assert results['FAITH'].prediction_id is None
+        assert all(p.prediction_id is not None for bot, p in results.items() if bot != 'FAITH')
+
+
 class TestGetProphetSingleton:
     """Tests for the get_prophet() singleton function"""
 
@@ -17,6 +17,16 @@ import pandas as pd
 from datetime import datetime, timedelta
 
 
+def _threshold_strategy(data, params):
+    """Deterministic module-level strategy (picklable for the process pool)"""
+    if params.get('fail'):
+        raise ValueError("bad params")
+    moves = data['Close'].diff().abs().dropna()
+    trades = int((moves > params['threshold'] * 0.1).sum())
+    wins = int((moves > params['threshold'] * 0.2).sum())
+    return {'win_rate': wins / trades * 100 if trades else 0, 'trades': trades}
+
+
 class TestWalkForwardOptimizer:
     """Tests for Walk-Forward Optimization"""
 
@@ -87,6 +97,56 @@ class TestWalkForwardOptimizer:
         assert 'degradation_pct' in dict_result
         assert 'is_robust' in dict_result
 
+    def _walk_forward_inputs(self):
+        index = pd.bdate_range('2024-01-01', '2024-12-31')
+        data = pd.DataFrame({'Close': 100 + np.sin(np.arange(len(index)) / 9.0) * 5}, index=index)
+        grid = {'threshold': [0.5, 1.0, 2.0], 'fail': [False, True]}
+        return dict(strategy_name="TEST", strategy_func=_threshold_strategy, param_grid=grid,
+                    start_date=datetime(2024, 1, 1), end_date=datetime(2024, 12, 1), historical_data=data)
+
+    def test_parallel_grid_matches_serial(self):
+        """Test process-pool evaluation picks the same params as the serial grid"""
+        from quant.walk_forward_optimizer import WalkForwardOptimizer
+
+        inputs = self._walk_forward_inputs()
+        serial = WalkForwardOptimizer(min_trades_per_window=1)
+        result = serial.run_walk_forward(**inputs)
+        parallel = WalkForwardOptimizer(min_trades_per_window=1, workers=2).run_walk_forward(**inputs)
+
+        assert result.total_windows > 0
+        assert [r.optimal_params for r in parallel.window_results] == \
+            [r.optimal_params for r in result.window_results]
+        # Failing combos are skipped and counted, never selected
+        assert all(not r.optimal_params.get('fail') for r in result.window_results)
+        assert serial.last_run_stats['failures'] > 0
+
+    def test_rerun_is_served_from_cache(self):
+        """Test strategy results are memoized per (window slice, params)"""
+        from quant.walk_forward_optimizer import WalkForwardOptimizer
+
+        inputs = self._walk_forward_inputs()
+        optimizer = WalkForwardOptimizer(min_trades_per_window=1)
+        first = optimizer.run_walk_forward(**inputs)
+        assert optimizer.last_run_stats['evaluations'] > 0
+
+        second = optimizer.run_walk_forward(**inputs)
+        assert optimizer.last_run_stats['evaluations'] == 0
+        assert second.recommended_params == first.recommended_params
+
+    def test_successive_halving_evaluates_fewer_rows(self):
+        """Test halving search picks a grid combo with a smaller row budget"""
+        from quant.walk_forward_optimizer import WalkForwardOptimizer
+
+        inputs = self._walk_forward_inputs()
+        inputs['param_grid'] = {'threshold': list(np.linspace(0.1, 3.0, 12)), 'fail': [False]}
+        grid = WalkForwardOptimizer(min_trades_per_window=1)
+        grid.run_walk_forward(**inputs)
+        halving = WalkForwardOptimizer(min_trades_per_window=1, search='halving')
+        result = halving.run_walk_forward(**inputs)
+
+        assert result.recommended_params['threshold'] in inputs['param_grid']['threshold']
+        assert halving.last_run_stats['rows_evaluated'] < grid.last_run_stats['rows_evaluated']
+
 
 class TestMonteCarloKelly:
     """Tests for Monte Carlo Kelly Stress Testing"""
@@ -203,6 +263,46 @@ class TestMonteCarloKelly:
         # Small sample should have higher uncertainty
         assert estimate_small.win_rate_std > estimate_large.win_rate_std
 
+    def test_simulate_paths_matches_scalar_path(self):
+        """Test the matrix engine reproduces simulate_path on the same outcomes"""
+        import numpy as np
+        from quant.monte_carlo_kelly import MonteCarloKelly, PathDraws
+
+        mc = MonteCarloKelly(num_simulations=1, num_trades_per_sim=40)
+        # Losing streak into ruin at 50% Kelly, then wins that must be ignored
+        wins = np.array([[True, False, False, False, False, False, False] + [True] * 33])
+        draws = PathDraws(win_rate=np.array([0.5]), avg_win=np.array([20.0]),
+                          avg_loss=np.array([60.0]), wins=wins)
+        batch = mc.simulate_paths(0.5, draws)
+
+        equity, peak = 1.0, 1.0
+        for trade, won in enumerate(wins[0]):
+            equity *= 1.1 if won else 0.7
+            peak = max(peak, equity)
+            if equity < mc.RUIN_THRESHOLD:
+                break
+
+        assert batch.ruin[0]
+        assert batch.num_trades[0] == trade + 1
+        assert batch.final_equity[0] == pytest.approx(equity)
+        assert batch.peak_equity[0] == pytest.approx(peak)
+        assert batch.max_drawdown_pct[0] == pytest.approx((peak - equity) / peak * 100)
+
+    def test_simulate_fractions_shares_paths(self):
+        """Test a vector of Kelly fractions is evaluated on common paths"""
+        from quant.monte_carlo_kelly import MonteCarloKelly
+
+        mc = MonteCarloKelly(num_simulations=500, num_trades_per_sim=100, random_seed=1)
+        estimate = mc.estimate_uncertainty(0.60, 12, 10, sample_size=30)
+        batches = mc.simulate_fractions([0.05, 0.15, 0.40], estimate)
+
+        assert [b.kelly_fraction for b in batches] == [0.05, 0.15, 0.40]
+        ruin = [b.ruin.mean() for b in batches]
+        assert ruin[0] <= ruin[1] <= ruin[2]
+
+        again = MonteCarloKelly(num_simulations=500, num_trades_per_sim=100, random_seed=1)
+        assert (again.simulate_fractions([0.15], estimate)[0].final_equity == batches[1].final_equity).all()
+
     def test_validate_current_sizing(self):
         """Test current sizing validation"""
         from quant.monte_carlo_kelly import validate_current_sizing
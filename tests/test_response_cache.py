@@ -0,0 +1,228 @@
+"""
+API Response Cache Tests
+
+LRU eviction, byte accounting, single-flight, stale-while-revalidate and
+per-prefix stats in backend/api/response_cache.py.
+
+Run with: pytest tests/test_response_cache.py -v
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.api.response_cache import APIResponseCache
+
+
+class TestLRU:
+    """OrderedDict LRU with entry and byte limits"""
+
+    def test_evicts_least_recently_used(self):
+        cache = APIResponseCache(max_entries=3)
+        for k in ('a:1', 'a:2', 'a:3'):
+            cache.set(k, k, ttl=60)
+        cache.get('a:1')
+        cache.set('a:4', 'a:4', ttl=60)
+        assert cache.get('a:2') is None
+        assert cache.get('a:1') == 'a:1'
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_byte_budget(self):
+        cache = APIResponseCache(max_entries=100, max_bytes=250)
+        for i in range(5):
+            cache.set(f'b:{i}', 'x' * 98, ttl=60)  # 100 bytes as JSON
+        stats = cache.get_stats()
+        assert stats['entries'] == 2
+        assert stats['bytes'] == 200
+        cache.invalidate('b:4')
+        assert cache.get_stats()['bytes'] == 100
+
+    def test_overwrite_keeps_byte_count(self):
+        cache = APIResponseCache()
+        cache.set('c:1', [1, 2, 3], ttl=60)
+        cache.set('c:1', [1, 2, 3], ttl=60)
+        assert cache.get_stats()['bytes'] == len('[1, 2, 3]')
+
+
+class TestSingleFlight:
+    """Concurrent misses share one computation"""
+
+    def test_threads_share_one_compute(self):
+        cache = APIResponseCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return {'v': 1}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            cache.get_or_compute('gex:SPY', compute, ttl=60))) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == [{'v': 1}] * 8
+        stats = cache.get_stats()['prefixes']['gex']
+        assert stats['computes'] == 1
+        assert (stats['misses'], stats['coalesced']) == (8, 7)
+
+    def test_errors_reach_every_waiter_and_are_not_cached(self):
+        cache = APIResponseCache()
+
+        def compute():
+            time.sleep(0.05)
+            raise RuntimeError('upstream down')
+
+        errors = []
+
+        def call():
+            try:
+                cache.get_or_compute('gex:QQQ', compute, ttl=60)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == ['upstream down'] * 4
+        assert cache.get('gex:QQQ') is None
+
+    def test_async_callers_share_one_task(self):
+        cache = APIResponseCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def main():
+            return await asyncio.gather(*(
+                cache.aget_or_compute('wt:snap', compute, ttl=60) for _ in range(5)))
+
+        assert asyncio.run(main()) == [42] * 5
+        assert len(calls) == 1
+
+
+class TestStaleWhileRevalidate:
+    """Expired values are served while one refresher runs"""
+
+    def test_stale_value_served_during_refresh(self):
+        cache = APIResponseCache()
+        cache.set('gex:SPX', 'old', ttl=0.01, stale_ttl=60)
+        time.sleep(0.02)
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute():
+            started.set()
+            release.wait(1)
+            return 'new'
+
+        assert cache.get_or_compute('gex:SPX', compute, ttl=60, stale_ttl=60) == 'old'
+        assert started.wait(1)
+        # A second stale read does not start another refresh
+        assert cache.get_or_compute('gex:SPX', lambda: 1 / 0, ttl=60, stale_ttl=60) == 'old'
+        release.set()
+        deadline = time.time() + 1
+        while cache.get('gex:SPX') != 'new' and time.time() < deadline:
+            time.sleep(0.01)
+        assert cache.get('gex:SPX') == 'new'
+        assert cache.get_stats()['prefixes']['gex']['stale_hits'] == 2
+
+    def test_plain_get_ignores_stale_values(self):
+        cache = APIResponseCache()
+        cache.set('gex:NDX', 'old', ttl=0.01, stale_ttl=60)
+        time.sleep(0.02)
+        assert cache.get('gex:NDX') is None
+        assert cache.get_stats()['entries'] == 1
+
+
+class TestStats:
+    """Per-prefix stats on get_stats"""
+
+    def test_prefix_buckets(self):
+        cache = APIResponseCache()
+        key = cache._make_key('status', 'bot')
+        assert key.startswith('status:')
+        cache.get(key)
+        cache.get_or_compute(key, lambda: {'ok': True}, ttl=60)
+        cache.get(key)
+        cache.get('legacy_key')
+
+        stats = cache.get_stats()
+        assert stats['prefixes']['status']['hits'] == 1
+        assert stats['prefixes']['status']['misses'] == 2
+        assert stats['prefixes']['status']['computes'] == 1
+        assert stats['prefixes']['other']['misses'] == 1
+        assert stats['hit_rate_pct'] == 25.0
+
+
+class TestCachedResponse:
+    """cached_response decorator on endpoints"""
+
+    def setup_method(self):
+        from backend.api.response_cache import response_cache
+        response_cache.clear()
+
+    def test_async_endpoint_shares_one_call(self):
+        from backend.api.response_cache import cached_response
+        calls = []
+
+        @cached_response(ttl=60, key_prefix="test_endpoint")
+        async def endpoint(symbol: str):
+            calls.append(symbol)
+            await asyncio.sleep(0.05)
+            return {'symbol': symbol}
+
+        async def main():
+            return await asyncio.gather(*(endpoint(symbol='SPY') for _ in range(5)))
+
+        assert asyncio.run(main()) == [{'symbol': 'SPY'}] * 5
+        assert asyncio.run(endpoint(symbol='SPY')) == {'symbol': 'SPY'}
+        assert calls == ['SPY']
+
+    def test_watchtower_gamma_is_cached(self):
+        from unittest.mock import MagicMock, patch
+        pytest.importorskip('httpx')
+        from backend.api.routes import watchtower_routes
+
+        fetches = []
+
+        async def fake_fetch(symbol, expiration):
+            fetches.append((symbol, expiration))
+            await asyncio.sleep(0.05)
+            return {'data_unavailable': True, 'reason': 'market closed', 'fetched_at': 'now'}
+
+        engine = MagicMock()
+        engine.get_0dte_expiration.return_value = '2026-10-16'
+
+        async def main():
+            return await asyncio.gather(*(
+                watchtower_routes.get_gamma_data(symbol='SPY', expiration=None, day=None)
+                for _ in range(5)))
+
+        with patch.object(watchtower_routes, 'get_engine', return_value=engine), \
+             patch.object(watchtower_routes, 'check_daily_reset'), \
+             patch.object(watchtower_routes, 'load_gamma_history'), \
+             patch.object(watchtower_routes, 'fetch_gamma_data', fake_fetch):
+            results = asyncio.run(main())
+            again = asyncio.run(
+                watchtower_routes.get_gamma_data(symbol='SPY', expiration=None, day=None))
+
+        assert all(r['data_unavailable'] for r in results)
+        assert again is results[0]
+        assert fetches == [('SPY', '2026-10-16')]
@@ -14,15 +14,39 @@ import os
 import sys
 import json
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from zoneinfo import ZoneInfo
 
+import pytest
+
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 CENTRAL_TZ = ZoneInfo("America/Chicago")
 
 
+@pytest.fixture
+def write_behind(monkeypatch):
+    """Fresh write-behind queue on a mock connection, drained at teardown.
+
+    Keeps queued scan rows off the process-wide queue, whose atexit flush
+    would otherwise try to reach a real database.
+    """
+    import db.write_behind as write_behind_module
+    import trading.scan_activity_logger as scan_activity_logger
+    from db.write_behind import WriteBehindQueue
+
+    mock_cursor = Mock()
+    mock_conn = Mock()
+    mock_conn.cursor.return_value = mock_cursor
+    queue = WriteBehindQueue(connect=lambda: mock_conn)
+
+    monkeypatch.setattr(write_behind_module, '_write_behind', queue)
+    monkeypatch.setattr(scan_activity_logger, '_write_behind', None)
+    yield mock_cursor
+    assert queue.stop()
+
+
 class TestScanExplainer:
     """Test the Claude AI explanation generator"""
 
@@ -184,19 +208,12 @@ class TestScanActivityLogger:
         assert ScanOutcome.BEFORE_WINDOW.value == "BEFORE_WINDOW"
         print(f"\n[PASS] All ScanOutcome values valid")
 
-    @patch('database_adapter.get_connection')
-    def test_log_scan_activity_structure(self, mock_get_conn):
+    def test_log_scan_activity_structure(self, write_behind):
         """Test log_scan_activity creates correct data structure"""
         from trading.scan_activity_logger import (
             log_scan_activity, ScanOutcome, CheckResult
         )
 
-        # Mock database connection
-        mock_cursor = Mock()
-        mock_conn = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_get_conn.return_value = mock_conn
-
         # Call the function with all parameters
         result = log_scan_activity(
             bot_name="SOLOMON",
@@ -227,21 +244,19 @@ class TestScanActivityLogger:
             generate_ai_explanation=False  # Skip Claude for unit test
         )
 
-        # Verify execute was called for table creation and insert
-        assert mock_cursor.execute.called
+        # The row is queued; flushing writes the DDL and the INSERT
+        from db.write_behind import get_write_behind
+        assert result is not None
+        assert get_write_behind().flush()
+        statements = [c[0][0] for c in write_behind.execute.call_args_list]
+        assert any('INSERT INTO scan_activity' in sql for sql in statements)
         print(f"\n[PASS] log_scan_activity called database correctly")
 
-    @patch('database_adapter.get_connection')
-    def test_log_fortress_scan_with_full_reasoning_kwarg(self, mock_get_conn):
+    @pytest.mark.usefixtures('write_behind')
+    def test_log_fortress_scan_with_full_reasoning_kwarg(self):
         """Test that passing full_reasoning as kwarg doesn't cause 'multiple values' error"""
         from trading.scan_activity_logger import log_fortress_scan, ScanOutcome, CheckResult
 
-        # Mock database connection
-        mock_cursor = Mock()
-        mock_conn = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_get_conn.return_value = mock_conn
-
         # This used to crash with: "got multiple values for keyword argument 'full_reasoning'"
         try:
             result = log_fortress_scan(
@@ -256,17 +271,11 @@ class TestScanActivityLogger:
                 raise AssertionError(f"kwargs bug not fixed: {e}")
             raise
 
-    @patch('database_adapter.get_connection')
-    def test_log_fortress_scan_with_all_kwargs(self, mock_get_conn):
+    @pytest.mark.usefixtures('write_behind')
+    def test_log_fortress_scan_with_all_kwargs(self):
         """Test that passing action_taken, error_type as kwargs doesn't cause errors"""
         from trading.scan_activity_logger import log_fortress_scan, ScanOutcome, CheckResult
 
-        # Mock database connection
-        mock_cursor = Mock()
-        mock_conn = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_get_conn.return_value = mock_conn
-
         # Test all kwargs that could cause "multiple values" errors
         try:
             result = log_fortress_scan(
@@ -282,17 +291,11 @@ class TestScanActivityLogger:
         except (TypeError, NameError) as e:
             raise AssertionError(f"kwargs bug not fixed: {e}")
 
-    @patch('database_adapter.get_connection')
-    def test_log_solomon_scan_with_all_kwargs(self, mock_get_conn):
+    @pytest.mark.usefixtures('write_behind')
+    def test_log_solomon_scan_with_all_kwargs(self):
         """Test that log_solomon_scan handles action_taken and error_type kwargs correctly"""
         from trading.scan_activity_logger import log_solomon_scan, ScanOutcome, CheckResult
 
-        # Mock database connection
-        mock_cursor = Mock()
-        mock_conn = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_get_conn.return_value = mock_conn
-
         # This used to crash with: NameError: name 'action_taken' is not defined
         try:
             result = log_solomon_scan(
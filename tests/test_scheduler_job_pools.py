@@ -0,0 +1,154 @@
+"""
+Scheduler Job Pool Tests
+
+Tests for named executor pools, trigger staggering and per-job latency
+histograms (scheduler/job_pools.py).
+
+Run with: pytest tests/test_scheduler_job_pools.py -v
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("apscheduler")
+
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from scheduler.job_pools import (
+    JobMetrics,
+    LatencyHistogram,
+    PooledBackgroundScheduler,
+    classify_job,
+    stagger_offset,
+    stagger_trigger,
+)
+
+CENTRAL_TZ = ZoneInfo("America/Chicago")
+
+
+class TestClassification:
+    """Job ids map to the right executor pool"""
+
+    @pytest.mark.parametrize("job_id,pool", [
+        ('fortress_trading', 'scans'),
+        ('agape_btc_perp_trading', 'scans'),
+        ('market_snapshot_prewarm', 'scans'),
+        ('prophet_training', 'training'),
+        ('auto_validation', 'training'),
+        ('weekly_vacuum', 'maintenance'),
+        ('equity_snapshots', 'maintenance'),
+        ('fortress_eod', 'default'),
+        ('tradier_sandbox_eod_primary', 'default'),
+    ])
+    def test_classify(self, job_id, pool):
+        assert classify_job(job_id) == pool
+
+
+class TestStaggering:
+    """Deterministic per-job start offsets"""
+
+    def test_offset_is_stable_and_bounded(self):
+        offsets = {job: stagger_offset(job, 45) for job in ('fortress_trading', 'anchor_trading', 'solomon_trading')}
+        assert offsets == {job: stagger_offset(job, 45) for job in offsets}
+        assert all(1 <= o <= 45 for o in offsets.values())
+        assert stagger_offset('market_snapshot_prewarm', 45) == 0
+
+    def test_interval_trigger_aligned_with_offset(self):
+        trigger = stagger_trigger(IntervalTrigger(minutes=5, timezone='America/Chicago'), 'fortress_trading', 45)
+        fire = trigger.get_next_fire_time(None, datetime.now(CENTRAL_TZ))
+        assert trigger.interval_length == 300
+        assert fire.timestamp() % 300 == stagger_offset('fortress_trading', 45)
+
+    def test_cron_trigger_keeps_schedule_and_adds_second(self):
+        original = CronTrigger(hour=15, minute=1, day_of_week='mon-fri', timezone='America/Chicago')
+        staggered = stagger_trigger(original, 'fortress_eod', 45)
+        now = datetime(2025, 1, 6, 9, 0, tzinfo=CENTRAL_TZ)  # Monday morning
+        base = original.get_next_fire_time(None, now)
+        fire = staggered.get_next_fire_time(None, now)
+        assert fire - base == timedelta(seconds=stagger_offset('fortress_eod', 45))
+
+    def test_hour_only_cron_still_fires_once(self):
+        original = CronTrigger(hour=8, timezone='America/Chicago')
+        staggered = stagger_trigger(original, 'fortress_eod', 45)
+        offset = timedelta(seconds=stagger_offset('fortress_eod', 45))
+        now = datetime(2025, 1, 6, 7, 0, tzinfo=CENTRAL_TZ)
+        fire = staggered.get_next_fire_time(None, now)
+        assert fire == original.get_next_fire_time(None, now) + offset
+        # Next fire is the following day, not 08:01
+        assert staggered.get_next_fire_time(fire, fire) == fire + timedelta(days=1)
+
+    def test_explicit_cron_second_untouched(self):
+        original = CronTrigger(minute=0, second=30, timezone='America/Chicago')
+        assert stagger_trigger(original, 'fortress_eod', 45) is original
+
+
+class TestLatencyHistogram:
+    def test_buckets_and_quantiles(self):
+        hist = LatencyHistogram(buckets=(10, 100, 1000))
+        for value in (5, 50, 50, 500, 5000):
+            hist.observe(value)
+        data = hist.to_dict()
+        assert data['buckets'] == {'le_10': 1, 'le_100': 2, 'le_1000': 1, 'inf': 1}
+        assert data['p50_ms'] == 100.0
+        assert data['p95_ms'] == 5000.0
+        assert data['max_ms'] == 5000.0
+
+
+class TestPooledScheduler:
+    """Slow training cannot starve scans; runs are timed"""
+
+    def test_training_does_not_block_scans(self):
+        metrics = JobMetrics()
+        sched = PooledBackgroundScheduler(metrics=metrics, stagger_seconds=0, timezone='America/Chicago')
+        release = threading.Event()
+        scanned = threading.Event()
+
+        try:
+            sched.start()
+            run_now = datetime.now(CENTRAL_TZ)
+            sched.add_job(release.wait, trigger='date', run_date=run_now, id='prophet_training', args=[5])
+            sched.add_job(release.wait, trigger='date', run_date=run_now, id='wisdom_training', args=[5])
+            sched.add_job(scanned.set, trigger='date', run_date=run_now, id='fortress_trading')
+
+            assert scanned.wait(3), "scan starved behind training jobs"
+            release.set()
+
+            deadline = time.time() + 3
+            while time.time() < deadline and len(metrics.snapshot()['jobs']) < 3:
+                time.sleep(0.05)
+        finally:
+            release.set()
+            sched.shutdown(wait=True)
+
+        jobs = metrics.snapshot()['jobs']
+        assert jobs['fortress_trading']['pool'] == 'scans'
+        assert jobs['prophet_training']['pool'] == 'training'
+        assert jobs['fortress_trading']['runtime']['count'] == 1
+        assert jobs['fortress_trading']['lag']['count'] == 1
+
+    def test_failed_job_counted(self):
+        metrics = JobMetrics()
+        sched = PooledBackgroundScheduler(metrics=metrics, timezone='America/Chicago')
+
+        def boom():
+            raise RuntimeError('scan failed')
+
+        try:
+            sched.start()
+            sched.add_job(boom, trigger='date', run_date=datetime.now(CENTRAL_TZ), id='anchor_trading')
+            deadline = time.time() + 3
+            while time.time() < deadline and not metrics.snapshot()['jobs']:
+                time.sleep(0.05)
+        finally:
+            sched.shutdown(wait=True)
+
+        assert metrics.snapshot()['jobs']['anchor_trading']['errors'] == 1
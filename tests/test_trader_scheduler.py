@@ -435,6 +435,7 @@ class TestSchedulerStartStop:
     """Tests for scheduler start/stop"""
 
     @patch('scheduler.trader_scheduler.APSCHEDULER_AVAILABLE', True)
+    @patch('scheduler.trader_scheduler.JOB_POOLS_AVAILABLE', False)
     @patch('scheduler.trader_scheduler.BackgroundScheduler')
     @patch('scheduler.trader_scheduler.AutonomousPaperTrader')
     @patch('scheduler.trader_scheduler.TradingVolatilityAPI')
@@ -457,6 +458,7 @@ class TestSchedulerStartStop:
             assert scheduler.is_running is True
 
     @patch('scheduler.trader_scheduler.APSCHEDULER_AVAILABLE', True)
+    @patch('scheduler.trader_scheduler.JOB_POOLS_AVAILABLE', False)
     @patch('scheduler.trader_scheduler.BackgroundScheduler')
     @patch('scheduler.trader_scheduler.AutonomousPaperTrader')
     @patch('scheduler.trader_scheduler.TradingVolatilityAPI')
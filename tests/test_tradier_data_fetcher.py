@@ -135,5 +135,75 @@ class TestTradierOrderExecution:
             pytest.skip("Tradier data fetcher not available")
 
 
+class TestTradierBatchChainFetch:
+    """Tests for concurrent multi-expiration fetch and the shared request budget"""
+
+    @staticmethod
+    def _fetcher(api_key):
+        from data.tradier_data_fetcher import TradierDataFetcher
+        return TradierDataFetcher(api_key=api_key, account_id='acct', sandbox=True)
+
+    @staticmethod
+    def _fake_responses(calls):
+        import threading
+        lock = threading.Lock()
+
+        def fake(method, endpoint, params=None, data=None, max_retries=3):
+            with lock:
+                calls.append((endpoint, dict(params or {})))
+            if endpoint == 'markets/quotes':
+                return {'quotes': {'quote': {'last': 585.5}}}
+            if endpoint == 'markets/options/expirations':
+                return {'expirations': {'date': ['2024-12-20', '2024-12-27', '2025-01-03']}}
+            exp = params['expiration']
+            return {'options': {'option': [
+                {'symbol': f'SPY{exp}C', 'strike': 585, 'option_type': 'call',
+                 'open_interest': 10, 'greeks': {'gamma': 0.05}},
+            ]}}
+        return fake
+
+    @pytest.mark.parametrize("concurrent", [True, False])
+    def test_multiple_chains_fetches_one_quote(self, concurrent):
+        calls = []
+        fetcher = self._fetcher(f'batch-key-{concurrent}')
+        fetcher._make_request = self._fake_responses(calls)
+
+        chain = fetcher.get_multiple_chains('SPY', num_expirations=3, concurrent=concurrent)
+
+        assert list(chain.chains.keys()) == ['2024-12-20', '2024-12-27', '2025-01-03']
+        assert chain.underlying_price == 585.5
+        assert sum(1 for endpoint, _ in calls if endpoint == 'markets/quotes') == 1
+        assert sum(1 for endpoint, _ in calls if endpoint == 'markets/options/chains') == 3
+
+    def test_get_all_expirations_is_uncapped(self):
+        calls = []
+        fetcher = self._fetcher('all-exp-key')
+        fetcher._make_request = self._fake_responses(calls)
+
+        chain = fetcher.get_all_expirations('SPY')
+        assert len(chain.chains) == 3
+
+    def test_clients_share_transport_per_api_key(self):
+        a = self._fetcher('shared-key')
+        b = self._fetcher('shared-key')
+        c = self._fetcher('other-key')
+        assert a.session is b.session
+        assert a._budget is b._budget
+        assert a.session is not c.session
+
+    def test_request_budget_allows_burst_then_throttles(self):
+        import time
+        from data.tradier_data_fetcher import RequestBudget
+
+        budget = RequestBudget(rate=50.0, burst=5, max_concurrent=2)
+        start = time.monotonic()
+        for _ in range(5):
+            budget.acquire()
+        assert time.monotonic() - start < 0.05  # burst is immediate
+
+        budget.acquire()  # bucket empty -> waits ~1/rate
+        assert time.monotonic() - start >= 0.015
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,121 @@
+"""
+WATCHTOWER Strike State Tests
+
+Tests for the incremental per-strike gamma state behind
+WatchtowerEngine.process_options_chain (core/watchtower_state.py).
+
+Run with: pytest tests/test_watchtower_state.py -v
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.watchtower_state import StrikeGammaState
+
+CENTRAL_TZ = ZoneInfo("America/Chicago")
+
+
+class TestSmoothing:
+    """Vectorized smoothing matches WatchtowerEngine._smooth_gamma_value"""
+
+    def test_matches_scalar_smoothing(self):
+        from core.watchtower_engine import WatchtowerEngine
+
+        engine = WatchtowerEngine()
+        state = StrikeGammaState(window_size=5)
+        strikes = [580.0, 585.0, 590.0]
+        idx = state.indices(strikes)
+        rng = np.random.default_rng(7)
+        spot = 585.0
+
+        for tick in range(12):
+            raw = rng.normal(1000, 400, size=3)
+            if tick == 6:
+                raw[1] *= 5  # spike without a price move -> dampened
+            expected = [engine._smooth_gamma_value(k, g, spot) for k, g in zip(strikes, raw)]
+            got = state.smooth(idx, raw, spot, engine._previous_spot_price, engine._max_gamma_change_pct)
+            engine._previous_spot_price = spot
+            np.testing.assert_allclose(got, expected)
+
+    def test_settled_strikes_skip_window_update(self):
+        state = StrikeGammaState(window_size=3)
+        idx = state.indices([600.0])
+        for _ in range(3):
+            state.smooth(idx, np.array([42.0]), 585.0, 585.0, 50.0)
+        pos = state.window_pos.copy()
+
+        assert state.smooth(idx, np.array([42.0]), 585.0, 585.0, 50.0).tolist() == [42.0]
+        assert (state.window_pos == pos).all()
+
+
+class TestHistoryRing:
+    """Shared time axis lookups, absent strikes and growth"""
+
+    def test_value_at_walks_back_for_absent_strike(self):
+        state = StrikeGammaState(history_ticks=8)
+        idx = state.indices([580.0, 585.0])
+        state.record(idx, np.array([1.0, 10.0]), 100.0)
+        state.record(idx[:1], np.array([2.0]), 160.0)        # 585 missing this tick
+        state.record(idx, np.array([3.0, 30.0]), 220.0)
+
+        assert state.value_at(idx, 170.0, 0.0).tolist() == [2.0, 10.0]
+        assert np.isnan(state.value_at(idx, 50.0, 0.0)).all()
+        assert np.isnan(state.value_at(idx, 170.0, 120.0)[1])  # older than retention cutoff
+        assert state.first_value_since(idx, 150.0).tolist() == [2.0, 30.0]
+
+    def test_previous_gamma_only_from_last_tick(self):
+        state = StrikeGammaState()
+        idx = state.indices([580.0, 585.0])
+        state.record(idx, np.array([5.0, -5.0]), 1.0)
+        state.record(idx[:1], np.array([6.0]), 2.0)
+
+        assert state.previous_gamma(idx).tolist() == [6.0, 0.0]
+
+    def test_ring_grows_instead_of_dropping_live_window(self):
+        state = StrikeGammaState(history_ticks=4)
+        idx = state.indices([580.0])
+        for t in range(10):
+            state.record(idx, np.array([float(t)]), float(t), keep_since_ts=0.0)
+
+        assert state.history_ticks >= 10
+        assert state.value_at(idx, 0.5, 0.0).tolist() == [0.0]
+
+    def test_ring_overwrites_expired_columns(self):
+        state = StrikeGammaState(history_ticks=4)
+        idx = state.indices([580.0])
+        for t in range(10):
+            state.record(idx, np.array([float(t)]), float(t), keep_since_ts=t - 2.0)
+
+        assert state.history_ticks == 4
+        assert state.value_at(idx, 7.5, 0.0).tolist() == [7.0]
+
+
+class TestEngineRestore:
+    """History restored from the database feeds ROC on the first refresh"""
+
+    def test_first_refresh_after_restore_uses_history(self):
+        from core.watchtower_engine import WatchtowerEngine
+
+        engine = WatchtowerEngine()
+        engine.set_gamma_smoothing(enabled=False)
+        engine.calculate_probability_hybrid = lambda *a, **k: 1.0
+
+        now = datetime.now(CENTRAL_TZ)
+        net_gamma = engine.calculate_net_gamma(0.02, 0.01, 100, 100)
+        engine.history[585.0] = [(now - timedelta(minutes=10), net_gamma / 2)]
+
+        snapshot = engine.process_options_chain(
+            {'strikes': [{'strike': 585.0, 'call_gamma': 0.02, 'put_gamma': 0.01,
+                          'call_oi': 100, 'put_oi': 100}]},
+            585.0, 18.0, now.strftime('%Y-%m-%d'),
+        )
+
+        assert snapshot.strikes[0].roc_5min == pytest.approx(100.0)
+        assert len(engine.history[585.0]) == 2
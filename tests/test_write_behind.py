@@ -0,0 +1,197 @@
+"""
+Write-Behind Queue Tests
+
+Batching, flush triggers, back-pressure, failure fallback and shutdown in
+db/write_behind.py, plus the in-memory scan numbering in
+trading/scan_activity_logger.py. The database is a MagicMock connection.
+
+Run with: pytest tests/test_write_behind.py -v
+"""
+
+import os
+import sys
+import threading
+import time
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import write_behind
+from db.write_behind import WriteBehindQueue, _Statement
+
+SQL = """
+    INSERT INTO agape_activity_log (timestamp, level, message)
+    VALUES (%s, %s, %s)
+"""
+OTHER_SQL = "INSERT INTO agape_equity_snapshots (timestamp, equity) VALUES (%s, %s)"
+
+
+def _queue(**kwargs):
+    conn = MagicMock()
+    cursor = MagicMock()
+    conn.cursor.return_value = cursor
+    kwargs.setdefault('flush_interval', 60)
+    return WriteBehindQueue(connect=lambda: conn, **kwargs), conn, cursor
+
+
+class _RecordingExecuteValues:
+    def __init__(self, fail_tables=()):
+        self.calls = []
+        self.fail_tables = fail_tables
+
+    def __call__(self, cursor, sql, rows, template=None, page_size=100):
+        if any(t in sql for t in self.fail_tables):
+            raise RuntimeError('bad row in batch')
+        self.calls.append((' '.join(sql.split()), template, list(rows)))
+
+
+class TestStatement:
+    """INSERT statements are split for execute_values"""
+
+    def test_split(self):
+        stmt = _Statement(SQL)
+        assert stmt.table == 'agape_activity_log'
+        assert stmt.template == '(%s, %s, %s)'
+        assert ' '.join(stmt.batch_sql.split()) == (
+            'INSERT INTO agape_activity_log (timestamp, level, message) VALUES %s')
+
+    def test_trailing_clause_kept(self):
+        stmt = _Statement("INSERT INTO t (a) VALUES (%s) ON CONFLICT DO NOTHING")
+        assert stmt.batch_sql == "INSERT INTO t (a) VALUES %s ON CONFLICT DO NOTHING"
+
+    def test_rejects_non_insert(self):
+        try:
+            _Statement("UPDATE t SET a = %s")
+        except ValueError:
+            return
+        raise AssertionError("UPDATE accepted")
+
+
+class TestBatching:
+    """Rows are grouped per statement into multi-row inserts"""
+
+    def test_size_trigger_groups_per_table(self):
+        queue, conn, _ = _queue(batch_size=4)
+        recorder = _RecordingExecuteValues()
+        with patch.object(write_behind, 'execute_values', recorder):
+            queue.enqueue(SQL, ('t1', 'INFO', 'a'))
+            queue.enqueue(OTHER_SQL, ('t1', 100.0))
+            queue.enqueue(SQL, ('t2', 'INFO', 'b'))
+            queue.enqueue(OTHER_SQL, ('t2', 101.0))
+            deadline = time.time() + 2
+            while queue.get_stats()['written'] < 4 and time.time() < deadline:
+                time.sleep(0.01)
+
+        assert [len(rows) for _, _, rows in recorder.calls] == [2, 2]
+        assert recorder.calls[0][2] == [('t1', 'INFO', 'a'), ('t2', 'INFO', 'b')]
+        stats = queue.get_stats()
+        assert stats['batches'] == 1
+        assert stats['tables'] == {'agape_activity_log': 2, 'agape_equity_snapshots': 2}
+        conn.close.assert_called_once()
+        queue.stop()
+
+    def test_interval_trigger(self):
+        queue, _, cursor = _queue(batch_size=100, flush_interval=0.05)
+        queue.enqueue(SQL, ('t1', 'INFO', 'a'))
+        assert queue.get_stats()['written'] == 0
+        time.sleep(0.3)
+        assert queue.get_stats()['written'] == 1
+        cursor.execute.assert_called_once_with(SQL, ('t1', 'INFO', 'a'))
+        queue.stop()
+
+    def test_failed_batch_retried_row_by_row(self):
+        queue, conn, cursor = _queue()
+        cursor.execute.side_effect = [None, RuntimeError('value too long'), None]
+        recorder = _RecordingExecuteValues(fail_tables=('agape_activity_log',))
+        with patch.object(write_behind, 'execute_values', recorder):
+            for i in range(3):
+                queue.enqueue(SQL, (f't{i}', 'INFO', str(i)))
+            assert queue.flush()
+
+        stats = queue.get_stats()
+        assert (stats['written'], stats['failed']) == (2, 1)
+        assert cursor.execute.call_count == 3
+
+    def test_prepare_hook_runs_once(self):
+        queue, _, _ = _queue()
+        hook = MagicMock()
+        queue.register_prepare('agape_activity_log', hook)
+        for _ in range(2):
+            queue.enqueue(SQL, ('t', 'INFO', 'x'))
+            queue.flush()
+        hook.assert_called_once()
+
+
+class TestBackPressure:
+    """A full queue drops rows instead of blocking the caller"""
+
+    def test_drops_when_full_and_flusher_stuck(self):
+        release = threading.Event()
+        conn = MagicMock()
+        conn.cursor.return_value.execute.side_effect = lambda *a: release.wait(2)
+        queue = WriteBehindQueue(connect=lambda: conn, batch_size=1, flush_interval=60,
+                                 max_pending=2, enqueue_wait=0.02)
+
+        queue.enqueue(SQL, ('t0', 'INFO', '0'))  # picked up by the flusher, then blocks
+        time.sleep(0.05)
+        start = time.monotonic()
+        results = [queue.enqueue(SQL, (f't{i}', 'INFO', str(i))) for i in range(1, 5)]
+        elapsed = time.monotonic() - start
+
+        assert results == [True, True, False, False]
+        assert elapsed < 0.5
+        assert queue.get_stats()['dropped'] == 2
+        release.set()
+        assert queue.stop()
+        assert queue.get_stats()['written'] == 3
+
+
+class TestShutdown:
+    """stop() drains the queue; later rows are written inline"""
+
+    def test_stop_flushes_then_writes_inline(self):
+        queue, _, cursor = _queue()
+        queue.enqueue(SQL, ('t1', 'INFO', 'a'))
+        assert queue.stop()
+        assert queue.get_stats()['written'] == 1
+
+        queue.enqueue(SQL, ('t2', 'INFO', 'b'))
+        assert queue.get_stats()['written'] == 2
+        assert cursor.execute.call_count == 2
+
+
+class TestScanNumbering:
+    """Scan numbers are seeded once per bot per day, then kept in memory"""
+
+    def setup_method(self):
+        from trading import scan_activity_logger
+        self.logger = scan_activity_logger
+        scan_activity_logger._scan_sequence.clear()
+
+    def test_seeded_once_then_incremented(self):
+        with patch.object(self.logger, '_seed_scan_number', return_value=41) as seed:
+            assert self.logger._get_scan_number_today('FORTRESS') == 42
+            assert self.logger._next_scan_number('FORTRESS') == 42
+            assert self.logger._next_scan_number('FORTRESS') == 43
+            assert self.logger._next_scan_number('SOLOMON') == 42
+        assert seed.call_count == 2
+
+    def test_new_day_reseeds(self):
+        self.logger._scan_sequence[('FORTRESS', date(2020, 1, 2))] = 300
+        with patch.object(self.logger, '_seed_scan_number', return_value=0):
+            assert self.logger._next_scan_number('FORTRESS') == 1
+        assert ('FORTRESS', date(2020, 1, 2)) not in self.logger._scan_sequence
+
+    def test_failed_seed_is_not_cached(self):
+        # DB down for the first scan, back for the second
+        with patch.object(self.logger, '_seed_scan_number', side_effect=[None, 57]) as seed:
+            assert self.logger._next_scan_number('FORTRESS') == 1
+            assert self.logger._scan_sequence == {}
+            assert self.logger._next_scan_number('FORTRESS') == 58
+            assert self.logger._next_scan_number('FORTRESS') == 59
+        assert seed.call_count == 2
+
+    def test_seed_query_failure_returns_none(self):
+        with patch('database_adapter.get_connection', side_effect=Exception('db down')):
+            assert self.logger._seed_scan_number('FORTRESS', date(2020, 1, 2)) is None
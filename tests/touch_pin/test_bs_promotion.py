@@ -41,3 +41,66 @@ def test_gamma_positive_atm():
 def test_vega_positive_atm():
     v = bs_vega(500.0, 500.0, 1/365, 0.20)
     assert v > 0
+
+
+def test_array_greeks_match_scalar():
+    import numpy as np
+    from quant.bs import (
+        bs_charm, bs_charm_array, bs_delta, bs_delta_array, bs_gamma_array,
+        bs_price_array, bs_vega_array,
+    )
+
+    rng = np.random.default_rng(1)
+    n = 500
+    S = rng.uniform(450.0, 550.0, n)
+    K = rng.uniform(400.0, 600.0, n)
+    T = rng.choice([0.0, 1 / 365, 5 / 365, 0.5], n)
+    sig = rng.choice([0.0, 0.15, 0.4, 1.2], n)
+    c = rng.random(n) < 0.5
+
+    cases = [
+        (bs_price, bs_price_array(S, K, T, sig, c), (S, K, T, sig, c)),
+        (bs_vega, bs_vega_array(S, K, T, sig), (S, K, T, sig)),
+        (bs_gamma, bs_gamma_array(S, K, T, sig), (S, K, T, sig)),
+        (bs_delta, bs_delta_array(S, K, T, sig, c), (S, K, T, sig, c)),
+        (bs_charm, bs_charm_array(S, K, T, sig), (S, K, T, sig)),
+    ]
+    for fn, vec, args in cases:
+        expected = np.array([fn(*row) for row in zip(*args)])
+        np.testing.assert_allclose(vec, expected, rtol=1e-10, atol=1e-12, err_msg=fn.__name__)
+
+
+def test_implied_vol_array_matches_scalar_including_rejections():
+    import numpy as np
+    from quant.bs import bs_price_array, implied_vol_array
+
+    rng = np.random.default_rng(2)
+    n = 2000
+    S = rng.uniform(450.0, 550.0, n)
+    K = rng.uniform(400.0, 600.0, n)
+    T = rng.choice([0.0, 1 / 365, 5 / 365, 0.25], n)
+    c = rng.random(n) < 0.5
+    # Fair prices, plus below-intrinsic and above-bound quotes that must reject.
+    price = bs_price_array(S, K, T, rng.uniform(0.05, 1.5, n), c)
+    price = price * rng.choice([1.0, 1.0, 0.5, 3.0], n) + rng.choice([0.0, -0.02, 0.02], n)
+    price[:10] = S[:10] + K[:10]
+
+    vec = implied_vol_array(price, S, K, T, c)
+    expected = np.array([
+        np.nan if iv is None else iv
+        for iv in (implied_vol(*row) for row in zip(price, S, K, T, c))
+    ])
+    assert np.array_equal(np.isnan(vec), np.isnan(expected))
+    assert np.isnan(vec[:10]).all()
+    np.testing.assert_allclose(vec, expected, rtol=1e-8, atol=1e-9, equal_nan=True)
+
+
+def test_implied_vol_array_broadcasts_scalar_spot():
+    import numpy as np
+    from quant.bs import bs_price_array, implied_vol_array
+
+    strikes = np.linspace(490.0, 510.0, 21)
+    prices = bs_price_array(500.0, strikes, 2 / 365, 0.22, True)
+    iv = implied_vol_array(prices, 500.0, strikes, 2 / 365, True)
+    assert iv.shape == strikes.shape
+    assert np.allclose(iv, 0.22, atol=1e-3)
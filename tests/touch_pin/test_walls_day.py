@@ -0,0 +1,66 @@
+"""Day-level wall table (quant.walls.build_day_walls / DayWalls)."""
+import numpy as np
+import pytest
+
+from quant.bs import bs_price
+from quant.walls import DayWalls, Walls, build_day_walls
+
+T = 1 / 365
+STRIKES = np.arange(495.0, 506.0)
+
+
+def _day_slice(spots):
+    """Model-priced chain for each minute's spot; one row per (minute, strike, right)."""
+    minute, strike, is_call, mid = [], [], [], []
+    for m, spot in spots.items():
+        for k in STRIKES:
+            for call in (True, False):
+                minute.append(m)
+                strike.append(k)
+                is_call.append(call)
+                mid.append(bs_price(spot, k, T, 0.20, is_call=call))
+    return np.array(minute), np.array(strike), np.array(is_call), np.array(mid)
+
+
+def _oi():
+    # Heavy call OI at 503, heavy put OI at 497
+    oi = {(float(k), r): 100 for k in STRIKES for r in ("C", "P")}
+    oi[(503.0, "C")] = 5000
+    oi[(497.0, "P")] = 5000
+    return oi
+
+
+def test_walls_for_every_minute_in_one_pass():
+    day = build_day_walls(*_day_slice({0: 500.0, 30: 501.0, 60: 499.5}), _oi(), t_years_at_open=T)
+
+    assert isinstance(day, DayWalls)
+    assert day.minutes.tolist() == [0, 30, 60]
+    assert day.spot == pytest.approx([500.0, 501.0, 499.5], abs=1e-6)
+    assert day.call_wall.tolist() == [503.0, 503.0, 503.0]
+    assert day.put_support.tolist() == [497.0, 497.0, 497.0]
+
+
+def test_minute_view_matches_single_minute_build():
+    slice_ = _day_slice({0: 500.0, 30: 501.0})
+    day = build_day_walls(*slice_, _oi(), t_years_at_open=T)
+    single = build_day_walls(*slice_, _oi(), t_years_at_open=T, minutes=[30])
+
+    walls = day.walls_at(30)
+    assert isinstance(walls, Walls)
+    assert walls == single.walls_at(30)
+    assert [s.strike for s in walls.by_strike] == STRIKES.tolist()
+    assert day.walls_at(15) is None
+
+
+def test_per_minute_time_to_expiry_and_missing_oi():
+    slice_ = _day_slice({0: 500.0, 60: 500.0})
+    day = build_day_walls(*slice_, _oi(), t_years_at_open=[T, T / 2], minutes=[60, 0])
+
+    assert day.minutes.tolist() == [0, 60]
+    # Each minute is solved at its own T, not the slice order or the first value
+    late = build_day_walls(*slice_, _oi(), t_years_at_open=T, minutes=[60])
+    early = build_day_walls(*slice_, _oi(), t_years_at_open=T / 2, minutes=[0])
+    assert day.walls_at(60) == late.walls_at(60)
+    assert day.walls_at(0) == early.walls_at(0)
+    assert not np.allclose(day.call_gamma_oi[0], day.call_gamma_oi[1])
+    assert build_day_walls(*slice_, {}, t_years_at_open=T) is None
@@ -21,6 +21,7 @@ CENTRAL_TZ = ZoneInfo("America/Chicago")
 
 get_connection = None
 try:
+    from db.write_behind import get_write_behind
     from database_adapter import get_connection
 except ImportError:
     logger.warning("AGAPE-AVAX-PERP DB: database_adapter not available")
@@ -467,83 +468,51 @@ class AgapeAvaxPerpDatabase:
             conn.close()
 
     def save_equity_snapshot(self, equity, unrealized_pnl, realized_cumulative, open_positions, avax_price=None, funding_rate=None):
-        conn = self._get_conn()
-        if not conn:
-            return False
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO agape_avax_perp_equity_snapshots
-                (equity, unrealized_pnl, realized_pnl_cumulative, open_positions, avax_price, funding_rate)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (equity, unrealized_pnl, realized_cumulative, open_positions, avax_price, funding_rate))
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"AGAPE-AVAX-PERP DB: Failed to save equity snapshot: {e}")
-            conn.rollback()
+        if get_connection is None:
             return False
-        finally:
-            cursor.close()
-            conn.close()
+        return get_write_behind().enqueue("""
+            INSERT INTO agape_avax_perp_equity_snapshots
+            (timestamp, equity, unrealized_pnl, realized_pnl_cumulative, open_positions, avax_price, funding_rate)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """, (_now_ct(), equity, unrealized_pnl, realized_cumulative, open_positions, avax_price, funding_rate))
 
     def log_scan(self, scan_data: Dict) -> bool:
-        conn = self._get_conn()
-        if not conn:
-            return False
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO agape_avax_perp_scan_activity (
-                    outcome, avax_price, funding_rate, funding_regime,
-                    ls_ratio, ls_bias, squeeze_risk, leverage_regime,
-                    max_pain, crypto_gex, crypto_gex_regime,
-                    combined_signal, combined_confidence,
-                    oracle_advice, oracle_win_prob,
-                    signal_action, signal_reasoning,
-                    position_id, error_message,
-                    oi_total_usd, ls_long_pct, taker_buy_ratio
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                scan_data.get("outcome"), scan_data.get("avax_price"),
-                scan_data.get("funding_rate"), scan_data.get("funding_regime"),
-                scan_data.get("ls_ratio"), scan_data.get("ls_bias"),
-                scan_data.get("squeeze_risk"), scan_data.get("leverage_regime"),
-                scan_data.get("max_pain"), scan_data.get("crypto_gex"),
-                scan_data.get("crypto_gex_regime"), scan_data.get("combined_signal"),
-                scan_data.get("combined_confidence"), scan_data.get("oracle_advice"),
-                scan_data.get("oracle_win_prob"), scan_data.get("signal_action"),
-                scan_data.get("signal_reasoning"), scan_data.get("position_id"),
-                scan_data.get("error_message"),
-                scan_data.get("oi_total_usd"), scan_data.get("ls_long_pct"),
-                scan_data.get("taker_buy_ratio"),
-            ))
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"AGAPE-AVAX-PERP DB: Failed to log scan: {e}")
-            conn.rollback()
+        if get_connection is None:
             return False
-        finally:
-            cursor.close()
-            conn.close()
+        return get_write_behind().enqueue("""
+            INSERT INTO agape_avax_perp_scan_activity (
+                timestamp, outcome, avax_price, funding_rate, funding_regime,
+                ls_ratio, ls_bias, squeeze_risk, leverage_regime,
+                max_pain, crypto_gex, crypto_gex_regime,
+                combined_signal, combined_confidence,
+                oracle_advice, oracle_win_prob,
+                signal_action, signal_reasoning,
+                position_id, error_message,
+                oi_total_usd, ls_long_pct, taker_buy_ratio
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, (
+            _now_ct(),
+            scan_data.get("outcome"), scan_data.get("avax_price"),
+            scan_data.get("funding_rate"), scan_data.get("funding_regime"),
+            scan_data.get("ls_ratio"), scan_data.get("ls_bias"),
+            scan_data.get("squeeze_risk"), scan_data.get("leverage_regime"),
+            scan_data.get("max_pain"), scan_data.get("crypto_gex"),
+            scan_data.get("crypto_gex_regime"), scan_data.get("combined_signal"),
+            scan_data.get("combined_confidence"), scan_data.get("oracle_advice"),
+            scan_data.get("oracle_win_prob"), scan_data.get("signal_action"),
+            scan_data.get("signal_reasoning"), scan_data.get("position_id"),
+            scan_data.get("error_message"),
+            scan_data.get("oi_total_usd"), scan_data.get("ls_long_pct"),
+            scan_data.get("taker_buy_ratio"),
+        ))
 
     def log(self, level, action, message, details=None):
-        conn = self._get_conn()
-        if not conn:
+        if get_connection is None:
             return
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO agape_avax_perp_activity_log (level, action, message, details)
-                VALUES (%s, %s, %s, %s)
-            """, (level, action, message, json.dumps(details) if details else None))
-            conn.commit()
-        except Exception:
-            conn.rollback()
-        finally:
-            cursor.close()
-            conn.close()
+        get_write_behind().enqueue("""
+            INSERT INTO agape_avax_perp_activity_log (timestamp, level, action, message, details)
+            VALUES (%s, %s, %s, %s, %s)
+        """, (_now_ct(), level, action, message, json.dumps(details) if details else None))
 
     def get_logs(self, limit=50):
         conn = self._get_conn()
@@ -16,6 +16,7 @@ CENTRAL_TZ = ZoneInfo("America/Chicago")
 
 get_connection = None
 try:
+    from db.write_behind import get_write_behind
     from database_adapter import get_connection
 except ImportError:
     logger.warning("AGAPE-BTC DB: database_adapter not available")
@@ -476,105 +477,72 @@ class AgapeBtcDatabase:
                             funding_rate: Optional[float] = None,
                             margin_used: float = 0, margin_available: float = 0,
                             margin_ratio: Optional[float] = None) -> bool:
-        conn = self._get_conn()
-        if not conn:
-            return False
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO agape_btc_equity_snapshots
-                (equity, unrealized_pnl, realized_pnl_cumulative,
-                 open_positions, btc_price, funding_rate,
-                 margin_used, margin_available, margin_ratio)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (equity, unrealized_pnl, realized_cumulative,
-                  open_positions, btc_price, funding_rate,
-                  margin_used, margin_available, margin_ratio))
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"AGAPE-BTC DB: Failed to save equity snapshot: {e}")
-            conn.rollback()
+        if get_connection is None:
             return False
-        finally:
-            cursor.close()
-            conn.close()
+        return get_write_behind().enqueue("""
+            INSERT INTO agape_btc_equity_snapshots
+            (timestamp, equity, unrealized_pnl, realized_pnl_cumulative,
+             open_positions, btc_price, funding_rate,
+             margin_used, margin_available, margin_ratio)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, (_now_ct(), equity, unrealized_pnl, realized_cumulative,
+              open_positions, btc_price, funding_rate,
+              margin_used, margin_available, margin_ratio))
 
     # ------------------------------------------------------------------
     # Scan Activity
     # ------------------------------------------------------------------
 
     def log_scan(self, scan_data: Dict) -> bool:
-        conn = self._get_conn()
-        if not conn:
-            return False
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO agape_btc_scan_activity (
-                    outcome, btc_price, funding_rate, funding_regime,
-                    ls_ratio, ls_bias, squeeze_risk, leverage_regime,
-                    max_pain, crypto_gex, crypto_gex_regime,
-                    combined_signal, combined_confidence,
-                    oracle_advice, oracle_win_prob,
-                    signal_action, signal_reasoning,
-                    position_id, error_message
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s
-                )
-            """, (
-                scan_data.get("outcome", "UNKNOWN"),
-                scan_data.get("btc_price"),
-                scan_data.get("funding_rate"),
-                scan_data.get("funding_regime"),
-                scan_data.get("ls_ratio"),
-                scan_data.get("ls_bias"),
-                scan_data.get("squeeze_risk"),
-                scan_data.get("leverage_regime"),
-                scan_data.get("max_pain"),
-                scan_data.get("crypto_gex"),
-                scan_data.get("crypto_gex_regime"),
-                scan_data.get("combined_signal"),
-                scan_data.get("combined_confidence"),
-                scan_data.get("oracle_advice"),
-                scan_data.get("oracle_win_prob"),
-                scan_data.get("signal_action"),
-                scan_data.get("signal_reasoning"),
-                scan_data.get("position_id"),
-                scan_data.get("error_message"),
-            ))
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"AGAPE-BTC DB: Failed to log scan: {e}")
-            conn.rollback()
+        if get_connection is None:
             return False
-        finally:
-            cursor.close()
-            conn.close()
+        return get_write_behind().enqueue("""
+            INSERT INTO agape_btc_scan_activity (
+                timestamp, outcome, btc_price, funding_rate, funding_regime,
+                ls_ratio, ls_bias, squeeze_risk, leverage_regime,
+                max_pain, crypto_gex, crypto_gex_regime,
+                combined_signal, combined_confidence,
+                oracle_advice, oracle_win_prob,
+                signal_action, signal_reasoning,
+                position_id, error_message
+            ) VALUES (
+                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                %s, %s, %s, %s, %s, %s, %s, %s, %s
+            )
+        """, (
+            _now_ct(),
+            scan_data.get("outcome", "UNKNOWN"),
+            scan_data.get("btc_price"),
+            scan_data.get("funding_rate"),
+            scan_data.get("funding_regime"),
+            scan_data.get("ls_ratio"),
+            scan_data.get("ls_bias"),
+            scan_data.get("squeeze_risk"),
+            scan_data.get("leverage_regime"),
+            scan_data.get("max_pain"),
+            scan_data.get("crypto_gex"),
+            scan_data.get("crypto_gex_regime"),
+            scan_data.get("combined_signal"),
+            scan_data.get("combined_confidence"),
+            scan_data.get("oracle_advice"),
+            scan_data.get("oracle_win_prob"),
+            scan_data.get("signal_action"),
+            scan_data.get("signal_reasoning"),
+            scan_data.get("position_id"),
+            scan_data.get("error_message"),
+        ))
 
     # ------------------------------------------------------------------
     # Activity Log
     # ------------------------------------------------------------------
 
     def log(self, level: str, action: str, message: str, details: Optional[Dict] = None):
-        conn = self._get_conn()
-        if not conn:
+        if get_connection is None:
             return
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO agape_btc_activity_log (level, action, message, details)
-                VALUES (%s, %s, %s, %s)
-            """, (level, action, message, json.dumps(details) if details else None))
-            conn.commit()
-        except Exception as e:
-            logger.error(f"AGAPE-BTC DB: Log failed: {e}")
-            conn.rollback()
-        finally:
-            cursor.close()
-            conn.close()
+        get_write_behind().enqueue("""
+            INSERT INTO agape_btc_activity_log (timestamp, level, action, message, details)
+            VALUES (%s, %s, %s, %s, %s)
+        """, (_now_ct(), level, action, message, json.dumps(details) if details else None))
 
     def get_logs(self, limit: int = 50) -> List[Dict]:
         conn = self._get_conn()
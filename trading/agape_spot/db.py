@@ -17,6 +17,7 @@ CENTRAL_TZ = ZoneInfo("America/Chicago")
 
 get_connection = None
 try:
+    from db.write_behind import get_write_behind
     from database_adapter import get_connection
 except ImportError:
     logger.warning("AGAPE-SPOT DB: database_adapter not available")
@@ -859,27 +860,15 @@ class AgapeSpotDatabase:
                              eth_price: Optional[float] = None,
                              funding_rate: Optional[float] = None) -> bool:
         """Save an equity snapshot for a specific ticker."""
-        conn = self._get_conn()
-        if not conn:
-            return False
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO agape_spot_equity_snapshots
-                (ticker, equity, unrealized_pnl, realized_pnl_cumulative,
-                 open_positions, eth_price, funding_rate)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, (ticker, equity, unrealized_pnl, realized_cumulative,
-                  open_positions, eth_price, funding_rate))
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"AGAPE-SPOT DB: Failed to save equity snapshot ({ticker}): {e}")
-            conn.rollback()
+        if get_connection is None:
             return False
-        finally:
-            cursor.close()
-            conn.close()
+        return get_write_behind().enqueue("""
+            INSERT INTO agape_spot_equity_snapshots
+            (timestamp, ticker, equity, unrealized_pnl, realized_pnl_cumulative,
+             open_positions, eth_price, funding_rate)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        """, (_now_ct(), ticker, equity, unrealized_pnl, realized_cumulative,
+              open_positions, eth_price, funding_rate))
 
     def get_equity_snapshots(self, ticker: Optional[str] = None, limit: int = 500) -> List[Dict]:
         """Get equity snapshots, optionally filtered by ticker."""
@@ -927,59 +916,48 @@ class AgapeSpotDatabase:
 
     def log_scan(self, scan_data: Dict) -> bool:
         """Log a scan cycle. scan_data should include 'ticker' key."""
-        conn = self._get_conn()
-        if not conn:
-            return False
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO agape_spot_scan_activity (
-                    ticker, outcome, eth_price, funding_rate, funding_regime,
-                    ls_ratio, ls_bias, squeeze_risk, leverage_regime,
-                    max_pain, crypto_gex, crypto_gex_regime,
-                    combined_signal, combined_confidence,
-                    oracle_advice, oracle_win_prob,
-                    signal_action, signal_reasoning,
-                    position_id, error_message,
-                    ml_probability, bayesian_probability
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s
-                )
-            """, (
-                scan_data.get("ticker", "ETH-USD"),
-                scan_data.get("outcome", "UNKNOWN"),
-                scan_data.get("eth_price"),
-                scan_data.get("funding_rate"),
-                scan_data.get("funding_regime"),
-                scan_data.get("ls_ratio"),
-                scan_data.get("ls_bias"),
-                scan_data.get("squeeze_risk"),
-                scan_data.get("leverage_regime"),
-                scan_data.get("max_pain"),
-                scan_data.get("crypto_gex"),
-                scan_data.get("crypto_gex_regime"),
-                scan_data.get("combined_signal"),
-                scan_data.get("combined_confidence"),
-                scan_data.get("oracle_advice"),
-                scan_data.get("oracle_win_prob"),
-                scan_data.get("signal_action"),
-                scan_data.get("signal_reasoning"),
-                scan_data.get("position_id"),
-                scan_data.get("error_message"),
-                scan_data.get("ml_probability"),
-                scan_data.get("bayesian_probability"),
-            ))
-            conn.commit()
-            return True
-        except Exception as e:
-            logger.error(f"AGAPE-SPOT DB: Failed to log scan: {e}")
-            conn.rollback()
+        if get_connection is None:
             return False
-        finally:
-            cursor.close()
-            conn.close()
+        return get_write_behind().enqueue("""
+            INSERT INTO agape_spot_scan_activity (
+                timestamp, ticker, outcome, eth_price, funding_rate, funding_regime,
+                ls_ratio, ls_bias, squeeze_risk, leverage_regime,
+                max_pain, crypto_gex, crypto_gex_regime,
+                combined_signal, combined_confidence,
+                oracle_advice, oracle_win_prob,
+                signal_action, signal_reasoning,
+                position_id, error_message,
+                ml_probability, bayesian_probability
+            ) VALUES (
+                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                %s, %s
+            )
+        """, (
+            _now_ct(),
+            scan_data.get("ticker", "ETH-USD"),
+            scan_data.get("outcome", "UNKNOWN"),
+            scan_data.get("eth_price"),
+            scan_data.get("funding_rate"),
+            scan_data.get("funding_regime"),
+            scan_data.get("ls_ratio"),
+            scan_data.get("ls_bias"),
+            scan_data.get("squeeze_risk"),
+            scan_data.get("leverage_regime"),
+            scan_data.get("max_pain"),
+            scan_data.get("crypto_gex"),
+            scan_data.get("crypto_gex_regime"),
+            scan_data.get("combined_signal"),
+            scan_data.get("combined_confidence"),
+            scan_data.get("oracle_advice"),
+            scan_data.get("oracle_win_prob"),
+            scan_data.get("signal_action"),
+            scan_data.get("signal_reasoning"),
+            scan_data.get("position_id"),
+            scan_data.get("error_message"),
+            scan_data.get("ml_probability"),
+            scan_data.get("bayesian_probability"),
+        ))
 
     # ------------------------------------------------------------------
     # ML Shadow predictions
@@ -1109,22 +1087,12 @@ class AgapeSpotDatabase:
     def log(self, level: str, action: str, message: str,
             details: Optional[Dict] = None, ticker: Optional[str] = None):
         """Log an activity event, optionally tagged with a ticker."""
-        conn = self._get_conn()
-        if not conn:
+        if get_connection is None:
             return
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO agape_spot_activity_log (ticker, level, action, message, details)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (ticker, level, action, message, json.dumps(details) if details else None))
-            conn.commit()
-        except Exception as e:
-            logger.error(f"AGAPE-SPOT DB: Log failed: {e}")
-            conn.rollback()
-        finally:
-            cursor.close()
-            conn.close()
+        get_write_behind().enqueue("""
+            INSERT INTO agape_spot_activity_log (timestamp, ticker, level, action, message, details)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, (_now_ct(), ticker, level, action, message, json.dumps(details) if details else None))
 
     def get_logs(self, ticker: Optional[str] = None, limit: int = 50) -> List[Dict]:
         """Get activity logs, optionally filtered by ticker."""
@@ -5,20 +5,119 @@ Provides real-time option price fetching from Tradier to calculate
 accurate unrealized P&L for open positions.
 
 This replaces estimation-based calculations with actual market quotes.
+
+Fleet-wide marking (mark_fleet_positions / get_fleet_mark_to_market) loads
+every open position across the options bots, dedupes their legs into one set
+of OCC symbols, fetches those in chunked concurrent markets/quotes calls and
+marks every position in one vectorized pass - per-tick cost scales with the
+number of unique legs, not positions x bots.
 """
 
 import os
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple, List
 from functools import lru_cache
 import time
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
-# Cache for option quotes (TTL-based)
-_quote_cache: Dict[str, Tuple[float, Dict]] = {}  # symbol -> (timestamp, quote)
 CACHE_TTL_SECONDS = 30  # Cache quotes for 30 seconds
+QUOTE_CACHE_MAX_ENTRIES = 5000  # LRU bound - a few days of 0DTE legs across all bots
+QUOTE_CHUNK_SIZE = 100  # Symbols per markets/quotes request (keeps the URL short)
+QUOTE_FETCH_WORKERS = 4  # Concurrent markets/quotes requests per batch
+
+
+class QuoteCache:
+    """Bounded LRU cache of option quotes with a TTL and hit/miss counters."""
+
+    def __init__(self, max_entries: int = QUOTE_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        with self._lock:
+            return self._get(symbol, time.time())
+
+    def get_many(self, symbols: List[str]) -> Tuple[Dict[str, Dict], List[str]]:
+        """Return (cached quotes, symbols that need fetching)."""
+        found, missing = {}, []
+        now = time.time()
+        with self._lock:
+            for symbol in symbols:
+                quote = self._get(symbol, now)
+                if quote is None:
+                    missing.append(symbol)
+                else:
+                    found[symbol] = quote
+        return found, missing
+
+    def _get(self, symbol: str, now: float) -> Optional[Dict]:
+        entry = self._entries.get(symbol)
+        if entry is None:
+            self.misses += 1
+            return None
+        cache_time, quote = entry
+        if now - cache_time >= self.ttl_seconds:
+            del self._entries[symbol]
+            self.expired += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(symbol)
+        self.hits += 1
+        return quote
+
+    def put(self, symbol: str, quote: Dict) -> None:
+        with self._lock:
+            self._entries[symbol] = (time.time(), quote)
+            self._entries.move_to_end(symbol)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._entries
+
+    def stats(self) -> Dict:
+        now = time.time()
+        with self._lock:
+            valid = sum(1 for ts, _ in self._entries.values() if now - ts < self.ttl_seconds)
+            lookups = self.hits + self.misses
+            return {
+                'total_entries': len(self._entries),
+                'valid_entries': valid,
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'evictions': self.evictions,
+                'hit_rate_pct': round(self.hits / lookups * 100, 1) if lookups else 0.0,
+            }
+
+
+# Cache for option quotes (bounded LRU + TTL)
+_quote_cache = QuoteCache()
 
 
 def _get_tradier_client(underlying: str = None, force_production: bool = False):
@@ -113,12 +212,10 @@ def get_option_quote(symbol: str, use_cache: bool = True) -> Optional[Dict]:
     Returns:
         Quote dict with bid, ask, last, etc. or None if unavailable
     """
-    global _quote_cache
-
     # Check cache
-    if use_cache and symbol in _quote_cache:
-        cache_time, cached_quote = _quote_cache[symbol]
-        if time.time() - cache_time < CACHE_TTL_SECONDS:
+    if use_cache:
+        cached_quote = _quote_cache.get(symbol)
+        if cached_quote is not None:
             return cached_quote
 
     # Detect underlying from OCC symbol (SPXW, SPY, etc.)
@@ -134,7 +231,7 @@ def get_option_quote(symbol: str, use_cache: bool = True) -> Optional[Dict]:
         quote = tradier.get_quote(symbol)
         if quote:
             # Cache the result
-            _quote_cache[symbol] = (time.time(), quote)
+            _quote_cache.put(symbol, quote)
             return quote
         else:
             logger.warning(f"Empty quote returned for {symbol} from Tradier API")
@@ -144,10 +241,48 @@ def get_option_quote(symbol: str, use_cache: bool = True) -> Optional[Dict]:
     return None
 
 
+def _fetch_quote_chunk(tradier, symbols: List[str]) -> Dict[str, Dict]:
+    """One markets/quotes request for up to QUOTE_CHUNK_SIZE symbols."""
+    results = {}
+    try:
+        # Tradier supports comma-separated symbols
+        response = tradier._make_request(
+            'GET',
+            'markets/quotes',
+            params={'symbols': ','.join(symbols)}
+        )
+
+        if response is None:
+            logger.warning(f"Null response from Tradier batch quote API for {len(symbols)} symbols")
+            return results
+
+        quotes = response.get('quotes', {})
+        if 'quote' in quotes:
+            quote_data = quotes['quote']
+            # Handle single quote vs list
+            if isinstance(quote_data, dict):
+                quote_data = [quote_data]
+
+            for quote in quote_data:
+                symbol = quote.get('symbol', '')
+                if symbol:
+                    _quote_cache.put(symbol, quote)
+                    results[symbol] = quote
+        else:
+            logger.warning(f"No 'quote' key in Tradier response for symbols: {symbols[:3]}...")
+    except Exception as e:
+        logger.warning(f"Failed to fetch batch quotes: {e}")
+    return results
+
+
 def get_option_quotes_batch(symbols: List[str], use_cache: bool = True) -> Dict[str, Dict]:
     """
     Get multiple option quotes efficiently.
 
+    Symbols are deduped, served from the quote cache where fresh, and the
+    rest fetched in QUOTE_CHUNK_SIZE chunks with up to QUOTE_FETCH_WORKERS
+    markets/quotes requests in flight.
+
     Args:
         symbols: List of OCC option symbols
         use_cache: Whether to use cached quotes
@@ -155,23 +290,13 @@ def get_option_quotes_batch(symbols: List[str], use_cache: bool = True) -> Dict[
     Returns:
         Dict mapping symbol to quote data
     """
-    global _quote_cache
-    results = {}
-    symbols_to_fetch = []
+    unique_symbols = list(dict.fromkeys(symbols))
 
     # Check cache first
     if use_cache:
-        for symbol in symbols:
-            if symbol in _quote_cache:
-                cache_time, cached_quote = _quote_cache[symbol]
-                if time.time() - cache_time < CACHE_TTL_SECONDS:
-                    results[symbol] = cached_quote
-                else:
-                    symbols_to_fetch.append(symbol)
-            else:
-                symbols_to_fetch.append(symbol)
+        results, symbols_to_fetch = _quote_cache.get_many(unique_symbols)
     else:
-        symbols_to_fetch = symbols
+        results, symbols_to_fetch = {}, unique_symbols
 
     # Fetch remaining from Tradier
     if symbols_to_fetch:
@@ -180,34 +305,15 @@ def get_option_quotes_batch(symbols: List[str], use_cache: bool = True) -> Dict[
         underlying = 'SPXW' if has_spx else None
         tradier = _get_tradier_client(underlying=underlying)
         if tradier:
-            try:
-                # Tradier supports comma-separated symbols
-                response = tradier._make_request(
-                    'GET',
-                    'markets/quotes',
-                    params={'symbols': ','.join(symbols_to_fetch)}
-                )
-
-                if response is None:
-                    logger.warning(f"Null response from Tradier batch quote API for {len(symbols_to_fetch)} symbols")
-                else:
-                    quotes = response.get('quotes', {})
-
-                    if 'quote' in quotes:
-                        quote_data = quotes['quote']
-                        # Handle single quote vs list
-                        if isinstance(quote_data, dict):
-                            quote_data = [quote_data]
-
-                        for quote in quote_data:
-                            symbol = quote.get('symbol', '')
-                            if symbol:
-                                _quote_cache[symbol] = (time.time(), quote)
-                                results[symbol] = quote
-                    else:
-                        logger.warning(f"No 'quote' key in Tradier response for symbols: {symbols_to_fetch[:3]}...")
-            except Exception as e:
-                logger.warning(f"Failed to fetch batch quotes: {e}")
+            chunks = [symbols_to_fetch[i:i + QUOTE_CHUNK_SIZE]
+                      for i in range(0, len(symbols_to_fetch), QUOTE_CHUNK_SIZE)]
+            if len(chunks) == 1:
+                results.update(_fetch_quote_chunk(tradier, chunks[0]))
+            else:
+                with ThreadPoolExecutor(max_workers=min(QUOTE_FETCH_WORKERS, len(chunks)),
+                                        thread_name_prefix="mtm-quotes") as pool:
+                    for chunk_quotes in pool.map(lambda c: _fetch_quote_chunk(tradier, c), chunks):
+                        results.update(chunk_quotes)
         else:
             logger.warning(f"No Tradier client for batch quote - SPX={has_spx}, check TRADIER_API_KEY env var")
 
@@ -458,19 +564,325 @@ def calculate_spread_mark_to_market(
     return result
 
 
+# =============================================================================
+# FLEET MARK-TO-MARKET
+# =============================================================================
+
+# Leg layout per structure: (leg name, option type or None for the spread's
+# type, sign in the position value). IC value is the debit to close
+# (put_short - put_long) + (call_short - call_long); a debit spread is worth
+# long - short.
+_STRUCTURE_LEGS = {
+    'iron_condor': (
+        ('put_short', 'P', 1.0),
+        ('put_long', 'P', -1.0),
+        ('call_short', 'C', 1.0),
+        ('call_long', 'C', -1.0),
+    ),
+    'spread': (
+        ('long', None, 1.0),
+        ('short', None, -1.0),
+    ),
+}
+
+# Open-position sources marked on every fleet tick:
+# bot -> (positions table, structure, underlying or None to read the ticker column)
+FLEET_MTM_BOTS = {
+    'fortress': ('fortress_positions', 'iron_condor', 'SPY'),
+    'samson': ('samson_positions', 'iron_condor', 'SPX'),
+    'anchor': ('anchor_positions', 'iron_condor', 'SPX'),
+    'faith': ('faith_positions', 'iron_condor', None),
+    'grace': ('grace_positions', 'iron_condor', None),
+    'solomon': ('solomon_positions', 'spread', 'SPY'),
+    'gideon': ('gideon_positions', 'spread', 'SPY'),
+}
+
+FLEET_MTM_MAX_AGE_SECONDS = 15  # Fleet results shared by callers within one tick
+
+
+@dataclass
+class MTMPosition:
+    """One open position to be marked. Strikes are keyed by leg name."""
+    bot: str
+    position_id: str
+    underlying: str
+    expiration: str
+    structure: str  # 'iron_condor' or 'spread'
+    strikes: Dict[str, float]
+    contracts: int
+    entry_price: float  # credit for ICs, debit for spreads
+    spread_type: str = ''
+
+
+def _spread_option_type(spread_type: str) -> str:
+    spread_upper = (spread_type or '').upper()
+    return 'C' if 'CALL' in spread_upper or 'BULL' in spread_upper else 'P'
+
+
+def mark_positions(positions: List[MTMPosition], use_cache: bool = True) -> List[Dict]:
+    """
+    Mark many positions with one batched quote fetch and one vectorized pass.
+
+    Every leg is turned into an OCC symbol, the symbols are deduped (bots and
+    positions that share strikes share a quote) and fetched through
+    get_option_quotes_batch, then position values are summed per position
+    with np.bincount. Results have the same shape as
+    calculate_ic_mark_to_market / calculate_spread_mark_to_market plus
+    bot and position_id.
+    """
+    if not positions:
+        return []
+
+    leg_pos, leg_sign, leg_symbol_idx, leg_names = [], [], [], []
+    symbol_index: Dict[str, int] = {}
+    position_symbols: List[Dict[str, str]] = []
+
+    for i, pos in enumerate(positions):
+        exp_str = pos.expiration if isinstance(pos.expiration, str) else pos.expiration.strftime('%Y-%m-%d')
+        spread_type = _spread_option_type(pos.spread_type)
+        symbols = {}
+        for leg, option_type, sign in _STRUCTURE_LEGS[pos.structure]:
+            symbol = build_occ_symbol(pos.underlying, exp_str, pos.strikes[leg], option_type or spread_type)
+            symbols[leg] = symbol
+            leg_pos.append(i)
+            leg_sign.append(sign)
+            leg_symbol_idx.append(symbol_index.setdefault(symbol, len(symbol_index)))
+            leg_names.append(leg)
+        position_symbols.append(symbols)
+
+    unique_symbols = list(symbol_index)
+    quotes = get_option_quotes_batch(unique_symbols, use_cache=use_cache)
+
+    # Mid per unique symbol: (bid+ask)/2 when both are positive, else last, else 0.
+    # Symbols without a quote are NaN so the positions using them can be failed.
+    n_symbols = len(unique_symbols)
+    bid = np.zeros(n_symbols)
+    ask = np.zeros(n_symbols)
+    last = np.zeros(n_symbols)
+    have_quote = np.zeros(n_symbols, dtype=bool)
+    for j, symbol in enumerate(unique_symbols):
+        quote = quotes.get(symbol)
+        if not quote:
+            continue
+        have_quote[j] = True
+        bid[j] = float(quote.get('bid') or 0)
+        ask[j] = float(quote.get('ask') or 0)
+        last[j] = float(quote.get('last') or 0)
+    mids = np.where((bid > 0) & (ask > 0), (bid + ask) / 2, last)
+
+    leg_pos = np.asarray(leg_pos)
+    leg_symbol_idx = np.asarray(leg_symbol_idx)
+    leg_mid = mids[leg_symbol_idx]
+    leg_missing = ~have_quote[leg_symbol_idx]
+
+    n_positions = len(positions)
+    values = np.bincount(leg_pos, weights=np.asarray(leg_sign) * leg_mid, minlength=n_positions)
+    missing_legs = np.bincount(leg_pos, weights=leg_missing, minlength=n_positions)
+    entry = np.array([float(p.entry_price) for p in positions])
+    contracts = np.array([float(p.contracts) for p in positions])
+    is_ic = np.array([p.structure == 'iron_condor' for p in positions])
+    pnl = np.where(is_ic, entry - values, values - entry) * 100 * contracts
+
+    results = []
+    for i, pos in enumerate(positions):
+        symbols = position_symbols[i]
+        result = {
+            'bot': pos.bot,
+            'position_id': pos.position_id,
+            'success': False,
+            'current_value': None,
+            'unrealized_pnl': None,
+            'quotes': {leg: quotes.get(sym) for leg, sym in symbols.items()},
+            'method': 'mark_to_market',
+            'error': None,
+        }
+        if missing_legs[i]:
+            missing = [leg for leg, sym in symbols.items() if not quotes.get(sym)]
+            result['error'] = f"Missing quotes for: {missing}"
+        else:
+            result['success'] = True
+            result['current_value'] = round(float(values[i]), 4)
+            result['unrealized_pnl'] = round(float(pnl[i]), 2)
+            result['leg_prices'] = {
+                f'{leg}_mid': float(mids[symbol_index[sym]]) for leg, sym in symbols.items()
+            }
+        results.append(result)
+
+    return results
+
+
+def _load_open_positions(cursor, bots: List[str]) -> Tuple[List[MTMPosition], Dict[str, str]]:
+    """Read open positions for each bot. Returns (positions, per-bot load errors)."""
+    positions: List[MTMPosition] = []
+    errors: Dict[str, str] = {}
+
+    for bot in bots:
+        table, structure, underlying = FLEET_MTM_BOTS[bot]
+        try:
+            if structure == 'iron_condor':
+                ticker_col = 'ticker' if underlying is None else 'NULL'
+                cursor.execute(f"""
+                    SELECT position_id, total_credit, contracts,
+                           put_short_strike, put_long_strike, call_short_strike, call_long_strike,
+                           expiration, {ticker_col}
+                    FROM {table}
+                    WHERE status = 'open'
+                """)
+                for pos_id, credit, contracts, put_short, put_long, call_short, call_long, exp, ticker in cursor.fetchall():
+                    if not all([credit, contracts, put_short, put_long, call_short, call_long, exp]):
+                        continue
+                    positions.append(MTMPosition(
+                        bot=bot,
+                        position_id=pos_id,
+                        underlying=underlying or ticker or 'SPY',
+                        expiration=str(exp),
+                        structure=structure,
+                        strikes={
+                            'put_short': float(put_short),
+                            'put_long': float(put_long),
+                            'call_short': float(call_short),
+                            'call_long': float(call_long),
+                        },
+                        contracts=int(contracts),
+                        entry_price=float(credit),
+                    ))
+            else:
+                cursor.execute(f"""
+                    SELECT position_id, spread_type, entry_debit, contracts,
+                           long_strike, short_strike, expiration
+                    FROM {table}
+                    WHERE status = 'open'
+                """)
+                for pos_id, spread_type, debit, contracts, long_strike, short_strike, exp in cursor.fetchall():
+                    if not all([debit, contracts, long_strike, short_strike, exp]):
+                        continue
+                    positions.append(MTMPosition(
+                        bot=bot,
+                        position_id=pos_id,
+                        underlying=underlying,
+                        expiration=str(exp),
+                        structure=structure,
+                        strikes={'long': float(long_strike), 'short': float(short_strike)},
+                        contracts=int(contracts),
+                        entry_price=float(debit),
+                        spread_type=spread_type or 'call_debit',
+                    ))
+        except Exception as e:
+            # Table may not exist yet - a failed statement aborts the transaction
+            errors[bot] = str(e)
+            try:
+                cursor.connection.rollback()
+            except Exception:
+                pass
+
+    return positions, errors
+
+
+def mark_fleet_positions(bots: Optional[List[str]] = None, use_cache: bool = True) -> Dict[str, Dict]:
+    """
+    Mark every open position across the fleet in one pass.
+
+    Loads open positions for all bots with a single connection, then calls
+    mark_positions once so the whole tick costs one deduped, chunked quote
+    fetch.
+
+    Returns:
+        Dict bot -> {unrealized_pnl, open_positions, marked, failed, method,
+        positions, error}. method is 'mark_to_market' when at least one
+        position was marked, so callers can fall back per bot.
+    """
+    bots = list(bots or FLEET_MTM_BOTS)
+    summary = {
+        bot: {
+            'unrealized_pnl': 0.0,
+            'open_positions': 0,
+            'marked': 0,
+            'failed': 0,
+            'method': 'none',
+            'positions': [],
+            'error': None,
+        }
+        for bot in bots
+    }
+
+    try:
+        from database_adapter import get_connection
+        conn = get_connection()
+    except Exception as e:
+        logger.warning(f"Fleet MTM: no database connection: {e}")
+        for bot_summary in summary.values():
+            bot_summary['method'] = 'failed'
+            bot_summary['error'] = str(e)
+        return summary
+
+    try:
+        cursor = conn.cursor()
+        positions, errors = _load_open_positions(cursor, bots)
+        cursor.close()
+    finally:
+        conn.close()
+
+    for bot, error in errors.items():
+        summary[bot]['error'] = error
+
+    started = time.time()
+    for result in mark_positions(positions, use_cache=use_cache):
+        bot_summary = summary[result['bot']]
+        bot_summary['open_positions'] += 1
+        bot_summary['positions'].append(result)
+        if result['success']:
+            bot_summary['marked'] += 1
+            bot_summary['unrealized_pnl'] += result['unrealized_pnl']
+            bot_summary['method'] = 'mark_to_market'
+        else:
+            bot_summary['failed'] += 1
+
+    for bot_summary in summary.values():
+        bot_summary['unrealized_pnl'] = round(bot_summary['unrealized_pnl'], 2)
+        if bot_summary['open_positions'] and bot_summary['method'] != 'mark_to_market':
+            bot_summary['method'] = 'failed'
+
+    logger.debug(
+        f"Fleet MTM: {len(positions)} positions across {len(bots)} bots "
+        f"marked in {(time.time() - started) * 1000:.0f}ms"
+    )
+    return summary
+
+
+_fleet_lock = threading.Lock()
+_fleet_result: Optional[Tuple[float, Dict[str, Dict]]] = None
+
+
+def get_fleet_mark_to_market(max_age: float = FLEET_MTM_MAX_AGE_SECONDS) -> Dict[str, Dict]:
+    """
+    Shared fleet marks for the current tick.
+
+    The equity snapshot job and the metrics endpoints all ask for the same
+    marks; the first caller computes them and concurrent callers wait on the
+    lock and reuse that result instead of re-fetching.
+    """
+    global _fleet_result
+
+    cached = _fleet_result
+    if cached and time.time() - cached[0] < max_age:
+        return cached[1]
+
+    with _fleet_lock:
+        cached = _fleet_result
+        if cached and time.time() - cached[0] < max_age:
+            return cached[1]
+        result = mark_fleet_positions()
+        _fleet_result = (time.time(), result)
+        return result
+
+
 def clear_quote_cache():
-    """Clear the quote cache."""
-    global _quote_cache
-    _quote_cache = {}
+    """Clear the quote cache and the shared fleet marks."""
+    global _fleet_result
+    _quote_cache.clear()
+    _fleet_result = None
 
 
 def get_cache_stats() -> Dict:
     """Get cache statistics."""
-    global _quote_cache
-    now = time.time()
-    valid_count = sum(1 for ts, _ in _quote_cache.values() if now - ts < CACHE_TTL_SECONDS)
-    return {
-        'total_entries': len(_quote_cache),
-        'valid_entries': valid_count,
-        'ttl_seconds': CACHE_TTL_SECONDS,
-    }
+    return _quote_cache.stats()
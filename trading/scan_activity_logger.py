@@ -10,6 +10,10 @@ on every single scan. No more mystery - you'll see exactly:
 4. WHY a trade was or wasn't taken
 5. WHAT checks were performed and their results
 
+Rows are queued on the shared write-behind buffer (db/write_behind.py) and
+written in batches off the scan thread, so logging adds no database round
+trip to a scan.
+
 Usage:
     from trading.scan_activity_logger import log_scan_activity, ScanOutcome
 
@@ -25,11 +29,12 @@ Usage:
 
 import json
 import logging
+import threading
 from dataclasses import dataclass, field, asdict
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
@@ -271,31 +276,38 @@ def _generate_scan_id(bot_name: str) -> str:
     return f"{bot_name}-{now.strftime('%Y%m%d-%H%M%S')}-{_scan_counters[bot_name]:04d}"
 
 
-def _get_scan_number_today(bot_name: str) -> int:
-    """Get the scan number for today from database.
+# In-memory scan numbering: seeded from the table once per bot per day, then
+# incremented locally so a scan never waits on a MAX(scan_number) query.
+# Keyed by (bot_name, date); rows still queued in the write-behind buffer are
+# counted because the sequence never re-reads the table after seeding.
+_scan_sequence: Dict[Tuple[str, date], int] = {}
+_scan_sequence_lock = threading.Lock()
+
+
+def _seed_scan_number(bot_name: str, today: date) -> Optional[int]:
+    """Last scan number already stored for bot_name today (0 if none).
+
+    Returns None when the table could not be read, so the caller does not
+    cache a seed that would restart the day's numbering at 1.
 
     CRITICAL: Uses finally block to prevent connection leaks.
-    This function is called on EVERY scan, so leaks here cause
-    pool exhaustion over time (the 6:05 AM stoppage root cause).
     """
     conn = None
     try:
         from database_adapter import get_connection
         conn = get_connection()
         c = conn.cursor()
-
-        today = datetime.now(CENTRAL_TZ).date()
         c.execute("""
-            SELECT COALESCE(MAX(scan_number), 0) + 1
+            SELECT COALESCE(MAX(scan_number), 0)
             FROM scan_activity
             WHERE bot_name = %s AND date = %s
         """, (bot_name, today))
 
         result = c.fetchone()
-        return result[0] if result else 1
+        return result[0] if result else 0
     except Exception as e:
-        logger.debug(f"Could not get scan number: {e}")
-        return _scan_counters.get(bot_name, 0) + 1
+        logger.debug(f"Could not seed scan number: {e}")
+        return None
     finally:
         # CRITICAL: Always close connection to prevent pool exhaustion
         try:
@@ -305,6 +317,219 @@ def _get_scan_number_today(bot_name: str) -> int:
             pass
 
 
+def _current_scan_number(bot_name: str, today: date) -> Optional[int]:
+    """Last scan number claimed for bot_name today, or None if it could not
+    be seeded (the next call tries the table again)."""
+    # Caller holds _scan_sequence_lock
+    key = (bot_name, today)
+    if key not in _scan_sequence:
+        # New day: drop yesterday's counters and seed from the table
+        for stale in [k for k in _scan_sequence if k[1] != today]:
+            del _scan_sequence[stale]
+        seed = _seed_scan_number(bot_name, today)
+        if seed is None:
+            return None
+        _scan_sequence[key] = seed
+    return _scan_sequence[key]
+
+
+def _get_scan_number_today(bot_name: str) -> int:
+    """Scan number the next logged scan for bot_name will get (does not consume it)."""
+    today = datetime.now(CENTRAL_TZ).date()
+    with _scan_sequence_lock:
+        return (_current_scan_number(bot_name, today) or 0) + 1
+
+
+def _next_scan_number(bot_name: str) -> int:
+    """Claim the next scan number for bot_name today."""
+    today = datetime.now(CENTRAL_TZ).date()
+    with _scan_sequence_lock:
+        current = _current_scan_number(bot_name, today)
+        if current is None:
+            # Unseeded (DB unavailable): don't start a sequence from 0
+            return 1
+        _scan_sequence[(bot_name, today)] = current + 1
+        return current + 1
+
+
+def _ensure_scan_activity_table(c) -> None:
+    """Create scan_activity and add any missing columns.
+
+    Runs once per process, on the write-behind flusher, before the first
+    batch of scan rows is written.
+    """
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS scan_activity (
+            id SERIAL PRIMARY KEY,
+            bot_name VARCHAR(50) NOT NULL,
+            scan_id VARCHAR(100) NOT NULL UNIQUE,
+            scan_number INTEGER NOT NULL,
+            timestamp TIMESTAMP NOT NULL,
+            date DATE NOT NULL,
+            time_ct VARCHAR(20) NOT NULL,
+            outcome VARCHAR(50) NOT NULL,
+            action_taken VARCHAR(100),
+            decision_summary TEXT NOT NULL,
+            full_reasoning TEXT,
+            underlying_price DECIMAL(15, 4),
+            underlying_symbol VARCHAR(10),
+            vix DECIMAL(10, 4),
+            expected_move DECIMAL(10, 4),
+            gex_regime VARCHAR(50),
+            net_gex DECIMAL(20, 2),
+            call_wall DECIMAL(15, 4),
+            put_wall DECIMAL(15, 4),
+            distance_to_call_wall_pct DECIMAL(10, 4),
+            distance_to_put_wall_pct DECIMAL(10, 4),
+            signal_source VARCHAR(50),
+            signal_direction VARCHAR(20),
+            signal_confidence DECIMAL(5, 4),
+            signal_win_probability DECIMAL(5, 4),
+            oracle_advice VARCHAR(50),
+            oracle_reasoning TEXT,
+            oracle_win_probability DECIMAL(5, 4),
+            oracle_confidence DECIMAL(5, 4),
+            oracle_top_factors JSONB,
+            oracle_probabilities JSONB,
+            oracle_suggested_strikes JSONB,
+            oracle_thresholds JSONB,
+            min_win_probability_threshold DECIMAL(5, 4),
+            risk_reward_ratio DECIMAL(10, 4),
+            checks_performed JSONB,
+            all_checks_passed BOOLEAN DEFAULT TRUE,
+            trade_executed BOOLEAN DEFAULT FALSE,
+            position_id VARCHAR(100),
+            strike_selection JSONB,
+            contracts INTEGER,
+            premium_collected DECIMAL(15, 4),
+            max_risk DECIMAL(15, 4),
+            error_message TEXT,
+            error_type VARCHAR(100),
+            what_would_trigger TEXT,
+            market_insight TEXT,
+            full_context JSONB,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Add new columns if they don't exist (for existing tables)
+    # Note: These are safe migrations - ADD COLUMN IF NOT EXISTS won't error
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS risk_reward_ratio DECIMAL(10, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS what_would_trigger TEXT")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS market_insight TEXT")
+    # Prophet context columns
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_win_probability DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_confidence DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_top_factors JSONB")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_probabilities JSONB")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_suggested_strikes JSONB")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_thresholds JSONB")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS min_win_probability_threshold DECIMAL(5, 4)")
+    # === NEW: Quant ML Advisor columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_advice VARCHAR(50)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_win_probability DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_confidence DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_suggested_risk_pct DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_suggested_sd_multiplier DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_top_factors JSONB")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_model_version VARCHAR(50)")
+    # === NEW: ML Regime Classifier columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS regime_predicted_action VARCHAR(50)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS regime_confidence DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS regime_probabilities JSONB")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS regime_feature_importance JSONB")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS regime_model_version VARCHAR(50)")
+    # === NEW: GEX Directional ML columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS gex_ml_direction VARCHAR(20)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS gex_ml_confidence DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS gex_ml_probabilities JSONB")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS gex_ml_features_used JSONB")
+    # === NEW: Ensemble Strategy columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_signal VARCHAR(50)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_confidence DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_bullish_weight DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_bearish_weight DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_neutral_weight DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_should_trade BOOLEAN")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_position_size_multiplier DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_component_signals JSONB")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_reasoning TEXT")
+    # === NEW: Volatility Regime columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS volatility_regime VARCHAR(50)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS volatility_risk_level VARCHAR(20)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS volatility_description TEXT")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS at_flip_point BOOLEAN")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS flip_point DECIMAL(15, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS flip_point_distance_pct DECIMAL(10, 4)")
+    # === NEW: Psychology Patterns columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS psychology_pattern VARCHAR(100)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS liberation_setup BOOLEAN")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS false_floor_detected BOOLEAN")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS forward_magnets JSONB")
+    # === NEW: Monte Carlo Kelly columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS kelly_optimal DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS kelly_safe DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS kelly_conservative DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS kelly_prob_ruin DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS kelly_recommendation TEXT")
+    # === NEW: WATCHTOWER Pattern Analysis columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS argus_pattern_match VARCHAR(100)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS argus_similarity_score DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS argus_historical_outcome VARCHAR(50)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS argus_roc_value DECIMAL(10, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS argus_roc_signal VARCHAR(50)")
+    # === NEW: IV Context columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS iv_rank DECIMAL(5, 2)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS iv_percentile DECIMAL(5, 2)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS iv_hv_ratio DECIMAL(5, 2)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS iv_30d DECIMAL(5, 2)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS hv_30d DECIMAL(5, 2)")
+    # === NEW: Time Context columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS day_of_week VARCHAR(20)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS day_of_week_num INTEGER")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS time_of_day VARCHAR(20)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS hour_ct INTEGER")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS minute_ct INTEGER")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS days_to_monthly_opex INTEGER")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS days_to_weekly_opex INTEGER")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS is_opex_week BOOLEAN")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS is_fomc_day BOOLEAN")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS is_cpi_day BOOLEAN")
+    # === NEW: Recent Performance Context columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS similar_setup_win_rate DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS similar_setup_count INTEGER")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS similar_setup_avg_pnl DECIMAL(15, 2)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS current_streak INTEGER")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS streak_type VARCHAR(10)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS last_5_trades_win_rate DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS last_10_trades_win_rate DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS daily_pnl DECIMAL(15, 2)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS weekly_pnl DECIMAL(15, 2)")
+    # === NEW: ML Consensus & Conflict Detection columns ===
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_consensus VARCHAR(50)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_consensus_score DECIMAL(5, 4)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_systems_agree INTEGER")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_systems_total INTEGER")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_conflicts JSONB")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_conflict_severity VARCHAR(20)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_highest_confidence_system VARCHAR(50)")
+    c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_highest_confidence_value DECIMAL(5, 4)")
+
+
+_write_behind = None
+
+
+def _get_write_behind():
+    """Process-wide write-behind queue with the scan_activity DDL registered."""
+    global _write_behind
+    if _write_behind is None:
+        from db.write_behind import get_write_behind
+        queue = get_write_behind()
+        queue.register_prepare("scan_activity", _ensure_scan_activity_table)
+        _write_behind = queue
+    return _write_behind
+
+
 def log_scan_activity(
     bot_name: str,
     outcome: ScanOutcome,
@@ -536,13 +761,10 @@ def log_scan_activity(
         # Clamp to valid range
         return max(-max_val, min(max_val, val))
 
-    conn = None  # Initialize to prevent NameError in finally block
     try:
-        from database_adapter import get_connection
-
         now = datetime.now(CENTRAL_TZ)
         scan_id = _generate_scan_id(bot_name)
-        scan_number = _get_scan_number_today(bot_name)
+        scan_number = _next_scan_number(bot_name)
 
         # Extract market data
         underlying_price = 0
@@ -596,176 +818,6 @@ def log_scan_activity(
         context['market_data'] = market_data
         context['gex_data'] = gex_data
 
-        conn = get_connection()
-        c = conn.cursor()
-
-        # Ensure table exists with all columns
-        c.execute("""
-            CREATE TABLE IF NOT EXISTS scan_activity (
-                id SERIAL PRIMARY KEY,
-                bot_name VARCHAR(50) NOT NULL,
-                scan_id VARCHAR(100) NOT NULL UNIQUE,
-                scan_number INTEGER NOT NULL,
-                timestamp TIMESTAMP NOT NULL,
-                date DATE NOT NULL,
-                time_ct VARCHAR(20) NOT NULL,
-                outcome VARCHAR(50) NOT NULL,
-                action_taken VARCHAR(100),
-                decision_summary TEXT NOT NULL,
-                full_reasoning TEXT,
-                underlying_price DECIMAL(15, 4),
-                underlying_symbol VARCHAR(10),
-                vix DECIMAL(10, 4),
-                expected_move DECIMAL(10, 4),
-                gex_regime VARCHAR(50),
-                net_gex DECIMAL(20, 2),
-                call_wall DECIMAL(15, 4),
-                put_wall DECIMAL(15, 4),
-                distance_to_call_wall_pct DECIMAL(10, 4),
-                distance_to_put_wall_pct DECIMAL(10, 4),
-                signal_source VARCHAR(50),
-                signal_direction VARCHAR(20),
-                signal_confidence DECIMAL(5, 4),
-                signal_win_probability DECIMAL(5, 4),
-                oracle_advice VARCHAR(50),
-                oracle_reasoning TEXT,
-                oracle_win_probability DECIMAL(5, 4),
-                oracle_confidence DECIMAL(5, 4),
-                oracle_top_factors JSONB,
-                oracle_probabilities JSONB,
-                oracle_suggested_strikes JSONB,
-                oracle_thresholds JSONB,
-                min_win_probability_threshold DECIMAL(5, 4),
-                risk_reward_ratio DECIMAL(10, 4),
-                checks_performed JSONB,
-                all_checks_passed BOOLEAN DEFAULT TRUE,
-                trade_executed BOOLEAN DEFAULT FALSE,
-                position_id VARCHAR(100),
-                strike_selection JSONB,
-                contracts INTEGER,
-                premium_collected DECIMAL(15, 4),
-                max_risk DECIMAL(15, 4),
-                error_message TEXT,
-                error_type VARCHAR(100),
-                what_would_trigger TEXT,
-                market_insight TEXT,
-                full_context JSONB,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Add new columns if they don't exist (for existing tables)
-        # Note: These are safe migrations - ADD COLUMN IF NOT EXISTS won't error
-        try:
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS risk_reward_ratio DECIMAL(10, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS what_would_trigger TEXT")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS market_insight TEXT")
-            # Prophet context columns
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_win_probability DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_confidence DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_top_factors JSONB")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_probabilities JSONB")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_suggested_strikes JSONB")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS oracle_thresholds JSONB")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS min_win_probability_threshold DECIMAL(5, 4)")
-            # === NEW: Quant ML Advisor columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_advice VARCHAR(50)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_win_probability DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_confidence DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_suggested_risk_pct DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_suggested_sd_multiplier DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_top_factors JSONB")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS quant_ml_model_version VARCHAR(50)")
-            # === NEW: ML Regime Classifier columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS regime_predicted_action VARCHAR(50)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS regime_confidence DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS regime_probabilities JSONB")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS regime_feature_importance JSONB")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS regime_model_version VARCHAR(50)")
-            # === NEW: GEX Directional ML columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS gex_ml_direction VARCHAR(20)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS gex_ml_confidence DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS gex_ml_probabilities JSONB")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS gex_ml_features_used JSONB")
-            # === NEW: Ensemble Strategy columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_signal VARCHAR(50)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_confidence DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_bullish_weight DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_bearish_weight DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_neutral_weight DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_should_trade BOOLEAN")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_position_size_multiplier DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_component_signals JSONB")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ensemble_reasoning TEXT")
-            # === NEW: Volatility Regime columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS volatility_regime VARCHAR(50)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS volatility_risk_level VARCHAR(20)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS volatility_description TEXT")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS at_flip_point BOOLEAN")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS flip_point DECIMAL(15, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS flip_point_distance_pct DECIMAL(10, 4)")
-            # === NEW: Psychology Patterns columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS psychology_pattern VARCHAR(100)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS liberation_setup BOOLEAN")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS false_floor_detected BOOLEAN")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS forward_magnets JSONB")
-            # === NEW: Monte Carlo Kelly columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS kelly_optimal DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS kelly_safe DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS kelly_conservative DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS kelly_prob_ruin DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS kelly_recommendation TEXT")
-            # === NEW: WATCHTOWER Pattern Analysis columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS argus_pattern_match VARCHAR(100)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS argus_similarity_score DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS argus_historical_outcome VARCHAR(50)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS argus_roc_value DECIMAL(10, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS argus_roc_signal VARCHAR(50)")
-            # === NEW: IV Context columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS iv_rank DECIMAL(5, 2)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS iv_percentile DECIMAL(5, 2)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS iv_hv_ratio DECIMAL(5, 2)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS iv_30d DECIMAL(5, 2)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS hv_30d DECIMAL(5, 2)")
-            # === NEW: Time Context columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS day_of_week VARCHAR(20)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS day_of_week_num INTEGER")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS time_of_day VARCHAR(20)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS hour_ct INTEGER")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS minute_ct INTEGER")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS days_to_monthly_opex INTEGER")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS days_to_weekly_opex INTEGER")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS is_opex_week BOOLEAN")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS is_fomc_day BOOLEAN")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS is_cpi_day BOOLEAN")
-            # === NEW: Recent Performance Context columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS similar_setup_win_rate DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS similar_setup_count INTEGER")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS similar_setup_avg_pnl DECIMAL(15, 2)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS current_streak INTEGER")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS streak_type VARCHAR(10)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS last_5_trades_win_rate DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS last_10_trades_win_rate DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS daily_pnl DECIMAL(15, 2)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS weekly_pnl DECIMAL(15, 2)")
-            # === NEW: ML Consensus & Conflict Detection columns ===
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_consensus VARCHAR(50)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_consensus_score DECIMAL(5, 4)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_systems_agree INTEGER")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_systems_total INTEGER")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_conflicts JSONB")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_conflict_severity VARCHAR(20)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_highest_confidence_system VARCHAR(50)")
-            c.execute("ALTER TABLE scan_activity ADD COLUMN IF NOT EXISTS ml_highest_confidence_value DECIMAL(5, 4)")
-            conn.commit()  # Commit schema changes before INSERT
-        except Exception as e:
-            # Log the error but continue - columns likely already exist
-            logger.debug(f"ALTER TABLE scan_activity (non-critical): {e}")
-            try:
-                conn.rollback()  # Rollback any failed transaction to clean state
-            except Exception:
-                pass
-
         # Generate Claude AI explanation if enabled and market data available
         ai_what_trigger = what_would_trigger
         ai_market_insight = market_insight
@@ -826,8 +878,8 @@ def log_scan_activity(
             except Exception as e:
                 logger.debug(f"Could not generate Claude explanation: {e}")
 
-        # Insert scan activity
-        c.execute("""
+        # Queue the row; the write-behind flusher batches it into scan_activity
+        queued = _get_write_behind().enqueue("""
             INSERT INTO scan_activity (
                 bot_name, scan_id, scan_number,
                 timestamp, date, time_ct,
@@ -981,7 +1033,8 @@ def log_scan_activity(
             _convert_numpy(high_of_day), _convert_numpy(low_of_day)
         ))
 
-        conn.commit()
+        if not queued:
+            return None
         logger.info(f"[{bot_name}] Scan #{scan_number} logged: {outcome.value} - {decision_summary}")
         return scan_id
 
@@ -991,14 +1044,6 @@ def log_scan_activity(
         logger.error(traceback.format_exc())
         return None
 
-    finally:
-        # Always close connection to prevent leaks
-        try:
-            if conn:
-                conn.close()
-        except Exception:
-            pass
-
 
 def get_recent_scans(
     bot_name: Optional[str] = None,
@@ -19,7 +19,9 @@ Author: AlphaGEX
 """
 
 import math
+import threading
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, NamedTuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -29,6 +31,21 @@ from scipy.stats import norm
 import warnings
 
 
+# SVI slice fitting
+SVI_FIT_WORKERS = 4              # Expiration slices fitted concurrently
+SVI_REFIT_IV_TOL = 0.0005        # Refit a slice only if an input IV moved more than this (5 bps of vol)
+SVI_REFIT_MONEYNESS_TOL = 0.0005  # ... or its log-moneyness shifted more than this (spot/forward move)
+
+# Bounds to ensure valid SVI parameters: a, b, rho, m, sigma
+SVI_BOUNDS = [
+    (0, None),      # a >= 0
+    (0.001, 1.0),   # 0 < b <= 1
+    (-0.99, 0.99),  # -1 < rho < 1
+    (-0.5, 0.5),    # m around 0
+    (0.01, 0.5)     # sigma > 0
+]
+
+
 # =============================================================================
 # DATA STRUCTURES
 # =============================================================================
@@ -88,6 +105,9 @@ class SVIParams:
             return False
         return True
 
+    def as_array(self) -> np.ndarray:
+        return np.array([self.a, self.b, self.rho, self.m, self.sigma])
+
 
 @dataclass
 class SkewMetrics:
@@ -135,6 +155,55 @@ class TermStructure:
         return self.spot_iv
 
 
+# =============================================================================
+# SVI MODEL
+# =============================================================================
+
+def svi_total_variance(params, k: np.ndarray) -> np.ndarray:
+    """SVI total variance w(k) = a + b * (rho * (k - m) + sqrt((k - m)^2 + sigma^2))"""
+    a, b, rho, m, sigma = params
+    return a + b * (rho * (k - m) + np.sqrt((k - m)**2 + sigma**2))
+
+
+def svi_objective(params, k: np.ndarray, w: np.ndarray, weights: np.ndarray) -> Tuple[float, np.ndarray]:
+    """
+    Weighted sum of squared total-variance errors and its analytic gradient
+
+    With d = k - m and s = sqrt(d^2 + sigma^2):
+        dw/da = 1, dw/db = rho*d + s, dw/drho = b*d,
+        dw/dm = -b*(rho + d/s), dw/dsigma = b*sigma/s
+    """
+    a, b, rho, m, sigma = params
+    d = k - m
+    s = np.sqrt(d**2 + sigma**2)
+    residual = a + b * (rho * d + s) - w
+    wr = 2.0 * weights * residual
+
+    grad = np.array([
+        np.sum(wr),
+        np.sum(wr * (rho * d + s)),
+        np.sum(wr * b * d),
+        np.sum(wr * -b * (rho + d / s)),
+        np.sum(wr * b * sigma / s),
+    ])
+    return float(np.sum(weights * residual**2)), grad
+
+
+def _interp_rows(xp: np.ndarray, rows: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Per-element linear interpolation across rows: rows[i, j] is the value at
+    xp[i] for element j; returns the value at x[j] (flat outside xp).
+    """
+    if len(xp) == 1:
+        return rows[0]
+    hi = np.clip(np.searchsorted(xp, x, side='left'), 1, len(xp) - 1)
+    lo = hi - 1
+    weight = np.clip((x - xp[lo]) / (xp[hi] - xp[lo]), 0.0, 1.0)
+    cols = np.arange(rows.shape[1])
+    low, high = rows[lo, cols], rows[hi, cols]
+    return np.where(weight >= 1.0, high, low + weight * (high - low))
+
+
 # =============================================================================
 # VOLATILITY SURFACE CLASS
 # =============================================================================
@@ -176,6 +245,13 @@ class VolatilitySurface:
         self.svi_params: Dict[int, SVIParams] = {}  # Per-expiration SVI fits
         self.surface_spline: Optional[RectBivariateSpline] = None
 
+        # Inputs each SVI slice was last fitted from (strikes, ivs, log-moneyness),
+        # so a refresh only refits slices that moved
+        self._svi_inputs: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._fit_lock = threading.Lock()
+        self._fit_evaluations = 0
+        self.last_fit_stats: Dict[str, int] = {}
+
         # Surface state
         self.is_fitted = False
         self.fit_quality: Dict[str, float] = {}
@@ -234,7 +310,45 @@ class VolatilitySurface:
                 oi=opt.get('open_interest', 0)
             )
 
-    def _fit_svi_slice(self, dte: int) -> Optional[SVIParams]:
+    def update_chains(self, chains: Dict[int, List[Dict]], spot_price: Optional[float] = None):
+        """
+        Replace the IV data with a fresh chain snapshot (DTE -> chain list).
+
+        Fitted SVI slices are kept, so the next fit('svi') warm-starts from
+        them and skips expirations whose IVs have not moved - a refresh
+        costs a few small corrections instead of a full refit.
+        """
+        if spot_price is not None:
+            self.spot = spot_price
+        self.iv_data = {}
+        for dte, chain in chains.items():
+            self.add_iv_chain(chain, dte)
+        self.is_fitted = False
+        self.last_update = datetime.now()
+
+    def _slice_inputs(self, dte: int) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """(strikes, ivs, log-moneyness) for one expiration, ordered by strike"""
+        if dte not in self.iv_data or len(self.iv_data[dte]) < 5:
+            return None
+        strikes = np.array(sorted(self.iv_data[dte]))
+        points = [self.iv_data[dte][k] for k in strikes]
+        return (strikes,
+                np.array([p.iv for p in points]),
+                np.array([p.moneyness for p in points]))
+
+    def _slice_unchanged(self, dte: int, inputs: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> bool:
+        """True if the slice was fitted before from (nearly) the same inputs"""
+        previous = self._svi_inputs.get(dte)
+        if previous is None or dte not in self.svi_params:
+            return False
+        strikes, ivs, k = inputs
+        prev_strikes, prev_ivs, prev_k = previous
+        return (len(strikes) == len(prev_strikes)
+                and np.array_equal(strikes, prev_strikes)
+                and np.max(np.abs(ivs - prev_ivs)) <= SVI_REFIT_IV_TOL
+                and np.max(np.abs(k - prev_k)) <= SVI_REFIT_MONEYNESS_TOL)
+
+    def _fit_svi_slice(self, dte: int, warm_start: Optional[SVIParams] = None) -> Optional[SVIParams]:
         """
         Fit SVI model to single expiration slice
 
@@ -242,6 +356,9 @@ class VolatilitySurface:
         w(k) = a + b * (rho * (k - m) + sqrt((k - m)^2 + sigma^2))
 
         where k = log(K/F) is log-moneyness
+
+        Starts from warm_start (the previous fit of this slice) when given,
+        falling back to the cold start if that does not converge.
         """
         if dte not in self.iv_data or len(self.iv_data[dte]) < 5:
             return None
@@ -257,38 +374,30 @@ class VolatilitySurface:
         weights = np.array([max(1, p.volume + p.open_interest / 10) for p in points])
         weights = weights / weights.sum()
 
-        def svi_variance(params, k):
-            """SVI total variance function"""
-            a, b, rho, m, sigma = params
-            return a + b * (rho * (k - m) + np.sqrt((k - m)**2 + sigma**2))
+        # Initial guess
+        order = np.argsort(k)
+        atm_var = np.interp(0, k[order], w[order])
+        cold_x0 = [atm_var, 0.1, -0.3, 0.0, 0.1]
 
-        def objective(params):
-            """Weighted sum of squared errors"""
-            w_pred = svi_variance(params, k)
-            return np.sum(weights * (w_pred - w)**2)
+        starts = [cold_x0]
+        if warm_start is not None:
+            lower = [lo if lo is not None else -np.inf for lo, _ in SVI_BOUNDS]
+            upper = [hi if hi is not None else np.inf for _, hi in SVI_BOUNDS]
+            starts.insert(0, np.clip(warm_start.as_array(), lower, upper))
 
-        # Initial guess
-        atm_var = np.interp(0, k, w)
-        x0 = [atm_var, 0.1, -0.3, 0.0, 0.1]
-
-        # Bounds to ensure valid SVI parameters
-        bounds = [
-            (0, None),      # a >= 0
-            (0.001, 1.0),   # 0 < b <= 1
-            (-0.99, 0.99),  # -1 < rho < 1
-            (-0.5, 0.5),    # m around 0
-            (0.01, 0.5)     # sigma > 0
-        ]
-
-        try:
-            result = minimize(objective, x0, method='L-BFGS-B', bounds=bounds)
-
-            if result.success:
-                params = SVIParams(*result.x)
-                if params.validate():
-                    return params
-        except Exception:
-            pass
+        for x0 in starts:
+            try:
+                result = minimize(svi_objective, x0, args=(k, w, weights), jac=True,
+                                  method='L-BFGS-B', bounds=SVI_BOUNDS)
+                with self._fit_lock:
+                    self._fit_evaluations += result.nfev
+
+                if result.success:
+                    params = SVIParams(*result.x)
+                    if params.validate():
+                        return params
+            except Exception:
+                pass
 
         return None
 
@@ -306,16 +415,60 @@ class VolatilitySurface:
             return False
 
         if method == 'svi':
-            # Fit SVI to each expiration
+            self.surface_spline = None
+            self._fit_evaluations = 0
+
+            # Expired / dropped expirations
+            for dte in list(self.svi_params):
+                if dte not in self.iv_data:
+                    del self.svi_params[dte]
+                    self._svi_inputs.pop(dte, None)
+
+            # Only refit slices whose inputs moved; warm-start them from their last fit
+            to_fit = {}
+            reused = 0
             for dte in sorted(self.iv_data.keys()):
-                params = self._fit_svi_slice(dte)
+                inputs = self._slice_inputs(dte)
+                if inputs is None:
+                    continue
+                if self._slice_unchanged(dte, inputs):
+                    reused += 1
+                else:
+                    to_fit[dte] = inputs
+
+            warm_started = sum(1 for dte in to_fit if dte in self.svi_params)
+
+            def fit_slice(dte):
+                return self._fit_svi_slice(dte, warm_start=self.svi_params.get(dte))
+
+            dtes = list(to_fit)
+            if len(dtes) > 1:
+                with ThreadPoolExecutor(max_workers=min(SVI_FIT_WORKERS, len(dtes))) as pool:
+                    fitted = list(pool.map(fit_slice, dtes))
+            else:
+                fitted = [fit_slice(dte) for dte in dtes]
+
+            for dte, params in zip(dtes, fitted):
                 if params:
                     self.svi_params[dte] = params
+                    self._svi_inputs[dte] = to_fit[dte]
+                else:
+                    # The slice moved and no longer fits; its old params describe stale quotes
+                    self.svi_params.pop(dte, None)
+                    self._svi_inputs.pop(dte, None)
+
+            self.last_fit_stats = {
+                'refit': len(dtes),
+                'reused': reused,
+                'warm_started': warm_started,
+                'function_evaluations': self._fit_evaluations,
+            }
 
             if len(self.svi_params) >= 2:
                 self.is_fitted = True
                 self._calculate_fit_quality()
                 return True
+            self.is_fitted = False
 
         elif method == 'spline':
             # Bivariate spline interpolation
@@ -330,16 +483,14 @@ class VolatilitySurface:
             if len(strikes) < 4 or len(all_dtes) < 2:
                 return False
 
-            # Build IV grid
+            # Build IV grid - one np.interp per expiration fills its missing strikes
+            # (observed strikes come back exactly, the ends are held flat)
             iv_grid = np.zeros((len(strikes), len(all_dtes)))
 
-            for i, strike in enumerate(strikes):
-                for j, dte in enumerate(all_dtes):
-                    if strike in self.iv_data.get(dte, {}):
-                        iv_grid[i, j] = self.iv_data[dte][strike].iv
-                    else:
-                        # Interpolate missing points
-                        iv_grid[i, j] = self._interpolate_iv_linear(strike, dte)
+            for j, dte in enumerate(all_dtes):
+                slice_strikes = sorted(self.iv_data[dte].keys())
+                slice_ivs = [self.iv_data[dte][k].iv for k in slice_strikes]
+                iv_grid[:, j] = np.interp(strikes, slice_strikes, slice_ivs)
 
             try:
                 self.surface_spline = RectBivariateSpline(
@@ -381,34 +532,41 @@ class VolatilitySurface:
         if not self.is_fitted:
             return
 
-        total_error = 0
-        n_points = 0
+        points = [point for strikes in self.iv_data.values() for point in strikes.values()]
+        n_points = len(points)
 
-        for dte, strikes in self.iv_data.items():
-            for strike, point in strikes.items():
-                predicted_iv = self.get_iv(strike, dte)
-                error = abs(predicted_iv - point.iv)
-                total_error += error
-                n_points += 1
+        if n_points > 0:
+            predicted = self.get_iv(np.array([p.strike for p in points]),
+                                    np.array([p.expiration_days for p in points]))
+            total_error = float(np.sum(np.abs(predicted - np.array([p.iv for p in points]))))
+        else:
+            total_error = 0
 
         self.fit_quality['mae'] = total_error / n_points if n_points > 0 else float('inf')
         self.fit_quality['n_points'] = n_points
         self.fit_quality['n_expirations'] = len(self.iv_data)
 
-    def get_iv(self, strike: float, dte: int) -> float:
+    def get_iv(self, strike, dte):
         """
         Get implied volatility for any strike/DTE combination
 
         This is the main interpolation method - returns IV even for
         strikes/expirations not in the original data.
 
+        strike and dte may also be arrays; they are broadcast against each
+        other (pass strikes[:, None] and dtes[None, :] for a whole grid) and
+        evaluated in one vectorized pass.
+
         Args:
-            strike: Option strike price
-            dte: Days to expiration
+            strike: Option strike price (or array of strikes)
+            dte: Days to expiration (or array of DTEs)
 
         Returns:
-            Interpolated implied volatility
+            Interpolated implied volatility (array for array inputs)
         """
+        if np.ndim(strike) or np.ndim(dte):
+            return self._get_iv_array(np.asarray(strike, dtype=float), np.asarray(dte, dtype=float))
+
         if not self.is_fitted:
             # Fall back to linear interpolation
             return self._interpolate_iv_linear(strike, dte)
@@ -439,6 +597,42 @@ class VolatilitySurface:
 
         return 0.20  # Default fallback
 
+    def _get_iv_array(self, strikes: np.ndarray, dtes: np.ndarray) -> np.ndarray:
+        """Vectorized get_iv - same interpolation rules as the scalar path"""
+        strikes, dtes = np.broadcast_arrays(strikes, dtes)
+        shape = strikes.shape
+        strikes, dtes = strikes.ravel(), dtes.ravel()
+
+        if not self.is_fitted:
+            # Linear in strike within each expiration, then linear across expirations
+            data_dtes = np.array(sorted(self.iv_data.keys()), dtype=float)
+            rows = []
+            for d in sorted(self.iv_data.keys()):
+                slice_strikes = sorted(self.iv_data[d].keys())
+                rows.append(np.interp(strikes, slice_strikes, [self.iv_data[d][k].iv for k in slice_strikes]))
+            ivs = _interp_rows(data_dtes, np.array(rows), dtes)
+
+        elif self.surface_spline is not None:
+            ivs = self.surface_spline(strikes, dtes, grid=False)
+
+        else:
+            # SVI IV at each fitted expiration, linear in DTE between them (flat outside)
+            fitted = sorted(self.svi_params.keys())
+            fitted_dtes = np.array(fitted, dtype=float)
+            rows = np.array([self._svi_iv_array(strikes, d, self.svi_params[d]) for d in fitted])
+            ivs = _interp_rows(fitted_dtes, rows, dtes)
+
+        return np.asarray(ivs, dtype=float).reshape(shape)
+
+    def _svi_iv_array(self, strikes: np.ndarray, dte: int, params: SVIParams) -> np.ndarray:
+        """Vectorized _svi_iv for one fitted expiration"""
+        t = dte / 365.0
+        forward = self.spot * math.exp(self.r * t)
+        w = svi_total_variance(params.as_array(), np.log(strikes / forward))
+        if t <= 0:
+            return np.full(strikes.shape, 0.20)
+        return np.where(w > 0, np.sqrt(np.maximum(w, 0) / t), 0.20)
+
     def _svi_iv(self, strike: float, dte: int, params: SVIParams) -> float:
         """Calculate IV from SVI parameters"""
         t = dte / 365.0